@@ -0,0 +1,130 @@
+"""Add exclusion constraints preventing facility and instructor double-booking
+
+Revision ID: 20250801_session_exclusion
+Revises: 20250726_merge_name_fields
+Create Date: 2025-08-01 09:00:00.000000
+
+Sessions get a generated ``time_range`` column and a GiST exclusion
+constraint per (facility, facility_slot). Instructor assignments carry a
+trigger-maintained copy of their session's time range and busy flag so a
+second exclusion constraint can reject overlapping assignments per
+instructor. Only scheduled / in-progress sessions and active assignments
+take part.
+
+Timestamps are stored without time zone, so ``tsrange`` is used rather
+than ``tstzrange``. Existing overlapping bookings must be resolved before
+upgrading, otherwise adding the constraints fails.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20250801_session_exclusion'
+down_revision = '20250726_merge_name_fields'
+branch_labels = None
+depends_on = None
+
+
+BUSY_STATUSES = "('SCHEDULED', 'IN_PROGRESS')"
+
+
+def upgrade():
+    """Add time range columns, sync triggers and exclusion constraints."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    # Sessions: one booking per facility slot at a time
+    op.add_column(
+        'scheduled_sessions',
+        sa.Column(
+            'facility_slot', sa.Integer(), nullable=False, server_default='0',
+            comment='Concurrency slot within the facility (0 unless the facility allows concurrent sessions)'
+        )
+    )
+    op.execute("""
+        ALTER TABLE scheduled_sessions
+        ADD COLUMN time_range tsrange
+        GENERATED ALWAYS AS (tsrange(start_time, end_time, '[)')) STORED
+    """)
+    op.execute(f"""
+        ALTER TABLE scheduled_sessions
+        ADD CONSTRAINT excl_scheduled_sessions_facility_overlap
+        EXCLUDE USING gist (facility_id WITH =, facility_slot WITH =, time_range WITH &&)
+        WHERE (status IN {BUSY_STATUSES})
+    """)
+
+    # Instructor assignments: copy of the session's time range and status
+    op.add_column('session_instructors', sa.Column('time_range', postgresql.TSRANGE(), nullable=True))
+    op.add_column(
+        'session_instructors',
+        sa.Column('session_busy', sa.Boolean(), nullable=False, server_default=sa.false())
+    )
+
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION session_instructors_sync_time_range() RETURNS trigger AS $$
+        BEGIN
+            SELECT s.time_range, s.status::text IN {BUSY_STATUSES}
+            INTO NEW.time_range, NEW.session_busy
+            FROM scheduled_sessions s
+            WHERE s.id = NEW.session_id;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_session_instructors_sync_time_range
+        BEFORE INSERT OR UPDATE OF session_id ON session_instructors
+        FOR EACH ROW EXECUTE FUNCTION session_instructors_sync_time_range()
+    """)
+
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION scheduled_sessions_propagate_time_range() RETURNS trigger AS $$
+        BEGIN
+            UPDATE session_instructors
+            SET time_range = NEW.time_range,
+                session_busy = NEW.status::text IN {BUSY_STATUSES}
+            WHERE session_id = NEW.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_scheduled_sessions_propagate_time_range
+        AFTER UPDATE OF start_time, end_time, status ON scheduled_sessions
+        FOR EACH ROW
+        WHEN (OLD.start_time IS DISTINCT FROM NEW.start_time
+              OR OLD.end_time IS DISTINCT FROM NEW.end_time
+              OR OLD.status IS DISTINCT FROM NEW.status)
+        EXECUTE FUNCTION scheduled_sessions_propagate_time_range()
+    """)
+
+    # Backfill existing assignments
+    op.execute(f"""
+        UPDATE session_instructors si
+        SET time_range = s.time_range,
+            session_busy = s.status::text IN {BUSY_STATUSES}
+        FROM scheduled_sessions s
+        WHERE s.id = si.session_id
+    """)
+
+    op.execute("""
+        ALTER TABLE session_instructors
+        ADD CONSTRAINT excl_session_instructors_overlap
+        EXCLUDE USING gist (instructor_id WITH =, time_range WITH &&)
+        WHERE (removed_at IS NULL AND session_busy)
+    """)
+
+
+def downgrade():
+    """Drop exclusion constraints, triggers and time range columns."""
+    op.execute("ALTER TABLE session_instructors DROP CONSTRAINT IF EXISTS excl_session_instructors_overlap")
+    op.execute("DROP TRIGGER IF EXISTS trg_scheduled_sessions_propagate_time_range ON scheduled_sessions")
+    op.execute("DROP FUNCTION IF EXISTS scheduled_sessions_propagate_time_range()")
+    op.execute("DROP TRIGGER IF EXISTS trg_session_instructors_sync_time_range ON session_instructors")
+    op.execute("DROP FUNCTION IF EXISTS session_instructors_sync_time_range()")
+    op.drop_column('session_instructors', 'session_busy')
+    op.drop_column('session_instructors', 'time_range')
+
+    op.execute("ALTER TABLE scheduled_sessions DROP CONSTRAINT IF EXISTS excl_scheduled_sessions_facility_overlap")
+    op.drop_column('scheduled_sessions', 'time_range')
+    op.drop_column('scheduled_sessions', 'facility_slot')
@@ -0,0 +1,51 @@
+"""Add outbox_messages table for background work
+
+Revision ID: 20250805_outbox_messages
+Revises: 20250801_session_exclusion
+Create Date: 2025-08-05 09:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20250805_outbox_messages'
+down_revision = '20250801_session_exclusion'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the outbox table and its claim index."""
+    op.create_table(
+        'outbox_messages',
+        sa.Column('id', sa.String(36), primary_key=True),
+        sa.Column('topic', sa.String(100), nullable=False, comment="Handler topic, e.g. 'scheduling.notification'"),
+        sa.Column('payload', sa.JSON(), nullable=False, comment='Message body passed to the topic handler'),
+        sa.Column(
+            'status', sa.String(20), nullable=False, server_default=sa.text("'pending'"),
+            comment='pending, processing, done or failed'
+        ),
+        sa.Column(
+            'attempts', sa.Integer(), nullable=False, server_default=sa.text('0'),
+            comment='Number of times the message has been claimed'
+        ),
+        sa.Column(
+            'available_at', sa.DateTime(), nullable=False,
+            comment='Earliest time the message may be claimed (retry backoff)'
+        ),
+        sa.Column('locked_at', sa.DateTime(), nullable=True, comment='When a worker claimed the message'),
+        sa.Column(
+            'locked_by', sa.String(36), nullable=True,
+            comment='Claim token of the worker batch holding the message'
+        ),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('processed_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('idx_outbox_messages_claim', 'outbox_messages', ['topic', 'status', 'available_at'])
+
+
+def downgrade():
+    """Drop the outbox table."""
+    op.drop_index('idx_outbox_messages_claim', table_name='outbox_messages')
+    op.drop_table('outbox_messages')
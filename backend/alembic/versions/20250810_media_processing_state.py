@@ -0,0 +1,54 @@
+"""Track background processing state on media_library
+
+Revision ID: 20250810_media_processing
+Revises: 20250805_outbox_messages
+Create Date: 2025-08-10 09:00:00.000000
+
+Existing media were processed inline before this change, so they are
+marked completed.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20250810_media_processing'
+down_revision = '20250805_outbox_messages'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add processing status, steps, error and extracted metadata columns."""
+    op.add_column(
+        'media_library',
+        sa.Column(
+            'processing_status', sa.String(20), nullable=False, server_default=sa.text("'completed'"),
+            comment='Background processing status (pending, processing, completed, failed)'
+        )
+    )
+    op.alter_column('media_library', 'processing_status', server_default=sa.text("'pending'"))
+    op.add_column(
+        'media_library',
+        sa.Column('processing_steps', sa.JSON(), nullable=True, comment='Per-step processing state keyed by step name')
+    )
+    op.add_column(
+        'media_library',
+        sa.Column('processing_error', sa.Text(), nullable=True, comment='Last processing error')
+    )
+    op.add_column(
+        'media_library',
+        sa.Column('processed_at', sa.DateTime(), nullable=True, comment='When background processing finished')
+    )
+    op.add_column(
+        'media_library',
+        sa.Column('extracted_metadata', sa.JSON(), nullable=True, comment='Technical metadata extracted from the file')
+    )
+
+
+def downgrade():
+    """Drop media processing columns."""
+    op.drop_column('media_library', 'extracted_metadata')
+    op.drop_column('media_library', 'processed_at')
+    op.drop_column('media_library', 'processing_error')
+    op.drop_column('media_library', 'processing_steps')
+    op.drop_column('media_library', 'processing_status')
@@ -0,0 +1,33 @@
+"""Store the SHA-256 of media files
+
+Revision ID: 20250812_media_content_hash
+Revises: 20250810_media_processing
+Create Date: 2025-08-12 09:00:00.000000
+
+The hash backs strong ETags for media delivery. Existing rows are filled
+in by the media worker's metadata extraction.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20250812_media_content_hash'
+down_revision = '20250810_media_processing'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add the content hash column."""
+    op.add_column(
+        'media_library',
+        sa.Column(
+            'content_sha256', sa.String(64), nullable=True,
+            comment='SHA-256 of the file content (hex); used as the strong ETag'
+        )
+    )
+
+
+def downgrade():
+    """Drop the content hash column."""
+    op.drop_column('media_library', 'content_sha256')
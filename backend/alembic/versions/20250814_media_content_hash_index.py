@@ -0,0 +1,26 @@
+"""Index media content hashes for blob reference counting
+
+Revision ID: 20250814_media_blob_refs
+Revises: 20250812_media_content_hash
+Create Date: 2025-08-14 09:00:00.000000
+
+Uploads are now stored once per SHA-256 and every media row with the
+hash references the blob; the index keeps reference counts cheap.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20250814_media_blob_refs'
+down_revision = '20250812_media_content_hash'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Index content_sha256."""
+    op.create_index('idx_media_library_content_sha256', 'media_library', ['content_sha256'])
+
+
+def downgrade():
+    """Drop the content hash index."""
+    op.drop_index('idx_media_library_content_sha256', table_name='media_library')
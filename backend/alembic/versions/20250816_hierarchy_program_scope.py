@@ -0,0 +1,87 @@
+"""Denormalize program and curriculum scope onto the curriculum hierarchy
+
+Revision ID: 20250816_hierarchy_program_scope
+Revises: 20250814_media_blob_refs
+Create Date: 2025-08-16 09:00:00.000000
+
+Levels get program_id; modules, sections, lessons and media get
+curriculum_id and program_id, so program-scoped queries filter one table
+instead of joining up to courses. The columns are kept in sync by
+app.features.curricula.services.program_scope and backfilled here
+top-down. Media that is not attached to a lesson keeps a NULL scope.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20250816_hierarchy_program_scope'
+down_revision = '20250814_media_blob_refs'
+branch_labels = None
+depends_on = None
+
+# (table, parent table, parent foreign key) from the top of the hierarchy down
+SCOPED_TABLES = [
+    ('modules', 'levels', 'level_id'),
+    ('sections', 'modules', 'module_id'),
+    ('lessons', 'sections', 'section_id'),
+    ('media_library', 'lessons', 'lesson_id'),
+]
+
+
+def upgrade():
+    """Add, backfill and index the scope columns."""
+    _add_scope_column('levels', 'program_id', 'programs', 'Owning program (denormalized from the hierarchy)')
+    for table, _, _ in SCOPED_TABLES:
+        _add_scope_column(table, 'curriculum_id', 'curricula', 'Owning curriculum (denormalized from the hierarchy)')
+        _add_scope_column(table, 'program_id', 'programs', 'Owning program (denormalized from the hierarchy)')
+
+    op.execute(
+        """
+        UPDATE levels
+        SET program_id = courses.program_id
+        FROM curricula
+        JOIN courses ON courses.id = curricula.course_id
+        WHERE curricula.id = levels.curriculum_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE modules
+        SET curriculum_id = levels.curriculum_id, program_id = levels.program_id
+        FROM levels
+        WHERE levels.id = modules.level_id
+        """
+    )
+    for table, parent, foreign_key in SCOPED_TABLES[1:]:
+        op.execute(
+            f"""
+            UPDATE {table}
+            SET curriculum_id = {parent}.curriculum_id, program_id = {parent}.program_id
+            FROM {parent}
+            WHERE {parent}.id = {table}.{foreign_key}
+            """
+        )
+
+    op.create_index('idx_levels_program_id', 'levels', ['program_id'])
+    for table, _, _ in SCOPED_TABLES:
+        op.create_index(f'idx_{table}_program_id', table, ['program_id'])
+        op.create_index(f'idx_{table}_curriculum_id', table, ['curriculum_id'])
+
+
+def downgrade():
+    """Drop the scope columns."""
+    for table, _, _ in reversed(SCOPED_TABLES):
+        op.drop_index(f'idx_{table}_curriculum_id', table_name=table)
+        op.drop_index(f'idx_{table}_program_id', table_name=table)
+        op.drop_constraint(f'fk_{table}_program_id', table, type_='foreignkey')
+        op.drop_constraint(f'fk_{table}_curriculum_id', table, type_='foreignkey')
+        op.drop_column(table, 'program_id')
+        op.drop_column(table, 'curriculum_id')
+    op.drop_index('idx_levels_program_id', table_name='levels')
+    op.drop_constraint('fk_levels_program_id', 'levels', type_='foreignkey')
+    op.drop_column('levels', 'program_id')
+
+
+def _add_scope_column(table, column, referenced_table, comment):
+    op.add_column(table, sa.Column(column, sa.String(36), nullable=True, comment=comment))
+    op.create_foreign_key(f'fk_{table}_{column}', table, referenced_table, [column], ['id'])
@@ -0,0 +1,51 @@
+"""Trigram and full-text search indexes
+
+Revision ID: 20250818_text_search_indexes
+Revises: 20250816_hierarchy_program_scope
+Create Date: 2025-08-18 09:00:00.000000
+
+Free-text search (app.features.common.services.text_search) matches a
+lower-cased concatenation of each table's searchable columns. The
+expressions here must stay identical to SearchDocument.expression() for
+PostgreSQL to use the indexes.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20250818_text_search_indexes'
+down_revision = '20250816_hierarchy_program_scope'
+branch_labels = None
+depends_on = None
+
+SEARCH_DOCUMENTS = {
+    'users': ('first_name', 'last_name', 'email', 'username'),
+    'students': ('first_name', 'last_name', 'email', 'student_id'),
+    'media_library': ('title', 'description', 'file_name', 'original_file_name'),
+    'scheduled_sessions': ('title', 'description'),
+}
+
+
+def upgrade():
+    """Enable pg_trgm and create trigram and tsvector indexes."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, columns in SEARCH_DOCUMENTS.items():
+        document = _document(columns)
+        op.execute(
+            f"CREATE INDEX idx_{table}_search_trgm ON {table} USING gin ({document} gin_trgm_ops)"
+        )
+        op.execute(
+            f"CREATE INDEX idx_{table}_search_tsv ON {table} USING gin (to_tsvector('simple', {document}))"
+        )
+    op.create_index('idx_media_library_tags', 'media_library', ['tags'], postgresql_using='gin')
+
+
+def downgrade():
+    """Drop the search indexes (the extension is left installed)."""
+    op.drop_index('idx_media_library_tags', table_name='media_library')
+    for table in SEARCH_DOCUMENTS:
+        op.drop_index(f'idx_{table}_search_tsv', table_name=table)
+        op.drop_index(f'idx_{table}_search_trgm', table_name=table)
+
+
+def _document(columns):
+    return "lower(" + " || ' ' || ".join(f"coalesce({column}, '')" for column in columns) + ")"
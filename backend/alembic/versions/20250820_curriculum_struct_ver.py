@@ -0,0 +1,34 @@
+"""Version the curriculum content tree
+
+Revision ID: 20250820_curriculum_struct_ver
+Revises: 20250818_text_search_indexes
+Create Date: 2025-08-20 09:00:00.000000
+
+curricula.structure_version is bumped whenever a level, module, section or
+lesson of the curriculum changes (app.features.curricula.services.tree_cache).
+Serialized curriculum trees are cached under it and it forms the tree ETag.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20250820_curriculum_struct_ver'
+down_revision = '20250818_text_search_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add the structure version column."""
+    op.add_column(
+        'curricula',
+        sa.Column(
+            'structure_version', sa.Integer(), nullable=False, server_default=sa.text('1'),
+            comment="Version of the curriculum's content tree, for tree caching and ETags"
+        )
+    )
+
+
+def downgrade():
+    """Drop the structure version column."""
+    op.drop_column('curricula', 'structure_version')
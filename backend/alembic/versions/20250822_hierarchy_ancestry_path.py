@@ -0,0 +1,71 @@
+"""Materialize ancestry paths on the curriculum hierarchy
+
+Revision ID: 20250822_hierarchy_ancestry_path
+Revises: 20250820_curriculum_struct_ver
+Create Date: 2025-08-22 09:00:00.000000
+
+Levels, modules, sections and lessons get ancestry_path: the IDs of their
+ancestors from the program down to the parent, '/'-separated. Breadcrumbs
+resolve from it in one query and subtrees are prefix matches, so the
+indexes use varchar_pattern_ops. The paths are kept in sync by
+app.features.curricula.services.ancestry and backfilled here top-down.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20250822_hierarchy_ancestry_path'
+down_revision = '20250820_curriculum_struct_ver'
+branch_labels = None
+depends_on = None
+
+# (table, parent table, parent foreign key) below levels, from the top down
+PATH_TABLES = [
+    ('modules', 'levels', 'level_id'),
+    ('sections', 'modules', 'module_id'),
+    ('lessons', 'sections', 'section_id'),
+]
+
+
+def upgrade():
+    """Add, backfill and index the ancestry paths."""
+    for table in ['levels'] + [table for table, _, _ in PATH_TABLES]:
+        op.add_column(
+            table,
+            sa.Column(
+                'ancestry_path', sa.String(255), nullable=True,
+                comment="IDs of the ancestors from the program down to the parent, '/'-separated"
+            )
+        )
+
+    op.execute(
+        """
+        UPDATE levels
+        SET ancestry_path = courses.program_id || '/' || courses.id || '/' || curricula.id
+        FROM curricula
+        JOIN courses ON courses.id = curricula.course_id
+        WHERE curricula.id = levels.curriculum_id
+        """
+    )
+    for table, parent, foreign_key in PATH_TABLES:
+        op.execute(
+            f"""
+            UPDATE {table}
+            SET ancestry_path = {parent}.ancestry_path || '/' || {parent}.id
+            FROM {parent}
+            WHERE {parent}.id = {table}.{foreign_key}
+            """
+        )
+
+    for table in ['levels'] + [table for table, _, _ in PATH_TABLES]:
+        op.create_index(
+            f'idx_{table}_ancestry_path', table, ['ancestry_path'],
+            postgresql_ops={'ancestry_path': 'varchar_pattern_ops'}
+        )
+
+
+def downgrade():
+    """Drop the ancestry paths."""
+    for table in ['levels'] + [table for table, _, _ in PATH_TABLES]:
+        op.drop_index(f'idx_{table}_ancestry_path', table_name=table)
+        op.drop_column(table, 'ancestry_path')
@@ -0,0 +1,48 @@
+"""Add dashboard_counters table for materialized dashboard statistics
+
+Revision ID: 20250824_dashboard_counters
+Revises: 20250822_hierarchy_ancestry_path
+Create Date: 2025-08-24 09:00:00.000000
+
+Counters are kept current by session flush events and rebuilt by the
+periodic reconcile, which fills the table after this upgrade. Databases
+bootstrapped with setup_db.py may already have the table; it is left as is.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20250824_dashboard_counters'
+down_revision = '20250822_hierarchy_ancestry_path'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the counter table."""
+    if sa.inspect(op.get_bind()).has_table('dashboard_counters'):
+        return
+    op.create_table(
+        'dashboard_counters',
+        sa.Column(
+            'scope', sa.String(36), primary_key=True,
+            comment="Program ID, or 'global' for academy-wide counters"
+        ),
+        sa.Column(
+            'name', sa.String(150), primary_key=True,
+            comment="Counter name, e.g. 'students.active' or 'media.by_type.VIDEO'"
+        ),
+        sa.Column(
+            'value', sa.BigInteger(), nullable=False, server_default=sa.text('0'),
+            comment='Current counter value'
+        ),
+        sa.Column(
+            'updated_at', sa.DateTime(timezone=True), nullable=False,
+            server_default=sa.text('CURRENT_TIMESTAMP')
+        ),
+    )
+
+
+def downgrade():
+    """Drop the counter table."""
+    op.drop_table('dashboard_counters')
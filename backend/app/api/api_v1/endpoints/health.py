@@ -1,6 +1,10 @@
+from typing import Any, Dict
+
 from fastapi import APIRouter
 from pydantic import BaseModel
 
+from app.features.common.services.pool_metrics import get_pool_metrics
+
 router = APIRouter()
 
 class HealthResponse(BaseModel):
@@ -12,4 +16,23 @@ async def health_check():
     return HealthResponse(
         status="healthy",
         message="Academy Admin API is running"
-    )
\ No newline at end of file
+    )
+
+class DatabaseHealthResponse(BaseModel):
+    status: str
+    pools: Dict[str, Any]
+
+@router.get("/db", response_model=DatabaseHealthResponse)
+async def database_health_check():
+    """
+    Connection pool metrics for the sync and async engines.
+    
+    Reads in-process counters only (no connection is checked out), so it
+    stays responsive while the pool is exhausted.
+    """
+    pools = get_pool_metrics()
+    exhausted = any(metrics["pool"].get("exhausted") for metrics in pools.values())
+    return DatabaseHealthResponse(
+        status="degraded" if exhausted else "healthy",
+        pools=pools
+    )
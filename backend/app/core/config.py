@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import List, Optional, Union
 from pydantic import AnyHttpUrl, field_validator
 from pydantic_settings import BaseSettings
 import os
@@ -24,12 +24,40 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = "sqlite:///./academy_admin.db"
+    # Async driver URL; derived from DATABASE_URL (asyncpg / aiosqlite) when unset
+    ASYNC_DATABASE_URL: Optional[str] = None
+    # Connection pool (applies to server databases; SQLite keeps its default pool)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds before a connection is replaced
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # PostgreSQL statement_timeout; 0 disables
     
     # Security
     SECRET_KEY: str = "your-secret-key-here"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
-    
+
+    # Authenticated-user cache (per process; 0 TTL disables)
+    AUTH_USER_CACHE_TTL_SECONDS: int = 60
+    AUTH_USER_CACHE_MAX_ENTRIES: int = 2048
+
+    # Program access matrix cache (per process; 0 TTL disables)
+    PROGRAM_ACCESS_CACHE_TTL_SECONDS: int = 300
+    PROGRAM_ACCESS_CACHE_MAX_USERS: int = 4096
+
+    # Serialized curriculum trees (per process; revalidated against the curriculum's structure version)
+    CURRICULUM_TREE_CACHE_MAX_ENTRIES: int = 256
+
+    # Rows per streamed export fetch and per import insert (COPY) batch
+    CURRICULUM_TRANSFER_BATCH_SIZE: int = 1000
+
+    # Assignment typeahead prefix index (per process; users changed by other processes are
+    # picked up every sync interval, and the whole index is rebuilt after the TTL)
+    TYPEAHEAD_INDEX_TTL_SECONDS: int = 900
+    TYPEAHEAD_SYNC_INTERVAL_SECONDS: int = 5
+    TYPEAHEAD_MAX_RESULTS: int = 10
+
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
     
@@ -48,6 +76,31 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str = ""
     FROM_EMAIL: str = "noreply@academy.com"
     
+    # Dashboard counters (seconds between full reconciliations; 0 disables)
+    DASHBOARD_COUNTER_RECONCILE_INTERVAL: int = 3600
+    
+    # Outbox worker (in-process poll interval in seconds; 0 disables the worker)
+    OUTBOX_POLL_INTERVAL_SECONDS: float = 2.0
+    OUTBOX_WORKER_CONCURRENCY: int = 4
+    OUTBOX_MAX_ATTEMPTS: int = 5
+    # Comma-separated topics drained only by the standalone worker (python -m app.worker)
+    OUTBOX_WORKER_ONLY_TOPICS: str = "media.processing"
+    
+    @property
+    def OUTBOX_WORKER_ONLY_TOPIC_LIST(self) -> List[str]:
+        """Parse worker-only outbox topics from environment variable"""
+        return [topic.strip() for topic in self.OUTBOX_WORKER_ONLY_TOPICS.split(",") if topic.strip()]
+    
+    # Media storage and background processing
+    MEDIA_ROOT: str = "/app/media"
+    MEDIA_MAX_FILE_SIZE: int = 2 * 1024 * 1024 * 1024  # 2GB
+    MEDIA_PROCESSING_WORKERS: int = 2  # processes for thumbnails / metadata extraction
+    MEDIA_PROCESSING_BATCH_SIZE: int = 10
+    MEDIA_CACHE_MAX_AGE_SECONDS: int = 3600  # Cache-Control max-age for downloads and thumbnails
+    # Hand file bodies to a fronting proxy: "" (serve from Python), "x-accel-redirect" (nginx) or "x-sendfile"
+    MEDIA_SENDFILE_BACKEND: str = ""
+    MEDIA_ACCEL_REDIRECT_PREFIX: str = "/protected-media/"  # nginx internal location mapped to MEDIA_ROOT
+    
     # Feature flags
     ENABLE_DOCS: bool = True
     ENABLE_ADMIN_OVERRIDE: bool = True
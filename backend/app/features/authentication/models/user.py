@@ -9,6 +9,7 @@ from sqlalchemy import Boolean, Column, DateTime, String, text, ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.features.common.models.base import BaseModel
+from app.features.common.models.search import SearchDocument
 from app.features.common.models.enums import UserRole, ProfileType
 
 
@@ -384,4 +385,8 @@ class User(BaseModel):
         """String representation of the user."""
         roles_str = ', '.join(self.roles)
         username_display = self.username or self.email or f"{self.first_name} {self.last_name}"
-        return f"<User(id={self.id}, username='{username_display}', roles=[{roles_str}], profile_type='{self.profile_type.value}')>"
\ No newline at end of file
+        return f"<User(id={self.id}, username='{username_display}', roles=[{roles_str}], profile_type='{self.profile_type.value}')>"
+
+
+# Free-text search over names, email and username
+USER_SEARCH = SearchDocument(User.__table__, ("first_name", "last_name", "email", "username"))
@@ -20,6 +20,7 @@ from app.features.authentication.schemas.auth import (
     PasswordChangeRequest,
 )
 from app.features.authentication.services.auth_service import auth_service
+from app.features.authentication.services.principal_cache import AuthenticatedUser
 from app.features.common.models.database import get_db
 
 
@@ -30,7 +31,7 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: Session = Depends(get_db)
-) -> User:
+) -> AuthenticatedUser:
     """Get current user from JWT token."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -46,8 +47,8 @@ async def get_current_user(
 
 
 async def get_current_active_user(
-    current_user: Annotated[User, Depends(get_current_user)]
-) -> User:
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)]
+) -> AuthenticatedUser:
     """Get current active user."""
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
@@ -11,7 +11,9 @@ from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.features.authentication.models.user import User
+from app.features.authentication.models.user_program_assignment import UserProgramAssignment
 from app.features.authentication.schemas.auth import TokenData, UserResponse
+from app.features.authentication.services.principal_cache import AuthenticatedUser, principal_cache
 from app.features.common.models.database import get_db
 
 
@@ -35,24 +37,31 @@ class AuthService:
     def create_access_token(self, data: dict, expires_delta: Optional[timedelta] = None) -> str:
         """Create a JWT access token."""
         to_encode = data.copy()
+        issued_at = datetime.utcnow()
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = issued_at + expires_delta
         else:
-            expire = datetime.utcnow() + timedelta(minutes=15)
+            expire = issued_at + timedelta(minutes=15)
         
-        to_encode.update({"exp": expire})
+        to_encode.update({"exp": expire, "iat": issued_at})
         encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
         return encoded_jwt
     
     def verify_token(self, token: str) -> Optional[TokenData]:
         """Verify and decode a JWT token."""
+        payload = self.decode_token(token)
+        if payload is None:
+            return None
+        username: str = payload.get("sub")
+        if username is None:
+            return None
+        token_data = TokenData(username=username)
+        return token_data
+    
+    def decode_token(self, token: str) -> Optional[dict]:
+        """Verify a JWT token and return its payload."""
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            username: str = payload.get("sub")
-            if username is None:
-                return None
-            token_data = TokenData(username=username)
-            return token_data
+            return jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
         except jwt.PyJWTError:
             return None
     
@@ -188,17 +197,36 @@ class AuthService:
         db.commit()
         return True
     
-    def get_current_user(self, db: Session, token: str) -> Optional[User]:
-        """Get current user from JWT token."""
-        token_data = self.verify_token(token)
-        if token_data is None:
+    def get_current_user(self, db: Session, token: str) -> Optional[AuthenticatedUser]:
+        """
+        Get current user from JWT token.
+        
+        Returns a detached snapshot served from the principal cache, keyed by
+        the token subject and issue time; the user and their program
+        assignments are only loaded on a cache miss.
+        """
+        payload = self.decode_token(token)
+        if payload is None or payload.get("sub") is None:
             return None
         
-        user = self.get_user_by_username(db, token_data.username)
+        # Tokens issued before "iat" was added are still unique by expiry
+        cache_key = (payload["sub"], payload.get("iat", payload.get("exp")))
+        principal = principal_cache.get(cache_key)
+        if principal is not None:
+            return principal
+        
+        generation = principal_cache.generation
+        user = self.get_user_by_username(db, payload["sub"])
         if user is None:
             return None
         
-        return user
+        assignments = db.query(UserProgramAssignment).filter(
+            UserProgramAssignment.user_id == user.id
+        ).all()
+        principal = AuthenticatedUser(user, assignments)
+        principal_cache.put(cache_key, principal, generation)
+        
+        return principal
 
 
 # Global instance
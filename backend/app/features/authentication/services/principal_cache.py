@@ -0,0 +1,235 @@
+"""
+Authenticated-user (principal) cache for request authentication.
+
+``AuthService.get_current_user`` runs on every protected request. Instead of
+re-querying the user (and their program assignments) each time, it keeps a
+detached ``AuthenticatedUser`` snapshot in a per-process TTL + LRU cache
+keyed by the token subject and its issued-at stamp.
+
+Entries are invalidated after any committed change to a ``User`` row or one
+of its ``UserProgramAssignment`` rows (role changes, deactivation, password
+changes, reassignment), detected through session flush events. Bulk
+``query.update()`` statements and other worker processes are only covered
+by the TTL, which is why it is kept short.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.features.authentication.models.user import User
+from app.features.authentication.models.user_program_assignment import UserProgramAssignment
+
+_PENDING_USER_IDS_KEY = "principal_cache_user_ids"
+
+# Every mapped column except the password hash is copied into the snapshot.
+_USER_FIELDS: Tuple[str, ...] = tuple(
+    column.key for column in User.__table__.columns if column.key != "password_hash"
+)
+
+
+class ProgramAssignmentSnapshot:
+    """Detached copy of a user's program assignment."""
+
+    __slots__ = ("program_id", "is_default")
+
+    def __init__(self, program_id: str, is_default: bool):
+        self.program_id = program_id
+        self.is_default = is_default
+
+    def __repr__(self) -> str:
+        return f"<ProgramAssignmentSnapshot(program_id={self.program_id}, is_default={self.is_default})>"
+
+
+class AuthenticatedUser:
+    """
+    Detached, read-only snapshot of an authenticated user.
+
+    Exposes the same column attributes and role helpers as ``User`` (minus
+    the password hash), plus the user's program assignments, so it can be
+    shared between requests without being bound to a session.
+    """
+
+    __slots__ = _USER_FIELDS + ("program_assignments",)
+
+    def __init__(self, user: User, assignments: Iterable[UserProgramAssignment] = ()):
+        for field in _USER_FIELDS:
+            value = getattr(user, field)
+            if field == "roles":
+                value = tuple(value or ())
+            object.__setattr__(self, field, value)
+        object.__setattr__(self, "program_assignments", tuple(
+            ProgramAssignmentSnapshot(assignment.program_id, bool(assignment.is_default))
+            for assignment in assignments
+        ))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("AuthenticatedUser snapshots are read-only")
+
+    @property
+    def program_ids(self) -> Tuple[str, ...]:
+        """IDs of the programs the user is assigned to."""
+        return tuple(assignment.program_id for assignment in self.program_assignments)
+
+    @property
+    def default_program_id(self) -> Optional[str]:
+        """ID of the user's default program, if any."""
+        for assignment in self.program_assignments:
+            if assignment.is_default:
+                return assignment.program_id
+        return None
+
+    def has_program_access(self, program_id: str) -> bool:
+        """Check if the user is a super admin or assigned to the program."""
+        return self.is_super_admin() or program_id in self.program_ids
+
+    # Role helpers only read column attributes, so the model's implementations apply as-is.
+    has_role = User.has_role
+    is_super_admin = User.is_super_admin
+    is_program_admin = User.is_program_admin
+    is_program_coordinator = User.is_program_coordinator
+    is_instructor = User.is_instructor
+    is_student = User.is_student
+    is_parent = User.is_parent
+    has_admin_dashboard_access = User.has_admin_dashboard_access
+    has_mobile_app_access = User.has_mobile_app_access
+    can_access = User.can_access
+    is_full_user = User.is_full_user
+    is_profile_only = User.is_profile_only
+
+    def __repr__(self) -> str:
+        return f"<AuthenticatedUser(id={self.id}, username={self.username}, roles={list(self.roles)})>"
+
+
+class PrincipalCache:
+    """Thread-safe TTL + LRU cache of ``AuthenticatedUser`` snapshots."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, AuthenticatedUser]]" = OrderedDict()
+        self._keys_by_user: Dict[str, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    @property
+    def generation(self) -> int:
+        """
+        Invalidation counter.
+
+        Read it before loading a user and pass it to ``put`` so a snapshot
+        loaded concurrently with an invalidation is not cached.
+        """
+        return self._generation
+
+    def get(self, key: Hashable) -> Optional[AuthenticatedUser]:
+        """Return a live cached snapshot, refreshing its LRU position."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return principal
+
+    def put(self, key: Hashable, principal: AuthenticatedUser, generation: Optional[int] = None) -> None:
+        """Cache a snapshot unless an invalidation happened since ``generation``."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, principal)
+            self._keys_by_user.setdefault(principal.id, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop every cached snapshot of a user."""
+        self.invalidate_users([user_id])
+
+    def invalidate_users(self, user_ids: Iterable[str]) -> None:
+        """Drop every cached snapshot of the given users."""
+        with self._lock:
+            self._generation += 1
+            for user_id in user_ids:
+                for key in self._keys_by_user.pop(user_id, set()):
+                    self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached snapshots."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: Hashable) -> None:
+        _, principal = self._entries.pop(key)
+        keys = self._keys_by_user.get(principal.id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[principal.id]
+
+
+def _changed_user_ids(session: Session) -> Set[str]:
+    user_ids = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, User):
+            if obj.id is not None:
+                user_ids.add(obj.id)
+        elif isinstance(obj, UserProgramAssignment):
+            for value in (obj.user_id, _committed_user_id(obj)):
+                if value is not None:
+                    user_ids.add(value)
+    return user_ids
+
+
+def _committed_user_id(assignment: UserProgramAssignment) -> Optional[str]:
+    history = inspect(assignment).attrs.user_id.history
+    return history.deleted[0] if history.deleted else None
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_changed_users(session: Session, flush_context: Any, instances: Any) -> None:
+    user_ids = _changed_user_ids(session)
+    if user_ids:
+        session.info.setdefault(_PENDING_USER_IDS_KEY, set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session: Session) -> None:
+    user_ids = session.info.pop(_PENDING_USER_IDS_KEY, None)
+    if user_ids:
+        principal_cache.invalidate_users(user_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session: Session) -> None:
+    session.info.pop(_PENDING_USER_IDS_KEY, None)
+
+
+# Global instance
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS,
+    max_entries=settings.AUTH_USER_CACHE_MAX_ENTRIES,
+)
@@ -5,14 +5,15 @@ Enhanced User service for managing users with multiple roles and family relation
 from datetime import datetime
 from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, and_, or_, desc, asc
+from sqlalchemy import and_, or_, desc, asc
 
-from app.features.authentication.models.user import User
+from app.features.authentication.models.user import USER_SEARCH, User
 from app.features.authentication.models.user_relationship import UserRelationship
 from app.features.authentication.models.user_program_assignment import UserProgramAssignment
 from app.features.enrollments.models.course_enrollment import CourseEnrollment
 from app.features.students.models.student import Student
 from app.features.common.models.enums import UserRole, RelationshipType, EnrollmentStatus
+from app.features.common.services.text_search import text_search
 from app.features.courses.services.base_service import BaseService
 
 
@@ -351,16 +352,7 @@ class UserService(BaseService[User, dict, dict]):
         
         # Apply filters
         if search_params.get("search"):
-            search_term = f"%{search_params['search']}%"
-            query = query.filter(
-                or_(
-                    User.first_name.ilike(search_term),
-                    User.last_name.ilike(search_term),
-                    func.concat(User.first_name, ' ', User.last_name).ilike(search_term),
-                    User.email.ilike(search_term),
-                    User.username.ilike(search_term)
-                )
-            )
+            query = text_search.filter(query, USER_SEARCH, search_params["search"])
         
         if search_params.get("roles"):
             role_filters = search_params["roles"]
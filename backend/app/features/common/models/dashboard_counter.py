@@ -0,0 +1,54 @@
+"""
+Dashboard counter model for materialized statistics.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .database import Base
+
+
+class DashboardCounter(Base):
+    """
+    Materialized counter backing the dashboard statistics endpoints.
+
+    Each row holds one named counter for a scope: a program ID for
+    program-scoped counters or ``"global"`` for academy-wide ones. Rows are
+    kept current by session flush events and periodically reconciled
+    against the source tables, so dashboard reads are primary-key lookups.
+    """
+
+    __tablename__ = "dashboard_counters"
+
+    scope: Mapped[str] = mapped_column(
+        String(36),
+        primary_key=True,
+        comment="Program ID, or 'global' for academy-wide counters",
+    )
+
+    name: Mapped[str] = mapped_column(
+        String(150),
+        primary_key=True,
+        comment="Counter name, e.g. 'students.active' or 'media.by_type.VIDEO'",
+    )
+
+    value: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+        comment="Current counter value",
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=text("CURRENT_TIMESTAMP"),
+        onupdate=datetime.utcnow,
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        """String representation of the counter."""
+        return f"<DashboardCounter(scope={self.scope}, name={self.name}, value={self.value})>"
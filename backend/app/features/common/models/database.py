@@ -3,11 +3,53 @@ Database configuration and session management.
 """
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import Any, AsyncGenerator, Dict, Generator
 
 from app.core.config import settings
+from app.features.common.services.pool_metrics import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    instrument_pool,
+)
+
+
+def get_engine_options(database_url: str, is_async: bool = False) -> Dict[str, Any]:
+    """
+    Build pool and timeout options for an engine from settings.
+    
+    SQLite keeps SQLAlchemy's default pool (in-memory databases need a
+    single shared connection); server databases get a sized, recycled,
+    instrumented queue pool and an optional PostgreSQL statement timeout.
+    """
+    url = make_url(database_url)
+    options: Dict[str, Any] = {"pool_pre_ping": True}
+    if url.get_backend_name() == "sqlite":
+        return options
+    
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+    
+    if settings.DB_STATEMENT_TIMEOUT_MS and url.get_backend_name() == "postgresql":
+        if is_async:
+            options["connect_args"] = {
+                "server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+            }
+        else:
+            options["connect_args"] = {
+                "options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+            }
+    
+    return options
+
 
 # Create database engine
 engine = create_engine(
@@ -15,8 +57,9 @@ engine = create_engine(
     # SQLAlchemy 2.0 style
     future=True,
     echo=False,  # Set to True for SQL logging during development
-    pool_pre_ping=True,
+    **get_engine_options(settings.DATABASE_URL),
 )
+instrument_pool(engine.pool, "sync")
 
 # Create sessionmaker
 SessionLocal = sessionmaker(
@@ -26,6 +69,45 @@ SessionLocal = sessionmaker(
     future=True,
 )
 
+# Async drivers used for the parallel async engine
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """
+    Derive the async driver URL from a sync database URL.
+    
+    ``postgresql://`` / ``postgresql+psycopg2://`` become ``postgresql+asyncpg://``
+    and ``sqlite://`` becomes ``sqlite+aiosqlite://``.
+    """
+    url = make_url(database_url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver configured for database backend '{url.get_backend_name()}'")
+    return url.set(drivername=f"{url.get_backend_name()}+{driver}").render_as_string(hide_password=False)
+
+
+# Create async database engine alongside the sync one, sharing the same database
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or get_async_database_url(settings.DATABASE_URL)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=False,
+    **get_engine_options(ASYNC_DATABASE_URL, is_async=True),
+)
+instrument_pool(async_engine.sync_engine.pool, "async")
+
+# Create async sessionmaker; objects stay usable after commit since lazy
+# loads are not available on AsyncSession
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Create base class for models
 Base = declarative_base()
 
@@ -41,4 +123,15 @@ def get_db() -> Generator[Session, None, None]:
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function to get an async database session.
+    
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,102 @@
+"""
+Outbox model for durable background work.
+"""
+
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Index, Integer, JSON, String, Text, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .database import Base
+
+
+class OutboxMessage(Base):
+    """
+    Message written in the same transaction as the change that caused it.
+
+    Rows are claimed in batches by background workers (``FOR UPDATE SKIP
+    LOCKED`` on PostgreSQL), handed to the handler registered for their
+    topic and marked done, retried with backoff, or failed after too many
+    attempts.
+    """
+
+    __tablename__ = "outbox_messages"
+
+    id: Mapped[str] = mapped_column(
+        String(36),
+        primary_key=True,
+        default=lambda: str(uuid.uuid4()),
+    )
+
+    topic: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="Handler topic, e.g. 'scheduling.notification'",
+    )
+
+    payload: Mapped[dict] = mapped_column(
+        JSON,
+        nullable=False,
+        comment="Message body passed to the topic handler",
+    )
+
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        default="pending",
+        server_default=text("'pending'"),
+        comment="pending, processing, done or failed",
+    )
+
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+        comment="Number of times the message has been claimed",
+    )
+
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        comment="Earliest time the message may be claimed (retry backoff)",
+    )
+
+    locked_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime,
+        nullable=True,
+        comment="When a worker claimed the message",
+    )
+
+    locked_by: Mapped[Optional[str]] = mapped_column(
+        String(36),
+        nullable=True,
+        comment="Claim token of the worker batch holding the message",
+    )
+
+    last_error: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+    )
+
+    processed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime,
+        nullable=True,
+    )
+
+    __table_args__ = (
+        Index("idx_outbox_messages_claim", "topic", "status", "available_at"),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of the message."""
+        return f"<OutboxMessage(id={self.id}, topic={self.topic}, status={self.status})>"
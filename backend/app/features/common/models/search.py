@@ -0,0 +1,97 @@
+"""
+Text search documents.
+
+A ``SearchDocument`` names the text columns of a table that free-text
+search looks at. The columns are folded into one lower-cased expression
+(``lower(coalesce(a, '') || ' ' || coalesce(b, '') ...)``) which is
+indexed for:
+
+* PostgreSQL: a ``pg_trgm`` GIN index on the expression (substring
+  ``LIKE '%term%'`` matching) and a GIN index on
+  ``to_tsvector('simple', expression)`` (word and prefix matching, ranking);
+* SQLite: an external-content FTS5 table kept in sync by triggers, so
+  tests exercise the same search paths without PostgreSQL.
+
+Queries must use ``SearchDocument.expression`` / ``vector`` verbatim for
+the expression indexes to apply; ``text_search`` builds them.
+"""
+
+from typing import Optional, Sequence
+
+from sqlalchemy import DDL, Index, Table, event, func, literal_column
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.features.common.models.database import Base
+
+TEXT_SEARCH_CONFIG = "simple"
+
+# The trigram operator classes live in the pg_trgm extension
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+class SearchDocument:
+    """Searchable text columns of a table and their indexes."""
+
+    def __init__(self, table: Table, columns: Sequence[str], name: Optional[str] = None):
+        self.table = table
+        self.columns = tuple(columns)
+        self.name = name or f"{table.name}_search"
+
+        Index(
+            f"idx_{self.name}_trgm",
+            self.expression().label("document"),
+            postgresql_using="gin",
+            postgresql_ops={"document": "gin_trgm_ops"},
+            # Not inferred from expressions that contain literal columns
+            _table=table,
+        ).ddl_if(dialect="postgresql")
+        Index(
+            f"idx_{self.name}_tsv",
+            self.vector(),
+            postgresql_using="gin",
+            _table=table,
+        ).ddl_if(dialect="postgresql")
+
+        for statement in self._sqlite_ddl():
+            event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+        event.listen(
+            table, "before_drop", DDL(f"DROP TABLE IF EXISTS {self.fts_table}").execute_if(dialect="sqlite")
+        )
+
+    @property
+    def fts_table(self) -> str:
+        """Name of the SQLite FTS5 table."""
+        return f"{self.name}_fts"
+
+    def expression(self) -> ColumnElement:
+        """Lower-cased concatenation of the document's columns."""
+        # Literal constants (not bound parameters) so the SQL matches the index expression
+        parts = [func.coalesce(self.table.c[column], literal_column("''")) for column in self.columns]
+        document = parts[0]
+        for part in parts[1:]:
+            document = document.concat(literal_column("' '")).concat(part)
+        return func.lower(document)
+
+    def vector(self) -> ColumnElement:
+        """``tsvector`` of the document (PostgreSQL)."""
+        return func.to_tsvector(literal_column(f"'{TEXT_SEARCH_CONFIG}'"), self.expression())
+
+    def _sqlite_ddl(self):
+        table, fts = self.table.name, self.fts_table
+        columns = ", ".join(self.columns)
+        new_values = ", ".join(f"new.{column}" for column in self.columns)
+        old_values = ", ".join(f"old.{column}" for column in self.columns)
+        delete_old = (
+            f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.rowid, {old_values});"
+        )
+        insert_new = f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.rowid, {new_values});"
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({columns}, content='{table}', content_rowid='rowid')",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN {insert_new} END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN {delete_old} END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} BEGIN {delete_old} {insert_new} END",
+        ]
@@ -0,0 +1,143 @@
+"""
+Async base service class for common database operations.
+
+Mirrors the CRUD surface of the sync ``BaseService`` on an ``AsyncSession``
+so services running inside ``async def`` routes do not block the event loop.
+"""
+
+from typing import TypeVar, Generic, List, Optional, Dict, Any, Tuple, Type
+import uuid
+from sqlalchemy import select, func, or_, desc, asc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.features.common.models.base import BaseModel
+
+# Type variables for generic service
+ModelType = TypeVar("ModelType", bound=BaseModel)
+CreateSchemaType = TypeVar("CreateSchemaType")
+UpdateSchemaType = TypeVar("UpdateSchemaType")
+
+
+class AsyncBaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """Async base service class with common CRUD operations."""
+
+    def __init__(self, model: Type[ModelType]):
+        self.model = model
+
+    async def create(self,
+                     db: AsyncSession,
+                     obj_in: CreateSchemaType,
+                     created_by: Optional[str] = None) -> ModelType:
+        """Create a new object."""
+        obj_data = obj_in.dict() if hasattr(obj_in, 'dict') else dict(obj_in)
+
+        # Add audit fields if available
+        if hasattr(self.model, 'created_by') and created_by:
+            obj_data['created_by'] = created_by
+
+        # Ensure ID is generated if not provided
+        if hasattr(self.model, 'id') and 'id' not in obj_data:
+            obj_data['id'] = str(uuid.uuid4())
+
+        db_obj = self.model(**obj_data)
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def get(self, db: AsyncSession, id: str) -> Optional[ModelType]:
+        """Get object by ID."""
+        return await db.get(self.model, id)
+
+    async def get_multi(self,
+                        db: AsyncSession,
+                        skip: int = 0,
+                        limit: int = 100,
+                        filters: Optional[Dict[str, Any]] = None,
+                        sort_by: Optional[str] = None,
+                        sort_order: str = "asc") -> Tuple[List[ModelType], int]:
+        """Get multiple objects with pagination and filtering."""
+        query = select(self.model)
+
+        # Apply filters
+        if filters:
+            for field, value in filters.items():
+                if hasattr(self.model, field) and value is not None:
+                    if isinstance(value, str):
+                        # For string fields, use ILIKE for case-insensitive search
+                        query = query.where(getattr(self.model, field).ilike(f"%{value}%"))
+                    else:
+                        query = query.where(getattr(self.model, field) == value)
+
+        # Apply sorting
+        if sort_by and hasattr(self.model, sort_by):
+            sort_column = getattr(self.model, sort_by)
+            query = query.order_by(desc(sort_column) if sort_order.lower() == "desc" else asc(sort_column))
+        elif hasattr(self.model, 'created_at'):
+            # Default sort by created_at desc if available
+            query = query.order_by(desc(self.model.created_at))
+
+        return await self.paginate(db, query, skip, limit)
+
+    async def update(self,
+                     db: AsyncSession,
+                     db_obj: ModelType,
+                     obj_in: UpdateSchemaType,
+                     updated_by: Optional[str] = None) -> ModelType:
+        """Update an existing object."""
+        obj_data = obj_in.dict(exclude_unset=True) if hasattr(obj_in, 'dict') else dict(obj_in)
+
+        # Add audit fields if available
+        if hasattr(self.model, 'updated_by') and updated_by:
+            obj_data['updated_by'] = updated_by
+
+        for field, value in obj_data.items():
+            if hasattr(db_obj, field):
+                setattr(db_obj, field, value)
+
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def delete(self, db: AsyncSession, id: str) -> bool:
+        """Delete an object by ID."""
+        obj = await self.get(db, id)
+        if obj:
+            await db.delete(obj)
+            await db.commit()
+            return True
+        return False
+
+    async def count(self, db: AsyncSession) -> int:
+        """Count all objects."""
+        return await db.scalar(select(func.count()).select_from(self.model)) or 0
+
+    async def search(self,
+                     db: AsyncSession,
+                     search_term: str,
+                     search_fields: List[str],
+                     skip: int = 0,
+                     limit: int = 100) -> Tuple[List[ModelType], int]:
+        """Search across multiple fields."""
+        query = select(self.model)
+
+        search_conditions = [
+            getattr(self.model, field).ilike(f"%{search_term}%")
+            for field in search_fields
+            if hasattr(self.model, field)
+        ]
+        if search_conditions:
+            query = query.where(or_(*search_conditions))
+
+        return await self.paginate(db, query, skip, limit)
+
+    @staticmethod
+    async def paginate(db: AsyncSession, query: Select, skip: int, limit: int) -> Tuple[List[Any], int]:
+        """Run a select for one page of results plus the total row count."""
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        total = await db.scalar(count_query) or 0
+
+        result = await db.execute(query.offset(skip).limit(limit))
+        return list(result.scalars().all()), total
@@ -0,0 +1,49 @@
+"""
+HTTP conditional request helpers.
+
+Entity tags and the ``If-None-Match`` / ``If-Modified-Since`` checks shared
+by routes that answer revalidations with ``304 Not Modified``: media file
+delivery and cached curriculum trees.
+"""
+
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request
+
+
+def strong_etag(content_hash: Optional[str]) -> Optional[str]:
+    """Strong entity tag for a stored content hash."""
+    return f'"{content_hash}"' if content_hash else None
+
+
+def etag_matches(request: Request, etag: Optional[str]) -> bool:
+    """Whether ``If-None-Match`` lists ``etag`` (weak comparison) or is ``*``."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None or etag is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def is_not_modified(request: Request, etag: Optional[str], last_modified: Optional[float] = None) -> bool:
+    """
+    Whether the client's cached copy is current.
+
+    ``If-None-Match`` takes precedence over ``If-Modified-Since`` (RFC 9110
+    13.2.2) and uses weak comparison. ``last_modified`` is a POSIX timestamp.
+    """
+    if request.headers.get("if-none-match") is not None:
+        return etag_matches(request, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return int(last_modified) <= since.timestamp()
+
+    return False
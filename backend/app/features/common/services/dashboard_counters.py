@@ -0,0 +1,374 @@
+"""
+Materialized dashboard counters with incremental refresh.
+
+Features register ``CounterDefinition`` entries describing what to count
+(model, scope column, equality conditions, optional group-by or summed
+column). Session flush events turn inserts, updates and deletes of those
+models into counter deltas which are upserted into ``dashboard_counters``
+inside the same transaction. A periodic reconciliation recomputes every
+counter from the source tables to absorb drift from bulk ``query.update()``
+/ ``query.delete()`` calls and raw SQL, which bypass ORM events.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, func, inspect, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, attributes
+
+from app.features.common.models.dashboard_counter import DashboardCounter
+from app.features.common.models.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_SCOPE = "global"
+
+_PENDING_DELTAS_KEY = "dashboard_counter_deltas"
+
+# Transaction-level advisory lock held by the process running a reconcile
+_RECONCILE_LOCK_KEY = 0x64617368626F6172
+
+CounterKey = Tuple[str, str]
+
+
+def _normalize(value: Any) -> Any:
+    """Reduce enum members to their stored value for comparisons and names."""
+    return value.value if hasattr(value, "value") else value
+
+
+@dataclass(frozen=True)
+class CounterDefinition:
+    """
+    Declarative description of a materialized counter.
+
+    Attributes:
+        name: Counter name; grouped counters are stored as ``name.<group value>``
+        model: ORM model whose rows are counted
+        scope_attribute: Column holding the program ID, or None for global counters
+        conditions: ``(attribute, value)`` equality filters a row must match
+        group_by: Optional column whose value splits the counter into groups
+        sum_attribute: Optional column to sum instead of counting rows
+    """
+
+    name: str
+    model: Any
+    scope_attribute: Optional[str] = None
+    conditions: Tuple[Tuple[str, Any], ...] = ()
+    group_by: Optional[str] = None
+    sum_attribute: Optional[str] = None
+
+    @property
+    def attributes(self) -> List[str]:
+        """Model attributes this counter depends on."""
+        names = [attribute for attribute, _ in self.conditions]
+        for attribute in (self.scope_attribute, self.group_by, self.sum_attribute):
+            if attribute:
+                names.append(attribute)
+        return names
+
+    def owns(self, counter_name: str) -> bool:
+        """Whether a stored counter name belongs to this definition."""
+        if self.group_by:
+            return counter_name.startswith(f"{self.name}.")
+        return counter_name == self.name
+
+    def contribution(self, values: Dict[str, Any]) -> Optional[Tuple[CounterKey, int]]:
+        """Return the (key, amount) a row with these attribute values adds, if any."""
+        for attribute, expected in self.conditions:
+            if _normalize(values.get(attribute)) != _normalize(expected):
+                return None
+
+        key = self._key(values)
+        if key is None:
+            return None
+        amount = (values.get(self.sum_attribute) or 0) if self.sum_attribute else 1
+        return key, int(amount)
+
+    def compute(self, db: Session, *conditions: Any) -> Iterable[Tuple[CounterKey, int]]:
+        """Recompute this counter from the source table (rows matching ``conditions``) with one GROUP BY query."""
+        group_attributes = [
+            attribute for attribute in (self.scope_attribute, self.group_by) if attribute
+        ]
+        group_columns = [getattr(self.model, attribute) for attribute in group_attributes]
+        amount = (
+            func.coalesce(func.sum(getattr(self.model, self.sum_attribute)), 0)
+            if self.sum_attribute else func.count()
+        )
+
+        query = db.query(*group_columns, amount).select_from(self.model)
+        for attribute, expected in self.conditions:
+            query = query.filter(getattr(self.model, attribute) == expected)
+        if conditions:
+            query = query.filter(*conditions)
+        if group_columns:
+            query = query.group_by(*group_columns)
+
+        for row in query.all():
+            key = self._key(dict(zip(group_attributes, row)))
+            if key is not None:
+                yield key, int(row[-1] or 0)
+
+    def _key(self, values: Dict[str, Any]) -> Optional[CounterKey]:
+        if self.scope_attribute:
+            scope = values.get(self.scope_attribute)
+            if scope is None:
+                return None
+        else:
+            scope = GLOBAL_SCOPE
+
+        name = self.name
+        if self.group_by:
+            group = _normalize(values.get(self.group_by))
+            name = f"{self.name}.{group if group is not None else 'unknown'}"
+        return str(scope), name
+
+
+class DashboardCounterService:
+    """Registry, incremental maintenance and reads for dashboard counters."""
+
+    def __init__(self):
+        self._definitions: Dict[type, List[CounterDefinition]] = defaultdict(list)
+        self._installed = False
+
+    @property
+    def definitions(self) -> List[CounterDefinition]:
+        """All registered counter definitions."""
+        return [definition for group in self._definitions.values() for definition in group]
+
+    def register(self, *definitions: CounterDefinition) -> None:
+        """Register counters and start tracking their models."""
+        for definition in definitions:
+            self._definitions[definition.model].append(definition)
+            for attribute in definition.attributes:
+                # Active history makes the pre-update value available at flush time
+                # even when the attribute was expired before being changed.
+                event.listen(
+                    getattr(definition.model, attribute), "set", _noop, active_history=True
+                )
+        self._install()
+
+    def _install(self) -> None:
+        if self._installed:
+            return
+        event.listen(Session, "before_flush", self._before_flush)
+        event.listen(Session, "after_flush", self._after_flush)
+        self._installed = True
+
+    # ------------------------------------------------------------------
+    # Incremental maintenance
+    # ------------------------------------------------------------------
+
+    def _before_flush(self, session: Session, flush_context: Any, instances: Any) -> None:
+        """Collect counter deltas for the objects about to be flushed."""
+        deltas: Dict[CounterKey, int] = defaultdict(int)
+
+        for obj in session.new:
+            self._accumulate(deltas, obj, committed=False, sign=1)
+
+        for obj in session.deleted:
+            self._accumulate(deltas, obj, committed=True, sign=-1)
+
+        for obj in session.dirty:
+            if obj in session.deleted or not session.is_modified(obj, include_collections=False):
+                continue
+            self._accumulate(deltas, obj, committed=True, sign=-1)
+            self._accumulate(deltas, obj, committed=False, sign=1)
+
+        session.info[_PENDING_DELTAS_KEY] = deltas
+
+    def _after_flush(self, session: Session, flush_context: Any) -> None:
+        """Apply collected deltas in the flushing transaction."""
+        deltas = session.info.pop(_PENDING_DELTAS_KEY, None)
+        if not deltas:
+            return
+        changed = {key: delta for key, delta in deltas.items() if delta}
+        if changed:
+            self._apply_deltas(session.connection(), changed)
+
+    def add_rows(self, db: Session, model: Any, *conditions: Any) -> None:
+        """
+        Count rows inserted with set-based SQL, which bypasses flush events.
+
+        ``conditions`` must match exactly the inserted rows.
+        """
+        deltas: Dict[CounterKey, int] = defaultdict(int)
+        for definition in self._definitions.get(model, []):
+            for key, amount in definition.compute(db, *conditions):
+                deltas[key] += amount
+        changed = {key: delta for key, delta in deltas.items() if delta}
+        if changed:
+            self._apply_deltas(db.connection(), changed)
+
+    def _accumulate(self, deltas: Dict[CounterKey, int], obj: Any, committed: bool, sign: int) -> None:
+        definitions = self._definitions.get(type(obj))
+        if not definitions:
+            return
+        for definition in definitions:
+            values = {
+                attribute: _committed_value(obj, attribute) if committed else _current_value(obj, attribute)
+                for attribute in definition.attributes
+            }
+            contribution = definition.contribution(values)
+            if contribution:
+                key, amount = contribution
+                deltas[key] += sign * amount
+
+    def _apply_deltas(self, connection: Any, deltas: Dict[CounterKey, int]) -> None:
+        """Upsert ``value = value + delta`` for each counter, in key order to avoid deadlocks."""
+        table = DashboardCounter.__table__
+        rows = [
+            {"scope": scope, "name": name, "value": delta}
+            for (scope, name), delta in sorted(deltas.items())
+        ]
+
+        dialect = connection.dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            statement = insert(table).values(rows)
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.scope, table.c.name],
+                set_={
+                    "value": table.c.value + statement.excluded.value,
+                    "updated_at": func.current_timestamp(),
+                },
+            )
+            connection.execute(statement)
+            return
+
+        for row in rows:
+            result = connection.execute(
+                table.update()
+                .where(table.c.scope == row["scope"], table.c.name == row["name"])
+                .values(value=table.c.value + row["value"], updated_at=func.current_timestamp())
+            )
+            if result.rowcount == 0:
+                connection.execute(table.insert().values(**row))
+
+    # ------------------------------------------------------------------
+    # Reconciliation
+    # ------------------------------------------------------------------
+
+    def reconcile(self, db: Session) -> int:
+        """
+        Recompute every registered counter from its source table.
+
+        On PostgreSQL the counters table is locked for the duration so
+        concurrent increments queue behind the rewrite instead of being lost.
+        Only one process reconciles at a time: if another holds the
+        reconcile lock this one skips the run rather than queueing behind it.
+
+        Returns:
+            Number of counters that were corrected
+        """
+        if db.get_bind().dialect.name == "postgresql":
+            acquired = db.execute(
+                text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": _RECONCILE_LOCK_KEY}
+            ).scalar()
+            if not acquired:
+                db.rollback()
+                logger.debug("Dashboard counter reconciliation already running elsewhere; skipped")
+                return 0
+            db.execute(text("LOCK TABLE dashboard_counters IN EXCLUSIVE MODE"))
+
+        expected: Dict[CounterKey, int] = defaultdict(int)
+        for definition in self.definitions:
+            for key, value in definition.compute(db):
+                expected[key] += value
+
+        corrected = 0
+        existing = {
+            (counter.scope, counter.name): counter
+            for counter in db.query(DashboardCounter).all()
+        }
+        for key, counter in existing.items():
+            if not any(definition.owns(key[1]) for definition in self.definitions):
+                continue
+            value = expected.pop(key, 0)
+            if counter.value != value:
+                counter.value = value
+                corrected += 1
+
+        for (scope, name), value in expected.items():
+            if value:
+                db.add(DashboardCounter(scope=scope, name=name, value=value))
+                corrected += 1
+
+        db.commit()
+        if corrected:
+            logger.info(f"Dashboard counter reconciliation corrected {corrected} counters")
+        return corrected
+
+    async def reconcile_periodically(self, interval_seconds: int) -> None:
+        """Reconcile on startup and then every ``interval_seconds``, off the event loop."""
+        while True:
+            try:
+                await asyncio.to_thread(self._reconcile_with_new_session)
+            except Exception as e:
+                logger.error(f"Dashboard counter reconciliation failed: {e}")
+            await asyncio.sleep(interval_seconds)
+
+    def _reconcile_with_new_session(self) -> int:
+        db = SessionLocal()
+        try:
+            return self.reconcile(db)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get_counters(self, db: Session, scope: str = GLOBAL_SCOPE, prefix: Optional[str] = None) -> Dict[str, int]:
+        """Read all counters for a scope (optionally under a name prefix) in one query."""
+        query = db.query(DashboardCounter.name, DashboardCounter.value).filter(
+            DashboardCounter.scope == scope
+        )
+        if prefix:
+            query = query.filter(DashboardCounter.name.like(f"{prefix}%"))
+        return {name: value for name, value in query.all()}
+
+    @staticmethod
+    def grouped(counters: Dict[str, int], name: str) -> Dict[str, int]:
+        """Extract the non-zero groups of a grouped counter as ``{group: value}``."""
+        prefix = f"{name}."
+        return {
+            key[len(prefix):]: value
+            for key, value in counters.items()
+            if key.startswith(prefix) and value
+        }
+
+
+def _committed_value(obj: Any, attribute: str) -> Any:
+    """Value of an attribute as last loaded from the database."""
+    history = attributes.get_history(obj, attribute)
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    return getattr(obj, attribute)
+
+
+def _current_value(obj: Any, attribute: str) -> Any:
+    """Value an attribute will be flushed with, including scalar column defaults."""
+    value = getattr(obj, attribute)
+    if value is None and inspect(obj).pending:
+        column = inspect(type(obj)).columns.get(attribute)
+        default = column.default if column is not None else None
+        if default is not None and default.is_scalar:
+            return default.arg
+    return value
+
+
+def _noop(target: Any, value: Any, oldvalue: Any, initiator: Any) -> None:
+    """Attribute listener used only to enable active history."""
+
+
+# Global instance
+dashboard_counters = DashboardCounterService()
@@ -0,0 +1,40 @@
+"""
+Keyset pagination helpers.
+
+A page is requested with the sort values of the previous page's last row,
+encoded as an opaque cursor, instead of an offset. The sort columns must end
+with a unique column (usually the primary key) so the order is total.
+"""
+
+import base64
+import json
+from typing import Any, List, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import literal, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque cursor for a row's sort values (JSON-serializable)."""
+    return base64.urlsafe_b64encode(json.dumps(list(values)).encode()).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Sort values from a cursor; 400 if it is malformed or for another ordering."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        values = None
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+    return values
+
+
+def after_cursor(columns: Sequence[ColumnElement], cursor: str, descending: bool = False) -> ColumnElement:
+    """Condition selecting the rows that follow the cursor in the given order."""
+    values = tuple_(*(literal(value) for value in decode_cursor(cursor, len(columns))))
+    return tuple_(*columns) < values if descending else tuple_(*columns) > values
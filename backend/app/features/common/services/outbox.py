@@ -0,0 +1,256 @@
+"""
+Transactional outbox and background worker.
+
+Producers call ``outbox.enqueue`` inside their own transaction, so messages
+become visible exactly when the change that caused them commits. Workers
+claim pending messages per topic in batches (``FOR UPDATE SKIP LOCKED`` on
+PostgreSQL, so concurrent workers never share rows), pass them to the
+handler registered for the topic and mark them done or schedule a retry
+with exponential backoff. Messages held by a crashed worker are released
+after ``lock_timeout``.
+"""
+
+import asyncio
+import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.features.common.models.database import SessionLocal
+from app.features.common.models.outbox import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+PROCESSING = "processing"
+DONE = "done"
+FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class ClaimedMessage:
+    """Outbox message handed to a topic handler."""
+
+    id: str
+    payload: Dict[str, Any]
+    attempts: int
+
+
+# Handlers receive a batch and return {message_id: error} for messages that failed
+OutboxHandler = Callable[[List[ClaimedMessage]], Optional[Dict[str, str]]]
+
+
+@dataclass(frozen=True)
+class _Registration:
+    handler: OutboxHandler
+    batch_size: int
+
+
+class OutboxService:
+    """Enqueue, claim and dispatch outbox messages by topic."""
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        retry_backoff: timedelta = timedelta(seconds=30),
+        lock_timeout: timedelta = timedelta(minutes=10),
+    ):
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.lock_timeout = lock_timeout
+        self._handlers: Dict[str, _Registration] = {}
+
+    def register(self, topic: str, handler: OutboxHandler, batch_size: int = 100) -> None:
+        """Register the handler draining a topic."""
+        self._handlers[topic] = _Registration(handler, batch_size)
+
+    @property
+    def topics(self) -> List[str]:
+        return list(self._handlers)
+
+    # ------------------------------------------------------------------
+    # Producers
+    # ------------------------------------------------------------------
+
+    def enqueue(
+        self,
+        db: Session,
+        topic: str,
+        payloads: List[Dict[str, Any]],
+        available_at: Optional[datetime] = None,
+    ) -> int:
+        """
+        Add messages for a topic in the caller's transaction (not committed here).
+
+        Returns the number of messages enqueued.
+        """
+        if not payloads:
+            return 0
+        available_at = available_at or datetime.utcnow()
+        db.execute(insert(OutboxMessage), [
+            {
+                'id': str(uuid.uuid4()),
+                'topic': topic,
+                'payload': payload,
+                'status': PENDING,
+                'attempts': 0,
+                'available_at': available_at,
+            }
+            for payload in payloads
+        ])
+        return len(payloads)
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def claim(self, db: Session, topic: str, limit: int) -> List[ClaimedMessage]:
+        """Atomically claim up to ``limit`` available messages of a topic."""
+        now = datetime.utcnow()
+        token = str(uuid.uuid4())
+
+        available = db.query(OutboxMessage.id).filter(
+            OutboxMessage.topic == topic,
+            OutboxMessage.status == PENDING,
+            OutboxMessage.available_at <= now,
+        ).order_by(OutboxMessage.available_at).limit(limit).with_for_update(skip_locked=True)
+
+        # The status guard keeps the claim exclusive where SKIP LOCKED is unavailable (SQLite)
+        db.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(available.scalar_subquery()), OutboxMessage.status == PENDING)
+            .values(
+                status=PROCESSING,
+                locked_at=now,
+                locked_by=token,
+                attempts=OutboxMessage.attempts + 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        claimed = db.query(OutboxMessage.id, OutboxMessage.payload, OutboxMessage.attempts).filter(
+            OutboxMessage.locked_by == token
+        ).all()
+        db.commit()
+        return [ClaimedMessage(id, payload, attempts) for id, payload, attempts in claimed]
+
+    def complete(self, db: Session, message_ids: List[str]) -> None:
+        """Mark messages as processed."""
+        if not message_ids:
+            return
+        db.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(message_ids))
+            .values(status=DONE, processed_at=datetime.utcnow(), locked_by=None, last_error=None)
+            .execution_options(synchronize_session=False)
+        )
+
+    def fail(self, db: Session, message: ClaimedMessage, error: str) -> None:
+        """Schedule a retry with exponential backoff, or give up after ``max_attempts``."""
+        values: Dict[str, Any] = {'locked_by': None, 'last_error': error[:2000]}
+        if message.attempts >= self.max_attempts:
+            values.update(status=FAILED, processed_at=datetime.utcnow())
+        else:
+            delay = self.retry_backoff * (2 ** (message.attempts - 1))
+            values.update(status=PENDING, available_at=datetime.utcnow() + delay)
+        db.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id == message.id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+    def release_stale(self, db: Session) -> int:
+        """Return messages claimed by workers that never finished to the queue."""
+        result = db.execute(
+            update(OutboxMessage)
+            .where(
+                OutboxMessage.status == PROCESSING,
+                OutboxMessage.locked_at < datetime.utcnow() - self.lock_timeout,
+            )
+            .values(status=PENDING, locked_by=None)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return result.rowcount or 0
+
+    def process_batch(self, db: Session, topic: str) -> int:
+        """Claim one batch of a topic and run its handler. Returns the batch size."""
+        registration = self._handlers[topic]
+        messages = self.claim(db, topic, registration.batch_size)
+        if not messages:
+            return 0
+
+        try:
+            failures = registration.handler(messages) or {}
+        except Exception as e:
+            logger.exception(f"Outbox handler for {topic} failed")
+            failures = {message.id: str(e) for message in messages}
+
+        self.complete(db, [message.id for message in messages if message.id not in failures])
+        for message in messages:
+            if message.id in failures:
+                self.fail(db, message, failures[message.id])
+        db.commit()
+        return len(messages)
+
+    def drain(self, db: Session, topic: Optional[str] = None) -> int:
+        """Process batches until no message is available (for scripts and tests)."""
+        processed = 0
+        for name in [topic] if topic else self.topics:
+            while True:
+                count = self.process_batch(db, name)
+                processed += count
+                if not count:
+                    break
+        return processed
+
+    async def run_periodically(
+        self,
+        poll_interval: float,
+        concurrency: int,
+        topics: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Drain topics (all registered ones by default) with a pool of ``concurrency`` worker threads.
+
+        Each worker uses its own session; idle cycles sleep ``poll_interval``.
+        """
+        topics = self.topics if topics is None else topics
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="outbox")
+        try:
+            while True:
+                try:
+                    await loop.run_in_executor(executor, self._with_new_session, self.release_stale)
+                    processed = await asyncio.gather(*[
+                        loop.run_in_executor(executor, self._with_new_session, self.process_batch, topic)
+                        for topic in topics
+                        for _ in range(concurrency)
+                    ])
+                except Exception as e:
+                    logger.error(f"Outbox worker cycle failed: {e}")
+                    processed = []
+                if not any(processed):
+                    await asyncio.sleep(poll_interval)
+        finally:
+            executor.shutdown(wait=False)
+
+    def _with_new_session(self, func: Callable[..., int], *args: Any) -> int:
+        db = SessionLocal()
+        try:
+            return func(db, *args)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+# Global instance
+outbox = OutboxService(max_attempts=settings.OUTBOX_MAX_ATTEMPTS)
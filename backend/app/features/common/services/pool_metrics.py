@@ -0,0 +1,192 @@
+"""
+Connection pool instrumentation.
+
+Engines are created with ``InstrumentedQueuePool`` / ``InstrumentedAsyncQueuePool``,
+which time every checkout (including time spent waiting for a free
+connection) into a per-engine ``PoolMetrics``. Pool events add checkout,
+connect and invalidation counts plus connection ages. Snapshots are served
+from ``/health/db`` so pool exhaustion is visible before requests time out.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# Upper bounds (milliseconds) of the checkout wait histogram buckets
+WAIT_BUCKETS_MS: Tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class PoolMetrics:
+    """Thread-safe counters and wait-time histogram for one connection pool."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool: Optional[Pool] = None
+        self._lock = threading.Lock()
+        self._connected_at: Dict[int, float] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero all counters (pool gauges are read live)."""
+        with self._lock:
+            self.checkouts = 0
+            self.checkout_timeouts = 0
+            self.connects = 0
+            self.invalidations = 0
+            self.max_overflow_seen = 0
+            self.wait_total_ms = 0.0
+            self.wait_max_ms = 0.0
+            self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def attach(self, pool: Pool) -> None:
+        """Listen to connection lifecycle events of a pool."""
+        self.pool = pool
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "invalidate", self._on_invalidate)
+        event.listen(pool, "close", self._on_close)
+
+    def record_wait(self, wait_ms: float, timed_out: bool = False) -> None:
+        """Record how long a checkout waited for a connection."""
+        with self._lock:
+            if timed_out:
+                self.checkout_timeouts += 1
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+            for index, upper_bound in enumerate(WAIT_BUCKETS_MS):
+                if wait_ms <= upper_bound:
+                    self.wait_buckets[index] += 1
+                    break
+            else:
+                self.wait_buckets[-1] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current pool gauges, counters, wait histogram and connection ages."""
+        now = time.monotonic()
+        with self._lock:
+            ages = [now - connected_at for connected_at in self._connected_at.values()]
+            waits = sum(self.wait_buckets)
+            histogram = {
+                f"le_{upper_bound:g}ms": count
+                for upper_bound, count in zip(WAIT_BUCKETS_MS, self.wait_buckets)
+            }
+            histogram["gt_{:g}ms".format(WAIT_BUCKETS_MS[-1])] = self.wait_buckets[-1]
+            counters = {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "max_overflow_seen": self.max_overflow_seen,
+            }
+            wait = {
+                "count": waits,
+                "avg_ms": round(self.wait_total_ms / waits, 3) if waits else 0.0,
+                "max_ms": round(self.wait_max_ms, 3),
+                "histogram": histogram,
+            }
+
+        return {
+            "pool": self._pool_gauges(),
+            "counters": counters,
+            "checkout_wait": wait,
+            "connection_age_seconds": {
+                "open": len(ages),
+                "max": round(max(ages), 1) if ages else 0.0,
+                "avg": round(sum(ages) / len(ages), 1) if ages else 0.0,
+            },
+        }
+
+    def _pool_gauges(self) -> Dict[str, Any]:
+        pool = self.pool
+        if not isinstance(pool, QueuePool):
+            return {"class": type(pool).__name__ if pool else None}
+
+        size = pool.size()
+        checked_out = pool.checkedout()
+        max_overflow = pool._max_overflow
+        capacity = size + max_overflow if max_overflow >= 0 else None
+        return {
+            "class": type(pool).__name__,
+            "size": size,
+            "max_overflow": max_overflow,
+            "checked_out": checked_out,
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "capacity": capacity,
+            "exhausted": capacity is not None and checked_out >= capacity,
+        }
+
+    def _on_connect(self, dbapi_connection: Any, connection_record: Any) -> None:
+        with self._lock:
+            self.connects += 1
+            self._connected_at[id(connection_record)] = time.monotonic()
+
+    def _on_checkout(self, dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        overflow = max(self.pool.overflow(), 0) if isinstance(self.pool, QueuePool) else 0
+        with self._lock:
+            self.checkouts += 1
+            self.max_overflow_seen = max(self.max_overflow_seen, overflow)
+
+    def _on_invalidate(self, dbapi_connection: Any, connection_record: Any, exception: Any) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def _on_close(self, dbapi_connection: Any, connection_record: Any) -> None:
+        with self._lock:
+            self._connected_at.pop(id(connection_record), None)
+
+
+class _InstrumentedPoolMixin:
+    """Times ``_do_get`` so checkout waits (and timeouts) are measured."""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_wait((time.perf_counter() - started) * 1000, timed_out)
+
+    def recreate(self):
+        # Engine.dispose() swaps in a fresh pool; keep reporting into the same metrics
+        pool = super().recreate()
+        if self.metrics is not None:
+            pool.metrics = self.metrics
+            self.metrics.pool = pool
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool recording checkout wait times."""
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool recording checkout wait times."""
+
+
+def instrument_pool(pool: Pool, name: str) -> PoolMetrics:
+    """Attach metrics to a pool and register them for ``/health/db``."""
+    metrics = PoolMetrics(name)
+    metrics.attach(pool)
+    if isinstance(pool, _InstrumentedPoolMixin):
+        pool.metrics = metrics
+    pool_metrics[name] = metrics
+    return metrics
+
+
+def get_pool_metrics() -> Dict[str, Dict[str, Any]]:
+    """Snapshots of every instrumented pool, keyed by engine name."""
+    return {name: metrics.snapshot() for name, metrics in pool_metrics.items()}
+
+
+# Registry of instrumented pools by engine name
+pool_metrics: Dict[str, PoolMetrics] = {}
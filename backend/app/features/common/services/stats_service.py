@@ -0,0 +1,122 @@
+"""
+SQL-side aggregation helpers for dashboard statistics.
+
+Statistics endpoints build a filtered base query (joins, program scope,
+active-user filters) and hand it to these helpers, which push COUNT /
+GROUP BY / FILTER / CASE work into the database so only a handful of
+aggregate rows cross the wire.
+"""
+
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Query
+
+
+class StatsAggregator:
+    """Reusable aggregate queries shared by the stats endpoints."""
+
+    @staticmethod
+    def aggregate(query: Query, **expressions: Any) -> Dict[str, Any]:
+        """
+        Evaluate several aggregate expressions over a base query in one round-trip.
+
+        Example:
+            StatsAggregator.aggregate(
+                base_query,
+                total=func.count(),
+                recent=func.count().filter(Model.created_at >= cutoff),
+            )
+        """
+        labelled = [expression.label(name) for name, expression in expressions.items()]
+        row = query.with_entities(*labelled).order_by(None).one()
+        return {name: getattr(row, name) or 0 for name in expressions}
+
+    @staticmethod
+    def count_by(
+        query: Query,
+        column: Any,
+        defaults: Optional[Dict[str, int]] = None,
+        null_key: str = "unknown",
+    ) -> Dict[str, int]:
+        """
+        Count rows of a base query grouped by a column.
+
+        Enum values are normalised to their ``.value``; NULLs are reported
+        under ``null_key``. Keys in ``defaults`` are always present.
+        """
+        counts: Dict[str, int] = dict(defaults or {})
+        rows = (
+            query.with_entities(column, func.count())
+            .order_by(None)
+            .group_by(column)
+            .all()
+        )
+        for value, count in rows:
+            if value is None:
+                key = null_key
+            else:
+                key = value.value if hasattr(value, "value") else str(value)
+            counts[key] = counts.get(key, 0) + count
+        return counts
+
+    @staticmethod
+    def bucket_counts(
+        query: Query,
+        buckets: List[Tuple[str, Any]],
+        else_key: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """
+        Count rows of a base query into ordered CASE buckets.
+
+        ``buckets`` is a list of ``(label, condition)`` pairs evaluated in
+        order; rows matching no condition go to ``else_key`` (or are
+        ignored when it is None).
+        """
+        counts = {label: 0 for label, _ in buckets}
+        if else_key is not None:
+            counts.setdefault(else_key, 0)
+
+        bucket = case(*[(condition, label) for label, condition in buckets], else_=else_key)
+        rows = (
+            query.with_entities(bucket.label("bucket"), func.count())
+            .order_by(None)
+            .group_by(bucket)
+            .all()
+        )
+        for label, count in rows:
+            if label is not None:
+                counts[label] = counts.get(label, 0) + count
+        return counts
+
+    @staticmethod
+    def age_group_conditions(
+        date_of_birth_column: Any,
+        upper_bounds: List[Tuple[str, int]],
+        today: Optional[date] = None,
+    ) -> List[Tuple[str, Any]]:
+        """
+        Build age-bucket conditions as date-of-birth cutoffs.
+
+        ``upper_bounds`` is a list of ``(label, max_age)`` pairs in ascending
+        order. Comparing the birth date against precomputed cutoffs keeps the
+        expression index-friendly and portable across PostgreSQL and SQLite.
+        """
+        today = today or date.today()
+        conditions = []
+        for label, max_age in upper_bounds:
+            conditions.append((label, date_of_birth_column > _years_before(today, max_age + 1)))
+        return conditions
+
+
+def _years_before(day: date, years: int) -> date:
+    """Return the same calendar day ``years`` earlier, clamping Feb 29."""
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        return day.replace(year=day.year - years, day=28)
+
+
+# Global instance
+stats_aggregator = StatsAggregator()
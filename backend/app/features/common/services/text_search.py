@@ -0,0 +1,109 @@
+"""
+Free-text search over ``SearchDocument``s.
+
+One query builder for every list endpoint that takes a ``search`` term:
+
+* PostgreSQL: ``document LIKE '%term%'`` (served by the trigram index; terms
+  shorter than three characters cannot use it and rely on the next clause)
+  OR ``to_tsvector(document) @@ 'word1:* & word2:*'`` (served by the tsvector
+  index). Results can be ranked by trigram similarity plus ``ts_rank``.
+* SQLite: an FTS5 ``MATCH`` with prefix tokens, ranked by ``bm25``.
+* Anything else: ``ILIKE`` on the document expression.
+"""
+
+import re
+from typing import List, Optional
+
+from sqlalchemy import column, desc, func, literal, literal_column, or_, select, table, true
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.features.common.models.search import TEXT_SEARCH_CONFIG, SearchDocument
+
+TRIGRAM_MIN_LENGTH = 3
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def search_tokens(term: str) -> List[str]:
+    """Lower-cased word tokens of a search term."""
+    return _TOKEN.findall(term.lower())
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class TextSearchService:
+    """Build search conditions and ranking for search documents."""
+
+    def condition(self, document: SearchDocument, term: str, dialect: str) -> ColumnElement:
+        """Condition matching rows whose document contains the term."""
+        term = (term or "").strip().lower()
+        if not term:
+            return true()
+        tokens = search_tokens(term)
+
+        if dialect == "postgresql":
+            clauses = []
+            if len(term) >= TRIGRAM_MIN_LENGTH or not tokens:
+                clauses.append(document.expression().like(f"%{_escape_like(term)}%", escape="\\"))
+            if tokens:
+                clauses.append(document.vector().op("@@")(self._tsquery(tokens)))
+            return or_(*clauses)
+
+        if dialect == "sqlite" and tokens:
+            fts = table(document.fts_table, column("rowid"))
+            matches = select(fts.c.rowid).where(
+                literal_column(document.fts_table).op("MATCH")(self._fts_query(tokens))
+            )
+            return literal_column(f"{document.table.name}.rowid").in_(matches)
+
+        return document.expression().ilike(f"%{_escape_like(term)}%", escape="\\")
+
+    def rank(self, document: SearchDocument, term: str, dialect: str) -> ColumnElement:
+        """Relevance of a row for the term (higher is better)."""
+        term = (term or "").strip().lower()
+        tokens = search_tokens(term)
+        if not tokens:
+            return literal(0)
+
+        if dialect == "postgresql":
+            return func.similarity(document.expression(), term) + func.ts_rank(
+                document.vector(), self._tsquery(tokens)
+            )
+
+        if dialect == "sqlite":
+            fts = table(document.fts_table, column("rowid"), column("rank"))
+            # FTS5 rank is bm25, where lower is better
+            return -select(fts.c.rank).where(
+                fts.c.rowid == literal_column(f"{document.table.name}.rowid"),
+                literal_column(document.fts_table).op("MATCH")(self._fts_query(tokens)),
+            ).scalar_subquery()
+
+        return literal(0)
+
+    def filter(self, query: Query, document: SearchDocument, term: Optional[str], order_by_rank: bool = False) -> Query:
+        """Restrict an ORM query to rows matching the term, optionally best matches first."""
+        if not term or not term.strip():
+            return query
+        dialect = query.session.get_bind().dialect.name
+        query = query.filter(self.condition(document, term, dialect))
+        if order_by_rank:
+            query = query.order_by(desc(self.rank(document, term, dialect)))
+        return query
+
+    @staticmethod
+    def _tsquery(tokens: List[str]) -> ColumnElement:
+        # Every word must match; each as a prefix so partially typed words match
+        return func.to_tsquery(
+            literal_column(f"'{TEXT_SEARCH_CONFIG}'"), " & ".join(f"{token}:*" for token in tokens)
+        )
+
+    @staticmethod
+    def _fts_query(tokens: List[str]) -> str:
+        return " ".join(f'"{token}"*' for token in tokens)
+
+
+# Global instance
+text_search = TextSearchService()
@@ -34,6 +34,28 @@ class Lesson(BaseModel):
         comment="Reference to parent section",
     )
     
+    # Denormalized scope (kept in sync by app.features.curricula.services.program_scope)
+    curriculum_id: Mapped[Optional[str]] = mapped_column(
+        String(36),
+        ForeignKey("curricula.id"),
+        nullable=True,
+        comment="Owning curriculum (denormalized from the hierarchy)",
+    )
+    
+    program_id: Mapped[Optional[str]] = mapped_column(
+        String(36),
+        ForeignKey("programs.id"),
+        nullable=True,
+        comment="Owning program (denormalized from the hierarchy)",
+    )
+    
+    # Materialized path (kept in sync by app.features.curricula.services.ancestry)
+    ancestry_path: Mapped[Optional[str]] = mapped_column(
+        String(255),
+        nullable=True,
+        comment="IDs of the ancestors from the program down to the parent, '/'-separated",
+    )
+    
     # Lesson Identification
     lesson_id: Mapped[str] = mapped_column(
         String(20),
@@ -183,6 +205,9 @@ class Lesson(BaseModel):
     
     # Indexes for performance
     __table_args__ = (
+        Index("idx_lessons_program_id", "program_id"),
+        Index("idx_lessons_curriculum_id", "curriculum_id"),
+        Index("idx_lessons_ancestry_path", "ancestry_path", postgresql_ops={"ancestry_path": "varchar_pattern_ops"}),
         Index("idx_lessons_section_id", "section_id"),
         Index("idx_lessons_lesson_id", "lesson_id"),
         Index("idx_lessons_title", "title"),
@@ -41,30 +41,16 @@ class LessonService(BaseService[Lesson, LessonCreate, LessonUpdate]):
                      program_context: Optional[str] = None) -> LessonResponse:
         """Create a new lesson."""
         # Verify section exists and program access
-        section_query = db.query(Section).join(Module).join(Level).join(Curriculum).join(Course).filter(
-            Section.id == lesson_data.section_id
-        )
+        section_query = db.query(Section).filter(Section.id == lesson_data.section_id)
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            section_query = section_query.filter(Course.program_id == program_context)
+            section_query = section_query.filter(Section.program_id == program_context)
         
         section = section_query.first()
         if not section:
             raise ValueError(f"Section with ID '{lesson_data.section_id}' not found or access denied")
         
-        # 🔒 PROGRAM CONTEXT VALIDATION
-        if program_context:
-            module = db.query(Module).filter(Module.id == section.module_id).first()
-            if module:
-                level = db.query(Level).filter(Level.id == module.level_id).first()
-                if level:
-                    curriculum = db.query(Curriculum).filter(Curriculum.id == level.curriculum_id).first()
-                    if curriculum:
-                        course = db.query(Course).filter(Course.id == curriculum.course_id).first()
-                        if course and course.program_id != program_context:
-                            raise PermissionError(f"Cannot create lesson for section in different program context")
-        
         # Check for duplicate sequence in the same section
         existing_lesson = db.query(Lesson).filter(
             and_(
@@ -88,9 +74,7 @@ class LessonService(BaseService[Lesson, LessonCreate, LessonUpdate]):
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            query = query.join(Section).join(Module).join(Level).join(Curriculum).join(Course).filter(
-                Course.program_id == program_context
-            )
+            query = query.filter(Lesson.program_id == program_context)
         
         lesson = query.first()
         if not lesson:
@@ -105,9 +89,7 @@ class LessonService(BaseService[Lesson, LessonCreate, LessonUpdate]):
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            query = query.join(Section).join(Module).join(Level).join(Curriculum).join(Course).filter(
-                Course.program_id == program_context
-            )
+            query = query.filter(Lesson.program_id == program_context)
         
         lesson = query.first()
         if not lesson:
@@ -122,14 +104,18 @@ class LessonService(BaseService[Lesson, LessonCreate, LessonUpdate]):
                     per_page: int = 20,
                     program_context: Optional[str] = None) -> Tuple[List[LessonResponse], int]:
         """List lessons with pagination and filtering."""
-        query = db.query(Lesson).join(Section).join(Module).join(Level).join(Curriculum).join(Course).join(Program)
+        query = db.query(Lesson)
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            query = query.filter(Course.program_id == program_context)
+            query = query.filter(Lesson.program_id == program_context)
         
         # Apply filters
         if search_params:
+            # Only name search and the module/level/course filters need the parent tables
+            if search_params.search or search_params.module_id or search_params.level_id or search_params.course_id:
+                query = query.join(Section).join(Module).join(Level).join(Curriculum).join(Course).join(Program)
+            
             if search_params.search:
                 search_term = f"%{search_params.search}%"
                 query = query.filter(
@@ -157,13 +143,13 @@ class LessonService(BaseService[Lesson, LessonCreate, LessonUpdate]):
                 query = query.filter(Module.level_id == search_params.level_id)
             
             if search_params.curriculum_id:
-                query = query.filter(Level.curriculum_id == search_params.curriculum_id)
+                query = query.filter(Lesson.curriculum_id == search_params.curriculum_id)
             
             if search_params.course_id:
                 query = query.filter(Curriculum.course_id == search_params.course_id)
             
             if search_params.program_id:
-                query = query.filter(Course.program_id == search_params.program_id)
+                query = query.filter(Lesson.program_id == search_params.program_id)
             
             if search_params.content_type:
                 query = query.filter(Lesson.content_type == search_params.content_type)
@@ -215,9 +201,7 @@ class LessonService(BaseService[Lesson, LessonCreate, LessonUpdate]):
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            query = query.join(Section).join(Module).join(Level).join(Curriculum).join(Course).filter(
-                Course.program_id == program_context
-            )
+            query = query.filter(Lesson.program_id == program_context)
         
         lesson = query.first()
         if not lesson:
@@ -238,29 +222,15 @@ class LessonService(BaseService[Lesson, LessonCreate, LessonUpdate]):
         
         # Verify new section exists and program access if being updated
         if lesson_data.section_id and lesson_data.section_id != lesson.section_id:
-            section_query = db.query(Section).join(Module).join(Level).join(Curriculum).join(Course).filter(
-                Section.id == lesson_data.section_id
-            )
+            section_query = db.query(Section).filter(Section.id == lesson_data.section_id)
             
             # 🔒 PROGRAM CONTEXT FILTERING
             if program_context:
-                section_query = section_query.filter(Course.program_id == program_context)
+                section_query = section_query.filter(Section.program_id == program_context)
             
             section = section_query.first()
             if not section:
                 raise ValueError(f"Section with ID '{lesson_data.section_id}' not found or access denied")
-            
-            # 🔒 PROGRAM CONTEXT VALIDATION
-            if program_context:
-                module = db.query(Module).filter(Module.id == section.module_id).first()
-                if module:
-                    level = db.query(Level).filter(Level.id == module.level_id).first()
-                    if level:
-                        curriculum = db.query(Curriculum).filter(Curriculum.id == level.curriculum_id).first()
-                        if curriculum:
-                            course = db.query(Course).filter(Course.id == curriculum.course_id).first()
-                            if course and course.program_id != program_context:
-                                raise PermissionError(f"Cannot move lesson to section in different program context")
         
         # Update lesson
         updated_lesson = self.update(db, lesson, lesson_data, updated_by)
@@ -274,9 +244,7 @@ class LessonService(BaseService[Lesson, LessonCreate, LessonUpdate]):
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            lesson_query = lesson_query.join(Section).join(Module).join(Level).join(Curriculum).join(Course).filter(
-                Course.program_id == program_context
-            )
+            lesson_query = lesson_query.filter(Lesson.program_id == program_context)
         
         lesson = lesson_query.first()
         if not lesson:
@@ -295,13 +263,11 @@ class LessonService(BaseService[Lesson, LessonCreate, LessonUpdate]):
                               program_context: Optional[str] = None) -> Tuple[List[LessonResponse], int]:
         """Get lessons for a specific section."""
         # Verify section access first
-        section_query = db.query(Section).join(Module).join(Level).join(Curriculum).join(Course).filter(
-            Section.id == section_id
-        )
+        section_query = db.query(Section).filter(Section.id == section_id)
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            section_query = section_query.filter(Course.program_id == program_context)
+            section_query = section_query.filter(Section.program_id == program_context)
         
         section = section_query.first()
         if not section:
@@ -332,9 +298,7 @@ class LessonService(BaseService[Lesson, LessonCreate, LessonUpdate]):
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            query = query.join(Section).join(Module).join(Level).join(Curriculum).join(Course).filter(
-                Course.program_id == program_context
-            )
+            query = query.filter(Lesson.program_id == program_context)
         
         lesson = query.first()
         if not lesson:
@@ -373,9 +337,7 @@ class LessonService(BaseService[Lesson, LessonCreate, LessonUpdate]):
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            original_query = original_query.join(Section).join(Module).join(Level).join(Curriculum).join(Course).filter(
-                Course.program_id == program_context
-            )
+            original_query = original_query.filter(Lesson.program_id == program_context)
         
         original = original_query.first()
         if not original:
@@ -383,30 +345,16 @@ class LessonService(BaseService[Lesson, LessonCreate, LessonUpdate]):
         
         # Determine target section with program context validation
         target_section_id = duplicate_data.target_section_id or original.section_id
-        target_section_query = db.query(Section).join(Module).join(Level).join(Curriculum).join(Course).filter(
-            Section.id == target_section_id
-        )
+        target_section_query = db.query(Section).filter(Section.id == target_section_id)
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            target_section_query = target_section_query.filter(Course.program_id == program_context)
+            target_section_query = target_section_query.filter(Section.program_id == program_context)
         
         target_section = target_section_query.first()
         if not target_section:
             raise ValueError(f"Target section with ID '{target_section_id}' not found or access denied")
         
-        # 🔒 PROGRAM CONTEXT VALIDATION
-        if program_context:
-            module = db.query(Module).filter(Module.id == target_section.module_id).first()
-            if module:
-                level = db.query(Level).filter(Level.id == module.level_id).first()
-                if level:
-                    curriculum = db.query(Curriculum).filter(Curriculum.id == level.curriculum_id).first()
-                    if curriculum:
-                        course = db.query(Course).filter(Course.id == curriculum.course_id).first()
-                        if course and course.program_id != program_context:
-                            raise PermissionError(f"Cannot duplicate lesson to section in different program context")
-        
         # Create new lesson
         new_lesson_data = {
             "title": duplicate_data.new_title,
@@ -450,9 +398,7 @@ class LessonService(BaseService[Lesson, LessonCreate, LessonUpdate]):
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            lessons_query = lessons_query.join(Section).join(Module).join(Level).join(Curriculum).join(Course).filter(
-                Course.program_id == program_context
-            )
+            lessons_query = lessons_query.filter(Lesson.program_id == program_context)
         
         lessons = lessons_query.all()
         
@@ -504,10 +450,10 @@ class LessonService(BaseService[Lesson, LessonCreate, LessonUpdate]):
         """Bulk update lesson status."""
         # Validate all lessons are accessible in current program context
         if program_context:
-            accessible_lessons = db.query(Lesson.id).join(Section).join(Module).join(Level).join(Curriculum).join(Course).filter(
+            accessible_lessons = db.query(Lesson.id).filter(
                 and_(
                     Lesson.id.in_(status_data.lesson_ids),
-                    Course.program_id == program_context
+                    Lesson.program_id == program_context
                 )
             ).all()
             
@@ -529,11 +475,11 @@ class LessonService(BaseService[Lesson, LessonCreate, LessonUpdate]):
     def get_lesson_stats(self, db: Session, program_context: Optional[str] = None) -> LessonStatsResponse:
         """Get lesson statistics."""
         # Base query with program context filtering
-        base_query = db.query(Lesson).join(Section).join(Module).join(Level).join(Curriculum).join(Course)
+        base_query = db.query(Lesson)
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            base_query = base_query.filter(Course.program_id == program_context)
+            base_query = base_query.filter(Lesson.program_id == program_context)
         
         # Total lessons
         total_lessons = base_query.count()
@@ -542,10 +488,10 @@ class LessonService(BaseService[Lesson, LessonCreate, LessonUpdate]):
         status_query = db.query(
             Lesson.status,
             func.count(Lesson.id)
-        ).join(Section).join(Module).join(Level).join(Curriculum).join(Course)
+        )
         
         if program_context:
-            status_query = status_query.filter(Course.program_id == program_context)
+            status_query = status_query.filter(Lesson.program_id == program_context)
         
         status_stats = status_query.group_by(Lesson.status).all()
         lessons_by_status = dict(status_stats)
@@ -554,10 +500,10 @@ class LessonService(BaseService[Lesson, LessonCreate, LessonUpdate]):
         content_type_query = db.query(
             Lesson.content_type,
             func.count(Lesson.id)
-        ).join(Section).join(Module).join(Level).join(Curriculum).join(Course)
+        )
         
         if program_context:
-            content_type_query = content_type_query.filter(Course.program_id == program_context)
+            content_type_query = content_type_query.filter(Lesson.program_id == program_context)
         
         content_type_stats = content_type_query.group_by(Lesson.content_type).all()
         lessons_by_content_type = dict(content_type_stats)
@@ -566,10 +512,10 @@ class LessonService(BaseService[Lesson, LessonCreate, LessonUpdate]):
         section_query = db.query(
             Section.name,
             func.count(Lesson.id)
-        ).join(Section).join(Module).join(Level).join(Curriculum).join(Course)
+        ).select_from(Lesson).join(Section)
         
         if program_context:
-            section_query = section_query.filter(Course.program_id == program_context)
+            section_query = section_query.filter(Lesson.program_id == program_context)
         
         section_stats = section_query.group_by(Section.name).all()
         lessons_by_section = dict(section_stats)
@@ -578,21 +524,21 @@ class LessonService(BaseService[Lesson, LessonCreate, LessonUpdate]):
         program_query = db.query(
             Program.name,
             func.count(Lesson.id)
-        ).join(Section).join(Module).join(Level).join(Curriculum).join(Course).join(Program)
+        ).select_from(Lesson).join(Program, Program.id == Lesson.program_id)
         
         if program_context:
-            program_query = program_query.filter(Course.program_id == program_context)
+            program_query = program_query.filter(Lesson.program_id == program_context)
         
         program_stats = program_query.group_by(Program.name).all()
         lessons_by_program = dict(program_stats)
         
         # Average duration
-        duration_query = db.query(func.avg(Lesson.duration_minutes)).join(Section).join(Module).join(Level).join(Curriculum).join(Course).filter(
+        duration_query = db.query(func.avg(Lesson.duration_minutes)).filter(
             Lesson.duration_minutes.isnot(None)
         )
         
         if program_context:
-            duration_query = duration_query.filter(Course.program_id == program_context)
+            duration_query = duration_query.filter(Lesson.program_id == program_context)
         
         avg_duration = duration_query.scalar() or 0
         
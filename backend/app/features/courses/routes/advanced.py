@@ -3,12 +3,16 @@ Advanced API routes for curriculum management.
 Includes tree navigation, bulk operations, and advanced search.
 """
 
+import json
 from typing import Annotated, List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.features.common.models.database import get_db
 from app.features.authentication.routes.auth import get_current_active_user
+from app.middleware import create_program_filter_dependency
 from app.features.courses.schemas.advanced import (
     FullCurriculumTreeResponse,
     CurriculumSearchRequest,
@@ -20,13 +24,18 @@ from app.features.courses.schemas.advanced import (
     CurriculumExportRequest,
     CurriculumImportRequest,
     CurriculumTemplateResponse,
+    ExportFormat,
 )
 from app.features.courses.schemas.common import BulkActionResponse
 from app.features.courses.services.advanced_service import advanced_service
+from app.features.courses.services.curriculum_tree import iter_tree_json
 
 
 router = APIRouter()
 
+# Create program filter dependency with authentication integration
+get_program_filter = create_program_filter_dependency(get_current_active_user)
+
 
 @router.get("/tree/full", response_model=FullCurriculumTreeResponse)
 async def get_full_curriculum_tree(
@@ -43,7 +52,7 @@ async def get_full_curriculum_tree(
     Get complete curriculum tree with all nested levels.
     
     Returns hierarchical structure from programs down to individual lessons
-    with optional filtering and depth control.
+    with optional filtering and depth control. The JSON body is streamed.
     """
     try:
         tree = advanced_service.get_full_curriculum_tree(
@@ -55,7 +64,7 @@ async def get_full_curriculum_tree(
             include_media=include_media,
             max_depth=max_depth
         )
-        return tree
+        return StreamingResponse(iter_tree_json(tree), media_type="application/json")
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -230,25 +239,31 @@ async def get_curriculum_dependencies(
         )
 
 
-@router.post("/export", response_model=Dict[str, Any])
+@router.post("/export")
 async def export_curriculum(
     export_request: CurriculumExportRequest,
     db: Annotated[Session, Depends(get_db)],
+    program_context: Annotated[Optional[str], Depends(get_program_filter)],
     current_user: Annotated[dict, Depends(get_current_active_user)]
 ):
     """
-    Export curriculum data in various formats.
-    
-    Supports exporting programs, courses, or curricula with all nested content
-    in JSON, CSV, or custom formats.
+    Export a program, course, curriculum or part of a curriculum with all nested content.
+
+    Streams newline-delimited JSON (``json``/``ndjson``) or MessagePack
+    (``msgpack``) records, parents first, that ``/import`` accepts.
     """
     try:
-        export_data = advanced_service.export_curriculum(
+        exporter = advanced_service.export_curriculum(
             db=db,
             export_request=export_request,
-            current_user_id=current_user["id"]
+            current_user_id=current_user["id"],
+            program_context=program_context
+        )
+    except PermissionError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e)
         )
-        return export_data
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -259,25 +274,33 @@ async def export_curriculum(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error exporting curriculum: {str(e)}"
         )
+    return StreamingResponse(
+        exporter.iter_bytes(),
+        media_type=exporter.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{exporter.file_name}"'},
+    )
 
 
 @router.post("/import", response_model=BulkActionResponse)
 async def import_curriculum(
     import_request: CurriculumImportRequest,
     db: Annotated[Session, Depends(get_db)],
+    program_context: Annotated[Optional[str], Depends(get_program_filter)],
     current_user: Annotated[dict, Depends(get_current_active_user)]
 ):
     """
-    Import curriculum data from external sources.
-    
-    Supports importing curriculum structures from JSON, CSV, or other formats
-    with validation and conflict resolution.
+    Import curriculum data exported by ``/export``.
+
+    ``data`` holds NDJSON text or base64-encoded MessagePack; large exports
+    should use ``/import/file``. Records get new IDs; ``custom_mappings``
+    attach them to existing parents. Failed records are reported individually.
     """
     try:
         result = advanced_service.import_curriculum(
             db=db,
             import_request=import_request,
-            current_user_id=current_user["id"]
+            current_user_id=current_user["id"],
+            program_context=program_context
         )
         
         return BulkActionResponse(
@@ -288,6 +311,71 @@ async def import_curriculum(
             total_failed=result["total_failed"]
         )
         
+    except PermissionError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error importing curriculum: {str(e)}"
+        )
+
+
+
+@router.post("/import/file", response_model=BulkActionResponse)
+async def import_curriculum_file(
+    db: Annotated[Session, Depends(get_db)],
+    program_context: Annotated[Optional[str], Depends(get_program_filter)],
+    current_user: Annotated[dict, Depends(get_current_active_user)],
+    file: UploadFile = File(..., description="NDJSON or MessagePack export"),
+    format: ExportFormat = Form(ExportFormat.NDJSON),
+    target_program_id: str = Form(...),
+    merge_strategy: str = Form("create_new"),
+    validate_only: bool = Form(False),
+    custom_mappings: str = Form("{}", description="JSON object mapping source IDs to existing IDs"),
+):
+    """
+    Import an exported file of any size.
+
+    The upload is read as a stream and inserted in batches; failed records
+    are reported individually.
+    """
+    try:
+        mappings = json.loads(custom_mappings)
+        if not isinstance(mappings, dict):
+            raise ValueError
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="custom_mappings must be a JSON object"
+        )
+
+    try:
+        result = await run_in_threadpool(
+            advanced_service.import_curriculum_stream,
+            db,
+            file.file,
+            import_format=format,
+            target_program_id=target_program_id,
+            merge_strategy=merge_strategy,
+            validate_only=validate_only,
+            custom_mappings=mappings,
+            current_user_id=current_user["id"],
+            program_context=program_context,
+        )
+        return BulkActionResponse(**result)
+    except PermissionError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e)
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -41,6 +41,8 @@ class ExportFormat(str, Enum):
     XLSX = "xlsx"
     PDF = "pdf"
     SCORM = "scorm"
+    NDJSON = "ndjson"
+    MSGPACK = "msgpack"
 
 
 # Tree Navigation Schemas
@@ -3,21 +3,29 @@ Advanced service layer for curriculum management.
 Handles complex operations like tree navigation, bulk operations, and analytics.
 """
 
-from typing import List, Optional, Dict, Any, Tuple
+from typing import BinaryIO, List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
+import base64
+import binascii
+import io
 import json
 import time
-from collections import defaultdict
 
+from app.features.common.models.enums import CurriculumStatus
 from app.features.programs.models.program import Program
 from app.features.courses.models import Course
-from app.features.curricula.models import Curriculum, Level, Module, Section
-from app.features.content.models import Lesson, AssessmentRubric, ContentVersion
-from app.features.equipment.models import EquipmentRequirement
+from app.features.curricula.models import Curriculum
+from app.features.content.models import Lesson, ContentVersion
 from app.features.media.models import MediaLibrary
+from app.features.courses.schemas.common import CurriculumStatusEnum
+from app.features.courses.services.curriculum_transfer import (
+    CurriculumExporter, CurriculumImporter, read_records
+)
+from app.features.courses.services.curriculum_tree import CurriculumTreeLoader
+from app.features.curricula.services.ancestry import join_path, load_breadcrumbs
 from app.features.courses.schemas.advanced import (
-    FullCurriculumTreeResponse, TreeNode, CurriculumSearchRequest,
+    FullCurriculumTreeResponse, CurriculumSearchRequest,
     CurriculumSearchResponse, SearchResult, SearchFacet, BulkCurriculumOperationRequest,
     CurriculumAnalyticsResponse, EntityStats, UsageStats, StudentProgress,
     CurriculumPathResponse, PathNode, CurriculumDependencyResponse, Dependency,
@@ -39,28 +47,17 @@ class AdvancedService:
         include_media: bool = True,
         max_depth: int = 10
     ) -> FullCurriculumTreeResponse:
-        """Get complete curriculum tree with all nested levels."""
-        start_time = time.time()
-        
-        # Build query for programs
-        programs_query = db.query(Program)
-        if program_id:
-            programs_query = programs_query.filter(Program.id == program_id)
-        if not include_inactive:
-            programs_query = programs_query.filter(Program.status == "active")
-        
-        programs = programs_query.order_by(Program.display_order).all()
-        
-        # Build tree structure
-        tree_programs = []
-        counters = defaultdict(int)
-        
-        for program in programs:
-            program_node = self._build_program_tree_node(
-                db, program, include_inactive, include_assessments, 
-                include_equipment, include_media, max_depth, counters
-            )
-            tree_programs.append(program_node)
+        """Get complete curriculum tree with all nested levels (one query per hierarchy level)."""
+        loader = CurriculumTreeLoader(
+            db,
+            include_inactive=include_inactive,
+            include_assessments=include_assessments,
+            include_equipment=include_equipment,
+            include_media=include_media,
+            max_depth=max_depth
+        )
+        tree_programs = loader.load(program_id)
+        counters = loader.counters
         
         return FullCurriculumTreeResponse(
             programs=tree_programs,
@@ -76,359 +73,6 @@ class AdvancedService:
             generated_at=datetime.utcnow()
         )
 
-    def _build_program_tree_node(
-        self, db: Session, program: Program, include_inactive: bool,
-        include_assessments: bool, include_equipment: bool, include_media: bool,
-        max_depth: int, counters: Dict[str, int], current_depth: int = 0
-    ) -> TreeNode:
-        """Build tree node for a program with all children."""
-        counters["programs"] += 1
-        
-        if current_depth >= max_depth:
-            return TreeNode(
-                id=program.id,
-                name=program.name,
-                type="program",
-                status=program.status,
-                sequence=program.display_order,
-                children=[],
-                metadata={
-                    "description": program.description,
-                    "created_at": program.created_at.isoformat(),
-                    "max_depth_reached": True
-                }
-            )
-        
-        # Get courses for this program
-        courses_query = db.query(Course).filter(Course.program_id == program.id)
-        if not include_inactive:
-            courses_query = courses_query.filter(Course.status == "active")
-        courses = courses_query.order_by(Course.display_order).all()
-        
-        course_nodes = []
-        for course in courses:
-            course_node = self._build_course_tree_node(
-                db, course, include_inactive, include_assessments,
-                include_equipment, include_media, max_depth, counters, current_depth + 1
-            )
-            course_nodes.append(course_node)
-        
-        return TreeNode(
-            id=program.id,
-            name=program.name,
-            type="program",
-            status=program.status,
-            sequence=program.display_order,
-            children=course_nodes,
-            metadata={
-                "description": program.description,
-                "created_at": program.created_at.isoformat(),
-                "total_courses": len(course_nodes)
-            }
-        )
-
-    def _build_course_tree_node(
-        self, db: Session, course: Course, include_inactive: bool,
-        include_assessments: bool, include_equipment: bool, include_media: bool,
-        max_depth: int, counters: Dict[str, int], current_depth: int = 0
-    ) -> TreeNode:
-        """Build tree node for a course with all children."""
-        counters["courses"] += 1
-        
-        if current_depth >= max_depth:
-            return TreeNode(
-                id=course.id,
-                name=course.name,
-                type="course",
-                status=course.status,
-                sequence=course.display_order,
-                children=[],
-                metadata={
-                    "description": course.description,
-                    "duration_weeks": course.duration_weeks,
-                    "max_depth_reached": True
-                }
-            )
-        
-        # Get curricula for this course
-        curricula_query = db.query(Curriculum).filter(Curriculum.course_id == course.id)
-        if not include_inactive:
-            curricula_query = curricula_query.filter(Curriculum.status == "active")
-        curricula = curricula_query.order_by(Curriculum.display_order).all()
-        
-        curriculum_nodes = []
-        for curriculum in curricula:
-            curriculum_node = self._build_curriculum_tree_node(
-                db, curriculum, include_inactive, include_assessments,
-                include_equipment, include_media, max_depth, counters, current_depth + 1
-            )
-            curriculum_nodes.append(curriculum_node)
-        
-        return TreeNode(
-            id=course.id,
-            name=course.name,
-            type="course",
-            status=course.status,
-            sequence=course.display_order,
-            children=curriculum_nodes,
-            metadata={
-                "description": course.description,
-                "duration_weeks": course.duration_weeks,
-                "total_curricula": len(curriculum_nodes)
-            }
-        )
-
-    def _build_curriculum_tree_node(
-        self, db: Session, curriculum: Curriculum, include_inactive: bool,
-        include_assessments: bool, include_equipment: bool, include_media: bool,
-        max_depth: int, counters: Dict[str, int], current_depth: int = 0
-    ) -> TreeNode:
-        """Build tree node for a curriculum with all children."""
-        counters["curricula"] += 1
-        
-        if current_depth >= max_depth:
-            return TreeNode(
-                id=curriculum.id,
-                name=curriculum.name,
-                type="curriculum",
-                status=curriculum.status,
-                sequence=curriculum.display_order,
-                children=[],
-                metadata={
-                    "description": curriculum.description,
-                    "difficulty_level": curriculum.difficulty_level,
-                    "max_depth_reached": True
-                }
-            )
-        
-        # Get levels for this curriculum
-        levels_query = db.query(Level).filter(Level.curriculum_id == curriculum.id)
-        if not include_inactive:
-            levels_query = levels_query.filter(Level.status == "active")
-        levels = levels_query.order_by(Level.sequence).all()
-        
-        level_nodes = []
-        for level in levels:
-            level_node = self._build_level_tree_node(
-                db, level, include_inactive, include_assessments,
-                include_equipment, include_media, max_depth, counters, current_depth + 1
-            )
-            level_nodes.append(level_node)
-        
-        return TreeNode(
-            id=curriculum.id,
-            name=curriculum.name,
-            type="curriculum",
-            status=curriculum.status,
-            sequence=curriculum.display_order,
-            children=level_nodes,
-            metadata={
-                "description": curriculum.description,
-                "difficulty_level": curriculum.difficulty_level,
-                "min_age_months": curriculum.min_age_months,
-                "max_age_months": curriculum.max_age_months,
-                "total_levels": len(level_nodes)
-            }
-        )
-
-    def _build_level_tree_node(
-        self, db: Session, level: Level, include_inactive: bool,
-        include_assessments: bool, include_equipment: bool, include_media: bool,
-        max_depth: int, counters: Dict[str, int], current_depth: int = 0
-    ) -> TreeNode:
-        """Build tree node for a level with all children."""
-        counters["levels"] += 1
-        
-        if current_depth >= max_depth:
-            return TreeNode(
-                id=level.id,
-                name=level.name,
-                type="level",
-                status=level.status,
-                sequence=level.sequence,
-                children=[],
-                metadata={
-                    "description": level.description,
-                    "duration_hours": level.duration_hours,
-                    "max_depth_reached": True
-                }
-            )
-        
-        # Get modules for this level
-        modules_query = db.query(Module).filter(Module.level_id == level.id)
-        if not include_inactive:
-            modules_query = modules_query.filter(Module.status == "active")
-        modules = modules_query.order_by(Module.sequence).all()
-        
-        module_nodes = []
-        for module in modules:
-            module_node = self._build_module_tree_node(
-                db, module, include_inactive, include_assessments,
-                include_equipment, include_media, max_depth, counters, current_depth + 1
-            )
-            module_nodes.append(module_node)
-        
-        return TreeNode(
-            id=level.id,
-            name=level.name,
-            type="level",
-            status=level.status,
-            sequence=level.sequence,
-            children=module_nodes,
-            metadata={
-                "description": level.description,
-                "duration_hours": level.duration_hours,
-                "total_modules": len(module_nodes)
-            }
-        )
-
-    def _build_module_tree_node(
-        self, db: Session, module: Module, include_inactive: bool,
-        include_assessments: bool, include_equipment: bool, include_media: bool,
-        max_depth: int, counters: Dict[str, int], current_depth: int = 0
-    ) -> TreeNode:
-        """Build tree node for a module with all children."""
-        counters["modules"] += 1
-        
-        if current_depth >= max_depth:
-            return TreeNode(
-                id=module.id,
-                name=module.name,
-                type="module",
-                status=module.status,
-                sequence=module.sequence,
-                children=[],
-                metadata={
-                    "description": module.description,
-                    "duration_hours": module.duration_hours,
-                    "max_depth_reached": True
-                }
-            )
-        
-        # Get sections for this module
-        sections_query = db.query(Section).filter(Section.module_id == module.id)
-        if not include_inactive:
-            sections_query = sections_query.filter(Section.status == "active")
-        sections = sections_query.order_by(Section.sequence).all()
-        
-        section_nodes = []
-        for section in sections:
-            section_node = self._build_section_tree_node(
-                db, section, include_inactive, include_assessments,
-                include_equipment, include_media, max_depth, counters, current_depth + 1
-            )
-            section_nodes.append(section_node)
-        
-        return TreeNode(
-            id=module.id,
-            name=module.name,
-            type="module",
-            status=module.status,
-            sequence=module.sequence,
-            children=section_nodes,
-            metadata={
-                "description": module.description,
-                "duration_hours": module.duration_hours,
-                "total_sections": len(section_nodes)
-            }
-        )
-
-    def _build_section_tree_node(
-        self, db: Session, section: Section, include_inactive: bool,
-        include_assessments: bool, include_equipment: bool, include_media: bool,
-        max_depth: int, counters: Dict[str, int], current_depth: int = 0
-    ) -> TreeNode:
-        """Build tree node for a section with all children."""
-        counters["sections"] += 1
-        
-        if current_depth >= max_depth:
-            return TreeNode(
-                id=section.id,
-                name=section.name,
-                type="section",
-                status=section.status,
-                sequence=section.sequence,
-                children=[],
-                metadata={
-                    "description": section.description,
-                    "duration_hours": section.duration_hours,
-                    "max_depth_reached": True
-                }
-            )
-        
-        # Get lessons for this section
-        lessons_query = db.query(Lesson).filter(Lesson.section_id == section.id)
-        if not include_inactive:
-            lessons_query = lessons_query.filter(Lesson.status == "active")
-        lessons = lessons_query.order_by(Lesson.sequence).all()
-        
-        lesson_nodes = []
-        for lesson in lessons:
-            lesson_node = self._build_lesson_tree_node(
-                db, lesson, include_inactive, include_assessments,
-                include_equipment, include_media, counters
-            )
-            lesson_nodes.append(lesson_node)
-        
-        return TreeNode(
-            id=section.id,
-            name=section.name,
-            type="section",
-            status=section.status,
-            sequence=section.sequence,
-            children=lesson_nodes,
-            metadata={
-                "description": section.description,
-                "duration_hours": section.duration_hours,
-                "total_lessons": len(lesson_nodes)
-            }
-        )
-
-    def _build_lesson_tree_node(
-        self, db: Session, lesson: Lesson, include_inactive: bool,
-        include_assessments: bool, include_equipment: bool, include_media: bool,
-        counters: Dict[str, int]
-    ) -> TreeNode:
-        """Build tree node for a lesson (leaf node)."""
-        counters["lessons"] += 1
-        
-        metadata = {
-            "description": lesson.description,
-            "lesson_type": lesson.lesson_type,
-            "duration_minutes": lesson.duration_minutes,
-            "content": lesson.content[:200] + "..." if lesson.content and len(lesson.content) > 200 else lesson.content
-        }
-        
-        # Add assessment information if requested
-        if include_assessments:
-            assessments = db.query(AssessmentRubric).filter(
-                AssessmentRubric.lesson_id == lesson.id
-            ).all()
-            metadata["assessments"] = len(assessments)
-            counters["assessments"] += len(assessments)
-        
-        # Add equipment information if requested
-        if include_equipment:
-            equipment = db.query(EquipmentRequirement).filter(
-                EquipmentRequirement.lesson_id == lesson.id
-            ).all()
-            metadata["equipment_count"] = len(equipment)
-        
-        # Add media information if requested
-        if include_media:
-            # This would need to be implemented based on how media is linked to lessons
-            metadata["media_count"] = 0
-        
-        return TreeNode(
-            id=lesson.id,
-            name=lesson.name,
-            type="lesson",
-            status=lesson.status,
-            sequence=lesson.sequence,
-            children=[],
-            metadata=metadata
-        )
-
     def advanced_search(
         self,
         db: Session,
@@ -484,21 +128,22 @@ class AdvancedService:
         
         if search_request.query:
             query = query.filter(
-                Lesson.name.ilike(f"%{search_request.query}%") |
+                Lesson.title.ilike(f"%{search_request.query}%") |
                 Lesson.description.ilike(f"%{search_request.query}%")
             )
         
         if not search_request.include_inactive:
-            query = query.filter(Lesson.status == "active")
+            query = query.filter(Lesson.status == CurriculumStatus.ACTIVE)
         
         lessons = query.all()
+        breadcrumbs = load_breadcrumbs(db, [lesson.ancestry_path for lesson in lessons])
         
         results = []
         for lesson in lessons:
             # Calculate relevance score (simplified)
             relevance_score = 1.0
             if search_request.query:
-                if search_request.query.lower() in lesson.name.lower():
+                if search_request.query.lower() in lesson.title.lower():
                     relevance_score += 0.5
                 if lesson.description and search_request.query.lower() in lesson.description.lower():
                     relevance_score += 0.3
@@ -506,13 +151,13 @@ class AdvancedService:
             results.append(SearchResult(
                 id=lesson.id,
                 entity_type=SearchEntityType.LESSON,
-                title=lesson.name,
+                title=lesson.title,
                 description=lesson.description,
-                path=self._get_lesson_path(db, lesson),
+                path=[crumb.name for crumb in breadcrumbs.get(lesson.ancestry_path, [])],
                 relevance_score=relevance_score,
                 highlights={},
                 metadata={
-                    "lesson_type": lesson.lesson_type,
+                    "lesson_types": lesson.lesson_types or [],
                     "duration_minutes": lesson.duration_minutes,
                     "status": lesson.status
                 }
@@ -524,7 +169,7 @@ class AdvancedService:
         self, db: Session, search_request: CurriculumSearchRequest, page: int, per_page: int
     ) -> List[SearchResult]:
         """Search curricula."""
-        query = db.query(Curriculum)
+        query = db.query(Curriculum, Course.program_id).join(Course, Course.id == Curriculum.course_id)
         
         if search_request.query:
             query = query.filter(
@@ -533,12 +178,15 @@ class AdvancedService:
             )
         
         if not search_request.include_inactive:
-            query = query.filter(Curriculum.status == "active")
+            query = query.filter(Curriculum.status == CurriculumStatusEnum.PUBLISHED.value)
         
-        curricula = query.all()
+        rows = query.all()
+        # A curriculum's path is its course's: program/course
+        paths = {curriculum.id: join_path(program_id, curriculum.course_id) for curriculum, program_id in rows}
+        breadcrumbs = load_breadcrumbs(db, paths.values())
         
         results = []
-        for curriculum in curricula:
+        for curriculum, _ in rows:
             # Calculate relevance score (simplified)
             relevance_score = 1.0
             if search_request.query:
@@ -552,71 +200,18 @@ class AdvancedService:
                 entity_type=SearchEntityType.CURRICULUM,
                 title=curriculum.name,
                 description=curriculum.description,
-                path=self._get_curriculum_path(db, curriculum),
+                path=[crumb.name for crumb in breadcrumbs.get(paths[curriculum.id], [])],
                 relevance_score=relevance_score,
                 highlights={},
                 metadata={
                     "difficulty_level": curriculum.difficulty_level,
-                    "min_age_months": curriculum.min_age_months,
-                    "max_age_months": curriculum.max_age_months,
+                    "age_ranges": curriculum.age_ranges,
                     "status": curriculum.status
                 }
             ))
         
         return results
 
-    def _get_lesson_path(self, db: Session, lesson: Lesson) -> List[str]:
-        """Get path for a lesson."""
-        path = []
-        
-        # Get section
-        section = db.query(Section).filter(Section.id == lesson.section_id).first()
-        if section:
-            path.append(section.name)
-            
-            # Get module
-            module = db.query(Module).filter(Module.id == section.module_id).first()
-            if module:
-                path.append(module.name)
-                
-                # Get level
-                level = db.query(Level).filter(Level.id == module.level_id).first()
-                if level:
-                    path.append(level.name)
-                    
-                    # Get curriculum
-                    curriculum = db.query(Curriculum).filter(Curriculum.id == level.curriculum_id).first()
-                    if curriculum:
-                        path.append(curriculum.name)
-                        
-                        # Get course
-                        course = db.query(Course).filter(Course.id == curriculum.course_id).first()
-                        if course:
-                            path.append(course.name)
-                            
-                            # Get program
-                            program = db.query(Program).filter(Program.id == course.program_id).first()
-                            if program:
-                                path.append(program.name)
-        
-        return list(reversed(path))
-
-    def _get_curriculum_path(self, db: Session, curriculum: Curriculum) -> List[str]:
-        """Get path for a curriculum."""
-        path = []
-        
-        # Get course
-        course = db.query(Course).filter(Course.id == curriculum.course_id).first()
-        if course:
-            path.append(course.name)
-            
-            # Get program
-            program = db.query(Program).filter(Program.id == course.program_id).first()
-            if program:
-                path.append(program.name)
-        
-        return list(reversed(path))
-
     def bulk_curriculum_operations(
         self, db: Session, operation_request: BulkCurriculumOperationRequest, current_user_id: str
     ) -> Dict[str, Any]:
@@ -721,44 +316,26 @@ class AdvancedService:
         )
 
     def get_curriculum_path(self, db: Session, lesson_id: str) -> Optional[CurriculumPathResponse]:
-        """Get curriculum path for a lesson."""
-        lesson = db.query(Lesson).filter(Lesson.id == lesson_id).first()
+        """Get curriculum path for a lesson, from its program down to its section."""
+        lesson = db.query(Lesson.ancestry_path).filter(Lesson.id == lesson_id).first()
         if not lesson:
             return None
         
-        path = []
-        current_level = 0
-        
-        # Build path from lesson up to program
-        if lesson.section_id:
-            section = db.query(Section).filter(Section.id == lesson.section_id).first()
-            if section:
-                path.append(PathNode(
-                    id=section.id,
-                    name=section.name,
-                    type="section",
-                    level=current_level,
-                    metadata={"sequence": section.sequence}
-                ))
-                current_level += 1
-                
-                if section.module_id:
-                    module = db.query(Module).filter(Module.id == section.module_id).first()
-                    if module:
-                        path.append(PathNode(
-                            id=module.id,
-                            name=module.name,
-                            type="module",
-                            level=current_level,
-                            metadata={"sequence": module.sequence}
-                        ))
-                        current_level += 1
-                        
-                        # Continue building path...
+        crumbs = load_breadcrumbs(db, [lesson.ancestry_path]).get(lesson.ancestry_path, [])
+        path = [
+            PathNode(
+                id=crumb.id,
+                name=crumb.name,
+                type=crumb.type,
+                level=depth,
+                metadata={"sequence": crumb.sequence}
+            )
+            for depth, crumb in enumerate(crumbs)
+        ]
         
         return CurriculumPathResponse(
             lesson_id=lesson_id,
-            path=list(reversed(path)),
+            path=path,
             total_depth=len(path),
             prerequisites=[],
             next_lessons=[]
@@ -784,34 +361,101 @@ class AdvancedService:
         )
 
     def export_curriculum(
-        self, db: Session, export_request: CurriculumExportRequest, current_user_id: str
-    ) -> Dict[str, Any]:
-        """Export curriculum data."""
-        # This is a simplified implementation
-        # In production, you would implement proper export functionality
-        
-        return {
-            "export_id": "export_123",
-            "format": export_request.format,
-            "status": "completed",
-            "download_url": "/api/v1/exports/export_123/download",
-            "created_at": datetime.utcnow().isoformat()
-        }
+        self,
+        db: Session,
+        export_request: CurriculumExportRequest,
+        current_user_id: str,
+        program_context: Optional[str] = None,
+    ) -> CurriculumExporter:
+        """Exporter streaming the requested subtree as NDJSON or MessagePack records."""
+        export_format = export_request.format
+        if export_format == ExportFormat.JSON:
+            export_format = ExportFormat.NDJSON  # One JSON document per record
+        exporter = CurriculumExporter.for_root(
+            db,
+            export_request.entity_type.value,
+            export_request.entity_id,
+            export_format,
+            export_request,
+        )
+        if program_context and exporter.program_id != program_context:
+            raise PermissionError(f"Cannot export {exporter.root_type} from a different program context")
+        return exporter
 
     def import_curriculum(
-        self, db: Session, import_request: CurriculumImportRequest, current_user_id: str
+        self,
+        db: Session,
+        import_request: CurriculumImportRequest,
+        current_user_id: str,
+        program_context: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Import curriculum data."""
-        # This is a simplified implementation
-        # In production, you would implement proper import functionality
-        
-        return {
-            "successful": [],
-            "failed": [],
-            "total_processed": 0,
-            "total_successful": 0,
-            "total_failed": 0
-        }
+        """Import records sent inline: NDJSON text, or base64-encoded MessagePack."""
+        if not isinstance(import_request.data, str):
+            raise ValueError("Import data must be NDJSON text or base64-encoded MessagePack")
+        if import_request.format == ExportFormat.MSGPACK:
+            try:
+                payload = base64.b64decode(import_request.data, validate=True)
+            except binascii.Error:
+                raise ValueError("MessagePack import data must be base64-encoded")
+        else:
+            payload = import_request.data.encode()
+
+        return self.import_curriculum_stream(
+            db,
+            io.BytesIO(payload),
+            import_format=import_request.format,
+            target_program_id=import_request.target_program_id,
+            merge_strategy=import_request.merge_strategy,
+            validate_only=import_request.validate_only,
+            custom_mappings=import_request.custom_mappings,
+            current_user_id=current_user_id,
+            program_context=program_context,
+        )
+
+    def import_curriculum_stream(
+        self,
+        db: Session,
+        stream: BinaryIO,
+        import_format: ExportFormat,
+        target_program_id: str,
+        merge_strategy: str = "create_new",
+        validate_only: bool = False,
+        custom_mappings: Optional[Dict[str, str]] = None,
+        current_user_id: Optional[str] = None,
+        program_context: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Import an export stream below a program as new rows.
+
+        Records are validated, given new IDs and inserted in batches; failures
+        are reported per record. With ``validate_only`` everything is rolled back.
+        ``custom_mappings`` may only target rows of the target program.
+        """
+        if program_context and target_program_id != program_context:
+            raise PermissionError("Cannot import into a different program context")
+        if merge_strategy != "create_new":
+            raise ValueError(f"Merge strategy '{merge_strategy}' is not supported; use create_new")
+        if import_format == ExportFormat.JSON:
+            import_format = ExportFormat.NDJSON
+        if not db.query(Program.id).filter(Program.id == target_program_id).first():
+            raise ValueError(f"Program with ID '{target_program_id}' not found")
+
+        importer = CurriculumImporter(
+            db,
+            target_program_id=target_program_id,
+            custom_mappings=custom_mappings,
+            created_by=current_user_id,
+        )
+        try:
+            result = importer.run(read_records(stream, import_format))
+        except Exception:
+            db.rollback()
+            raise
+        if validate_only:
+            db.rollback()
+        else:
+            db.commit()
+        return result
 
     def get_curriculum_templates(
         self, db: Session, template_type: Optional[str] = None, is_public: Optional[bool] = None
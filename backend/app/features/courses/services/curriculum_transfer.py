@@ -0,0 +1,585 @@
+"""
+Streaming curriculum export and batched import.
+
+An export is a stream of records, parents before children, written as
+newline-delimited JSON or as consecutive MessagePack objects::
+
+    {"type": "header", "version": 1, "root_type": "curriculum", "root_id": "...", "exported_at": "..."}
+    {"type": "level", "id": "...", "data": {"curriculum_id": "...", "name": "...", ...}}
+
+``data`` holds the row's columns except its ID, timestamps, audit columns
+and the denormalized scope, ancestry and version columns, which the
+importer recomputes. Parent references keep the source IDs.
+
+The exporter reads each table with one streamed query (``yield_per``) that
+selects the subtree through the ancestry paths, so memory stays bounded by
+the batch size whatever the size of the export.
+
+The importer validates each record, gives it a new ID and remaps its parent
+reference through the IDs assigned so far, seeded with ``custom_mappings``
+to attach roots to existing rows of the target program (a course's program
+defaults to the target program). Rows are inserted in batches per table,
+with ``COPY`` on PostgreSQL (psycopg2) and multi-row ``INSERT`` elsewhere.
+A batch that fails is retried row by row in savepoints, so errors are
+reported per record and the children of a failed record fail with it.
+"""
+
+import io
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import Date, DateTime, Numeric, insert, or_, select, union_all
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.features.common.models.database import SessionLocal
+from app.features.common.services.dashboard_counters import dashboard_counters
+from app.features.content.models.assessment import AssessmentCriteria, AssessmentRubric
+from app.features.content.models.lesson import Lesson
+from app.features.courses.models.course import Course
+from app.features.courses.schemas.advanced import ExportFormat
+from app.features.curricula.models.curriculum import Curriculum
+from app.features.curricula.models.level import Level
+from app.features.curricula.models.module import Module
+from app.features.curricula.models.section import Section
+from app.features.curricula.services.ancestry import SEPARATOR, join_path, refresh_paths
+from app.features.curricula.services.tree_cache import bump_structure_versions
+from app.features.equipment.models.equipment import EquipmentRequirement
+from app.features.media.models.media import MediaLibrary
+from app.features.programs.models.program import Program
+from app.features.progression.models.progression import LevelAssessmentCriteria
+
+try:
+    import msgpack
+except ImportError:  # MessagePack is optional; NDJSON always works
+    msgpack = None
+
+FORMAT_VERSION = 1
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.MSGPACK: "application/msgpack",
+}
+
+# Never exported; the importer fills them in
+_GENERATED_COLUMNS = {"id", "created_at", "updated_at", "created_by", "updated_by", "ancestry_path", "structure_version"}
+_SCOPE_COLUMNS = {"curriculum_id", "program_id"}
+
+Scope = Tuple[Optional[str], Optional[str]]  # (curriculum_id, program_id)
+
+
+@dataclass(frozen=True)
+class TransferTable:
+    """A record type and the table it is stored in."""
+
+    type: str
+    model: Any
+    parent_key: str
+    parent_type: str
+    option: Optional[str] = None
+
+    @property
+    def table(self) -> Any:
+        return self.model.__table__
+
+    @property
+    def columns(self) -> List[Any]:
+        """Columns carried in a record's ``data``."""
+        excluded = _GENERATED_COLUMNS | (_SCOPE_COLUMNS - {self.parent_key})
+        if self.model is Course:
+            excluded = _GENERATED_COLUMNS
+        return [column for column in self.table.columns if column.name not in excluded]
+
+
+# Parents before children; ``option`` names the CurriculumExportRequest flag a table depends on
+TRANSFER_TABLES: List[TransferTable] = [
+    TransferTable("course", Course, "program_id", "program"),
+    TransferTable("curriculum", Curriculum, "course_id", "course"),
+    TransferTable("level", Level, "curriculum_id", "curriculum"),
+    TransferTable("module", Module, "level_id", "level"),
+    TransferTable("section", Section, "module_id", "module"),
+    TransferTable("lesson", Lesson, "section_id", "section"),
+    TransferTable("assessment_rubric", AssessmentRubric, "level_id", "level", "include_assessments"),
+    TransferTable("assessment_criteria", AssessmentCriteria, "rubric_id", "assessment_rubric", "include_assessments"),
+    TransferTable("level_assessment_criteria", LevelAssessmentCriteria, "level_id", "level", "include_assessments"),
+    TransferTable("equipment", EquipmentRequirement, "level_id", "level", "include_equipment"),
+    TransferTable("media", MediaLibrary, "lesson_id", "lesson", "include_media"),
+]
+_BY_TYPE: Dict[str, TransferTable] = {spec.type: spec for spec in TRANSFER_TABLES}
+
+# Types whose rows carry an ancestry path, and the exportable roots
+_PATH_TYPES = ("level", "module", "section", "lesson")
+ROOT_TYPES = ("program", "course", "curriculum") + _PATH_TYPES
+
+
+def _owning_programs(spec: TransferTable) -> Any:
+    """Select of (id, program_id) for a table's rows, joining up to the nearest ancestor with a program."""
+    owner, joins = spec, []
+    while "program_id" not in owner.table.c:
+        parent = _BY_TYPE[owner.parent_type]
+        joins.append((parent.model, parent.model.id == getattr(owner.model, owner.parent_key)))
+        owner = parent
+    query = select(spec.model.id.label("id"), owner.model.program_id.label("program_id")).select_from(spec.model)
+    for model, onclause in joins:
+        query = query.join(model, onclause)
+    return query
+
+
+def owning_programs(db: Session, ids: Iterable[str]) -> Dict[str, str]:
+    """Program of each existing program, course, curriculum or hierarchy row among ``ids``."""
+    ids = list(set(ids))
+    if not ids:
+        return {}
+    selects = [select(Program.id.label("id"), Program.id.label("program_id")).where(Program.id.in_(ids))]
+    selects += [_owning_programs(spec).where(spec.model.id.in_(ids)) for spec in TRANSFER_TABLES]
+    return {row.id: row.program_id for row in db.execute(union_all(*selects))}
+
+
+def _check_format(format: ExportFormat) -> None:
+    if format not in MEDIA_TYPES:
+        raise ValueError(f"Unsupported format '{format.value}'; use ndjson or msgpack")
+    if format == ExportFormat.MSGPACK and msgpack is None:
+        raise ValueError("MessagePack support is not installed; use ndjson")
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+# ----------------------------------------------------------------------
+# Export
+# ----------------------------------------------------------------------
+
+class CurriculumExporter:
+    """Stream a program, course, curriculum or hierarchy subtree as records."""
+
+    def __init__(self, root_type: str, root_id: str, root_path: str, format: ExportFormat, options: Any):
+        _check_format(format)
+        self.root_type = root_type
+        self.root_id = root_id
+        self.root_path = root_path
+        self.format = format
+        self.options = options
+        self.batch_size = settings.CURRICULUM_TRANSFER_BATCH_SIZE
+
+    @classmethod
+    def for_root(cls, db: Session, root_type: str, root_id: str, format: ExportFormat, options: Any) -> "CurriculumExporter":
+        """Exporter for an existing root; raises ValueError if it is not found."""
+        if root_type not in ROOT_TYPES:
+            raise ValueError(f"Cannot export entity type '{root_type}'")
+        if root_type == "program":
+            root_path = root_id if db.query(Program.id).filter(Program.id == root_id).first() else None
+        elif root_type == "course":
+            course = db.query(Course.program_id).filter(Course.id == root_id).first()
+            root_path = join_path(course.program_id, root_id) if course else None
+        elif root_type == "curriculum":
+            curriculum = db.query(Course.program_id, Curriculum.course_id).select_from(Curriculum).join(
+                Course, Course.id == Curriculum.course_id
+            ).filter(Curriculum.id == root_id).first()
+            root_path = join_path(curriculum.program_id, curriculum.course_id, root_id) if curriculum else None
+        else:
+            model = _BY_TYPE[root_type].model
+            row = db.query(model.ancestry_path).filter(model.id == root_id).first()
+            root_path = join_path(row.ancestry_path, root_id) if row else None
+        if root_path is None:
+            raise ValueError(f"{root_type.capitalize()} with ID '{root_id}' not found")
+        return cls(root_type, root_id, root_path, format, options)
+
+    @property
+    def program_id(self) -> str:
+        """Program the exported subtree belongs to."""
+        return self.root_path.split(SEPARATOR, 1)[0]
+
+    @property
+    def media_type(self) -> str:
+        return MEDIA_TYPES[self.format]
+
+    @property
+    def file_name(self) -> str:
+        return f"{self.root_type}-{self.root_id}.{self.format.value}"
+
+    def iter_bytes(self) -> Iterator[bytes]:
+        """Encoded records, in their own session so they can be streamed after the request's session closed."""
+        encode = self._encoder()
+        db = SessionLocal()
+        try:
+            if db.get_bind().dialect.name == "postgresql":
+                # One snapshot for all tables of the export
+                db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+            for record in self.iter_records(db):
+                yield encode(record)
+        finally:
+            db.close()
+
+    def iter_records(self, db: Session) -> Iterator[Dict[str, Any]]:
+        """The header, then the records of every table in the subtree, parents first."""
+        yield {
+            "type": "header",
+            "version": FORMAT_VERSION,
+            "root_type": self.root_type,
+            "root_id": self.root_id,
+            "exported_at": datetime.utcnow().isoformat(),
+        }
+        conditions = self._conditions()
+        for spec in TRANSFER_TABLES:
+            condition = conditions.get(spec.type)
+            if condition is None:
+                continue
+            columns = spec.columns
+            statement = select(spec.table.c.id, *columns).where(condition).order_by(spec.table.c.id)
+            result = db.execute(statement, execution_options={"yield_per": self.batch_size})
+            for row in result:
+                yield {
+                    "type": spec.type,
+                    "id": row.id,
+                    "data": {column.name: _jsonable(row._mapping[column]) for column in columns},
+                }
+
+    def _conditions(self) -> Dict[str, Any]:
+        """WHERE clause selecting the subtree rows of each exported table."""
+        conditions: Dict[str, Any] = {}
+        for spec in TRANSFER_TABLES:
+            if spec.option and not getattr(self.options, spec.option, True):
+                continue
+            model = spec.model
+            if spec.type == self.root_type:
+                conditions[spec.type] = model.id == self.root_id
+            elif not getattr(self.options, "include_children", True):
+                continue
+            elif spec.type in _PATH_TYPES and self._below_root(spec.type):
+                conditions[spec.type] = or_(
+                    model.ancestry_path == self.root_path,
+                    model.ancestry_path.like(self.root_path + SEPARATOR + "%"),
+                )
+            elif spec.parent_type == "program" and self.root_type == "program":
+                conditions[spec.type] = model.program_id == self.root_id
+            elif spec.parent_type in conditions:
+                parent = _BY_TYPE[spec.parent_type].model
+                conditions[spec.type] = getattr(model, spec.parent_key).in_(
+                    select(parent.id).where(conditions[spec.parent_type])
+                )
+        return conditions
+
+    def _below_root(self, record_type: str) -> bool:
+        return ROOT_TYPES.index(record_type) > ROOT_TYPES.index(self.root_type)
+
+    def _encoder(self) -> Any:
+        if self.format == ExportFormat.MSGPACK:
+            packer = msgpack.Packer()
+            return packer.pack
+        return lambda record: (json.dumps(record, separators=(",", ":")) + "\n").encode()
+
+
+# ----------------------------------------------------------------------
+# Import
+# ----------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class DecodeFailure:
+    """A record that could not be decoded."""
+
+    position: int
+    error: str
+
+
+def read_records(stream: BinaryIO, format: ExportFormat) -> Iterator[Any]:
+    """Records from an export stream; undecodable NDJSON lines yield ``DecodeFailure``."""
+    _check_format(format)
+    if format == ExportFormat.MSGPACK:
+        try:
+            yield from msgpack.Unpacker(stream, raw=False)
+        except (ValueError, msgpack.UnpackException) as e:
+            yield DecodeFailure(0, f"Invalid MessagePack data: {e}")
+        return
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            yield DecodeFailure(line_number, f"Invalid JSON on line {line_number}: {e}")
+
+
+class RecordError(ValueError):
+    """A record that cannot be imported."""
+
+
+class CurriculumImporter:
+    """Validate records, remap their IDs and insert them in batches."""
+
+    def __init__(
+        self,
+        db: Session,
+        target_program_id: str,
+        custom_mappings: Optional[Dict[str, str]] = None,
+        created_by: Optional[str] = None,
+        batch_size: Optional[int] = None,
+    ):
+        self.db = db
+        self.target_program_id = target_program_id
+        self.created_by = created_by
+        self.batch_size = batch_size or settings.CURRICULUM_TRANSFER_BATCH_SIZE
+        # Source ID -> new (or existing, for custom mappings) ID
+        self.id_map: Dict[str, str] = dict(custom_mappings or {})
+        # New ID -> scope, for rows that have scoped children
+        self.scopes: Dict[str, Scope] = {}
+        self.touched_curricula: Set[str] = set()
+        self.successful: List[str] = []
+        self.failed: List[Dict[str, Any]] = []
+        self._pending: List[Tuple[str, Dict[str, Any]]] = []  # (source ID, row)
+        self._pending_spec: Optional[TransferTable] = None
+
+    def check_mappings(self) -> None:
+        """Raise ValueError unless every custom mapping targets an existing row of the target program."""
+        programs = owning_programs(self.db, self.id_map.values())
+        outside = sorted(
+            {target for target in self.id_map.values() if programs.get(target) != self.target_program_id}
+        )
+        if outside:
+            raise ValueError(
+                f"Custom mappings must target existing rows in program '{self.target_program_id}': {outside}"
+            )
+
+    def run(self, records: Iterable[Any]) -> Dict[str, Any]:
+        """Import records; the caller commits or rolls back."""
+        self.check_mappings()
+        records = iter(records)
+        header = next(records, None)
+        if not isinstance(header, dict) or header.get("type") != "header":
+            raise ValueError("Import data must start with an export header record")
+        if header.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported export version {header.get('version')!r}")
+
+        for record in records:
+            if isinstance(record, DecodeFailure):
+                self.failed.append({"position": record.position, "error": record.error})
+                continue
+            try:
+                spec, source_id, row = self._prepare(record)
+            except RecordError as e:
+                self._fail(record, str(e))
+                continue
+            if spec is not self._pending_spec or len(self._pending) >= self.batch_size:
+                self._flush()
+                self._pending_spec = spec
+            self._pending.append((source_id, row))
+        self._flush()
+
+        connection = self.db.connection()
+        self.touched_curricula.discard(None)
+        if self.touched_curricula:
+            refresh_paths(connection, curriculum_ids=self.touched_curricula)
+            bump_structure_versions(connection, self.touched_curricula)
+
+        return {
+            "successful": self.successful,
+            "failed": self.failed,
+            "total_processed": len(self.successful) + len(self.failed),
+            "total_successful": len(self.successful),
+            "total_failed": len(self.failed),
+        }
+
+    # ------------------------------------------------------------------
+    # Validation and remapping
+    # ------------------------------------------------------------------
+
+    def _prepare(self, record: Any) -> Tuple[TransferTable, str, Dict[str, Any]]:
+        if not isinstance(record, dict):
+            raise RecordError("Record must be an object")
+        spec = _BY_TYPE.get(record.get("type"))
+        if spec is None:
+            raise RecordError(f"Unknown record type {record.get('type')!r}")
+        source_id, data = record.get("id"), record.get("data")
+        if not isinstance(source_id, str) or not source_id:
+            raise RecordError("Record has no ID")
+        if source_id in self.id_map:
+            raise RecordError(f"Duplicate record ID '{source_id}'")
+        if not isinstance(data, dict):
+            raise RecordError("Record has no data object")
+
+        row: Dict[str, Any] = {}
+        for column in spec.columns:
+            if column.name == spec.parent_key:
+                continue
+            value = data.get(column.name)
+            if value is None:
+                if column.default is not None:
+                    # COPY does not apply Python-side defaults
+                    row[column.name] = _column_default(column)
+                elif column.server_default is None:
+                    if not column.nullable:
+                        raise RecordError(f"Missing required field '{column.name}'")
+                    row[column.name] = None
+                continue
+            try:
+                row[column.name] = _to_python(column, value)
+            except (TypeError, ValueError):
+                raise RecordError(f"Invalid value for '{column.name}': {value!r}")
+
+        parent_id = self._new_parent_id(spec, data.get(spec.parent_key))
+        curriculum_id, program_id = self._parent_scope(spec, parent_id)
+        new_id = str(uuid.uuid4())
+
+        row["id"] = new_id
+        row[spec.parent_key] = parent_id
+        row["created_by"] = row["updated_by"] = self.created_by
+        if spec.model is Curriculum:
+            row["is_default_for_age_groups"] = []  # Defaults stay with the target course's own curricula
+            curriculum_id = new_id
+        if spec.type in _PATH_TYPES or spec.model is MediaLibrary:
+            if spec.model is not Level:
+                row["curriculum_id"] = curriculum_id
+            row["program_id"] = program_id
+            self.touched_curricula.add(curriculum_id)
+        if spec.type in ("course", "curriculum") + _PATH_TYPES:
+            self.scopes[new_id] = (curriculum_id, program_id)
+
+        self.id_map[source_id] = new_id
+        return spec, source_id, row
+
+    def _new_parent_id(self, spec: TransferTable, source_parent_id: Any) -> str:
+        if isinstance(source_parent_id, str) and source_parent_id in self.id_map:
+            return self.id_map[source_parent_id]
+        if spec.parent_type == "program":
+            return self.target_program_id
+        raise RecordError(
+            f"Parent {spec.parent_type} '{source_parent_id}' is not in the import "
+            "(or failed); map it to an existing ID with custom_mappings"
+        )
+
+    def _parent_scope(self, spec: TransferTable, parent_id: str) -> Scope:
+        """(curriculum_id, program_id) that rows below ``parent_id`` inherit."""
+        if spec.parent_type == "program":
+            return None, parent_id
+        if spec.parent_type not in ("course", "curriculum") + _PATH_TYPES:
+            return None, None
+        if parent_id in self.scopes:
+            return self.scopes[parent_id]
+
+        # An existing row the import was mapped onto
+        if spec.parent_type == "course":
+            row = self.db.query(Course.program_id).filter(Course.id == parent_id).first()
+            scope = (None, row.program_id) if row else None
+        elif spec.parent_type == "curriculum":
+            row = self.db.query(Course.program_id).join(
+                Curriculum, Curriculum.course_id == Course.id
+            ).filter(Curriculum.id == parent_id).first()
+            scope = (parent_id, row.program_id) if row else None
+        else:
+            parent = _BY_TYPE[spec.parent_type].model
+            curriculum_column = parent.curriculum_id
+            row = self.db.query(curriculum_column, parent.program_id).filter(parent.id == parent_id).first()
+            scope = (row[0], row[1]) if row else None
+        if scope is None:
+            raise RecordError(f"Mapped {spec.parent_type} '{parent_id}' does not exist")
+        self.scopes[parent_id] = scope
+        return scope
+
+    def _fail(self, record: Any, error: str) -> None:
+        failure: Dict[str, Any] = {"error": error}
+        if isinstance(record, dict):
+            failure["id"] = record.get("id")
+            failure["type"] = record.get("type")
+        self.failed.append(failure)
+
+    # ------------------------------------------------------------------
+    # Batched inserts
+    # ------------------------------------------------------------------
+
+    def _flush(self) -> None:
+        pending, spec = self._pending, self._pending_spec
+        self._pending = []
+        if not pending:
+            return
+        try:
+            with self.db.begin_nested():
+                self._insert(spec, [row for _, row in pending])
+            inserted = pending
+        except Exception:
+            # Retry one by one to find the failing records
+            inserted = []
+            for source_id, row in pending:
+                try:
+                    with self.db.begin_nested():
+                        self._insert(spec, [row])
+                    inserted.append((source_id, row))
+                except Exception as e:
+                    self.id_map.pop(source_id, None)
+                    self.scopes.pop(row["id"], None)
+                    self.failed.append({"id": source_id, "type": spec.type, "error": str(getattr(e, "orig", e))})
+
+        new_ids = [row["id"] for _, row in inserted]
+        self.successful.extend(new_ids)
+        if new_ids:
+            dashboard_counters.add_rows(self.db, spec.model, spec.model.id.in_(new_ids))
+
+    def _insert(self, spec: TransferTable, rows: List[Dict[str, Any]]) -> None:
+        connection = self.db.connection()
+        if connection.dialect.name == "postgresql" and connection.dialect.driver == "psycopg2":
+            _copy_rows(connection, spec.table, rows)
+        else:
+            connection.execute(insert(spec.table), rows)
+
+
+def _column_default(column: Any) -> Any:
+    default = column.default
+    if default.is_callable:
+        return default.arg(None)
+    return default.arg
+
+
+def _to_python(column: Any, value: Any) -> Any:
+    """Decode a record value into the column's Python type."""
+    enum_class = getattr(column.type, "enum_class", None)
+    if enum_class is not None:
+        return enum_class(value)
+    if isinstance(column.type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column.type, Date):
+        return date.fromisoformat(value)
+    if isinstance(column.type, Numeric) and getattr(column.type, "asdecimal", False):
+        return Decimal(str(value))
+    return value
+
+
+def _copy_rows(connection: Any, table: Any, rows: List[Dict[str, Any]]) -> None:
+    """``COPY ... FROM STDIN`` a batch of rows (CSV; unquoted empty fields are NULL)."""
+    names = sorted({name for row in rows for name in row})
+    columns = [table.c[name] for name in names]
+    processors = [column.type.bind_processor(connection.dialect) for column in columns]
+
+    buffer = io.StringIO()
+    for row in rows:
+        fields = []
+        for name, column, process in zip(names, columns, processors):
+            value = row.get(name)
+            if value is None:
+                fields.append("")
+                continue
+            if process is not None:
+                value = process(value)
+            if isinstance(column.type, ARRAY):
+                value = "{" + ",".join('"' + str(item).replace("\\", "\\\\").replace('"', '\\"') + '"' for item in value) + "}"
+            fields.append('"' + str(value).replace('"', '""') + '"')
+        buffer.write(",".join(fields) + "\n")
+    buffer.seek(0)
+
+    preparer = connection.dialect.identifier_preparer
+    quoted = ", ".join(preparer.quote(name) for name in names)
+    cursor = connection.connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {preparer.format_table(table)} ({quoted}) FROM STDIN WITH (FORMAT csv)", buffer)
+    finally:
+        cursor.close()
@@ -0,0 +1,281 @@
+"""
+Level-at-a-time loader for the full curriculum tree.
+
+The tree Program -> Course -> Curriculum -> Level -> Module -> Section ->
+Lesson is loaded with one query per hierarchy level, filtered by the IDs of
+the parents kept at the level above, and assembled into ``TreeNode`` objects
+through dict lookups. Levels below ``max_depth`` and children of filtered-out
+(inactive) parents are never queried. Per-node counts (rubrics, equipment,
+media) are one grouped query each.
+
+``iter_tree_json`` serializes a tree response in chunks so large trees can be
+streamed instead of being encoded into one string.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.features.common.models.enums import CurriculumStatus
+from app.features.content.models import AssessmentRubric, Lesson
+from app.features.courses.models import Course
+from app.features.courses.schemas.advanced import FullCurriculumTreeResponse, TreeNode
+from app.features.courses.schemas.common import CurriculumStatusEnum
+from app.features.curricula.models import Curriculum, Level, Module, Section
+from app.features.equipment.models import EquipmentRequirement
+from app.features.media.models import MediaLibrary
+from app.features.programs.models.program import Program
+
+JSON_CHUNK_SIZE = 64 * 1024
+
+
+def _status(value: Any) -> str:
+    return value.value if hasattr(value, "value") else str(value)
+
+
+@dataclass(frozen=True)
+class TreeLevel:
+    """One level of the curriculum hierarchy and how to render its rows."""
+
+    type: str
+    counter: str
+    model: Any
+    parent_key: Optional[str]
+    name: Callable[[Any], str]
+    sequence: Callable[[Any], Optional[int]]
+    order_by: Tuple[Any, ...]
+    active_status: Any
+    metadata: Callable[[Any], Dict[str, Any]]
+
+
+# Top-down; a node at depth d (programs are 0) only gets children while d < max_depth
+TREE_LEVELS: List[TreeLevel] = [
+    TreeLevel(
+        "program", "programs", Program, None,
+        name=lambda row: row.name,
+        sequence=lambda row: row.display_order,
+        order_by=(Program.display_order, Program.name),
+        active_status=CurriculumStatus.ACTIVE,
+        metadata=lambda row: {
+            "description": row.description,
+            "created_at": row.created_at.isoformat() if row.created_at else None,
+        },
+    ),
+    TreeLevel(
+        "course", "courses", Course, "program_id",
+        name=lambda row: row.name,
+        sequence=lambda row: row.sequence,
+        order_by=(Course.sequence, Course.name),
+        active_status=CurriculumStatusEnum.PUBLISHED.value,
+        metadata=lambda row: {"description": row.description, "duration_weeks": row.duration_weeks},
+    ),
+    TreeLevel(
+        "curriculum", "curricula", Curriculum, "course_id",
+        name=lambda row: row.name,
+        sequence=lambda row: row.sequence,
+        order_by=(Curriculum.sequence, Curriculum.name),
+        active_status=CurriculumStatusEnum.PUBLISHED.value,
+        metadata=lambda row: {
+            "description": row.description,
+            "difficulty_level": row.difficulty_level,
+            "duration_hours": row.duration_hours,
+        },
+    ),
+    TreeLevel(
+        "level", "levels", Level, "curriculum_id",
+        name=lambda row: row.name,
+        sequence=lambda row: row.sequence_order,
+        order_by=(Level.sequence_order, Level.display_order),
+        active_status=CurriculumStatus.ACTIVE,
+        metadata=lambda row: {
+            "description": row.description,
+            "duration_hours": row.estimated_duration_hours,
+        },
+    ),
+    TreeLevel(
+        "module", "modules", Module, "level_id",
+        name=lambda row: row.name,
+        sequence=lambda row: row.sequence_order,
+        order_by=(Module.sequence_order, Module.display_order),
+        active_status=CurriculumStatus.ACTIVE,
+        metadata=lambda row: {
+            "description": row.description,
+            "duration_hours": row.estimated_duration_hours,
+        },
+    ),
+    TreeLevel(
+        "section", "sections", Section, "module_id",
+        name=lambda row: row.name,
+        sequence=lambda row: row.sequence_order,
+        order_by=(Section.sequence_order, Section.display_order),
+        active_status=CurriculumStatus.ACTIVE,
+        metadata=lambda row: {
+            "description": row.description,
+            "duration_minutes": row.estimated_duration_minutes,
+        },
+    ),
+    TreeLevel(
+        "lesson", "lessons", Lesson, "section_id",
+        name=lambda row: row.title,
+        sequence=lambda row: row.sequence_order,
+        order_by=(Lesson.sequence_order, Lesson.display_order),
+        active_status=CurriculumStatus.ACTIVE,
+        metadata=lambda row: {
+            "description": row.description,
+            "lesson_code": row.lesson_id,
+            "duration_minutes": row.duration_minutes,
+        },
+    ),
+]
+
+
+class CurriculumTreeLoader:
+    """Build the curriculum tree with one query per hierarchy level."""
+
+    def __init__(
+        self,
+        db: Session,
+        include_inactive: bool = False,
+        include_assessments: bool = True,
+        include_equipment: bool = True,
+        include_media: bool = True,
+        max_depth: int = 10
+    ):
+        self.db = db
+        self.include_inactive = include_inactive
+        self.include_assessments = include_assessments
+        self.include_equipment = include_equipment
+        self.include_media = include_media
+        self.max_depth = max_depth
+        self.counters: Dict[str, int] = defaultdict(int)
+
+    def load(self, program_id: Optional[str] = None) -> List[TreeNode]:
+        """Program nodes with their subtrees down to ``max_depth``."""
+        roots: List[TreeNode] = []
+        parents: Dict[str, TreeNode] = {}
+
+        for depth, level in enumerate(TREE_LEVELS):
+            rows = self._rows(level, list(parents), program_id)
+            expandable = depth < self.max_depth and depth + 1 < len(TREE_LEVELS)
+            extra = self._extra_metadata(level, [row.id for row in rows])
+
+            nodes: Dict[str, TreeNode] = {}
+            for row in rows:
+                metadata = level.metadata(row)
+                metadata.update(extra.get(row.id, {}))
+                if not expandable and depth + 1 < len(TREE_LEVELS):
+                    metadata["max_depth_reached"] = True
+                node = TreeNode(
+                    id=row.id,
+                    name=level.name(row),
+                    type=level.type,
+                    status=_status(row.status),
+                    sequence=level.sequence(row),
+                    children=[],
+                    metadata=metadata,
+                )
+                self.counters[level.counter] += 1
+                if level.parent_key is None:
+                    roots.append(node)
+                else:
+                    parents[getattr(row, level.parent_key)].children.append(node)
+                nodes[row.id] = node
+
+            if expandable:
+                child_counter = TREE_LEVELS[depth + 1].counter
+                for node in nodes.values():
+                    node.metadata[f"total_{child_counter}"] = 0
+            for node in parents.values():
+                node.metadata[f"total_{level.counter}"] = len(node.children)
+
+            if not expandable or not nodes:
+                break
+            parents = nodes
+
+        return roots
+
+    def _rows(self, level: TreeLevel, parent_ids: List[str], program_id: Optional[str]) -> List[Any]:
+        query = self.db.query(level.model)
+        if level.parent_key is None:
+            if program_id:
+                query = query.filter(Program.id == program_id)
+        else:
+            if not parent_ids:
+                return []
+            parent_column = getattr(level.model, level.parent_key)
+            query = query.filter(parent_column.in_(parent_ids))
+        if not self.include_inactive:
+            query = query.filter(level.model.status == level.active_status)
+        return query.order_by(*level.order_by, level.model.id).all()
+
+    def _extra_metadata(self, level: TreeLevel, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Grouped counts attached to nodes of a level."""
+        extra: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        if not ids:
+            return extra
+
+        if level.model is Level:
+            if self.include_assessments:
+                for level_id, count in self._counts(AssessmentRubric.level_id, ids):
+                    extra[level_id]["assessments"] = count
+                    self.counters["assessments"] += count
+            if self.include_equipment:
+                for level_id, count in self._counts(EquipmentRequirement.level_id, ids):
+                    extra[level_id]["equipment_count"] = count
+            for level_id in ids:
+                if self.include_assessments:
+                    extra[level_id].setdefault("assessments", 0)
+                if self.include_equipment:
+                    extra[level_id].setdefault("equipment_count", 0)
+
+        elif level.model is Lesson and self.include_media:
+            for lesson_id, count in self._counts(MediaLibrary.lesson_id, ids, MediaLibrary.is_active == True):
+                extra[lesson_id]["media_count"] = count
+            for lesson_id in ids:
+                extra[lesson_id].setdefault("media_count", 0)
+
+        return extra
+
+    def _counts(self, column: Any, ids: List[str], *conditions: Any) -> List[Tuple[str, int]]:
+        return self.db.query(column, func.count()).filter(column.in_(ids), *conditions).group_by(column).all()
+
+
+def iter_tree_json(tree: FullCurriculumTreeResponse, chunk_size: int = JSON_CHUNK_SIZE) -> Iterator[bytes]:
+    """Serialize a tree response as JSON in chunks of roughly ``chunk_size`` bytes."""
+    buffer: List[str] = []
+    size = 0
+    for part in _tree_parts(tree):
+        buffer.append(part)
+        size += len(part)
+        if size >= chunk_size:
+            yield "".join(buffer).encode()
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode()
+
+
+def _tree_parts(tree: FullCurriculumTreeResponse) -> Iterator[str]:
+    yield '{"programs":['
+    yield from _join(_node_parts(program) for program in tree.programs)
+    # Everything but the programs, as an object without its opening brace
+    yield "]," + tree.model_dump_json(exclude={"programs"})[1:]
+
+
+def _node_parts(node: TreeNode) -> Iterator[str]:
+    if not node.children:
+        yield node.model_dump_json()
+        return
+    # The node's own fields, with children appended last
+    yield node.model_dump_json(exclude={"children"})[:-1] + ',"children":['
+    yield from _join(_node_parts(child) for child in node.children)
+    yield "]}"
+
+
+def _join(groups: Iterable[Iterator[str]]) -> Iterator[str]:
+    for index, parts in enumerate(groups):
+        if index:
+            yield ","
+        yield from parts
@@ -4,7 +4,7 @@ Curriculum model for curriculum management.
 
 from typing import List, Optional
 
-from sqlalchemy import ForeignKey, Index, String, Text, Integer, Boolean
+from sqlalchemy import ForeignKey, Index, String, Text, Integer, Boolean, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -108,6 +108,16 @@ class Curriculum(BaseModel):
         comment="Curriculum status",
     )
     
+    # Bumped whenever the level/module/section/lesson tree changes
+    # (kept by app.features.curricula.services.tree_cache)
+    structure_version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1,
+        server_default=text("1"),
+        comment="Version of the curriculum's content tree, for tree caching and ETags",
+    )
+    
     # Relationships
     # Note: Relationships will be defined when related models are created
     course = relationship("Course", back_populates="curricula")
@@ -36,6 +36,21 @@ class Level(BaseModel):
         comment="Reference to parent curriculum",
     )
     
+    # Denormalized scope (kept in sync by app.features.curricula.services.program_scope)
+    program_id: Mapped[Optional[str]] = mapped_column(
+        String(36),
+        ForeignKey("programs.id"),
+        nullable=True,
+        comment="Owning program (denormalized from the hierarchy)",
+    )
+    
+    # Materialized path (kept in sync by app.features.curricula.services.ancestry)
+    ancestry_path: Mapped[Optional[str]] = mapped_column(
+        String(255),
+        nullable=True,
+        comment="IDs of the ancestors from the program down to the parent, '/'-separated",
+    )
+    
     # Basic Information
     name: Mapped[str] = mapped_column(
         String(255),
@@ -152,7 +167,9 @@ class Level(BaseModel):
     
     # Indexes for performance
     __table_args__ = (
+        Index("idx_levels_program_id", "program_id"),
         Index("idx_levels_curriculum_id", "curriculum_id"),
+        Index("idx_levels_ancestry_path", "ancestry_path", postgresql_ops={"ancestry_path": "varchar_pattern_ops"}),
         Index("idx_levels_name", "name"),
         Index("idx_levels_status", "status"),
         Index("idx_levels_sequence_order", "sequence_order"),
@@ -34,6 +34,28 @@ class Module(BaseModel):
         comment="Reference to parent level",
     )
     
+    # Denormalized scope (kept in sync by app.features.curricula.services.program_scope)
+    curriculum_id: Mapped[Optional[str]] = mapped_column(
+        String(36),
+        ForeignKey("curricula.id"),
+        nullable=True,
+        comment="Owning curriculum (denormalized from the hierarchy)",
+    )
+    
+    program_id: Mapped[Optional[str]] = mapped_column(
+        String(36),
+        ForeignKey("programs.id"),
+        nullable=True,
+        comment="Owning program (denormalized from the hierarchy)",
+    )
+    
+    # Materialized path (kept in sync by app.features.curricula.services.ancestry)
+    ancestry_path: Mapped[Optional[str]] = mapped_column(
+        String(255),
+        nullable=True,
+        comment="IDs of the ancestors from the program down to the parent, '/'-separated",
+    )
+    
     # Basic Information
     name: Mapped[str] = mapped_column(
         String(255),
@@ -131,6 +153,9 @@ class Module(BaseModel):
     
     # Indexes for performance
     __table_args__ = (
+        Index("idx_modules_program_id", "program_id"),
+        Index("idx_modules_curriculum_id", "curriculum_id"),
+        Index("idx_modules_ancestry_path", "ancestry_path", postgresql_ops={"ancestry_path": "varchar_pattern_ops"}),
         Index("idx_modules_level_id", "level_id"),
         Index("idx_modules_name", "name"),
         Index("idx_modules_status", "status"),
@@ -34,6 +34,28 @@ class Section(BaseModel):
         comment="Reference to parent module",
     )
     
+    # Denormalized scope (kept in sync by app.features.curricula.services.program_scope)
+    curriculum_id: Mapped[Optional[str]] = mapped_column(
+        String(36),
+        ForeignKey("curricula.id"),
+        nullable=True,
+        comment="Owning curriculum (denormalized from the hierarchy)",
+    )
+    
+    program_id: Mapped[Optional[str]] = mapped_column(
+        String(36),
+        ForeignKey("programs.id"),
+        nullable=True,
+        comment="Owning program (denormalized from the hierarchy)",
+    )
+    
+    # Materialized path (kept in sync by app.features.curricula.services.ancestry)
+    ancestry_path: Mapped[Optional[str]] = mapped_column(
+        String(255),
+        nullable=True,
+        comment="IDs of the ancestors from the program down to the parent, '/'-separated",
+    )
+    
     # Basic Information
     name: Mapped[str] = mapped_column(
         String(255),
@@ -155,6 +177,9 @@ class Section(BaseModel):
     
     # Indexes for performance
     __table_args__ = (
+        Index("idx_sections_program_id", "program_id"),
+        Index("idx_sections_curriculum_id", "curriculum_id"),
+        Index("idx_sections_ancestry_path", "ancestry_path", postgresql_ops={"ancestry_path": "varchar_pattern_ops"}),
         Index("idx_sections_module_id", "module_id"),
         Index("idx_sections_name", "name"),
         Index("idx_sections_status", "status"),
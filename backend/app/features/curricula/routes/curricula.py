@@ -3,7 +3,7 @@ Curriculum API routes for curriculum management.
 """
 
 from typing import Annotated, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.features.common.models.database import get_db
@@ -23,6 +23,7 @@ from app.features.curricula.schemas.curriculum import (
 )
 from app.features.courses.schemas.common import BulkActionResponse
 from app.features.curricula.services.curriculum_service import curriculum_service
+from app.features.common.services.conditional_requests import etag_matches
 
 
 router = APIRouter()
@@ -295,23 +296,28 @@ async def get_curricula_by_course(
 @router.get("/{curriculum_id}/tree", response_model=CurriculumTreeResponse)
 async def get_curriculum_tree(
     curriculum_id: str,
+    request: Request,
     db: Annotated[Session, Depends(get_db)],
     program_context: Annotated[Optional[str], Depends(get_program_filter)],
     current_user: Annotated[dict, Depends(get_current_active_user)]
 ):
     """
-    Get curriculum with full tree structure of levels, modules, and lessons.
+    Get curriculum with full tree structure of levels, modules, sections and lessons.
     
-    Returns hierarchical structure for navigation.
+    Returns hierarchical structure for navigation. The ETag changes whenever
+    the tree does, so clients can revalidate with If-None-Match and get 304.
     """
-    tree = curriculum_service.get_curriculum_tree(db, curriculum_id)
+    tree = curriculum_service.get_cached_curriculum_tree(db, curriculum_id, program_context)
     if not tree:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Curriculum not found"
         )
     
-    return tree
+    headers = {"ETag": tree.etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request, tree.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=tree.body, media_type="application/json", headers=headers)
 
 
 @router.post("/{curriculum_id}/duplicate", response_model=CurriculumResponse)
@@ -332,7 +338,8 @@ async def duplicate_curriculum(
             db,
             curriculum_id,
             duplicate_data,
-            current_user["id"]
+            current_user["id"],
+            program_context
         )
         
         return curriculum
@@ -0,0 +1,179 @@
+"""
+Materialized ancestry paths for the curriculum hierarchy.
+
+Levels, modules, sections and lessons carry ``ancestry_path``: the IDs of
+their ancestors from the program down to the parent, separated by ``/``::
+
+    level   program/course/curriculum
+    lesson  program/course/curriculum/level/module/section
+
+Breadcrumbs for any number of rows resolve with one ``UNION ALL`` query over
+the ancestor tables (``load_breadcrumbs``), and a subtree is a prefix match
+on the path.
+
+After each flush, paths are recomputed for new rows, rows moved to another
+parent, and everything below a curriculum moved to another course or a
+course moved to another program: one set-based ``UPDATE`` per table, top-down,
+each copying the parent's path.
+
+Bulk ``query.update()`` calls and raw SQL that change parent references
+bypass ORM events and must call ``refresh_paths`` themselves.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import literal, or_, select, union_all, update
+from sqlalchemy.orm import Session
+
+from app.features.courses.models.course import Course
+from app.features.curricula.models.curriculum import Curriculum
+from app.features.curricula.models.level import Level
+from app.features.curricula.models.module import Module
+from app.features.curricula.models.section import Section
+from app.features.curricula.services.hierarchy import (
+    HIERARCHY,
+    PATH_STAGE,
+    TREE_MODELS,
+    HierarchyChanges,
+    HierarchyLevel,
+    on_flush,
+)
+from app.features.programs.models.program import Program
+
+SEPARATOR = "/"
+
+# Every hierarchy level below media carries a path
+PATH_LEVELS: List[HierarchyLevel] = [spec for spec in HIERARCHY if spec.in_tree]
+
+# Ancestor type -> (model, name column, sequence column), in path order
+ANCESTORS: Dict[str, Tuple[Any, Any, Any]] = {
+    "program": (Program, Program.name, Program.display_order),
+    "course": (Course, Course.name, Course.sequence),
+    "curriculum": (Curriculum, Curriculum.name, Curriculum.sequence),
+    "level": (Level, Level.name, Level.sequence_order),
+    "module": (Module, Module.name, Module.sequence_order),
+    "section": (Section, Section.name, Section.sequence_order),
+}
+
+
+@dataclass(frozen=True)
+class Crumb:
+    """One ancestor in a breadcrumb."""
+
+    id: str
+    name: str
+    type: str
+    sequence: Optional[int]
+
+
+def join_path(*ids: Optional[str]) -> Optional[str]:
+    """Path from ancestor IDs, or None if one of them is missing."""
+    if any(ancestor_id is None for ancestor_id in ids):
+        return None
+    return SEPARATOR.join(ids)
+
+
+def parse_path(path: Optional[str]) -> List[Tuple[str, str]]:
+    """(ancestor type, ID) pairs of a path, top-down."""
+    if not path:
+        return []
+    return list(zip(ANCESTORS, path.split(SEPARATOR)))
+
+
+def load_breadcrumbs(db: Session, paths: Iterable[Optional[str]]) -> Dict[str, List[Crumb]]:
+    """Breadcrumbs for each distinct path, resolved with one query."""
+    paths = {path for path in paths if path}
+    ids_by_type: Dict[str, Set[str]] = defaultdict(set)
+    for path in paths:
+        for ancestor_type, ancestor_id in parse_path(path):
+            ids_by_type[ancestor_type].add(ancestor_id)
+    if not ids_by_type:
+        return {}
+
+    selects = []
+    for ancestor_type, ids in ids_by_type.items():
+        model, name, sequence = ANCESTORS[ancestor_type]
+        selects.append(
+            select(
+                literal(ancestor_type).label("type"),
+                model.id.label("id"),
+                name.label("name"),
+                sequence.label("sequence"),
+            ).where(model.id.in_(ids))
+        )
+    crumbs = {
+        (row.type, row.id): Crumb(id=row.id, name=row.name, type=row.type, sequence=row.sequence)
+        for row in db.execute(union_all(*selects))
+    }
+    # Ancestors deleted behind the ORM's back are left out rather than failing the lookup
+    return {path: [crumbs[key] for key in parse_path(path) if key in crumbs] for path in paths}
+
+
+# ----------------------------------------------------------------------
+# Maintenance
+# ----------------------------------------------------------------------
+
+def _parent_path(spec: HierarchyLevel) -> Any:
+    """Correlated subquery for the path of a row's children: the row's path plus its ID."""
+    if spec.model is Level:
+        return select(
+            Course.program_id + SEPARATOR + Course.id + SEPARATOR + Curriculum.id
+        ).where(
+            Curriculum.id == Level.curriculum_id,
+            Course.id == Curriculum.course_id,
+        ).scalar_subquery()
+    return select(spec.parent.ancestry_path + SEPARATOR + spec.parent.id).where(
+        spec.parent.id == getattr(spec.model, spec.foreign_key)
+    ).scalar_subquery()
+
+
+def refresh_paths(
+    connection: Any,
+    course_ids: Iterable[str] = (),
+    curriculum_ids: Iterable[str] = (),
+    row_ids: Optional[Dict[Any, Iterable[str]]] = None,
+) -> None:
+    """
+    Recompute the paths of the given rows and of everything below them.
+
+    ``course_ids`` and ``curriculum_ids`` refresh every row below those
+    courses and curricula; ``row_ids`` maps hierarchy models to row IDs.
+    """
+    row_ids = row_ids or {}
+    curricula = []
+    if curriculum_ids:
+        curricula.append(Curriculum.id.in_(list(curriculum_ids)))
+    if course_ids:
+        curricula.append(Curriculum.course_id.in_(list(course_ids)))
+    refreshed_parents = select(Curriculum.id).where(or_(*curricula)) if curricula else None
+
+    for spec in PATH_LEVELS:
+        conditions = []
+        ids = list(row_ids.get(spec.model, ()))
+        if ids:
+            conditions.append(spec.model.id.in_(ids))
+        if refreshed_parents is not None:
+            conditions.append(getattr(spec.model, spec.foreign_key).in_(refreshed_parents))
+        if not conditions:
+            refreshed_parents = None
+            continue
+        condition = or_(*conditions)
+        connection.execute(update(spec.model).where(condition).values(ancestry_path=_parent_path(spec)))
+        refreshed_parents = select(spec.model.id).where(condition)
+
+
+@on_flush(PATH_STAGE)
+def _refresh_flushed_paths(session: Session, changes: HierarchyChanges) -> None:
+    row_ids: Dict[Any, Set[str]] = defaultdict(set)
+    for obj in changes.new + changes.moved:
+        if isinstance(obj, TREE_MODELS):
+            row_ids[type(obj)].add(obj.id)
+    curriculum_ids = {curriculum.id for curriculum in changes.moved_curricula}
+    course_ids = {course.id for course in changes.moved_courses}
+
+    if not (row_ids or curriculum_ids or course_ids):
+        return
+    refresh_paths(session.connection(), course_ids, curriculum_ids, row_ids)
+    changes.expire(TREE_MODELS, ["ancestry_path"])
@@ -0,0 +1,166 @@
+"""
+Set-based deep copy of a curriculum's content.
+
+Each table below the curriculum is copied with one ``INSERT ... SELECT``.
+Rows that have children get their new IDs from a temporary ID map filled
+with ``gen_random_uuid()`` for every copied source row; children remap
+their parent reference by joining the map. Leaf rows take new IDs from the
+column's server default. A copy is a fixed number of statements regardless
+of the curriculum's size, runs in the caller's transaction and only reads
+the source rows, so it holds no locks on them.
+
+Other databases (SQLite in tests) have neither ``gen_random_uuid()`` nor
+the server defaults built on it: there the ID map is filled with UUIDs
+generated in Python, for leaf rows too, at the cost of reading the source
+IDs of each table.
+
+Set-based inserts bypass ORM flush events, so the copy sets the denormalized
+scope columns itself, refreshes the ancestry paths of the new rows and
+counts them in the dashboard counters.
+"""
+
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Column, MetaData, String, Table, delete, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from app.features.common.services.dashboard_counters import dashboard_counters
+from app.features.content.models.assessment import AssessmentCriteria, AssessmentRubric
+from app.features.content.models.lesson import Lesson
+from app.features.curricula.models.level import Level
+from app.features.curricula.models.module import Module
+from app.features.curricula.models.section import Section
+from app.features.curricula.services.ancestry import refresh_paths
+from app.features.equipment.models.equipment import EquipmentRequirement
+from app.features.media.models.media import MediaLibrary
+from app.features.progression.models.progression import LevelAssessmentCriteria
+
+# Source ID -> copy ID for the rows of one copy; dropped at the end of the transaction
+_id_map = Table(
+    "curriculum_copy_id_map",
+    MetaData(),
+    Column("old_id", String(36), primary_key=True),
+    Column("new_id", String(36), nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+# Maintained by the copy (or by the server) instead of copied from the source row
+_GENERATED_COLUMNS = {"created_at", "updated_at", "ancestry_path"}
+_AUDIT_COLUMNS = {"created_by", "updated_by"}
+
+
+@dataclass(frozen=True)
+class CopyStep:
+    """A table copied below its (already copied) parent."""
+
+    model: Any
+    parent_key: str
+    has_children: bool = False
+    option: Optional[str] = None
+
+
+# Parents before children. Levels hang off the curriculum itself; ``option``
+# names the CurriculumDuplicateRequest flag a step depends on.
+COPY_STEPS = [
+    CopyStep(Level, "curriculum_id", has_children=True),
+    CopyStep(Module, "level_id", has_children=True),
+    CopyStep(Section, "module_id", has_children=True),
+    CopyStep(Lesson, "section_id", has_children=True),
+    CopyStep(AssessmentRubric, "level_id", has_children=True, option="copy_assessments"),
+    CopyStep(AssessmentCriteria, "rubric_id", option="copy_assessments"),
+    CopyStep(LevelAssessmentCriteria, "level_id", option="copy_assessments"),
+    CopyStep(EquipmentRequirement, "level_id", option="copy_equipment"),
+    CopyStep(MediaLibrary, "lesson_id", option="copy_media"),
+]
+
+
+def copy_curriculum_content(
+    db: Session,
+    source_curriculum_id: str,
+    target_curriculum_id: str,
+    target_program_id: Optional[str],
+    options: Any,
+    created_by: Optional[str] = None,
+) -> Dict[str, int]:
+    """
+    Copy the levels, modules, sections and lessons of a curriculum, with
+    the assessments, equipment and media enabled in ``options``, below
+    another (new) curriculum. Returns the number of rows copied per table.
+    """
+    connection = db.connection()
+    _id_map.create(connection, checkfirst=True)
+    connection.execute(delete(_id_map))
+    server_ids = connection.dialect.name == "postgresql"
+
+    copied: Dict[str, int] = {}
+    for step in COPY_STEPS:
+        if step.option and not getattr(options, step.option, True):
+            continue
+        table = step.model.__table__
+        source = table.alias("source")
+        parent_map = _id_map.alias("parent_map")
+
+        if step.model is Level:
+            rows = select(source).where(source.c.curriculum_id == source_curriculum_id)
+            new_parent = literal(target_curriculum_id, String)
+        else:
+            rows = select(source).join(parent_map, parent_map.c.old_id == source.c[step.parent_key])
+            new_parent = parent_map.c.new_id
+
+        new_id = None
+        if step.has_children or not server_ids:
+            _map_new_ids(connection, rows.with_only_columns(source.c.id), server_ids)
+            own_map = _id_map.alias("own_map")
+            rows = rows.join(own_map, own_map.c.old_id == source.c.id)
+            new_id = own_map.c.new_id
+
+        values = {}
+        for column in table.columns:
+            name = column.name
+            if name in _GENERATED_COLUMNS or (name == "id" and new_id is None):
+                continue
+            if name == "id":
+                values[name] = new_id
+            elif name == step.parent_key:
+                values[name] = new_parent
+            elif name == "curriculum_id":
+                values[name] = literal(target_curriculum_id, String)
+            elif name == "program_id":
+                values[name] = literal(target_program_id, String)
+            elif name in _AUDIT_COLUMNS:
+                values[name] = literal(created_by, String)
+            else:
+                values[name] = source.c[name]
+
+        result = connection.execute(
+            insert(table).from_select(list(values), rows.with_only_columns(*values.values()))
+        )
+        copied[table.name] = result.rowcount
+
+        if step.model is Level:
+            dashboard_counters.add_rows(db, Level, Level.curriculum_id == target_curriculum_id)
+        else:
+            dashboard_counters.add_rows(
+                db, step.model, getattr(step.model, step.parent_key).in_(select(_id_map.c.new_id))
+            )
+
+    refresh_paths(connection, curriculum_ids=[target_curriculum_id])
+    return copied
+
+
+def _map_new_ids(connection: Any, source_ids: Any, server_ids: bool) -> None:
+    """Add a new ID to the ID map for every source row ID selected by ``source_ids``."""
+    if server_ids:
+        connection.execute(
+            insert(_id_map).from_select(
+                ["old_id", "new_id"],
+                source_ids.add_columns(func.gen_random_uuid().cast(String)),
+            )
+        )
+        return
+    old_ids = connection.execute(source_ids).scalars().all()
+    if old_ids:
+        connection.execute(insert(_id_map), [{"old_id": old_id, "new_id": str(uuid.uuid4())} for old_id in old_ids])
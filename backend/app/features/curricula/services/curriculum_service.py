@@ -3,7 +3,7 @@ Curriculum service for curriculum management operations.
 """
 
 from typing import List, Optional, Dict, Any, Tuple
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_, desc, asc
 
 from app.features.programs.models.program import Program
@@ -25,6 +25,8 @@ from app.features.curricula.schemas.curriculum import (
     CurriculumDuplicateRequest
 )
 from .base_service import BaseService
+from .curriculum_copy import copy_curriculum_content
+from .tree_cache import CachedTree, curriculum_tree_cache, tree_etag
 
 
 class CurriculumService(BaseService[Curriculum, CurriculumCreate, CurriculumUpdate]):
@@ -310,10 +312,10 @@ class CurriculumService(BaseService[Curriculum, CurriculumCreate, CurriculumUpda
         curricula_by_program = dict(program_stats)
         
         # Average levels per curriculum
-        level_query = db.query(func.count(Level.id)).join(Curriculum).join(Course)
+        level_query = db.query(func.count(Level.id))
         
         if program_context:
-            level_query = level_query.filter(Course.program_id == program_context)
+            level_query = level_query.filter(Level.program_id == program_context)
         
         level_counts = level_query.scalar() or 0
         avg_levels_per_curriculum = level_counts / total_curricula if total_curricula > 0 else 0
@@ -354,14 +356,46 @@ class CurriculumService(BaseService[Curriculum, CurriculumCreate, CurriculumUpda
             age_range_distribution=age_ranges
         )
     
+    def get_tree_version(self, db: Session, curriculum_id: str, program_context: Optional[str] = None) -> Optional[int]:
+        """Structure version of a curriculum's tree, or None if it is not found or not accessible."""
+        query = db.query(Curriculum.structure_version).filter(Curriculum.id == curriculum_id)
+        
+        # 🔒 PROGRAM CONTEXT FILTERING
+        if program_context:
+            query = query.join(Course).filter(Course.program_id == program_context)
+        
+        return query.scalar()
+    
+    def get_cached_curriculum_tree(self, db: Session, curriculum_id: str, program_context: Optional[str] = None) -> Optional[CachedTree]:
+        """
+        Serialized curriculum tree with its ETag.
+        
+        Costs one query for the version check while the cached tree is current;
+        the tree is rebuilt only after its structure version was bumped.
+        """
+        version = self.get_tree_version(db, curriculum_id, program_context)
+        if version is None:
+            return None
+        
+        cached = curriculum_tree_cache.get(curriculum_id, version)
+        if cached is not None:
+            return cached
+        
+        # Read after the version, so a concurrent change can only make the body newer than its key
+        tree = self.get_curriculum_tree(db, curriculum_id)
+        if tree is None:
+            return None
+        cached = CachedTree(
+            version=version,
+            etag=tree_etag(curriculum_id, version),
+            body=tree.model_dump_json().encode(),
+        )
+        curriculum_tree_cache.put(curriculum_id, cached)
+        return cached
+    
     def get_curriculum_tree(self, db: Session, curriculum_id: str, program_context: Optional[str] = None) -> Optional[CurriculumTreeResponse]:
-        """Get curriculum with full tree structure of levels, modules, and lessons."""
-        query = db.query(Curriculum).options(
-            joinedload(Curriculum.levels)
-            .joinedload(Level.modules)
-            .joinedload(Module.sections)
-            .joinedload(Section.lessons)
-        ).filter(Curriculum.id == curriculum_id)
+        """Get curriculum with full tree structure of levels, modules, sections and lessons."""
+        query = db.query(Curriculum).filter(Curriculum.id == curriculum_id)
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
@@ -372,57 +406,66 @@ class CurriculumService(BaseService[Curriculum, CurriculumCreate, CurriculumUpda
         if not curriculum:
             return None
         
-        # Build level tree with modules and lessons
+        # One query per level through the denormalized curriculum_id, already in display order
         levels = []
-        for level in curriculum.levels:
+        levels_by_id = {}
+        for level in db.query(Level).filter(Level.curriculum_id == curriculum_id).order_by(
+            Level.sequence_order, Level.display_order, Level.id
+        ):
             level_data = {
                 "id": level.id,
                 "name": level.name,
-                "sequence": level.sequence,
+                "sequence": level.sequence_order,
                 "status": level.status,
                 "modules": []
             }
-            
-            for module in level.modules:
-                module_data = {
-                    "id": module.id,
-                    "name": module.name,
-                    "sequence": module.sequence,
-                    "status": module.status,
-                    "sections": []
-                }
-                
-                for section in module.sections:
-                    section_data = {
-                        "id": section.id,
-                        "name": section.name,
-                        "sequence": section.sequence,
-                        "lessons": []
-                    }
-                    
-                    for lesson in section.lessons:
-                        lesson_data = {
-                            "id": lesson.id,
-                            "title": lesson.title,
-                            "sequence": lesson.sequence,
-                            "content_type": lesson.content_type
-                        }
-                        section_data["lessons"].append(lesson_data)
-                    
-                    # Sort lessons by sequence
-                    section_data["lessons"].sort(key=lambda x: x["sequence"])
-                    module_data["sections"].append(section_data)
-                
-                # Sort sections by sequence
-                module_data["sections"].sort(key=lambda x: x["sequence"])
-                level_data["modules"].append(module_data)
-            
-            # Sort modules by sequence
-            level_data["modules"].sort(key=lambda x: x["sequence"])
             levels.append(level_data)
-        
-        # Sort levels by sequence
-        levels.sort(key=lambda x: x["sequence"])
+            levels_by_id[level.id] = level_data
+        
+        modules_by_id = {}
+        for module in db.query(Module).filter(Module.curriculum_id == curriculum_id).order_by(
+            Module.sequence_order, Module.display_order, Module.id
+        ):
+            module_data = {
+                "id": module.id,
+                "name": module.name,
+                "sequence": module.sequence_order,
+                "status": module.status,
+                "sections": []
+            }
+            if module.level_id in levels_by_id:
+                levels_by_id[module.level_id]["modules"].append(module_data)
+                modules_by_id[module.id] = module_data
+        
+        sections_by_id = {}
+        for section in db.query(Section).filter(Section.curriculum_id == curriculum_id).order_by(
+            Section.sequence_order, Section.display_order, Section.id
+        ):
+            section_data = {
+                "id": section.id,
+                "name": section.name,
+                "sequence": section.sequence_order,
+                "status": section.status,
+                "lessons": []
+            }
+            if section.module_id in modules_by_id:
+                modules_by_id[section.module_id]["sections"].append(section_data)
+                sections_by_id[section.id] = section_data
+        
+        lessons = db.query(
+            Lesson.id, Lesson.section_id, Lesson.title, Lesson.sequence_order, Lesson.status, Lesson.lesson_types
+        ).filter(Lesson.curriculum_id == curriculum_id).order_by(
+            Lesson.sequence_order, Lesson.display_order, Lesson.id
+        )
+        for lesson in lessons:
+            if lesson.section_id in sections_by_id:
+                sections_by_id[lesson.section_id]["lessons"].append({
+                    "id": lesson.id,
+                    "title": lesson.title,
+                    "sequence": lesson.sequence_order,
+                    "status": lesson.status,
+                    "lesson_types": lesson.lesson_types or []
+                })
         
         return CurriculumTreeResponse(
             id=curriculum.id,
@@ -472,11 +515,12 @@ class CurriculumService(BaseService[Curriculum, CurriculumCreate, CurriculumUpda
             "name": request.new_name,
             "description": original.description,
             "course_id": target_course_id,
+            "objectives": original.objectives,
+            "duration_hours": original.duration_hours,
             "difficulty_level": original.difficulty_level,
-            "min_age": original.min_age,
-            "max_age": original.max_age,
             "prerequisites": original.prerequisites,
-            "learning_objectives": original.learning_objectives,
+            "age_ranges": list(original.age_ranges or []),
+            "is_default_for_age_groups": [],  # Defaults stay with the original
             "status": "draft",  # Always start as draft
             "sequence": 0  # Will be set to max + 1
         }
@@ -494,9 +538,15 @@ class CurriculumService(BaseService[Curriculum, CurriculumCreate, CurriculumUpda
         db.add(new_curriculum)
         db.flush()  # Get the ID without committing
         
-        # TODO: Duplicate levels, modules, sections, lessons, assessments, equipment, media
-        # This would be a complex operation requiring recursive duplication
-        # For now, just create the curriculum structure
+        # Levels, modules, sections, lessons, assessments, equipment and media, set-based
+        copy_curriculum_content(
+            db,
+            original.id,
+            new_curriculum.id,
+            target_course.program_id,
+            request,
+            created_by
+        )
         
         db.commit()
         db.refresh(new_curriculum)
@@ -631,18 +681,14 @@ class CurriculumService(BaseService[Curriculum, CurriculumCreate, CurriculumUpda
         ).scalar() or 0
         
         # Get total module count
-        total_module_count = db.query(func.count(Module.id)).join(
-            Level, Level.id == Module.level_id
-        ).filter(Level.curriculum_id == curriculum.id).scalar() or 0
+        total_module_count = db.query(func.count(Module.id)).filter(
+            Module.curriculum_id == curriculum.id
+        ).scalar() or 0
         
         # Get total lesson count
-        total_lesson_count = db.query(func.count(Lesson.id)).join(
-            Section, Section.id == Lesson.section_id
-        ).join(
-            Module, Module.id == Section.module_id
-        ).join(
-            Level, Level.id == Module.level_id
-        ).filter(Level.curriculum_id == curriculum.id).scalar() or 0
+        total_lesson_count = db.query(func.count(Lesson.id)).filter(
+            Lesson.curriculum_id == curriculum.id
+        ).scalar() or 0
         
         # Calculate estimated duration (placeholder calculation)
         estimated_duration_hours = level_count * 8.0  # Rough estimate
@@ -0,0 +1,204 @@
+"""
+The curriculum hierarchy and its flush-time change detection.
+
+Program scope (``program_scope``), ancestry paths (``ancestry``) and tree
+versions (``tree_cache``) are all denormalized down the curriculum -> level
+-> module -> section -> lesson (-> media) hierarchy. The hierarchy is
+defined here once, and after each flush one pass over the session finds the
+rows that were inserted, modified, moved to another parent or deleted,
+together with curricula moved to another course and courses moved to
+another program.
+
+Maintenance modules register flush handlers that receive that change set
+in stage order, update the denormalized columns with set-based SQL, and
+ask for the affected attributes of loaded rows to be expired once the
+flush has completed.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.features.content.models.lesson import Lesson
+from app.features.courses.models.course import Course
+from app.features.curricula.models.curriculum import Curriculum
+from app.features.curricula.models.level import Level
+from app.features.curricula.models.module import Module
+from app.features.curricula.models.section import Section
+from app.features.media.models.media import MediaLibrary
+
+_EXPIRE_KEY = "curriculum_hierarchy_expire"
+
+# Flush handler stages: program scope fills in the curriculum IDs of rows
+# inserted below new parents, which the later stages read
+SCOPE_STAGE = 0
+PATH_STAGE = 1
+VERSION_STAGE = 2
+
+
+@dataclass(frozen=True)
+class HierarchyLevel:
+    """A model in the hierarchy and how it references its parent."""
+
+    model: Any
+    parent: Any
+    foreign_key: str
+    relationship: Optional[str] = None
+
+    @property
+    def has_curriculum_column(self) -> bool:
+        # Levels reference their curriculum directly
+        return self.model is not Level
+
+    @property
+    def in_tree(self) -> bool:
+        # Media hangs off lessons but is not part of the content tree (no path, no version bump)
+        return self.model is not MediaLibrary
+
+
+# Top-down; each entry's parent is the previous entry's model (Level's is Curriculum)
+HIERARCHY: List[HierarchyLevel] = [
+    HierarchyLevel(Level, Curriculum, "curriculum_id", "curriculum"),
+    HierarchyLevel(Module, Level, "level_id", "level"),
+    HierarchyLevel(Section, Module, "module_id", "module"),
+    HierarchyLevel(Lesson, Section, "section_id", "section"),
+    HierarchyLevel(MediaLibrary, Lesson, "lesson_id"),
+]
+BY_MODEL: Dict[Any, int] = {spec.model: index for index, spec in enumerate(HIERARCHY)}
+TREE_MODELS = tuple(spec.model for spec in HIERARCHY if spec.in_tree)
+
+
+def level_of(obj: Any) -> Optional[HierarchyLevel]:
+    """Hierarchy entry of a row, or None for other objects (including curricula)."""
+    index = BY_MODEL.get(type(obj))
+    return HIERARCHY[index] if index is not None else None
+
+
+def depth(obj: Any) -> int:
+    """Sort key ordering curricula and hierarchy rows top-down."""
+    return BY_MODEL.get(type(obj), -1)
+
+
+def changed(obj: Any, *keys: Optional[str]) -> bool:
+    """Whether any of the given attributes has pending changes."""
+    state = inspect(obj)
+    return any(state.attrs[key].history.has_changes() for key in keys if key)
+
+
+def parent_changed(obj: Any, spec: HierarchyLevel) -> bool:
+    """Whether a row was given another parent, by foreign key or relationship."""
+    return changed(obj, spec.foreign_key, spec.relationship)
+
+
+@dataclass
+class HierarchyChanges:
+    """
+    Curricula and hierarchy rows touched by one flush, each list top-down.
+
+    ``modified`` includes the rows in ``moved`` and ``moved_curricula``;
+    ``previous_curricula`` are the curricula that moved rows left.
+    """
+
+    new: List[Any] = field(default_factory=list)
+    modified: List[Any] = field(default_factory=list)
+    deleted: List[Any] = field(default_factory=list)
+    moved: List[Any] = field(default_factory=list)
+    moved_curricula: List[Curriculum] = field(default_factory=list)
+    moved_courses: List[Course] = field(default_factory=list)
+    previous_curricula: Set[str] = field(default_factory=set)
+    expirations: Dict[Any, Dict[str, Optional[Set[str]]]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.new or self.modified or self.deleted or self.moved_courses)
+
+    def expire(self, models: Iterable[Any], attributes: Iterable[str], ids: Optional[Iterable[str]] = None) -> None:
+        """Expire attributes of loaded rows (all of them, or only ``ids``) after the flush."""
+        ids = set(ids) if ids is not None else None
+        for model in models:
+            pending = self.expirations.setdefault(model, {})
+            for attribute in attributes:
+                current = pending.get(attribute, set())
+                pending[attribute] = None if current is None or ids is None else current | ids
+
+
+def _tracked(obj: Any) -> bool:
+    return isinstance(obj, Curriculum) or type(obj) in BY_MODEL
+
+
+def detect_changes(session: Session) -> HierarchyChanges:
+    """Classify the session's pending curricula, hierarchy rows and moved courses."""
+    changes = HierarchyChanges()
+    changes.new = [obj for obj in session.new if _tracked(obj)]
+    changes.deleted = [obj for obj in session.deleted if _tracked(obj)]
+    for obj in session.dirty:
+        if obj in session.deleted:
+            continue
+        if isinstance(obj, Course):
+            if changed(obj, "program_id"):
+                changes.moved_courses.append(obj)
+            continue
+        if not _tracked(obj) or not session.is_modified(obj, include_collections=False):
+            continue
+        changes.modified.append(obj)
+        spec = level_of(obj)
+        if spec is None:
+            if changed(obj, "course_id", "course"):
+                changes.moved_curricula.append(obj)
+            continue
+        if parent_changed(obj, spec):
+            changes.moved.append(obj)
+        if spec.has_curriculum_column:
+            # Read now: later handlers may overwrite the history with set_committed_value()
+            changes.previous_curricula.update(inspect(obj).attrs.curriculum_id.history.deleted)
+    changes.previous_curricula.discard(None)
+
+    for rows in (changes.new, changes.modified, changes.deleted, changes.moved):
+        rows.sort(key=depth)
+    return changes
+
+
+# ----------------------------------------------------------------------
+# Flush handlers
+# ----------------------------------------------------------------------
+
+FlushHandler = Callable[[Session, HierarchyChanges], None]
+_handlers: List[Tuple[int, FlushHandler]] = []
+
+
+def on_flush(stage: int) -> Callable[[FlushHandler], FlushHandler]:
+    """Register a handler called after each flush that touched the hierarchy."""
+
+    def register(handler: FlushHandler) -> FlushHandler:
+        _handlers.append((stage, handler))
+        _handlers.sort(key=lambda entry: entry[0])
+        return handler
+
+    return register
+
+
+@event.listens_for(Session, "after_flush")
+def _run_flush_handlers(session: Session, flush_context: Any) -> None:
+    changes = detect_changes(session)
+    if not changes:
+        return
+    for _, handler in _handlers:
+        handler(session, changes)
+    if changes.expirations:
+        session.info[_EXPIRE_KEY] = changes.expirations
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _expire_updated_attributes(session: Session, flush_context: Any) -> None:
+    """Reload attributes of loaded rows that the handlers updated behind the ORM's back."""
+    expirations = session.info.pop(_EXPIRE_KEY, None)
+    if not expirations:
+        return
+    for obj in list(session.identity_map.values()):
+        pending = expirations.get(type(obj))
+        if not pending:
+            continue
+        attributes = [name for name, ids in pending.items() if ids is None or obj.id in ids]
+        if attributes:
+            session.expire(obj, attributes)
@@ -50,12 +50,6 @@ class LevelService(BaseService[Level, LevelCreate, LevelUpdate]):
         if not curriculum:
             raise ValueError(f"Curriculum with ID '{level_data.curriculum_id}' not found or access denied")
         
-        # 🔒 PROGRAM CONTEXT VALIDATION
-        if program_context:
-            course = db.query(Course).filter(Course.id == curriculum.course_id).first()
-            if course and course.program_id != program_context:
-                raise PermissionError(f"Cannot create level for curriculum in different program context")
-        
         # Check for duplicate sequence in the same curriculum
         existing_level = db.query(Level).filter(
             and_(
@@ -79,7 +73,7 @@ class LevelService(BaseService[Level, LevelCreate, LevelUpdate]):
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            query = query.join(Curriculum).join(Course).filter(Course.program_id == program_context)
+            query = query.filter(Level.program_id == program_context)
         
         level = query.first()
         if not level:
@@ -99,7 +93,7 @@ class LevelService(BaseService[Level, LevelCreate, LevelUpdate]):
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            query = query.join(Curriculum).join(Course).filter(Course.program_id == program_context)
+            query = query.filter(Level.program_id == program_context)
         
         level = query.first()
         if not level:
@@ -130,12 +124,6 @@ class LevelService(BaseService[Level, LevelCreate, LevelUpdate]):
             if not curriculum:
                 raise ValueError(f"Curriculum with ID '{level_data.curriculum_id}' not found or access denied")
             
-            # 🔒 PROGRAM CONTEXT VALIDATION
-            if program_context:
-                course = db.query(Course).filter(Course.id == curriculum.course_id).first()
-                if course and course.program_id != program_context:
-                    raise PermissionError(f"Cannot move level to curriculum in different program context")
-        
         # Update level
         updated_level = self.update(db, level, level_data, updated_by)
         
@@ -148,7 +136,7 @@ class LevelService(BaseService[Level, LevelCreate, LevelUpdate]):
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            level_query = level_query.join(Curriculum).join(Course).filter(Course.program_id == program_context)
+            level_query = level_query.filter(Level.program_id == program_context)
         
         level = level_query.first()
         if not level:
@@ -174,14 +162,18 @@ class LevelService(BaseService[Level, LevelCreate, LevelUpdate]):
                    per_page: int = 20,
                    program_context: Optional[str] = None) -> Tuple[List[LevelResponse], int]:
         """List levels with optional search and pagination."""
-        query = db.query(Level).join(Curriculum).join(Course).join(Program)
+        query = db.query(Level)
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            query = query.filter(Course.program_id == program_context)
+            query = query.filter(Level.program_id == program_context)
         
         # Apply filters
         if search_params:
+            # Only name search and the course filter need the parent tables
+            if search_params.search or search_params.course_id:
+                query = query.join(Curriculum).join(Course).join(Program)
+            
             if search_params.search:
                 search_term = f"%{search_params.search}%"
                 query = query.filter(
@@ -204,7 +196,7 @@ class LevelService(BaseService[Level, LevelCreate, LevelUpdate]):
                 query = query.filter(Curriculum.course_id == search_params.course_id)
             
             if search_params.program_id:
-                query = query.filter(Course.program_id == search_params.program_id)
+                query = query.filter(Level.program_id == search_params.program_id)
             
             if search_params.status:
                 query = query.filter(Level.status == search_params.status)
@@ -277,11 +269,11 @@ class LevelService(BaseService[Level, LevelCreate, LevelUpdate]):
     def get_level_stats(self, db: Session, program_context: Optional[str] = None) -> LevelStatsResponse:
         """Get level statistics."""
         # Base query with program context filtering
-        base_query = db.query(Level).join(Curriculum).join(Course)
+        base_query = db.query(Level)
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            base_query = base_query.filter(Course.program_id == program_context)
+            base_query = base_query.filter(Level.program_id == program_context)
         
         # Total levels
         total_levels = base_query.count()
@@ -290,10 +282,10 @@ class LevelService(BaseService[Level, LevelCreate, LevelUpdate]):
         status_query = db.query(
             Level.status,
             func.count(Level.id)
-        ).join(Curriculum).join(Course)
+        )
         
         if program_context:
-            status_query = status_query.filter(Course.program_id == program_context)
+            status_query = status_query.filter(Level.program_id == program_context)
         
         status_stats = status_query.group_by(Level.status).all()
         levels_by_status = dict(status_stats)
@@ -302,10 +294,10 @@ class LevelService(BaseService[Level, LevelCreate, LevelUpdate]):
         curriculum_query = db.query(
             Curriculum.name,
             func.count(Level.id)
-        ).join(Curriculum).join(Course)
+        ).select_from(Level).join(Curriculum)
         
         if program_context:
-            curriculum_query = curriculum_query.filter(Course.program_id == program_context)
+            curriculum_query = curriculum_query.filter(Level.program_id == program_context)
         
         curriculum_stats = curriculum_query.group_by(Curriculum.name).all()
         levels_by_curriculum = dict(curriculum_stats)
@@ -314,10 +306,10 @@ class LevelService(BaseService[Level, LevelCreate, LevelUpdate]):
         course_query = db.query(
             Course.name,
             func.count(Level.id)
-        ).join(Curriculum).join(Course)
+        ).select_from(Level).join(Curriculum).join(Course)
         
         if program_context:
-            course_query = course_query.filter(Course.program_id == program_context)
+            course_query = course_query.filter(Level.program_id == program_context)
         
         course_stats = course_query.group_by(Course.name).all()
         levels_by_course = dict(course_stats)
@@ -326,30 +318,30 @@ class LevelService(BaseService[Level, LevelCreate, LevelUpdate]):
         program_query = db.query(
             Program.name,
             func.count(Level.id)
-        ).join(Curriculum).join(Course).join(Program)
+        ).select_from(Level).join(Program, Program.id == Level.program_id)
         
         if program_context:
-            program_query = program_query.filter(Course.program_id == program_context)
+            program_query = program_query.filter(Level.program_id == program_context)
         
         program_stats = program_query.group_by(Program.name).all()
         levels_by_program = dict(program_stats)
         
         # Average modules per level
-        module_query = db.query(func.count(Module.id)).join(Level).join(Curriculum).join(Course)
+        module_query = db.query(func.count(Module.id))
         
         if program_context:
-            module_query = module_query.filter(Course.program_id == program_context)
+            module_query = module_query.filter(Module.program_id == program_context)
         
         module_counts = module_query.scalar() or 0
         avg_modules_per_level = module_counts / total_levels if total_levels > 0 else 0
         
         # Average duration
-        duration_query = db.query(func.avg(Level.estimated_duration_hours)).join(Curriculum).join(Course).filter(
+        duration_query = db.query(func.avg(Level.estimated_duration_hours)).filter(
             Level.estimated_duration_hours.isnot(None)
         )
         
         if program_context:
-            duration_query = duration_query.filter(Course.program_id == program_context)
+            duration_query = duration_query.filter(Level.program_id == program_context)
         
         avg_duration = duration_query.scalar() or 0
         
@@ -381,7 +373,7 @@ class LevelService(BaseService[Level, LevelCreate, LevelUpdate]):
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            query = query.join(Curriculum).join(Course).filter(Course.program_id == program_context)
+            query = query.filter(Level.program_id == program_context)
         
         level = query.first()
         
@@ -451,7 +443,7 @@ class LevelService(BaseService[Level, LevelCreate, LevelUpdate]):
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            levels_query = levels_query.join(Curriculum).join(Course).filter(Course.program_id == program_context)
+            levels_query = levels_query.filter(Level.program_id == program_context)
         
         levels = levels_query.all()
         
@@ -500,10 +492,10 @@ class LevelService(BaseService[Level, LevelCreate, LevelUpdate]):
         """Bulk update level status."""
         # Validate all levels are accessible in current program context
         if program_context:
-            accessible_levels = db.query(Level.id).join(Curriculum).join(Course).filter(
+            accessible_levels = db.query(Level.id).filter(
                 and_(
                     Level.id.in_(request.level_ids),
-                    Course.program_id == program_context
+                    Level.program_id == program_context
                 )
             ).all()
             
@@ -545,7 +537,7 @@ class LevelService(BaseService[Level, LevelCreate, LevelUpdate]):
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            query = query.join(Curriculum).join(Course).filter(Course.program_id == program_context)
+            query = query.filter(Level.program_id == program_context)
         
         level = query.first()
         if not level:
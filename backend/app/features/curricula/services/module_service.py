@@ -40,24 +40,16 @@ class ModuleService(BaseService[Module, ModuleCreate, ModuleUpdate]):
                      program_context: Optional[str] = None) -> ModuleResponse:
         """Create a new module."""
         # Verify level exists and program access
-        level_query = db.query(Level).join(Curriculum).join(Course).filter(Level.id == module_data.level_id)
+        level_query = db.query(Level).filter(Level.id == module_data.level_id)
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            level_query = level_query.filter(Course.program_id == program_context)
+            level_query = level_query.filter(Level.program_id == program_context)
         
         level = level_query.first()
         if not level:
             raise ValueError(f"Level with ID '{module_data.level_id}' not found or access denied")
         
-        # 🔒 PROGRAM CONTEXT VALIDATION
-        if program_context:
-            curriculum = db.query(Curriculum).filter(Curriculum.id == level.curriculum_id).first()
-            if curriculum:
-                course = db.query(Course).filter(Course.id == curriculum.course_id).first()
-                if course and course.program_id != program_context:
-                    raise PermissionError(f"Cannot create module for level in different program context")
-        
         # Check for duplicate sequence in the same level
         existing_module = db.query(Module).filter(
             and_(
@@ -81,7 +73,7 @@ class ModuleService(BaseService[Module, ModuleCreate, ModuleUpdate]):
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            query = query.join(Level).join(Curriculum).join(Course).filter(Course.program_id == program_context)
+            query = query.filter(Module.program_id == program_context)
         
         module = query.first()
         if not module:
@@ -94,14 +86,18 @@ class ModuleService(BaseService[Module, ModuleCreate, ModuleUpdate]):
         page: int = 1, per_page: int = 20, program_context: Optional[str] = None
     ) -> Tuple[List[ModuleResponse], int]:
         """List modules with pagination and filtering."""
-        query = db.query(Module).join(Level).join(Curriculum).join(Course).join(Program)
+        query = db.query(Module)
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            query = query.filter(Course.program_id == program_context)
+            query = query.filter(Module.program_id == program_context)
         
         # Apply filters
         if search_params:
+            # Only name search and the course filter need the parent tables
+            if search_params.search or search_params.course_id:
+                query = query.join(Level).join(Curriculum).join(Course).join(Program)
+            
             if search_params.search:
                 search_term = f"%{search_params.search}%"
                 query = query.filter(
@@ -120,13 +116,13 @@ class ModuleService(BaseService[Module, ModuleCreate, ModuleUpdate]):
                 query = query.filter(Module.level_id == search_params.level_id)
             
             if search_params.curriculum_id:
-                query = query.filter(Level.curriculum_id == search_params.curriculum_id)
+                query = query.filter(Module.curriculum_id == search_params.curriculum_id)
             
             if search_params.course_id:
                 query = query.filter(Curriculum.course_id == search_params.course_id)
             
             if search_params.program_id:
-                query = query.filter(Course.program_id == search_params.program_id)
+                query = query.filter(Module.program_id == search_params.program_id)
             
             if search_params.status:
                 query = query.filter(Module.status == search_params.status)
@@ -173,7 +169,7 @@ class ModuleService(BaseService[Module, ModuleCreate, ModuleUpdate]):
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            query = query.join(Level).join(Curriculum).join(Course).filter(Course.program_id == program_context)
+            query = query.filter(Module.program_id == program_context)
         
         module = query.first()
         if not module:
@@ -194,24 +190,16 @@ class ModuleService(BaseService[Module, ModuleCreate, ModuleUpdate]):
         
         # Verify new level exists and program access if being updated
         if module_data.level_id and module_data.level_id != module.level_id:
-            level_query = db.query(Level).join(Curriculum).join(Course).filter(Level.id == module_data.level_id)
+            level_query = db.query(Level).filter(Level.id == module_data.level_id)
             
             # 🔒 PROGRAM CONTEXT FILTERING
             if program_context:
-                level_query = level_query.filter(Course.program_id == program_context)
+                level_query = level_query.filter(Level.program_id == program_context)
             
             level = level_query.first()
             if not level:
                 raise ValueError(f"Level with ID '{module_data.level_id}' not found or access denied")
             
-            # 🔒 PROGRAM CONTEXT VALIDATION
-            if program_context:
-                curriculum = db.query(Curriculum).filter(Curriculum.id == level.curriculum_id).first()
-                if curriculum:
-                    course = db.query(Course).filter(Course.id == curriculum.course_id).first()
-                    if course and course.program_id != program_context:
-                        raise PermissionError(f"Cannot move module to level in different program context")
-        
         # Update module
         updated_module = self.update(db, module, module_data, updated_by)
         
@@ -224,7 +212,7 @@ class ModuleService(BaseService[Module, ModuleCreate, ModuleUpdate]):
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            module_query = module_query.join(Level).join(Curriculum).join(Course).filter(Course.program_id == program_context)
+            module_query = module_query.filter(Module.program_id == program_context)
         
         module = module_query.first()
         if not module:
@@ -249,11 +237,11 @@ class ModuleService(BaseService[Module, ModuleCreate, ModuleUpdate]):
     ) -> Tuple[List[ModuleResponse], int]:
         """Get modules for a specific level."""
         # Verify level access first
-        level_query = db.query(Level).join(Curriculum).join(Course).filter(Level.id == level_id)
+        level_query = db.query(Level).filter(Level.id == level_id)
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            level_query = level_query.filter(Course.program_id == program_context)
+            level_query = level_query.filter(Level.program_id == program_context)
         
         level = level_query.first()
         if not level:
@@ -283,7 +271,7 @@ class ModuleService(BaseService[Module, ModuleCreate, ModuleUpdate]):
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            query = query.join(Level).join(Curriculum).join(Course).filter(Course.program_id == program_context)
+            query = query.filter(Module.program_id == program_context)
         
         module = query.first()
         if not module:
@@ -333,7 +321,7 @@ class ModuleService(BaseService[Module, ModuleCreate, ModuleUpdate]):
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            query = query.join(Level).join(Curriculum).join(Course).filter(Course.program_id == program_context)
+            query = query.filter(Module.program_id == program_context)
         
         module = query.first()
         if not module:
@@ -366,7 +354,7 @@ class ModuleService(BaseService[Module, ModuleCreate, ModuleUpdate]):
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            modules_query = modules_query.join(Level).join(Curriculum).join(Course).filter(Course.program_id == program_context)
+            modules_query = modules_query.filter(Module.program_id == program_context)
         
         modules = modules_query.all()
         
@@ -417,10 +405,10 @@ class ModuleService(BaseService[Module, ModuleCreate, ModuleUpdate]):
         """Bulk update module status."""
         # Validate all modules are accessible in current program context
         if program_context:
-            accessible_modules = db.query(Module.id).join(Level).join(Curriculum).join(Course).filter(
+            accessible_modules = db.query(Module.id).filter(
                 and_(
                     Module.id.in_(status_data.module_ids),
-                    Course.program_id == program_context
+                    Module.program_id == program_context
                 )
             ).all()
             
@@ -455,11 +443,11 @@ class ModuleService(BaseService[Module, ModuleCreate, ModuleUpdate]):
     def get_module_stats(self, db: Session, program_context: Optional[str] = None) -> ModuleStatsResponse:
         """Get module statistics."""
         # Base query with program context filtering
-        base_query = db.query(Module).join(Level).join(Curriculum).join(Course)
+        base_query = db.query(Module)
         
         # 🔒 PROGRAM CONTEXT FILTERING
         if program_context:
-            base_query = base_query.filter(Course.program_id == program_context)
+            base_query = base_query.filter(Module.program_id == program_context)
         
         # Total modules
         total_modules = base_query.count()
@@ -468,10 +456,10 @@ class ModuleService(BaseService[Module, ModuleCreate, ModuleUpdate]):
         status_query = db.query(
             Module.status,
             func.count(Module.id)
-        ).join(Level).join(Curriculum).join(Course)
+        )
         
         if program_context:
-            status_query = status_query.filter(Course.program_id == program_context)
+            status_query = status_query.filter(Module.program_id == program_context)
         
         status_stats = status_query.group_by(Module.status).all()
         modules_by_status = dict(status_stats)
@@ -480,10 +468,10 @@ class ModuleService(BaseService[Module, ModuleCreate, ModuleUpdate]):
         level_query = db.query(
             Level.name,
             func.count(Module.id)
-        ).join(Level).join(Curriculum).join(Course)
+        ).select_from(Module).join(Level)
         
         if program_context:
-            level_query = level_query.filter(Course.program_id == program_context)
+            level_query = level_query.filter(Module.program_id == program_context)
         
         level_stats = level_query.group_by(Level.name).all()
         modules_by_level = dict(level_stats)
@@ -492,10 +480,10 @@ class ModuleService(BaseService[Module, ModuleCreate, ModuleUpdate]):
         curriculum_query = db.query(
             Curriculum.name,
             func.count(Module.id)
-        ).join(Level).join(Curriculum).join(Course)
+        ).select_from(Module).join(Curriculum, Curriculum.id == Module.curriculum_id)
         
         if program_context:
-            curriculum_query = curriculum_query.filter(Course.program_id == program_context)
+            curriculum_query = curriculum_query.filter(Module.program_id == program_context)
         
         curriculum_stats = curriculum_query.group_by(Curriculum.name).all()
         modules_by_curriculum = dict(curriculum_stats)
@@ -504,30 +492,30 @@ class ModuleService(BaseService[Module, ModuleCreate, ModuleUpdate]):
         program_query = db.query(
             Program.name,
             func.count(Module.id)
-        ).join(Level).join(Curriculum).join(Course).join(Program)
+        ).select_from(Module).join(Program, Program.id == Module.program_id)
         
         if program_context:
-            program_query = program_query.filter(Course.program_id == program_context)
+            program_query = program_query.filter(Module.program_id == program_context)
         
         program_stats = program_query.group_by(Program.name).all()
         modules_by_program = dict(program_stats)
         
         # Average sections per module
-        section_query = db.query(func.count(Section.id)).join(Module).join(Level).join(Curriculum).join(Course)
+        section_query = db.query(func.count(Section.id))
         
         if program_context:
-            section_query = section_query.filter(Course.program_id == program_context)
+            section_query = section_query.filter(Section.program_id == program_context)
         
         section_counts = section_query.scalar() or 0
         avg_sections_per_module = section_counts / total_modules if total_modules > 0 else 0
         
         # Average duration
-        duration_query = db.query(func.avg(Module.estimated_duration_hours)).join(Level).join(Curriculum).join(Course).filter(
+        duration_query = db.query(func.avg(Module.estimated_duration_hours)).filter(
             Module.estimated_duration_hours.isnot(None)
         )
         
         if program_context:
-            duration_query = duration_query.filter(Course.program_id == program_context)
+            duration_query = duration_query.filter(Module.program_id == program_context)
         
         avg_duration = duration_query.scalar() or 0
         
@@ -0,0 +1,170 @@
+"""
+Denormalized program scope for the curriculum hierarchy.
+
+Levels carry ``program_id``; modules, sections, lessons and media carry
+``curriculum_id`` and ``program_id``. Program-scoped queries filter on those
+columns directly instead of joining up through Section -> Module -> Level ->
+Curriculum -> Course.
+
+Session flush events keep the columns consistent:
+
+* new rows, and rows whose parent reference changed, copy the scope from
+  their parent before the flush. Rows whose parent is inserted in the same
+  flush (and so has no ID yet) are filled top-down right after it;
+* when an existing row moves to another parent, or a curriculum moves to
+  another course, or a course to another program, the rows below it are
+  updated with one set-based ``UPDATE`` per table after the flush.
+
+Bulk ``query.update()`` calls and raw SQL that change parent references
+bypass ORM events and must set the scope columns themselves.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event, inspect, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.features.courses.models.course import Course
+from app.features.curricula.models.curriculum import Curriculum
+from app.features.curricula.services.hierarchy import (
+    BY_MODEL,
+    HIERARCHY,
+    SCOPE_STAGE,
+    HierarchyChanges,
+    HierarchyLevel,
+    on_flush,
+    parent_changed,
+)
+from app.features.media.models.media import MediaLibrary
+
+_DEFERRED_KEY = "program_scope_deferred"
+
+Scope = Tuple[Optional[str], Optional[str]]  # (curriculum_id, program_id)
+
+
+def scope_of(session: Session, obj: Any) -> Scope:
+    """(curriculum_id, program_id) of a curriculum or a row in the hierarchy."""
+    if isinstance(obj, Curriculum):
+        course = session.get(Course, obj.course_id) if obj.course_id else obj.course
+        return obj.id, course.program_id if course is not None else None
+    return obj.curriculum_id, obj.program_id
+
+
+# ----------------------------------------------------------------------
+# Flush events
+# ----------------------------------------------------------------------
+
+@event.listens_for(Session, "before_flush")
+def _fill_scope(session: Session, flush_context: Any, instances: Any) -> None:
+    """Copy the scope from the parent onto new and re-parented rows."""
+    changed = [
+        obj for obj in list(session.new) + list(session.dirty)
+        if type(obj) in BY_MODEL and obj not in session.deleted
+    ]
+    changed.sort(key=lambda obj: BY_MODEL[type(obj)])
+
+    # Parents inserted in this flush, which session.get() cannot find yet
+    pending = {(type(obj), obj.id): obj for obj in session.new if obj.id is not None}
+    deferred: List[Any] = []
+    with session.no_autoflush:
+        for obj in changed:
+            spec = HIERARCHY[BY_MODEL[type(obj)]]
+            state = inspect(obj)
+            if state.pending or obj.program_id is None or parent_changed(obj, spec):
+                parent = _parent(session, obj, spec, pending)
+                if parent is not None and inspect(parent).pending:
+                    deferred.append(obj)
+                else:
+                    _assign_scope(session, obj, spec, parent)
+
+    if deferred:
+        session.info.setdefault(_DEFERRED_KEY, []).extend(deferred)
+
+
+@on_flush(SCOPE_STAGE)
+def _cascade_scope(session: Session, changes: HierarchyChanges) -> None:
+    """Fill rows inserted below new parents and update the rows below moved parents."""
+    deferred = session.info.pop(_DEFERRED_KEY, None)
+    roots = changes.moved_courses + changes.moved_curricula + changes.moved
+    if not deferred and not roots:
+        return
+    connection = session.connection()
+
+    for obj in deferred or []:
+        # Already ordered top-down, so each parent's scope is filled in before its children read it
+        spec = HIERARCHY[BY_MODEL[type(obj)]]
+        curriculum_id, program_id = scope_of(session, session.get(spec.parent, getattr(obj, spec.foreign_key)))
+        values = {"program_id": program_id}
+        if spec.has_curriculum_column:
+            values["curriculum_id"] = curriculum_id
+        connection.execute(update(spec.model).where(spec.model.id == obj.id).values(**values))
+        for key, value in values.items():
+            set_committed_value(obj, key, value)
+
+    if not roots:
+        return
+    # Courses first, then curricula, then hierarchy rows top-down
+    for root in roots:
+        if isinstance(root, Course):
+            curricula = select(Curriculum.id).where(Curriculum.course_id == root.id)
+            _set_program(connection, curricula, root.program_id)
+        elif isinstance(root, Curriculum):
+            program_id = connection.execute(
+                select(Course.program_id).where(Course.id == root.course_id)
+            ).scalar()
+            _set_program(connection, [root.id], program_id)
+        else:
+            _set_subtree(connection, scope_of(session, root), root)
+    changes.expire(BY_MODEL, ["curriculum_id", "program_id"])
+
+
+# ----------------------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------------------
+
+def _parent(session: Session, obj: Any, spec: HierarchyLevel, pending: Dict[Tuple[Any, str], Any]) -> Any:
+    state = inspect(obj)
+    if spec.relationship and state.attrs[spec.relationship].history.has_changes():
+        # Assigned through the relationship; the foreign key is only synced during the flush
+        return getattr(obj, spec.relationship)
+    parent_id = getattr(obj, spec.foreign_key)
+    if not parent_id:
+        return None
+    return pending.get((spec.parent, parent_id)) or session.get(spec.parent, parent_id)
+
+
+def _assign_scope(session: Session, obj: Any, spec: HierarchyLevel, parent: Any) -> None:
+    """Set the row's scope from its parent."""
+    if parent is None:
+        if spec.model is not MediaLibrary:
+            return
+        # Media detached from its lesson stays in its program
+        curriculum_id, program_id = None, obj.program_id
+    else:
+        curriculum_id, program_id = scope_of(session, parent)
+
+    if spec.has_curriculum_column:
+        obj.curriculum_id = curriculum_id
+    obj.program_id = program_id
+
+
+def _set_program(connection: Any, curriculum_ids: Any, program_id: Optional[str]) -> None:
+    """Set the program of everything below the given curricula."""
+    for spec in HIERARCHY:
+        column = spec.model.curriculum_id
+        connection.execute(
+            update(spec.model).where(column.in_(curriculum_ids)).values(program_id=program_id)
+        )
+
+
+def _set_subtree(connection: Any, scope: Scope, root: Any) -> None:
+    """Copy a moved row's scope to every row below it."""
+    curriculum_id, program_id = scope
+    parent_ids: Any = [root.id]
+    for spec in HIERARCHY[BY_MODEL[type(root)] + 1:]:
+        condition = getattr(spec.model, spec.foreign_key).in_(parent_ids)
+        connection.execute(
+            update(spec.model).where(condition).values(curriculum_id=curriculum_id, program_id=program_id)
+        )
+        parent_ids = select(spec.model.id).where(condition)
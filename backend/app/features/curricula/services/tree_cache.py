@@ -0,0 +1,150 @@
+"""
+Versioned cache of serialized curriculum trees.
+
+Every curriculum carries a ``structure_version`` that is bumped whenever the
+curriculum or a level, module, section or lesson below it is created,
+updated (including reorders and moves), or deleted. Serialized trees are
+cached per process under that version, so reading a tree costs one query
+for the version check; the version also forms the tree's ETag.
+
+Versions are bumped in the database, in the same transaction as the change,
+so every worker process sees them:
+
+* ORM flushes bump the curricula of the changed rows (the old and the new
+  one for rows that moved) right after the flush;
+* ORM-enabled bulk ``UPDATE``/``DELETE`` statements (``query.update()``,
+  ``query.delete()``) bump the curricula of the matched rows before they run.
+
+Raw SQL that changes the hierarchy bypasses both and must call
+``bump_structure_versions`` itself.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Set
+
+from sqlalchemy import event, select, update
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.core.config import settings
+from app.features.curricula.models.curriculum import Curriculum
+from app.features.curricula.services.hierarchy import (
+    TREE_MODELS,
+    VERSION_STAGE,
+    HierarchyChanges,
+    on_flush,
+)
+
+
+@dataclass(frozen=True)
+class CachedTree:
+    """A serialized curriculum tree at one structure version."""
+
+    version: int
+    etag: str
+    body: bytes
+
+
+def tree_etag(curriculum_id: str, version: int) -> str:
+    """Strong entity tag for a curriculum tree at a structure version."""
+    return f'"{curriculum_id}.{version}"'
+
+
+class CurriculumTreeCache:
+    """Thread-safe LRU of serialized trees, one (latest) version per curriculum."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._trees: "OrderedDict[str, CachedTree]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, curriculum_id: str, version: int) -> Optional[CachedTree]:
+        """The cached tree if it was built at ``version``."""
+        with self._lock:
+            tree = self._trees.get(curriculum_id)
+            if tree is None or tree.version != version:
+                return None
+            self._trees.move_to_end(curriculum_id)
+            return tree
+
+    def put(self, curriculum_id: str, tree: CachedTree) -> None:
+        """Cache a tree unless a newer version is already cached."""
+        if not self.enabled:
+            return
+        with self._lock:
+            current = self._trees.get(curriculum_id)
+            if current is not None and current.version > tree.version:
+                return
+            self._trees[curriculum_id] = tree
+            self._trees.move_to_end(curriculum_id)
+            while len(self._trees) > self.max_entries:
+                self._trees.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop everything."""
+        with self._lock:
+            self._trees.clear()
+
+
+def bump_structure_versions(connection: Any, curriculum_ids: Iterable[Optional[str]]) -> None:
+    """Increment the structure version of the given curricula."""
+    ids = sorted({curriculum_id for curriculum_id in curriculum_ids if curriculum_id})
+    if not ids:
+        return
+    connection.execute(
+        update(Curriculum)
+        .where(Curriculum.id.in_(ids))
+        # Content changes are not edits of the curriculum row itself
+        .values(structure_version=Curriculum.structure_version + 1, updated_at=Curriculum.updated_at)
+    )
+
+
+# ----------------------------------------------------------------------
+# Session events
+# ----------------------------------------------------------------------
+
+def _changed_curricula(changes: HierarchyChanges) -> Set[str]:
+    curriculum_ids: Set[str] = set(changes.previous_curricula)
+    for obj in changes.new + changes.modified + changes.deleted:
+        if isinstance(obj, Curriculum):
+            curriculum_ids.add(obj.id)
+        elif isinstance(obj, TREE_MODELS):
+            curriculum_ids.add(obj.curriculum_id)
+    curriculum_ids.discard(None)
+    return curriculum_ids
+
+
+@on_flush(VERSION_STAGE)
+def _bump_flushed_curricula(session: Session, changes: HierarchyChanges) -> None:
+    # Runs after program scope, which fills in the curriculum_id of rows inserted below new parents
+    curriculum_ids = _changed_curricula(changes)
+    if curriculum_ids:
+        bump_structure_versions(session.connection(), curriculum_ids)
+        changes.expire([Curriculum], ["structure_version"], curriculum_ids)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bump_bulk_curricula(orm_execute_state: ORMExecuteState) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    model = mapper.class_ if mapper is not None else None
+    if model is not Curriculum and model not in TREE_MODELS:
+        return
+
+    statement = orm_execute_state.statement
+    column = Curriculum.id if model is Curriculum else model.curriculum_id
+    affected = select(column).distinct()
+    if statement.whereclause is not None:
+        affected = affected.where(statement.whereclause)
+    session = orm_execute_state.session
+    bump_structure_versions(session.connection(), session.execute(affected).scalars())
+
+
+# Global instance
+curriculum_tree_cache = CurriculumTreeCache(max_entries=settings.CURRICULUM_TREE_CACHE_MAX_ENTRIES)
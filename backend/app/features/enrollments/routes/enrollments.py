@@ -20,6 +20,7 @@ from app.features.enrollments.services.enrollment_service import (
 from app.features.enrollments.services.user_search_service import (
     user_search_service, UserSearchParams, UserSearchResult, UserProgramStatus
 )
+from app.features.enrollments.services.typeahead_index import typeahead_index
 from app.features.students.services.unified_creation_service import UnifiedCreationService
 from app.features.enrollments.services.facility_enrollment_service import FacilityEnrollmentService
 from app.core.exceptions import ValidationError
@@ -113,6 +114,17 @@ class UserSearchRequest(BaseModel):
     exclude_enrolled_in_course: Optional[str] = None
     page: int = 1
     per_page: int = 20
+    cursor: Optional[str] = Field(None, description="next_cursor of the previous page (keyset pagination)")
+
+
+class TypeaheadUserResponse(BaseModel):
+    """Response model for assignment typeahead suggestions."""
+    id: str
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    full_name: str
+    email: Optional[str] = None
+    roles: List[str] = []
 
 
 class AssignmentEligibilityResponse(BaseModel):
@@ -993,7 +1005,8 @@ async def search_users_for_assignment(
             exclude_assigned_to_program=search_request.exclude_assigned_to_program,
             exclude_enrolled_in_course=search_request.exclude_enrolled_in_course,
             page=search_request.page,
-            per_page=search_request.per_page
+            per_page=search_request.per_page,
+            cursor=search_request.cursor
         )
         
         # Perform search
@@ -1079,6 +1092,44 @@ async def search_assignable_parents(
         )
 
 
+@router.get("/typeahead-assignable-users", response_model=List[TypeaheadUserResponse])
+async def typeahead_assignable_users(
+    q: str = Query(..., min_length=1, description="Typed prefix of a name or email"),
+    role: str = Query("student", pattern="^(student|parent)$", description="Role to suggest"),
+    exclude_enrolled_in_course: Optional[str] = Query(None, description="Course ID to exclude"),
+    limit: int = Query(
+        typeahead_index.max_results, ge=1, le=typeahead_index.max_results,
+        description="Maximum number of suggestions"
+    ),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_active_user),
+    program_context: str = Depends(get_program_context)
+):
+    """
+    Suggest users who can be assigned to the current program as they type.
+    
+    Served from an in-memory prefix index, so it only returns lightweight
+    user fields; use search-assignable-students/-parents for full details.
+    """
+    try:
+        return typeahead_index.search(
+            db,
+            query=q,
+            role=role,
+            program_id=program_context,
+            exclude_enrolled_in_course=exclude_enrolled_in_course,
+            limit=limit
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error searching assignable users: {str(e)}"
+        )
+
+
 @router.get("/check-eligibility/{user_id}/{course_id}", response_model=AssignmentEligibilityResponse)
 async def check_assignment_eligibility(
     user_id: str = Path(..., description="User ID"),
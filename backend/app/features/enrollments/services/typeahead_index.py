@@ -0,0 +1,390 @@
+"""
+In-memory prefix index for assignment typeahead.
+
+The enrollment dialogs search for assignable students and parents on every
+keystroke. Instead of running the full user search per keystroke, lookups
+bisect a sorted array of ``(normalized key, user_id)`` pairs built from
+users' names and emails, and filter the candidates against per-program
+assignment sets and per-course enrollment sets:
+
+- keys: accent-folded, lower-cased first name, last name and email
+- program_id -> user IDs with an active assignment to the program
+- course_id -> user IDs with an active or paused enrollment in the course
+
+Committed changes to ``User``, ``ProgramAssignment`` and ``CourseEnrollment``
+rows are picked up through session flush events: changed users are reloaded
+and re-keyed on the next lookup, and the affected program and course sets
+are dropped and reloaded on demand.
+
+Changes committed by other worker processes are picked up by a sync every
+``sync_interval_seconds``: users whose ``updated_at`` moved since the last
+sync are re-keyed the same way, and program and course sets expire after
+the same interval. The whole index is rebuilt after a TTL so deleted users
+and bulk statements that leave ``updated_at`` alone converge too.
+"""
+
+import threading
+import time
+import unicodedata
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, func, inspect
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.features.authentication.models.user import User
+from app.features.common.models.enums import EnrollmentStatus
+from app.features.enrollments.models.course_enrollment import CourseEnrollment
+from app.features.enrollments.models.program_assignment import ProgramAssignment
+
+_PENDING_CHANGES_KEY = "typeahead_index_changes"
+
+_ENROLLED_STATUSES = (EnrollmentStatus.active, EnrollmentStatus.paused)
+
+# Re-read users updated this long before the watermark: a transaction that
+# stamped updated_at earlier may commit after the previous sync
+_SYNC_OVERLAP = timedelta(seconds=60)
+
+
+def normalize(text: Optional[str]) -> str:
+    """Accent-folded, lower-cased form of a name or email."""
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).lower().strip()
+
+
+class TypeaheadEntry:
+    """Indexed snapshot of a user."""
+
+    __slots__ = ("id", "first_name", "last_name", "email", "roles", "is_active", "keys")
+
+    def __init__(self, user_id: str, first_name: str, last_name: str, email: str,
+                 roles: Iterable[str], is_active: bool):
+        self.id = user_id
+        self.first_name = first_name
+        self.last_name = last_name
+        self.email = email
+        self.roles: FrozenSet[str] = frozenset(roles or ())
+        self.is_active = bool(is_active)
+        keys = set()
+        for value in (first_name, last_name):
+            keys.update(normalize(value).split())
+        if email:
+            keys.add(normalize(email))
+        self.keys: Tuple[str, ...] = tuple(sorted(keys))
+
+    def matches(self, tokens: Iterable[str]) -> bool:
+        """Whether every token is a prefix of one of the entry's keys."""
+        return all(any(key.startswith(token) for key in self.keys) for token in tokens)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "full_name": f"{self.first_name or ''} {self.last_name or ''}".strip(),
+            "email": self.email,
+            "roles": sorted(self.roles),
+        }
+
+
+class TypeaheadIndex:
+    """Thread-safe, event-refreshed prefix index of users for typeahead."""
+
+    def __init__(self, ttl_seconds: float, max_results: int, sync_interval_seconds: float = 0):
+        self.ttl_seconds = ttl_seconds
+        self.max_results = max_results
+        # 0 disables the cross-process sync
+        self.sync_interval_seconds = sync_interval_seconds
+        self._entries: Dict[str, TypeaheadEntry] = {}
+        self._keys: List[Tuple[str, str]] = []
+        self._expires_at = 0.0
+        self._synced_at = 0.0
+        self._watermark: Optional[datetime] = None
+        self._stale_users: Set[str] = set()
+        self._assigned_by_program: Dict[str, Tuple[float, FrozenSet[str]]] = {}
+        self._enrolled_by_course: Dict[str, Tuple[float, FrozenSet[str]]] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._membership_generation = 0
+
+    @property
+    def syncing(self) -> bool:
+        return self.sync_interval_seconds > 0
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        db: Session,
+        query: str,
+        role: str,
+        program_id: str,
+        exclude_enrolled_in_course: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Active users with ``role`` not yet assigned to ``program_id``, whose
+        names or email start with every word of ``query``.
+
+        Results follow the alphabetical order of the most selective word's
+        matching key and are capped at ``limit`` (at most ``max_results``).
+        """
+        tokens = normalize(query).split()
+        if not tokens:
+            return []
+        limit = min(limit or self.max_results, self.max_results)
+
+        self._refresh(db)
+        excluded = self._assigned(db, program_id)
+        if exclude_enrolled_in_course:
+            excluded = excluded | self._enrolled(db, exclude_enrolled_in_course)
+
+        prefix = max(tokens, key=len)
+        results: List[Dict[str, Any]] = []
+        seen: Set[str] = set()
+        with self._lock:
+            position = bisect_left(self._keys, (prefix, ""))
+            while position < len(self._keys) and len(results) < limit:
+                key, user_id = self._keys[position]
+                position += 1
+                if not key.startswith(prefix):
+                    break
+                if user_id in seen or user_id in excluded:
+                    continue
+                seen.add(user_id)
+                entry = self._entries[user_id]
+                if entry.is_active and role in entry.roles and entry.matches(tokens):
+                    results.append(entry.as_dict())
+        return results
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    def invalidate_users(self, user_ids: Iterable[str]) -> None:
+        """Reload the given users on the next lookup."""
+        with self._lock:
+            self._stale_users.update(user_ids)
+
+    def invalidate_programs(self, program_ids: Iterable[str]) -> None:
+        """Drop the cached assignment sets of the given programs."""
+        with self._lock:
+            self._membership_generation += 1
+            for program_id in program_ids:
+                self._assigned_by_program.pop(program_id, None)
+
+    def invalidate_courses(self, course_ids: Iterable[str]) -> None:
+        """Drop the cached enrollment sets of the given courses."""
+        with self._lock:
+            self._membership_generation += 1
+            for course_id in course_ids:
+                self._enrolled_by_course.pop(course_id, None)
+
+    def clear(self) -> None:
+        """Drop everything; the next lookup rebuilds the index."""
+        with self._lock:
+            self._generation += 1
+            self._membership_generation += 1
+            self._entries = {}
+            self._keys = []
+            self._expires_at = 0.0
+            self._watermark = None
+            self._stale_users.clear()
+            self._assigned_by_program.clear()
+            self._enrolled_by_course.clear()
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _refresh(self, db: Session) -> None:
+        """Build the index if missing or expired, else re-key changed users."""
+        with self._lock:
+            now = time.monotonic()
+            sync = self.syncing and self._expires_at > now and self._synced_at + self.sync_interval_seconds <= now
+            if sync:
+                self._synced_at = now
+            watermark = self._watermark
+        if sync and watermark is not None:
+            self._sync(db, watermark)
+
+        with self._lock:
+            rebuild = self._expires_at <= time.monotonic()
+            # Taken before querying: changes committed after this point are marked again
+            stale = set() if rebuild else self._stale_users
+            self._stale_users = set()
+            generation = self._generation
+            if rebuild:
+                self._membership_generation += 1
+                self._assigned_by_program.clear()
+                self._enrolled_by_course.clear()
+        if rebuild:
+            self._rebuild(db, generation)
+        elif stale:
+            self._reload_users(db, stale, generation)
+
+    def _rebuild(self, db: Session, generation: int) -> None:
+        # Read first so users changed while loading are picked up by the next sync
+        watermark = self._latest_update(db) if self.syncing else None
+        entries = {entry.id: entry for entry in self._load_entries(db, None)}
+        keys = sorted((key, entry.id) for entry in entries.values() for key in entry.keys)
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._generation += 1
+            self._entries = entries
+            self._keys = keys
+            self._expires_at = time.monotonic() + self.ttl_seconds
+            self._synced_at = time.monotonic()
+            self._watermark = watermark
+
+    def _sync(self, db: Session, watermark: datetime) -> None:
+        """Mark users changed since the watermark (by any process) as stale."""
+        changed, latest = self._changed_users(db, watermark - _SYNC_OVERLAP)
+        with self._lock:
+            self._stale_users.update(changed)
+            if latest is not None and (self._watermark is None or latest > self._watermark):
+                self._watermark = latest
+
+    def _reload_users(self, db: Session, user_ids: Set[str], generation: int) -> None:
+        loaded = {entry.id: entry for entry in self._load_entries(db, user_ids)}
+        with self._lock:
+            if generation != self._generation:
+                self._stale_users.update(user_ids)
+                return
+            self._generation += 1
+            for user_id in user_ids:
+                old = self._entries.pop(user_id, None)
+                if old is not None:
+                    for key in old.keys:
+                        position = bisect_left(self._keys, (key, user_id))
+                        if position < len(self._keys) and self._keys[position] == (key, user_id):
+                            del self._keys[position]
+                new = loaded.get(user_id)
+                if new is not None:
+                    self._entries[user_id] = new
+                    for key in new.keys:
+                        insort(self._keys, (key, user_id))
+
+    @staticmethod
+    def _latest_update(db: Session) -> Optional[datetime]:
+        return db.query(func.max(User.updated_at)).scalar()
+
+    @staticmethod
+    def _changed_users(db: Session, since: datetime) -> Tuple[Set[str], Optional[datetime]]:
+        """IDs of users updated at or after ``since``, and the latest update time."""
+        rows = db.query(User.id, User.updated_at).filter(User.updated_at >= since).all()
+        return {row.id for row in rows}, max((row.updated_at for row in rows), default=None)
+
+    @staticmethod
+    def _load_entries(db: Session, user_ids: Optional[Set[str]]) -> List[TypeaheadEntry]:
+        query = db.query(
+            User.id, User.first_name, User.last_name, User.email, User.roles, User.is_active
+        )
+        if user_ids is not None:
+            query = query.filter(User.id.in_(user_ids))
+        return [
+            TypeaheadEntry(row.id, row.first_name, row.last_name, row.email, row.roles, row.is_active)
+            for row in query.all()
+        ]
+
+    def _assigned(self, db: Session, program_id: str) -> FrozenSet[str]:
+        with self._lock:
+            cached = self._assigned_by_program.get(program_id)
+            generation = self._membership_generation
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        rows = db.query(ProgramAssignment.user_id).filter(
+            ProgramAssignment.program_id == program_id,
+            ProgramAssignment.is_active == True
+        ).all()
+        user_ids = frozenset(row.user_id for row in rows)
+        with self._lock:
+            if generation == self._membership_generation:
+                self._assigned_by_program[program_id] = (self._membership_expiry(), user_ids)
+        return user_ids
+
+    def _membership_expiry(self) -> float:
+        # Without the sync, sets only change through invalidation and rebuilds
+        return time.monotonic() + self.sync_interval_seconds if self.syncing else float("inf")
+
+    def _enrolled(self, db: Session, course_id: str) -> FrozenSet[str]:
+        with self._lock:
+            cached = self._enrolled_by_course.get(course_id)
+            generation = self._membership_generation
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        rows = db.query(CourseEnrollment.user_id).filter(
+            CourseEnrollment.course_id == course_id,
+            CourseEnrollment.status.in_(_ENROLLED_STATUSES)
+        ).all()
+        user_ids = frozenset(row.user_id for row in rows)
+        with self._lock:
+            if generation == self._membership_generation:
+                self._enrolled_by_course[course_id] = (self._membership_expiry(), user_ids)
+        return user_ids
+
+
+def _values(obj: Any, attribute: str) -> Set[str]:
+    """Current and previously committed values of an attribute."""
+    values = {getattr(obj, attribute)}
+    values.update(inspect(obj).attrs[attribute].history.deleted)
+    values.discard(None)
+    return values
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_typeahead_changes(session: Session, flush_context: Any) -> None:
+    # After the flush so new users already have their server-generated IDs
+    user_ids: Set[str] = set()
+    program_ids: Set[str] = set()
+    course_ids: Set[str] = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, User):
+            user_ids.update(_values(obj, "id"))
+        elif isinstance(obj, ProgramAssignment):
+            program_ids.update(_values(obj, "program_id"))
+        elif isinstance(obj, CourseEnrollment):
+            course_ids.update(_values(obj, "course_id"))
+    if user_ids or program_ids or course_ids:
+        pending = session.info.setdefault(
+            _PENDING_CHANGES_KEY, {"user_ids": set(), "program_ids": set(), "course_ids": set()}
+        )
+        pending["user_ids"].update(user_ids)
+        pending["program_ids"].update(program_ids)
+        pending["course_ids"].update(course_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_typeahead_changes(session: Session) -> None:
+    pending = session.info.pop(_PENDING_CHANGES_KEY, None)
+    if not pending:
+        return
+    if pending["user_ids"]:
+        typeahead_index.invalidate_users(pending["user_ids"])
+    if pending["program_ids"]:
+        typeahead_index.invalidate_programs(pending["program_ids"])
+    if pending["course_ids"]:
+        typeahead_index.invalidate_courses(pending["course_ids"])
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_typeahead_changes(session: Session) -> None:
+    session.info.pop(_PENDING_CHANGES_KEY, None)
+
+
+# Global instance
+typeahead_index = TypeaheadIndex(
+    ttl_seconds=settings.TYPEAHEAD_INDEX_TTL_SECONDS,
+    max_results=settings.TYPEAHEAD_MAX_RESULTS,
+    sync_interval_seconds=settings.TYPEAHEAD_SYNC_INTERVAL_SECONDS,
+)
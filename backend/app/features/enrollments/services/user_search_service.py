@@ -6,14 +6,14 @@ with proper permission validation and role-based filtering for the new two-step
 student/parent creation and assignment process.
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, func, text
+from sqlalchemy import Float, and_, or_, func, text, select, cast
 from fastapi import HTTPException, status
 import logging
 
-from app.features.authentication.models.user import User
+from app.features.authentication.models.user import USER_SEARCH, User
 from app.features.students.models.student import Student
 from app.features.enrollments.models.program_assignment import ProgramAssignment
 from app.features.enrollments.models.course_enrollment import CourseEnrollment
@@ -22,9 +22,13 @@ from app.features.parents.models.parent_child_relationship import ParentChildRel
 from app.features.organizations.models.organization_membership import OrganizationMembership
 from app.features.programs.models.program import Program
 from app.features.common.models.enums import UserRole, ProgramRole, EnrollmentStatus
+from app.features.common.services.keyset import after_cursor, encode_cursor
+from app.features.common.services.text_search import text_search
 
 logger = logging.getLogger(__name__)
 
+_CURRENT_ENROLLMENT_STATUSES = (EnrollmentStatus.active, EnrollmentStatus.paused)
+
 
 @dataclass
 class UserSearchParams:
@@ -40,6 +44,7 @@ class UserSearchParams:
     exclude_enrolled_in_course: Optional[str] = None
     page: int = 1
     per_page: int = 20
+    cursor: Optional[str] = None
 
 
 @dataclass
@@ -50,6 +55,7 @@ class UserSearchResult:
     page: int
     per_page: int
     total_pages: int
+    next_cursor: Optional[str] = None
 
 
 @dataclass
@@ -82,6 +88,12 @@ class UserSearchService:
         """
         Search all users in the system with advanced filtering.
         
+        Pages are selected with an ID-only query ordered by relevance (when
+        searching) or name, then the page's users and their assignment,
+        enrollment and profile summaries are loaded in one batch per table.
+        Pass ``cursor`` (the previous result's ``next_cursor``) for keyset
+        pagination; otherwise ``page`` is used as an offset.
+        
         Args:
             db: Database session
             search_params: Search parameters and filters
@@ -93,86 +105,50 @@ class UserSearchService:
         """
         try:
             # Validate searcher permissions
-            searcher = db.query(User).filter(User.id == searcher_id).first()
+            searcher = db.query(User.id).filter(User.id == searcher_id).first()
             if not searcher:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="Invalid searcher credentials"
                 )
             
-            # Build base query
-            query = db.query(User).options(
-                joinedload(User.program_assignments),
-                joinedload(User.course_enrollments)
+            query = UserSearchService._apply_search_filters(db.query(User.id), search_params)
+            total_count = query.order_by(None).count()
+            
+            # Keyset over the sort columns; the user ID is always last so the order is total
+            if search_params.search_query and search_params.search_query.strip():
+                # Double precision so the value round-trips exactly through the cursor
+                rank = cast(text_search.rank(USER_SEARCH, search_params.search_query, db.get_bind().dialect.name), Float)
+                sort_columns = [rank, User.id]
+                descending = True
+            else:
+                sort_columns = [User.last_name, User.first_name, User.id]
+                descending = False
+            
+            page_query = query.with_entities(*sort_columns).order_by(
+                *(column.desc() if descending else column.asc() for column in sort_columns)
             )
-            
-            # Apply search query filter
-            if search_params.search_query:
-                search_term = f"%{search_params.search_query}%"
-                query = query.filter(
-                    or_(
-                        User.first_name.ilike(search_term),
-                        User.last_name.ilike(search_term),
-                        User.email.ilike(search_term),
-                        func.concat(User.first_name, ' ', User.last_name).ilike(search_term)
-                    )
-                )
-            
-            # Apply role filter
-            if search_params.role_filter:
-                role_conditions = []
-                for role in search_params.role_filter:
-                    role_conditions.append(
-                        func.json_extract(User.roles, '$').like(f'%"{role}"%')
-                    )
-                query = query.filter(or_(*role_conditions))
-            
-            # Apply active status filter
-            if search_params.is_active is not None:
-                query = query.filter(User.is_active == search_params.is_active)
-            
-            # Apply program assignment filter
-            if search_params.program_filter:
-                query = query.join(ProgramAssignment).filter(
-                    ProgramAssignment.program_id == search_params.program_filter,
-                    ProgramAssignment.is_active == True
-                )
-            
-            # Apply organization membership filter
-            if search_params.organization_filter:
-                query = query.join(OrganizationMembership).filter(
-                    OrganizationMembership.organization_id == search_params.organization_filter
-                )
-            
-            # Apply exclusion filters
-            if search_params.exclude_assigned_to_program:
-                # Exclude users already assigned to specific program
-                assigned_user_ids = db.query(ProgramAssignment.user_id).filter(
-                    ProgramAssignment.program_id == search_params.exclude_assigned_to_program,
-                    ProgramAssignment.is_active == True
-                ).subquery()
-                query = query.filter(~User.id.in_(assigned_user_ids))
-            
-            if search_params.exclude_enrolled_in_course:
-                # Exclude users already enrolled in specific course
-                enrolled_user_ids = db.query(CourseEnrollment.user_id).filter(
-                    CourseEnrollment.course_id == search_params.exclude_enrolled_in_course,
-                    CourseEnrollment.status.in_([EnrollmentStatus.ACTIVE, EnrollmentStatus.PAUSED])
-                ).subquery()
-                query = query.filter(~User.id.in_(enrolled_user_ids))
-            
-            # Get total count before pagination
-            total_count = query.count()
-            
-            # Apply pagination
-            offset = (search_params.page - 1) * search_params.per_page
-            users = query.offset(offset).limit(search_params.per_page).all()
-            
-            # Process user data
-            user_data = []
-            for user in users:
-                user_info = UserSearchService._build_user_search_result(db, user, searcher_program_context)
-                user_data.append(user_info)
+            if search_params.cursor:
+                page_query = page_query.filter(after_cursor(sort_columns, search_params.cursor, descending))
+            else:
+                page_query = page_query.offset((search_params.page - 1) * search_params.per_page)
+            rows = page_query.limit(search_params.per_page + 1).all()
+            
+            next_cursor = None
+            if len(rows) > search_params.per_page:
+                rows = rows[:search_params.per_page]
+                next_cursor = encode_cursor(rows[-1])
+            user_ids = [row[-1] for row in rows]
+            
+            users_by_id = {
+                user.id: user for user in db.query(User).filter(User.id.in_(user_ids)).all()
+            } if user_ids else {}
+            summaries = UserSearchService._load_search_summaries(db, user_ids, searcher_program_context)
+            user_data = [
+                UserSearchService._build_user_search_result(users_by_id[user_id], summaries[user_id])
+                for user_id in user_ids
+                if user_id in users_by_id
+            ]
             
             total_pages = (total_count + search_params.per_page - 1) // search_params.per_page
             
@@ -181,7 +157,8 @@ class UserSearchService:
                 total_count=total_count,
                 page=search_params.page,
                 per_page=search_params.per_page,
-                total_pages=total_pages
+                total_pages=total_pages,
+                next_cursor=next_cursor
             )
             
         except HTTPException:
@@ -193,6 +170,53 @@ class UserSearchService:
                 detail="Error performing user search"
             )
 
+    @staticmethod
+    def _apply_search_filters(query, search_params: UserSearchParams):
+        """Apply the search term and filters; membership filters are subqueries so users are never repeated."""
+        if search_params.search_query:
+            query = text_search.filter(query, USER_SEARCH, search_params.search_query)
+        
+        if search_params.role_filter:
+            query = query.filter(or_(*(User.roles.any(role) for role in search_params.role_filter)))
+        
+        if search_params.is_active is not None:
+            query = query.filter(User.is_active == search_params.is_active)
+        
+        if search_params.program_filter:
+            query = query.filter(User.id.in_(
+                select(ProgramAssignment.user_id).where(
+                    ProgramAssignment.program_id == search_params.program_filter,
+                    ProgramAssignment.is_active == True
+                )
+            ))
+        
+        if search_params.organization_filter:
+            query = query.filter(User.id.in_(
+                select(OrganizationMembership.user_id).where(
+                    OrganizationMembership.organization_id == search_params.organization_filter
+                )
+            ))
+        
+        if search_params.exclude_assigned_to_program:
+            # Exclude users already assigned to specific program
+            query = query.filter(~User.id.in_(
+                select(ProgramAssignment.user_id).where(
+                    ProgramAssignment.program_id == search_params.exclude_assigned_to_program,
+                    ProgramAssignment.is_active == True
+                )
+            ))
+        
+        if search_params.exclude_enrolled_in_course:
+            # Exclude users already enrolled in specific course
+            query = query.filter(~User.id.in_(
+                select(CourseEnrollment.user_id).where(
+                    CourseEnrollment.course_id == search_params.exclude_enrolled_in_course,
+                    CourseEnrollment.status.in_(_CURRENT_ENROLLMENT_STATUSES)
+                )
+            ))
+        
+        return query
+
     @staticmethod
     def search_assignable_students(
         db: Session,
@@ -445,87 +469,128 @@ class UserSearchService:
             return False
 
     @staticmethod
-    def _build_user_search_result(
+    def _load_search_summaries(
         db: Session,
-        user: User,
+        user_ids: Sequence[str],
         searcher_program_context: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> Dict[str, Dict[str, Any]]:
         """
-        Build comprehensive user search result data.
+        Load assignment, enrollment and profile summaries for a page of users.
         
-        Args:
-            db: Database session
-            user: User instance
-            searcher_program_context: Program context of searcher
-            
-        Returns:
-            Dictionary with user search result data
+        One projection query per table, filtered to current rows in SQL, so
+        the cost follows the page size rather than each user's history.
         """
-        # Get program assignments
-        program_assignments = []
-        for assignment in user.program_assignments:
-            if assignment.is_active:
-                program_assignments.append({
-                    "program_id": assignment.program_id,
-                    "role": assignment.role_in_program.value,
-                    "assignment_date": assignment.assignment_date.isoformat()
-                })
+        summaries: Dict[str, Dict[str, Any]] = {
+            user_id: {
+                "program_assignments": [],
+                "active_enrollments": [],
+                "student_profile": None,
+                "parent_profile": None,
+                "children_count": 0,
+                "organization_membership": None,
+            }
+            for user_id in user_ids
+        }
+        if not user_ids:
+            return summaries
         
-        # Get course enrollments
-        active_enrollments = []
-        for enrollment in user.course_enrollments:
-            if enrollment.status in [EnrollmentStatus.ACTIVE, EnrollmentStatus.PAUSED]:
-                active_enrollments.append({
-                    "course_id": enrollment.course_id,
-                    "program_id": enrollment.program_id,
-                    "status": enrollment.status.value,
-                    "enrollment_date": enrollment.enrollment_date.isoformat()
-                })
+        assignments = db.query(
+            ProgramAssignment.user_id,
+            ProgramAssignment.program_id,
+            ProgramAssignment.role_in_program,
+            ProgramAssignment.assignment_date
+        ).filter(
+            ProgramAssignment.user_id.in_(user_ids),
+            ProgramAssignment.is_active == True
+        ).order_by(ProgramAssignment.assignment_date).all()
+        for row in assignments:
+            summaries[row.user_id]["program_assignments"].append({
+                "program_id": row.program_id,
+                "role": row.role_in_program.value,
+                "assignment_date": row.assignment_date.isoformat()
+            })
+        
+        enrollments = db.query(
+            CourseEnrollment.user_id,
+            CourseEnrollment.course_id,
+            CourseEnrollment.program_id,
+            CourseEnrollment.status,
+            CourseEnrollment.enrollment_date
+        ).filter(
+            CourseEnrollment.user_id.in_(user_ids),
+            CourseEnrollment.status.in_(_CURRENT_ENROLLMENT_STATUSES)
+        ).order_by(CourseEnrollment.enrollment_date).all()
+        for row in enrollments:
+            summaries[row.user_id]["active_enrollments"].append({
+                "course_id": row.course_id,
+                "program_id": row.program_id,
+                "status": row.status.value,
+                "enrollment_date": row.enrollment_date.isoformat()
+            })
         
-        # Get student profile info (if applicable)
-        student_profile = None
-        if UserRole.STUDENT.value in user.roles:
-            student = db.query(Student).filter(Student.user_id == user.id).first()
-            if student:
-                student_profile = {
-                    "student_id": student.student_id,
-                    "program_id": student.program_id,
-                    "status": student.status,
-                    "enrollment_date": student.enrollment_date.isoformat() if student.enrollment_date else None
+        students = db.query(
+            Student.user_id,
+            Student.student_id,
+            Student.program_id,
+            Student.status,
+            Student.enrollment_date
+        ).filter(Student.user_id.in_(user_ids)).order_by(Student.created_at).all()
+        for row in students:
+            if summaries[row.user_id]["student_profile"] is None:
+                summaries[row.user_id]["student_profile"] = {
+                    "student_id": row.student_id,
+                    "program_id": row.program_id,
+                    "status": row.status,
+                    "enrollment_date": row.enrollment_date.isoformat() if row.enrollment_date else None
                 }
         
-        # Get parent profile info (if applicable)
-        parent_profile = None
-        children_count = 0
-        if UserRole.PARENT.value in user.roles:
-            parent = db.query(Parent).filter(Parent.user_id == user.id).first()
-            if parent:
-                parent_profile = {
-                    "program_id": parent.program_id,
-                    "payment_responsibility": parent.payment_responsibility
+        children_count = (
+            select(func.count(ParentChildRelationship.id))
+            .where(ParentChildRelationship.parent_id == Parent.id)
+            .correlate(Parent)
+            .scalar_subquery()
+        )
+        parents = db.query(
+            Parent.user_id,
+            Parent.is_primary_payer,
+            children_count.label("children_count")
+        ).filter(Parent.user_id.in_(user_ids)).order_by(Parent.created_at).all()
+        for row in parents:
+            if summaries[row.user_id]["parent_profile"] is None:
+                summaries[row.user_id]["parent_profile"] = {
+                    "payment_responsibility": row.is_primary_payer
                 }
-                # Count children
-                children_count = db.query(func.count(ParentChildRelationship.id)).filter(
-                    ParentChildRelationship.parent_id == parent.id
-                ).scalar() or 0
+                summaries[row.user_id]["children_count"] = row.children_count or 0
         
-        # Get organization membership
-        organization_membership = None
         if searcher_program_context:
-            org_membership = db.query(OrganizationMembership).options(
+            memberships = db.query(OrganizationMembership).options(
                 joinedload(OrganizationMembership.organization)
             ).filter(
-                OrganizationMembership.user_id == user.id,
+                OrganizationMembership.user_id.in_(user_ids),
                 OrganizationMembership.program_id == searcher_program_context
-            ).first()
-            
-            if org_membership:
-                organization_membership = {
-                    "organization_id": org_membership.organization_id,
-                    "organization_name": org_membership.organization.name if org_membership.organization else "Unknown",
-                    "membership_type": org_membership.membership_type.value if org_membership.membership_type else None
-                }
+            ).all()
+            for membership in memberships:
+                if summaries[membership.user_id]["organization_membership"] is None:
+                    summaries[membership.user_id]["organization_membership"] = {
+                        "organization_id": membership.organization_id,
+                        "organization_name": membership.organization.name if membership.organization else "Unknown",
+                        "membership_type": membership.membership_type.value if membership.membership_type else None
+                    }
         
+        return summaries
+
+    @staticmethod
+    def _build_user_search_result(user: User, summary: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build comprehensive user search result data.
+        
+        Args:
+            user: User instance
+            summary: The user's entry from ``_load_search_summaries``
+            
+        Returns:
+            Dictionary with user search result data
+        """
         return {
             "id": user.id,
             "first_name": user.first_name,
@@ -536,12 +601,9 @@ class UserSearchService:
             "roles": user.roles,
             "is_active": user.is_active,
             "created_at": user.created_at.isoformat(),
-            "program_assignments": program_assignments,
-            "active_enrollments": active_enrollments,
-            "student_profile": student_profile,
-            "parent_profile": parent_profile,
-            "children_count": children_count,
-            "organization_membership": organization_membership,
+            "program_ids": [assignment["program_id"] for assignment in summary["program_assignments"]],
+            "active_enrollment_count": len(summary["active_enrollments"]),
+            **summary,
             "assignment_eligibility": {
                 "can_be_student": UserRole.STUDENT.value in user.roles and user.is_active,
                 "can_be_parent": UserRole.PARENT.value in user.roles and user.is_active,
@@ -24,7 +24,6 @@ from .base_service import BaseService
 from app.features.curricula.models.level import Level
 from app.features.curricula.models.curriculum import Curriculum
 from app.features.courses.models.course import Course
-from app.features.programs.models.program import Program
 
 
 class EquipmentService(BaseService[EquipmentRequirement, EquipmentRequirementCreate, EquipmentRequirementUpdate]):
@@ -41,11 +40,7 @@ class EquipmentService(BaseService[EquipmentRequirement, EquipmentRequirementCre
         """Create a new equipment requirement."""
         # Validate level exists and is accessible within program context
         if program_context:
-            level_query = db.query(Level).filter(Level.id == equipment_data.level_id)\
-                           .join(Curriculum, Level.curriculum_id == Curriculum.id)\
-                           .join(Course, Curriculum.course_id == Course.id)\
-                           .join(Program, Course.program_id == Program.id)\
-                           .filter(Program.id == program_context)
+            level_query = db.query(Level).filter(Level.id == equipment_data.level_id, Level.program_id == program_context)
             
             if not level_query.first():
                 raise ValueError(f"Level {equipment_data.level_id} not found or not accessible in current program context")
@@ -71,10 +66,7 @@ class EquipmentService(BaseService[EquipmentRequirement, EquipmentRequirementCre
         # Apply program context filtering if provided
         if program_context:
             query = query.join(Level, EquipmentRequirement.level_id == Level.id)\
-                        .join(Curriculum, Level.curriculum_id == Curriculum.id)\
-                        .join(Course, Curriculum.course_id == Course.id)\
-                        .join(Program, Course.program_id == Program.id)\
-                        .filter(Program.id == program_context)
+                        .filter(Level.program_id == program_context)
         
         equipment = query.first()
         if not equipment:
@@ -94,10 +86,7 @@ class EquipmentService(BaseService[EquipmentRequirement, EquipmentRequirementCre
         # Apply program context filtering if provided
         if program_context:
             query = query.join(Level, EquipmentRequirement.level_id == Level.id)\
-                        .join(Curriculum, Level.curriculum_id == Curriculum.id)\
-                        .join(Course, Curriculum.course_id == Course.id)\
-                        .join(Program, Course.program_id == Program.id)\
-                        .filter(Program.id == program_context)
+                        .filter(Level.program_id == program_context)
         
         # Apply filters
         if search_params:
@@ -218,10 +207,7 @@ class EquipmentService(BaseService[EquipmentRequirement, EquipmentRequirementCre
         
         # Apply program context filtering if provided
         if program_context:
-            query = query.join(Curriculum, Level.curriculum_id == Curriculum.id)\
-                        .join(Course, Curriculum.course_id == Course.id)\
-                        .join(Program, Course.program_id == Program.id)\
-                        .filter(Program.id == program_context)
+            query = query.filter(Level.program_id == program_context)
         
         # Get total count
         total_count = query.count()
@@ -247,10 +233,7 @@ class EquipmentService(BaseService[EquipmentRequirement, EquipmentRequirementCre
         # Apply program context filtering if provided
         if program_context:
             base_query = base_query.join(Level, EquipmentRequirement.level_id == Level.id)\
-                                  .join(Curriculum, Level.curriculum_id == Curriculum.id)\
-                                  .join(Course, Curriculum.course_id == Course.id)\
-                                  .join(Program, Course.program_id == Program.id)\
-                                  .filter(Program.id == program_context)
+                                  .filter(Level.program_id == program_context)
         
         equipment_items = base_query.all()
         
@@ -271,10 +254,7 @@ class EquipmentService(BaseService[EquipmentRequirement, EquipmentRequirementCre
             # Get course info through level relationship
             level_query = db.query(Level).filter(Level.id == item.level_id)
             if program_context:
-                level_query = level_query.join(Curriculum, Level.curriculum_id == Curriculum.id)\
-                                       .join(Course, Curriculum.course_id == Course.id)\
-                                       .join(Program, Course.program_id == Program.id)\
-                                       .filter(Program.id == program_context)
+                level_query = level_query.filter(Level.program_id == program_context)
             
             level = level_query.first()
             if level:
@@ -369,10 +349,7 @@ class EquipmentService(BaseService[EquipmentRequirement, EquipmentRequirementCre
         # Apply program context filtering if provided
         if program_context:
             base_query = base_query.join(Level, EquipmentRequirement.level_id == Level.id)\
-                                  .join(Curriculum, Level.curriculum_id == Curriculum.id)\
-                                  .join(Course, Curriculum.course_id == Course.id)\
-                                  .join(Program, Course.program_id == Program.id)\
-                                  .filter(Program.id == program_context)
+                                  .filter(Level.program_id == program_context)
         
         # Total equipment items
         total_equipment_items = base_query.count()
@@ -431,10 +408,7 @@ class EquipmentService(BaseService[EquipmentRequirement, EquipmentRequirementCre
         # Apply program context filtering if provided
         if program_context:
             base_query = base_query.join(Level, EquipmentRequirement.level_id == Level.id)\
-                                  .join(Curriculum, Level.curriculum_id == Curriculum.id)\
-                                  .join(Course, Curriculum.course_id == Course.id)\
-                                  .join(Program, Course.program_id == Program.id)\
-                                  .filter(Program.id == program_context)
+                                  .filter(Level.program_id == program_context)
         
         # Group by equipment name and calculate totals
         inventory_data = base_query.with_entities(
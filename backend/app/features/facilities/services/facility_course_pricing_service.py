@@ -23,6 +23,7 @@ from app.features.facilities.schemas.facility_course_pricing import (
     CoursePricingMatrixResponse
 )
 from app.features.common.services.base_service import BaseService
+from app.features.common.services.dashboard_counters import CounterDefinition, dashboard_counters
 
 
 class FacilityCoursePricingService(BaseService[FacilityCoursePricing, FacilityCoursePricingCreate, FacilityCoursePricingUpdate]):
@@ -379,14 +380,16 @@ class FacilityCoursePricingService(BaseService[FacilityCoursePricing, FacilityCo
     def get_pricing_statistics(self, db: Session) -> FacilityCoursePricingStatsResponse:
         """Get facility course pricing statistics."""
         
-        # Basic counts
-        total_entries = db.query(FacilityCoursePricing).count()
-        active_entries = db.query(FacilityCoursePricing).filter(FacilityCoursePricing.is_active == True).count()
+        # Entry counts and per-facility/per-course breakdowns come from
+        # materialized counters maintained on flush
+        counters = dashboard_counters.get_counters(db, prefix="pricing.")
+        total_entries = counters.get("pricing.total", 0)
+        active_entries = counters.get("pricing.active", 0)
         
-        facilities_with_pricing = db.query(FacilityCoursePricing.facility_id).distinct().count()
-        courses_with_pricing = db.query(FacilityCoursePricing.course_id).distinct().count()
+        facilities_with_pricing = len(dashboard_counters.grouped(counters, "pricing.by_facility"))
+        courses_with_pricing = len(dashboard_counters.grouped(counters, "pricing.by_course"))
         
-        # Price statistics
+        # Price statistics (min/max cannot be maintained incrementally under deletes)
         price_stats = db.query(
             func.avg(FacilityCoursePricing.price),
             func.min(FacilityCoursePricing.price),
@@ -398,23 +401,8 @@ class FacilityCoursePricingService(BaseService[FacilityCoursePricing, FacilityCo
         max_price = price_stats[2] or 0
         
         # Grouping statistics
-        pricing_by_facility = {}
-        facility_counts = db.query(
-            FacilityCoursePricing.facility_id,
-            func.count(FacilityCoursePricing.id)
-        ).filter(FacilityCoursePricing.is_active == True).group_by(FacilityCoursePricing.facility_id).all()
-        
-        for facility_id, count in facility_counts:
-            pricing_by_facility[facility_id] = count
-        
-        pricing_by_course = {}
-        course_counts = db.query(
-            FacilityCoursePricing.course_id,
-            func.count(FacilityCoursePricing.id)
-        ).filter(FacilityCoursePricing.is_active == True).group_by(FacilityCoursePricing.course_id).all()
-        
-        for course_id, count in course_counts:
-            pricing_by_course[course_id] = count
+        pricing_by_facility = dashboard_counters.grouped(counters, "pricing.active_by_facility")
+        pricing_by_course = dashboard_counters.grouped(counters, "pricing.active_by_course")
         
         return FacilityCoursePricingStatsResponse(
             total_pricing_entries=total_entries,
@@ -429,4 +417,16 @@ class FacilityCoursePricingService(BaseService[FacilityCoursePricing, FacilityCo
 
 
 # Create global instance
-facility_course_pricing_service = FacilityCoursePricingService()
\ No newline at end of file
+facility_course_pricing_service = FacilityCoursePricingService()
+
+# Materialized counters read by get_pricing_statistics
+dashboard_counters.register(
+    CounterDefinition("pricing.total", FacilityCoursePricing),
+    CounterDefinition("pricing.active", FacilityCoursePricing, conditions=(("is_active", True),)),
+    CounterDefinition("pricing.by_facility", FacilityCoursePricing, group_by="facility_id"),
+    CounterDefinition("pricing.by_course", FacilityCoursePricing, group_by="course_id"),
+    CounterDefinition("pricing.active_by_facility", FacilityCoursePricing, group_by="facility_id",
+                      conditions=(("is_active", True),)),
+    CounterDefinition("pricing.active_by_course", FacilityCoursePricing, group_by="course_id",
+                      conditions=(("is_active", True),)),
+)
@@ -2,13 +2,15 @@
 Media library model for curriculum management.
 """
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
-from sqlalchemy import ForeignKey, Index, String, Text, BigInteger, Boolean
+from sqlalchemy import ForeignKey, Index, String, Text, BigInteger, Boolean, DateTime, JSON, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import ARRAY
 
 from app.features.common.models.base import BaseModel
+from app.features.common.models.search import SearchDocument
 from app.features.common.models.enums import MediaType
 
 
@@ -34,6 +36,21 @@ class MediaLibrary(BaseModel):
         comment="Reference to associated lesson (nullable for general media)",
     )
     
+    # Denormalized scope (kept in sync by app.features.curricula.services.program_scope)
+    curriculum_id: Mapped[Optional[str]] = mapped_column(
+        String(36),
+        ForeignKey("curricula.id"),
+        nullable=True,
+        comment="Owning curriculum (denormalized from the hierarchy)",
+    )
+    
+    program_id: Mapped[Optional[str]] = mapped_column(
+        String(36),
+        ForeignKey("programs.id"),
+        nullable=True,
+        comment="Owning program (denormalized from the hierarchy)",
+    )
+    
     # File Information
     file_name: Mapped[str] = mapped_column(
         String(255),
@@ -118,6 +135,12 @@ class MediaLibrary(BaseModel):
         comment="MIME type of the file",
     )
     
+    content_sha256: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="SHA-256 of the file content (hex); used as the strong ETag",
+    )
+    
     duration_seconds: Mapped[Optional[int]] = mapped_column(
         nullable=True,
         comment="Duration in seconds (for video/audio)",
@@ -154,12 +177,47 @@ class MediaLibrary(BaseModel):
         comment="Order for displaying media within lesson",
     )
     
+    # Background Processing
+    processing_status: Mapped[str] = mapped_column(
+        String(20),
+        default="pending",
+        server_default=text("'pending'"),
+        nullable=False,
+        comment="Background processing status (pending, processing, completed, failed)",
+    )
+    
+    processing_steps: Mapped[Optional[Dict[str, Any]]] = mapped_column(
+        JSON,
+        nullable=True,
+        comment="Per-step processing state keyed by step name",
+    )
+    
+    processing_error: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Last processing error",
+    )
+    
+    processed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime,
+        nullable=True,
+        comment="When background processing finished",
+    )
+    
+    extracted_metadata: Mapped[Optional[Dict[str, Any]]] = mapped_column(
+        JSON,
+        nullable=True,
+        comment="Technical metadata extracted from the file",
+    )
+    
     # Relationships
     # Note: Relationships will be defined when related models are created
     # lesson = relationship("Lesson", back_populates="media_files")
     
     # Indexes for performance
     __table_args__ = (
+        Index("idx_media_library_program_id", "program_id"),
+        Index("idx_media_library_curriculum_id", "curriculum_id"),
         Index("idx_media_library_lesson_id", "lesson_id"),
         Index("idx_media_library_file_name", "file_name"),
         Index("idx_media_library_file_type", "file_type"),
@@ -169,8 +227,15 @@ class MediaLibrary(BaseModel):
         Index("idx_media_library_display_order", "display_order"),
         Index("idx_media_library_lesson_type", "lesson_id", "file_type"),
         Index("idx_media_library_lesson_order", "lesson_id", "display_order"),
+        Index("idx_media_library_content_sha256", "content_sha256"),
+        Index("idx_media_library_tags", "tags", postgresql_using="gin"),
     )
     
+    @property
+    def is_processed(self) -> bool:
+        """Check if background processing has finished successfully."""
+        return self.processing_status == "completed"
+    
     @property
     def display_name(self) -> str:
         """Get display-friendly name."""
@@ -245,4 +310,8 @@ class MediaLibrary(BaseModel):
     
     def __repr__(self) -> str:
         """String representation of the media library item."""
-        return f"<MediaLibrary(id={self.id}, file_name='{self.file_name}', type='{self.file_type}', lesson_id='{self.lesson_id}')>"
\ No newline at end of file
+        return f"<MediaLibrary(id={self.id}, file_name='{self.file_name}', type='{self.file_type}', lesson_id='{self.lesson_id}')>"
+
+
+# Free-text search over titles, descriptions and file names
+MEDIA_SEARCH = SearchDocument(MediaLibrary.__table__, ("title", "description", "file_name", "original_file_name"))
@@ -2,10 +2,12 @@
 Media API routes for curriculum management.
 """
 
-from typing import Annotated, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status, File, UploadFile
-from fastapi.responses import FileResponse, StreamingResponse
+import re
+from typing import Annotated, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status, File, Header, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 import os
 from datetime import datetime
 
@@ -13,7 +15,6 @@ from app.features.common.models.database import get_db
 from app.features.authentication.routes.auth import get_current_active_user
 from app.middleware import create_program_filter_dependency
 from app.features.media.schemas.media import (
-    MediaLibraryCreate,
     MediaLibraryUpdate,
     MediaLibraryResponse,
     MediaLibraryListResponse,
@@ -21,12 +22,26 @@ from app.features.media.schemas.media import (
     MediaStatsResponse,
     MediaUploadRequest,
     MediaUploadResponse,
+    MediaUploadStatusResponse,
+    MediaUploadCompleteRequest,
     MediaBulkTagRequest,
     MediaUsageResponse,
     MediaProcessingStatusResponse,
 )
 from app.features.courses.schemas.common import BulkActionResponse
+from app.features.common.services.conditional_requests import strong_etag
+from app.features.media.services.file_delivery import file_response
 from app.features.media.services.media_service import media_service
+from app.features.media.services.upload_service import (
+    UploadAccessDeniedError,
+    UploadChunkLengthError,
+    UploadInProgressError,
+    UploadOffsetMismatchError,
+    UploadSessionNotFoundError,
+    UploadTooLargeError,
+    iter_upload_file,
+    upload_service,
+)
 
 
 router = APIRouter()
@@ -68,6 +83,56 @@ async def create_upload_session(
         )
 
 
+CONTENT_RANGE_PATTERN = re.compile(r"^bytes (\d+)-(\d+)/(\d+|\*)$")
+
+
+def _parse_content_range(content_range: Optional[str]) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    """Parse ``bytes start-end/total`` into (start, end, total); total may be unknown (``*``)."""
+    if content_range is None:
+        return None, None, None
+    match = CONTENT_RANGE_PATTERN.match(content_range.strip())
+    if not match or int(match.group(2)) < int(match.group(1)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid Content-Range header; expected 'bytes start-end/total'"
+        )
+    total = None if match.group(3) == "*" else int(match.group(3))
+    return int(match.group(1)), int(match.group(2)), total
+
+
+def _upload_error(error: Exception) -> HTTPException:
+    """Map upload errors to HTTP errors."""
+    if isinstance(error, UploadSessionNotFoundError):
+        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(error))
+    if isinstance(error, UploadAccessDeniedError):
+        return HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(error))
+    if isinstance(error, UploadChunkLengthError):
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"message": str(error), "received_bytes": error.received_bytes}
+        )
+    if isinstance(error, UploadOffsetMismatchError):
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"message": str(error), "received_bytes": error.expected_offset}
+        )
+    if isinstance(error, UploadInProgressError):
+        return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(error))
+    if isinstance(error, UploadTooLargeError):
+        return HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(error))
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+
+
+def _upload_status(session) -> MediaUploadStatusResponse:
+    return MediaUploadStatusResponse(
+        upload_id=session.upload_id,
+        received_bytes=session.received_bytes,
+        expected_size=session.expected_size,
+        max_file_size=session.max_file_size,
+        expires_at=session.expires_at
+    )
+
+
 @router.post("/upload/{upload_id}", response_model=MediaLibraryResponse)
 async def upload_media_file(
     upload_id: str,
@@ -77,9 +142,10 @@ async def upload_media_file(
     file: UploadFile = File(...)
 ):
     """
-    Upload media file using upload session.
+    Upload media file in a single request.
     
-    Processes the uploaded file and creates media library entry.
+    The file is streamed to disk in bounded chunks and a media library
+    entry is created. Large files should use the chunked endpoints.
     """
     if not current_user.get("is_active"):
         raise HTTPException(
@@ -87,43 +153,130 @@ async def upload_media_file(
             detail="Inactive user"
         )
     
+    session = await run_in_threadpool(upload_service.find_session, upload_id)
+    if session is None:
+        # Uploads without a prior upload session
+        session = await run_in_threadpool(upload_service.create_session, {}, current_user["id"], program_context)
+    
     try:
-        # Save uploaded file
-        upload_dir = f"/app/media/uploads/{upload_id}"
-        os.makedirs(upload_dir, exist_ok=True)
-        
-        file_path = os.path.join(upload_dir, file.filename)
-        
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
-        
-        # Create media library entry
-        media_data = MediaLibraryCreate(
-            title=file.filename,
-            description=f"Uploaded file: {file.filename}",
-            media_type="other",  # Will be determined by MIME type
-            file_name=file.filename,
-            file_path=file_path,
-            file_size=len(content),
-            mime_type=file.content_type or "application/octet-stream"
+        await upload_service.append(
+            session.upload_id, iter_upload_file(file), offset=0, user_id=current_user["id"]
+        )
+        upload = await run_in_threadpool(
+            upload_service.complete, session.upload_id, file.filename, None, current_user["id"]
+        )
+    except (UploadSessionNotFoundError, UploadAccessDeniedError, ValueError) as e:
+        raise _upload_error(e)
+    
+    try:
+        return media_service.create_media_from_upload(
+            db, upload, file.filename, file.content_type or "application/octet-stream",
+            session.media, current_user["id"], program_context
         )
-        
-        media = media_service.create_media(db, media_data, current_user["id"], program_context)
-        return media
-        
     except ValueError as e:
+        upload_service.discard(session.upload_id)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
+        upload_service.discard(session.upload_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error uploading file: {str(e)}"
         )
 
 
+@router.put("/upload/{upload_id}/chunks", response_model=MediaUploadStatusResponse)
+async def upload_media_chunk(
+    upload_id: str,
+    request: Request,
+    current_user: Annotated[dict, Depends(get_current_active_user)],
+    content_range: Annotated[Optional[str], Header()] = None
+):
+    """
+    Append a chunk to a resumable upload.
+    
+    The request body is the raw chunk. ``Content-Range: bytes start-end/total``
+    gives its position; ``start`` must equal the bytes received so far
+    (409 with ``received_bytes`` otherwise) and the body must be exactly
+    ``end - start + 1`` bytes (400, and nothing of it is kept, otherwise).
+    Without the header the chunk is appended at the current end. Only the
+    user who created the upload session may append to it.
+    """
+    start, end, total = _parse_content_range(content_range)
+    length = end - start + 1 if end is not None else None
+    
+    try:
+        session = await upload_service.append(
+            upload_id, request.stream(), offset=start, total_size=total, length=length,
+            user_id=current_user["id"]
+        )
+    except (UploadSessionNotFoundError, UploadAccessDeniedError, ValueError) as e:
+        raise _upload_error(e)
+    
+    return _upload_status(session)
+
+
+@router.get("/upload/{upload_id}", response_model=MediaUploadStatusResponse)
+async def get_upload_status(
+    upload_id: str,
+    current_user: Annotated[dict, Depends(get_current_active_user)]
+):
+    """
+    Get the state of a resumable upload.
+    
+    Clients resume an interrupted upload from ``received_bytes``.
+    """
+    try:
+        session = await run_in_threadpool(upload_service.get_session, upload_id, current_user["id"])
+    except (UploadSessionNotFoundError, UploadAccessDeniedError) as e:
+        raise _upload_error(e)
+    return _upload_status(session)
+
+
+@router.post("/upload/{upload_id}/complete", response_model=MediaLibraryResponse)
+async def complete_upload(
+    upload_id: str,
+    complete_request: MediaUploadCompleteRequest,
+    db: Annotated[Session, Depends(get_db)],
+    program_context: Annotated[Optional[str], Depends(get_program_filter)],
+    current_user: Annotated[dict, Depends(get_current_active_user)]
+):
+    """
+    Finish a chunked upload and create the media library entry.
+    
+    The optional SHA-256 is checked against the digest computed while the
+    chunks arrived.
+    """
+    try:
+        session = await run_in_threadpool(upload_service.get_session, upload_id, current_user["id"])
+        upload = await run_in_threadpool(
+            upload_service.complete, upload_id, complete_request.file_name, complete_request.sha256,
+            current_user["id"]
+        )
+    except (UploadSessionNotFoundError, UploadAccessDeniedError, ValueError) as e:
+        raise _upload_error(e)
+    
+    try:
+        return media_service.create_media_from_upload(
+            db, upload, complete_request.file_name, complete_request.mime_type,
+            session.media, current_user["id"], session.program_context or program_context
+        )
+    except ValueError as e:
+        upload_service.discard(session.upload_id)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        upload_service.discard(session.upload_id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error completing upload: {str(e)}"
+        )
+
+
 @router.get("", response_model=MediaLibraryListResponse)
 async def list_media(
     db: Annotated[Session, Depends(get_db)],
@@ -306,6 +459,7 @@ async def delete_media(
 @router.get("/{media_id}/download")
 async def download_media(
     media_id: str,
+    request: Request,
     db: Annotated[Session, Depends(get_db)],
     program_context: Annotated[Optional[str], Depends(get_program_filter)],
     current_user: Annotated[dict, Depends(get_current_active_user)]
@@ -313,9 +467,10 @@ async def download_media(
     """
     Download media file.
     
-    Returns the media file for download.
+    Supports byte ranges for seeking and conditional requests: the ETag is
+    derived from the stored content hash, so unchanged files return 304.
     """
-    media = media_service.get_media(db, media_id, program_context)
+    media = media_service.get_media_model(db, media_id, program_context)
     if not media:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -323,7 +478,7 @@ async def download_media(
         )
     
     # Check if file exists
-    file_path = media.file_path
+    file_path = media.file_url
     if not os.path.exists(file_path):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -337,16 +492,19 @@ async def download_media(
             detail="Access denied"
         )
     
-    return FileResponse(
-        path=file_path,
-        filename=media.file_name,
-        media_type=media.mime_type
+    return file_response(
+        request,
+        file_path,
+        media_type=media.mime_type,
+        filename=media.original_file_name,
+        etag=strong_etag(media.content_sha256)
     )
 
 
 @router.get("/{media_id}/thumbnail")
 async def get_media_thumbnail(
     media_id: str,
+    request: Request,
     db: Annotated[Session, Depends(get_db)],
     program_context: Annotated[Optional[str], Depends(get_program_filter)],
     current_user: Annotated[dict, Depends(get_current_active_user)]
@@ -354,26 +512,23 @@ async def get_media_thumbnail(
     """
     Get media thumbnail.
     
-    Returns thumbnail image for the media.
+    Returns thumbnail image for the media, honouring conditional requests.
     """
-    media = media_service.get_media(db, media_id, program_context)
-    if not media or not media.thumbnail_path:
+    media = media_service.get_media_model(db, media_id, program_context)
+    if not media or not media.thumbnail_url:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Thumbnail not found"
         )
     
     # Check if thumbnail exists
-    if not os.path.exists(media.thumbnail_path):
+    if not os.path.exists(media.thumbnail_url):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Thumbnail file not found on disk"
         )
     
-    return FileResponse(
-        path=media.thumbnail_path,
-        media_type="image/jpeg"
-    )
+    return file_response(request, media.thumbnail_url, media_type="image/jpeg")
 
 
 @router.get("/{media_id}/usage", response_model=MediaUsageResponse)
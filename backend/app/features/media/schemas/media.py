@@ -208,6 +208,7 @@ class MediaUploadRequest(BaseModel):
     accessibility_text: Optional[str] = Field(None, description="Accessibility description")
     copyright_info: Optional[str] = Field(None, description="Copyright information")
     source_url: Optional[str] = Field(None, description="Original source URL if applicable")
+    file_size: Optional[int] = Field(None, ge=1, description="Total file size in bytes, if known in advance")
     
     @validator('tags')
     def validate_tags(cls, v):
@@ -241,6 +242,24 @@ class MediaUploadResponse(BaseModel):
         }
 
 
+class MediaUploadStatusResponse(BaseModel):
+    """Schema for the state of a resumable upload."""
+    
+    upload_id: str = Field(..., description="Upload session ID")
+    received_bytes: int = Field(..., description="Bytes received so far; the next chunk starts here")
+    expected_size: Optional[int] = Field(None, description="Total file size, once known")
+    max_file_size: int = Field(..., description="Maximum allowed file size")
+    expires_at: datetime = Field(..., description="Upload session expiration time")
+
+
+class MediaUploadCompleteRequest(BaseModel):
+    """Schema for finishing a chunked upload."""
+    
+    file_name: str = Field(..., min_length=1, max_length=255, description="Original file name")
+    mime_type: str = Field(..., description="MIME type of the file")
+    sha256: Optional[str] = Field(None, min_length=64, max_length=64, description="Expected SHA-256 of the whole file")
+
+
 class MediaBulkTagRequest(BaseModel):
     """Schema for bulk tagging media items."""
     
@@ -0,0 +1,98 @@
+"""
+Content-addressed storage for media files.
+
+Files are stored once per SHA-256 under ``{root}/ab/cd/<sha256>``; every
+``MediaLibrary`` row with that ``content_sha256`` is a reference. Storing
+content that already exists just drops the new copy, and the blob is
+deleted when the last referencing row goes away.
+
+Placing a blob (followed by inserting the row that references it) and
+collecting a blob (counting references, then unlinking) take the same
+per-hash transaction-level advisory lock on PostgreSQL, so a collection
+cannot remove a blob that a concurrent upload is about to reference.
+"""
+
+import logging
+import os
+from typing import Optional
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.features.media.models.media import MediaLibrary
+
+logger = logging.getLogger(__name__)
+
+
+class ContentAddressedStore:
+    """Store files by SHA-256 with reference counting from media rows."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def path_for(self, sha256: str) -> str:
+        """Blob path for a hex digest (two levels of sharding)."""
+        sha256 = sha256.lower()
+        if len(sha256) != 64 or any(c not in "0123456789abcdef" for c in sha256):
+            raise ValueError(f"Invalid SHA-256 digest: {sha256}")
+        return os.path.join(self.root, sha256[:2], sha256[2:4], sha256)
+
+    def contains_path(self, path: Optional[str]) -> bool:
+        """Whether a file path points into the store."""
+        if not path:
+            return False
+        root = os.path.abspath(self.root)
+        return os.path.commonpath([root, os.path.abspath(path)]) == root
+
+    def lock(self, db: Session, sha256: str) -> None:
+        """Serialize blob placement and collection for a digest until the transaction ends."""
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": int(sha256[:15], 16)})
+
+    def put(self, db: Session, source_path: str, sha256: str) -> str:
+        """
+        Move a file into the store under its digest and return the blob path.
+
+        If the blob already exists the source is deleted instead. Call within
+        the transaction that inserts the referencing row; the digest stays
+        locked until it commits.
+        """
+        blob_path = self.path_for(sha256)
+        self.lock(db, sha256)
+
+        if os.path.exists(blob_path):
+            os.remove(source_path)
+            logger.info(f"Deduplicated upload of blob {sha256}")
+        else:
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            os.replace(source_path, blob_path)
+        return blob_path
+
+    def references(self, db: Session, sha256: str) -> int:
+        """Number of media rows referencing a digest."""
+        return db.query(func.count(MediaLibrary.id)).filter(MediaLibrary.content_sha256 == sha256).scalar() or 0
+
+    def collect(self, db: Session, sha256: str) -> bool:
+        """
+        Delete a blob if nothing references it any more; returns whether it was deleted.
+
+        Runs in its own transaction (committed here), after the deletion of
+        the referencing row has been committed.
+        """
+        try:
+            self.lock(db, sha256)
+            if self.references(db, sha256):
+                return False
+            blob_path = self.path_for(sha256)
+            if os.path.exists(blob_path):
+                os.remove(blob_path)
+                logger.info(f"Collected unreferenced blob {sha256}")
+                return True
+            return False
+        finally:
+            db.commit()
+
+
+# Global instance
+blob_store = ContentAddressedStore(os.path.join(settings.MEDIA_ROOT, "blobs"))
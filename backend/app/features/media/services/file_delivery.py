@@ -0,0 +1,92 @@
+"""
+HTTP delivery of media files.
+
+Builds responses for stored files with validators (``ETag``, ``Last-Modified``),
+answers conditional requests (``If-None-Match`` / ``If-Modified-Since``) with
+``304 Not Modified`` and serves byte ranges for seeking (``Range`` and
+``If-Range`` are handled by Starlette's ``FileResponse``). When a fronting
+proxy is configured the body is handed off with ``X-Accel-Redirect``
+(nginx) or ``X-Sendfile`` (Apache, lighttpd) instead of being streamed by
+the Python worker.
+"""
+
+import hashlib
+import os
+from email.utils import formatdate
+from typing import Dict, Optional
+from urllib.parse import quote
+
+from fastapi import Request, Response
+from fastapi.responses import FileResponse
+
+from app.core.config import settings
+from app.features.common.services.conditional_requests import is_not_modified
+
+X_ACCEL_REDIRECT = "x-accel-redirect"
+X_SENDFILE = "x-sendfile"
+
+
+def file_response(
+    request: Request,
+    path: str,
+    media_type: Optional[str] = None,
+    filename: Optional[str] = None,
+    etag: Optional[str] = None,
+    max_age: Optional[int] = None,
+) -> Response:
+    """
+    Serve a file with caching validators, conditional GET and range support.
+
+    ``etag`` should be a strong tag derived from the content hash when one is
+    stored; otherwise the tag is derived from the file's size and mtime, the
+    same way Starlette does, so that it also validates revalidations.
+    """
+    stat_result = os.stat(path)
+    etag = etag or stat_etag(stat_result)
+    max_age = settings.MEDIA_CACHE_MAX_AGE_SECONDS if max_age is None else max_age
+    headers: Dict[str, str] = {
+        "Cache-Control": f"private, max-age={max_age}",
+        "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True),
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+    }
+
+    if is_not_modified(request, etag, stat_result.st_mtime):
+        return Response(status_code=304, headers=headers)
+
+    offload_header = _offload_header(path)
+    if offload_header:
+        # The proxy serves the body, including ranges and its own conditional handling
+        headers.update(offload_header)
+        if filename:
+            headers["Content-Disposition"] = f"attachment; filename*=utf-8''{quote(filename)}"
+        return Response(status_code=200, headers=headers, media_type=media_type)
+
+    return FileResponse(
+        path=path,
+        media_type=media_type,
+        filename=filename,
+        headers=headers,
+        stat_result=stat_result,
+    )
+
+
+def stat_etag(stat_result: os.stat_result) -> str:
+    """Entity tag from a file's mtime and size, as Starlette's ``FileResponse`` builds it."""
+    etag_base = f"{stat_result.st_mtime}-{stat_result.st_size}"
+    return f'"{hashlib.md5(etag_base.encode(), usedforsecurity=False).hexdigest()}"'
+
+
+def _offload_header(path: str) -> Optional[Dict[str, str]]:
+    backend = settings.MEDIA_SENDFILE_BACKEND.lower()
+    if backend == X_SENDFILE:
+        return {"X-Sendfile": os.path.abspath(path)}
+    if backend == X_ACCEL_REDIRECT:
+        media_root = os.path.abspath(settings.MEDIA_ROOT)
+        absolute = os.path.abspath(path)
+        if os.path.commonpath([media_root, absolute]) != media_root:
+            # Only files below MEDIA_ROOT are mapped by the proxy's internal location
+            return None
+        relative = os.path.relpath(absolute, media_root)
+        return {"X-Accel-Redirect": settings.MEDIA_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + quote(relative)}
+    return None
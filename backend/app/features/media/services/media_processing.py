@@ -0,0 +1,244 @@
+"""
+Background processing of uploaded media (thumbnails and metadata extraction).
+
+Uploads enqueue a ``media.processing`` outbox message in the same
+transaction as the media row. The outbox worker hands claimed messages to
+``MediaProcessor.handle``, which runs each step in a process pool so that
+CPU-heavy work never runs on the API workers, and records the state of every
+step on the media row as it finishes. ``MediaService.get_processing_status``
+reports that state.
+
+Thumbnails use Pillow for images and ``ffmpeg`` for videos, metadata uses
+Pillow and ``ffprobe``; steps whose tool is not installed are skipped.
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import subprocess
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.features.common.models.database import SessionLocal
+from app.features.common.models.enums import MediaType
+from app.features.common.services.outbox import ClaimedMessage, outbox
+from app.features.media.models.media import MediaLibrary
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+MEDIA_PROCESSING_TOPIC = "media.processing"
+
+THUMBNAIL_STEP = "thumbnail_generation"
+METADATA_STEP = "metadata_extraction"
+PROCESSING_STEPS = (THUMBNAIL_STEP, METADATA_STEP)
+
+THUMBNAIL_SIZE = 320
+TOOL_TIMEOUT_SECONDS = 120
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+# ----------------------------------------------------------------------
+# Steps (run in worker processes; arguments and results must be picklable)
+# ----------------------------------------------------------------------
+
+def generate_thumbnail(file_path: str, file_type: str, thumbnail_path: str) -> Optional[str]:
+    """Write a JPEG thumbnail for an image or video; returns its path, or None if unsupported."""
+    os.makedirs(os.path.dirname(thumbnail_path), exist_ok=True)
+
+    if file_type == MediaType.IMAGE.value and Image is not None:
+        with Image.open(file_path) as image:
+            image.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+            image.convert("RGB").save(thumbnail_path, "JPEG", quality=85)
+        return thumbnail_path
+
+    if file_type == MediaType.VIDEO.value and shutil.which("ffmpeg"):
+        subprocess.run(
+            [
+                "ffmpeg", "-y", "-loglevel", "error", "-ss", "1", "-i", file_path,
+                "-frames:v", "1", "-vf", f"scale={THUMBNAIL_SIZE}:-2", thumbnail_path,
+            ],
+            check=True,
+            timeout=TOOL_TIMEOUT_SECONDS,
+        )
+        return thumbnail_path
+
+    return None
+
+
+def extract_metadata(file_path: str, file_type: str, compute_hash: bool = False) -> Dict[str, Any]:
+    """Extract size, dimensions and duration where the file type supports them (and the SHA-256 if asked)."""
+    metadata: Dict[str, Any] = {"file_size_bytes": os.path.getsize(file_path)}
+
+    if compute_hash:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as content:
+            for block in iter(lambda: content.read(HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        metadata["sha256"] = digest.hexdigest()
+
+    if file_type == MediaType.IMAGE.value and Image is not None:
+        with Image.open(file_path) as image:
+            metadata.update(width=image.width, height=image.height, format=image.format)
+
+    elif file_type in (MediaType.VIDEO.value, MediaType.AUDIO.value) and shutil.which("ffprobe"):
+        result = subprocess.run(
+            [
+                "ffprobe", "-v", "error", "-print_format", "json",
+                "-show_format", "-show_streams", file_path,
+            ],
+            check=True,
+            capture_output=True,
+            timeout=TOOL_TIMEOUT_SECONDS,
+        )
+        probe = json.loads(result.stdout or "{}")
+        duration = probe.get("format", {}).get("duration")
+        if duration:
+            metadata["duration_seconds"] = round(float(duration))
+        for stream in probe.get("streams", []):
+            if stream.get("codec_type") == "video" and stream.get("width"):
+                metadata.update(width=stream["width"], height=stream["height"])
+                break
+        metadata["codecs"] = [stream.get("codec_name") for stream in probe.get("streams", [])]
+
+    return metadata
+
+
+# ----------------------------------------------------------------------
+# Outbox handler
+# ----------------------------------------------------------------------
+
+class MediaProcessor:
+    """Run media processing steps in a process pool and record their progress."""
+
+    def __init__(self, max_workers: int, thumbnail_dir: str):
+        self.max_workers = max_workers
+        self.thumbnail_dir = thumbnail_dir
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        # Created on first use so API processes that never process media don't spawn workers.
+        # "spawn" avoids forking a process whose other threads may hold locks.
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def handle(self, messages: List[ClaimedMessage]) -> Dict[str, str]:
+        """Outbox handler: process a batch of media and return {message_id: error} for failures."""
+        db = SessionLocal()
+        try:
+            return self.process(db, messages)
+        finally:
+            db.close()
+
+    def process(self, db: Session, messages: List[ClaimedMessage]) -> Dict[str, str]:
+        message_by_media = {message.payload["media_id"]: message for message in messages}
+        media_by_id = {
+            media.id: media
+            for media in db.query(MediaLibrary).filter(MediaLibrary.id.in_(list(message_by_media))).all()
+        }
+
+        futures: Dict[Future, Tuple[str, str]] = {}
+        for media_id, media in media_by_id.items():
+            media.processing_status = "processing"
+            media.processing_error = None
+            media.processing_steps = {
+                step: {"status": "processing", "started_at": _now()} for step in PROCESSING_STEPS
+            }
+            file_type = media.file_type.value
+            thumbnail_path = os.path.join(self.thumbnail_dir, f"{media_id}.jpg")
+            futures[self.executor.submit(generate_thumbnail, media.file_url, file_type, thumbnail_path)] = (
+                media_id, THUMBNAIL_STEP
+            )
+            futures[self.executor.submit(
+                extract_metadata, media.file_url, file_type, media.content_sha256 is None
+            )] = (media_id, METADATA_STEP)
+        db.commit()
+
+        errors: Dict[str, str] = {}
+        for future in as_completed(futures):
+            media_id, step = futures[future]
+            media = media_by_id[media_id]
+            steps = dict(media.processing_steps or {})
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.warning(f"Media {media_id} {step} failed: {e}")
+                errors[media_id] = f"{step}: {e}"
+                steps[step] = {**steps.get(step, {}), "status": "failed", "error": str(e)}
+            else:
+                steps[step] = {
+                    **steps.get(step, {}),
+                    "status": "completed" if result is not None else "skipped",
+                    "completed_at": _now(),
+                }
+                self._apply_result(media, step, result)
+            media.processing_steps = steps
+
+            if all(state["status"] != "processing" for state in steps.values()):
+                self._finish(media, errors.get(media_id), message_by_media[media_id])
+            # Commit per finished step so get_processing_status reports progress
+            db.commit()
+
+        return {message_by_media[media_id].id: error for media_id, error in errors.items()}
+
+    @staticmethod
+    def _apply_result(media: MediaLibrary, step: str, result: Any) -> None:
+        if result is None:
+            return
+        if step == THUMBNAIL_STEP:
+            media.thumbnail_url = result
+        elif step == METADATA_STEP:
+            media.extracted_metadata = result
+            media.file_size_bytes = media.file_size_bytes or result.get("file_size_bytes")
+            media.content_sha256 = media.content_sha256 or result.get("sha256")
+            if result.get("duration_seconds") is not None:
+                media.duration_seconds = result["duration_seconds"]
+            if result.get("width") and result.get("height"):
+                media.resolution = f"{result['width']}x{result['height']}"
+
+    @staticmethod
+    def _finish(media: MediaLibrary, error: Optional[str], message: ClaimedMessage) -> None:
+        if error is None:
+            media.processing_status = "completed"
+            media.processed_at = datetime.utcnow()
+        elif message.attempts >= outbox.max_attempts:
+            media.processing_status = "failed"
+            media.processing_error = error
+            media.processed_at = datetime.utcnow()
+        else:
+            # The outbox schedules a retry
+            media.processing_status = "pending"
+            media.processing_error = error
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+# Global instance
+media_processor = MediaProcessor(
+    max_workers=settings.MEDIA_PROCESSING_WORKERS,
+    thumbnail_dir=os.path.join(settings.MEDIA_ROOT, "thumbnails"),
+)
+outbox.register(MEDIA_PROCESSING_TOPIC, media_processor.handle, batch_size=settings.MEDIA_PROCESSING_BATCH_SIZE)
@@ -3,14 +3,15 @@ Media service for curriculum management operations.
 """
 
 import os
-import hashlib
+import json
+import logging
 import mimetypes
 from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_, desc, asc
 from datetime import datetime, timedelta
 
-from app.features.media.models.media import MediaLibrary
+from app.features.media.models.media import MEDIA_SEARCH, MediaLibrary
 from app.features.media.schemas.media import (
     MediaLibraryCreate,
     MediaLibraryUpdate,
@@ -24,15 +25,16 @@ from app.features.media.schemas.media import (
     MediaProcessingStatusResponse
 )
 from .base_service import BaseService
+from .media_processing import MEDIA_PROCESSING_TOPIC, PROCESSING_STEPS
+from .blob_store import blob_store
+from .upload_service import CompletedUpload, upload_service
+from app.core.config import settings
+from app.features.common.models.enums import MediaType
+from app.features.common.services.dashboard_counters import CounterDefinition, dashboard_counters
+from app.features.common.services.outbox import outbox
+from app.features.common.services.text_search import text_search
 
-# Import related models for program context filtering
-from app.features.content.models.lesson import Lesson
-from app.features.curricula.models.section import Section
-from app.features.curricula.models.module import Module
-from app.features.curricula.models.level import Level
-from app.features.curricula.models.curriculum import Curriculum
-from app.features.courses.models.course import Course
-from app.features.programs.models.program import Program
+logger = logging.getLogger(__name__)
 
 
 class MediaService(BaseService[MediaLibrary, MediaLibraryCreate, MediaLibraryUpdate]):
@@ -41,7 +43,7 @@ class MediaService(BaseService[MediaLibrary, MediaLibraryCreate, MediaLibraryUpd
     def __init__(self, upload_path: str = "/app/media"):
         super().__init__(MediaLibrary)
         self.upload_path = upload_path
-        self.max_file_size = 2 * 1024 * 1024 * 1024  # 2GB
+        self.max_file_size = settings.MEDIA_MAX_FILE_SIZE
         self.allowed_mime_types = {
             "video": ["video/mp4", "video/avi", "video/mov", "video/wmv"],
             "audio": ["audio/mp3", "audio/wav", "audio/ogg", "audio/m4a"],
@@ -57,36 +59,82 @@ class MediaService(BaseService[MediaLibrary, MediaLibraryCreate, MediaLibraryUpd
     def create_upload_session(self, 
                              db: Session, 
                              upload_request: MediaUploadRequest,
-                             uploaded_by: Optional[str] = None) -> MediaUploadResponse:
-        """Create an upload session for media files."""
-        # Generate upload session ID
-        upload_id = hashlib.md5(f"{uploaded_by}-{datetime.now().isoformat()}".encode()).hexdigest()
-        
+                             uploaded_by: Optional[str] = None,
+                             program_context: Optional[str] = None) -> MediaUploadResponse:
+        """Create a resumable upload session for media files."""
         # Get allowed MIME types for the media type
         allowed_types = self.allowed_mime_types.get(upload_request.media_type, [])
         if upload_request.media_type == "other":
             # Allow all types for "other" category
             allowed_types = [mime_type for type_list in self.allowed_mime_types.values() for mime_type in type_list]
         
-        # Create upload URL
-        upload_url = f"/api/v1/media/upload/{upload_id}"
-        
-        # Set expiration (1 hour from now)
-        expires_at = datetime.now() + timedelta(hours=1)
+        session = upload_service.create_session(
+            upload_request.model_dump(mode="json", exclude={"file_size"}),
+            uploaded_by,
+            program_context,
+            expected_size=upload_request.file_size
+        )
         
         return MediaUploadResponse(
-            upload_id=upload_id,
-            upload_url=upload_url,
-            max_file_size=self.max_file_size,
+            upload_id=session.upload_id,
+            upload_url=f"/api/v1/media/upload/{session.upload_id}",
+            max_file_size=session.max_file_size,
             allowed_mime_types=allowed_types,
-            expires_at=expires_at
+            expires_at=session.expires_at
         )
     
+    def create_media_from_upload(self, 
+                                 db: Session, 
+                                 upload: CompletedUpload,
+                                 file_name: str,
+                                 mime_type: str,
+                                 media: Optional[Dict[str, Any]] = None,
+                                 uploaded_by: Optional[str] = None,
+                                 program_context: Optional[str] = None) -> MediaLibraryResponse:
+        """
+        Create a media library entry for a completed upload, using the session's media details.
+        
+        The file moves into the content-addressed store; content that is
+        already stored is not kept twice.
+        """
+        media = media or {}
+        blob_path = blob_store.put(db, upload.path, upload.sha256)
+        upload_service.discard(upload.upload_id)
+        
+        try:
+            media_data = MediaLibraryCreate(
+                title=media.get("title") or file_name,
+                description=media.get("description") or f"Uploaded file: {file_name}",
+                media_type=media.get("media_type") or "other",
+                file_name=file_name,
+                file_path=blob_path,
+                file_size=upload.size,
+                mime_type=mime_type,
+                tags=media.get("tags"),
+                is_public=media.get("is_public", False),
+                accessibility_text=media.get("accessibility_text"),
+                copyright_info=media.get("copyright_info"),
+                source_url=media.get("source_url")
+            )
+            return self.create_media(db, media_data, uploaded_by, program_context, content_sha256=upload.sha256)
+        except Exception:
+            # Release the digest lock and drop the blob if nothing else references it
+            db.rollback()
+            blob_store.collect(db, upload.sha256)
+            raise
+    
     def create_media(self, 
                     db: Session, 
                     media_data: MediaLibraryCreate, 
-                    uploaded_by: Optional[str] = None) -> MediaLibraryResponse:
-        """Create a new media library entry."""
+                    uploaded_by: Optional[str] = None,
+                    program_context: Optional[str] = None,
+                    content_sha256: Optional[str] = None) -> MediaLibraryResponse:
+        """
+        Create a new media library entry.
+        
+        Thumbnail generation and metadata extraction are queued in the same
+        transaction and run in the background worker.
+        """
         # Validate file exists
         if not os.path.exists(media_data.file_path):
             raise ValueError(f"File not found at path: {media_data.file_path}")
@@ -97,37 +145,42 @@ class MediaService(BaseService[MediaLibrary, MediaLibraryCreate, MediaLibraryUpd
             raise ValueError(f"MIME type '{media_data.mime_type}' not allowed for media type '{media_data.media_type}'")
         
         # Create media entry
-        media_dict = media_data.dict()
-        if uploaded_by:
-            media_dict['uploaded_by'] = uploaded_by
-            media_dict['created_by'] = uploaded_by
-        
-        media = MediaLibrary(**media_dict)
+        media = MediaLibrary(
+            file_name=os.path.basename(media_data.file_path),
+            original_file_name=media_data.file_name,
+            file_type=self._model_media_type(media_data.media_type, media_data.mime_type),
+            file_size_bytes=media_data.file_size,
+            file_url=media_data.file_path,
+            thumbnail_url=media_data.thumbnail_path,
+            title=media_data.title,
+            description=media_data.description,
+            tags=[tag.strip() for tag in media_data.tags.split(",") if tag.strip()] if media_data.tags else None,
+            is_public=media_data.is_public,
+            mime_type=media_data.mime_type,
+            content_sha256=content_sha256,
+            duration_seconds=media_data.duration_seconds,
+            resolution=media_data.resolution,
+            alt_text=media_data.accessibility_text,
+            copyright_info=media_data.copyright_info,
+            source_url=media_data.source_url,
+            program_id=program_context,
+            processing_status="pending",
+            processing_steps={step: {"status": "pending"} for step in PROCESSING_STEPS},
+            created_by=uploaded_by,
+        )
         db.add(media)
+        db.flush()
+        
+        # Queue background processing with the row
+        outbox.enqueue(db, MEDIA_PROCESSING_TOPIC, [{"media_id": media.id}])
         db.commit()
         db.refresh(media)
         
-        # Start background processing if needed
-        self._process_media_file(db, media)
-        
         return self._to_media_response(db, media)
     
     def get_media(self, db: Session, media_id: str, program_context: Optional[str] = None) -> Optional[MediaLibraryResponse]:
         """Get media by ID."""
-        query = db.query(MediaLibrary).filter(MediaLibrary.id == media_id)
-        
-        # Apply program context filtering if provided
-        if program_context:
-            query = query.join(Lesson, MediaLibrary.lesson_id == Lesson.id)\
-                        .join(Section, Lesson.section_id == Section.id)\
-                        .join(Module, Section.module_id == Module.id)\
-                        .join(Level, Module.level_id == Level.id)\
-                        .join(Curriculum, Level.curriculum_id == Curriculum.id)\
-                        .join(Course, Curriculum.course_id == Course.id)\
-                        .join(Program, Course.program_id == Program.id)\
-                        .filter(Program.id == program_context)
-        
-        media = query.first()
+        media = self._get_media_with_program_check(db, media_id, program_context)
         if not media:
             return None
         
@@ -156,29 +209,38 @@ class MediaService(BaseService[MediaLibrary, MediaLibraryCreate, MediaLibraryUpd
         return self._to_media_response(db, updated_media)
     
     def delete_media(self, db: Session, media_id: str, program_context: Optional[str] = None) -> bool:
-        """Delete media and associated files."""
+        """Delete media and its files; a stored blob is removed with its last reference."""
         # First validate media exists and user has access via program context
-        media_response = self.get_media(db, media_id, program_context)
-        if not media_response:
-            return False
-        
-        media = self.get(db, media_id)
+        media = self._get_media_with_program_check(db, media_id, program_context)
         if not media:
             return False
         
-        # Delete physical files
+        file_path, thumbnail_path, content_sha256 = media.file_url, media.thumbnail_url, media.content_sha256
+        
+        # Delete database record
+        db.delete(media)
+        db.commit()
+        
+        # Delete physical files (curriculum copies share them with the original rows)
         try:
-            if os.path.exists(media.file_path):
-                os.remove(media.file_path)
+            if content_sha256 and blob_store.contains_path(file_path):
+                blob_store.collect(db, content_sha256)
+            elif os.path.exists(file_path) and not self._is_referenced(db, MediaLibrary.file_url, file_path):
+                os.remove(file_path)
             
-            if media.thumbnail_path and os.path.exists(media.thumbnail_path):
-                os.remove(media.thumbnail_path)
+            if (thumbnail_path and os.path.exists(thumbnail_path)
+                    and not self._is_referenced(db, MediaLibrary.thumbnail_url, thumbnail_path)):
+                os.remove(thumbnail_path)
         except Exception as e:
-            # Log error but continue with database deletion
-            print(f"Error deleting files for media {media_id}: {e}")
+            # The record is gone; leftover files are only wasted space
+            logger.error(f"Error deleting files for media {media_id}: {e}")
         
-        # Delete database record
-        return self.delete(db, media_id)
+        return True
+    
+    @staticmethod
+    def _is_referenced(db: Session, column: Any, path: str) -> bool:
+        """Whether another media row still points at a file."""
+        return db.query(db.query(MediaLibrary.id).filter(column == path).exists()).scalar()
     
     def list_media(self, 
                   db: Session,
@@ -191,34 +253,15 @@ class MediaService(BaseService[MediaLibrary, MediaLibraryCreate, MediaLibraryUpd
         
         # Apply program context filtering if provided
         if program_context:
-            # Join through: MediaLibrary → Lesson → Section → Module → Level → Curriculum → Course → Program
-            from app.features.content.models.lesson import Lesson
-            from app.features.curricula.models.section import Section
-            from app.features.curricula.models.module import Module
-            from app.features.curricula.models.level import Level
-            from app.features.curricula.models.curriculum import Curriculum
-            from app.features.courses.models.course import Course
-            from app.features.programs.models.program import Program
-            
-            query = query.join(Lesson, MediaLibrary.lesson_id == Lesson.id)\
-                        .join(Section, Lesson.section_id == Section.id)\
-                        .join(Module, Section.module_id == Module.id)\
-                        .join(Level, Module.level_id == Level.id)\
-                        .join(Curriculum, Level.curriculum_id == Curriculum.id)\
-                        .join(Course, Curriculum.course_id == Course.id)\
-                        .join(Program, Course.program_id == Program.id)\
-                        .filter(Program.id == program_context)
+            query = query.filter(MediaLibrary.program_id == program_context)
         
         # Apply filters
         if search_params:
             if search_params.search:
-                search_term = f"%{search_params.search}%"
                 query = query.filter(
                     or_(
-                        MediaLibrary.title.ilike(search_term),
-                        MediaLibrary.description.ilike(search_term),
-                        MediaLibrary.tags.ilike(search_term),
-                        MediaLibrary.file_name.ilike(search_term)
+                        text_search.condition(MEDIA_SEARCH, search_params.search, db.get_bind().dialect.name),
+                        MediaLibrary.tags.contains([search_params.search.strip()])
                     )
                 )
             
@@ -290,32 +333,33 @@ class MediaService(BaseService[MediaLibrary, MediaLibraryCreate, MediaLibraryUpd
         
         # Apply program context filtering if provided
         if program_context:
-            base_query = base_query.join(Lesson, MediaLibrary.lesson_id == Lesson.id)\
-                                 .join(Section, Lesson.section_id == Section.id)\
-                                 .join(Module, Section.module_id == Module.id)\
-                                 .join(Level, Module.level_id == Level.id)\
-                                 .join(Curriculum, Level.curriculum_id == Curriculum.id)\
-                                 .join(Course, Curriculum.course_id == Course.id)\
-                                 .join(Program, Course.program_id == Program.id)\
-                                 .filter(Program.id == program_context)
-        
-        # Total media items
-        total_media_items = base_query.count()
-        
-        # Media by type
-        type_stats = base_query.with_entities(
-            MediaLibrary.media_type,
-            func.count(MediaLibrary.id)
-        ).group_by(MediaLibrary.media_type).all()
-        media_by_type = dict(type_stats)
-        
-        # Storage usage
-        total_storage_bytes = base_query.with_entities(func.sum(MediaLibrary.file_size)).scalar() or 0
+            base_query = base_query.filter(MediaLibrary.program_id == program_context)
+            
+            # Total media items
+            total_media_items = base_query.count()
+            
+            # Media by type
+            type_stats = base_query.with_entities(
+                MediaLibrary.file_type,
+                func.count(MediaLibrary.id)
+            ).group_by(MediaLibrary.file_type).all()
+            media_by_type = dict(type_stats)
+            
+            # Storage usage
+            total_storage_bytes = base_query.with_entities(func.sum(MediaLibrary.file_size_bytes)).scalar() or 0
+            
+            # Public vs private
+            public_count = base_query.filter(MediaLibrary.is_public == True).count()
+        else:
+            # Academy-wide figures come from materialized counters
+            counters = dashboard_counters.get_counters(db, prefix="media.")
+            total_media_items = counters.get("media.total", 0)
+            media_by_type = dashboard_counters.grouped(counters, "media.by_type")
+            total_storage_bytes = counters.get("media.storage_bytes", 0)
+            public_count = counters.get("media.public", 0)
+        
         total_storage_mb = total_storage_bytes / (1024 * 1024)
         total_storage_gb = total_storage_mb / 1024
-        
-        # Public vs private
-        public_count = base_query.filter(MediaLibrary.is_public == True).count()
         private_count = total_media_items - public_count
         
         # Most downloaded (placeholder)
@@ -339,7 +383,7 @@ class MediaService(BaseService[MediaLibrary, MediaLibraryCreate, MediaLibraryUpd
             {
                 "id": media.id,
                 "title": media.title,
-                "media_type": media.media_type,
+                "media_type": media.file_type,
                 "uploaded_at": media.created_at.isoformat()
             }
             for media in recent_uploads
@@ -450,58 +494,81 @@ class MediaService(BaseService[MediaLibrary, MediaLibraryCreate, MediaLibraryUpd
             access_frequency=3.2
         )
     
-    def get_processing_status(self, db: Session, media_id: str) -> Optional[MediaProcessingStatusResponse]:
-        """Get processing status for a media item."""
-        media = self.get(db, media_id)
+    def get_processing_status(self, 
+                              db: Session, 
+                              media_id: str, 
+                              program_context: Optional[str] = None) -> Optional[MediaProcessingStatusResponse]:
+        """Get background processing status for a media item."""
+        media = self._get_media_with_program_check(db, media_id, program_context)
         if not media:
             return None
         
-        # This would track actual processing status
-        # For now, return placeholder data
+        steps = media.processing_steps or {}
         processing_steps = [
             {
                 "step": "upload",
                 "status": "completed",
-                "completed_at": "2025-01-08T12:00:00Z"
-            },
-            {
-                "step": "thumbnail_generation",
-                "status": "completed",
-                "completed_at": "2025-01-08T12:01:00Z"
-            },
-            {
-                "step": "metadata_extraction",
-                "status": "completed",
-                "completed_at": "2025-01-08T12:02:00Z"
+                "completed_at": media.created_at.isoformat() if media.created_at else None
             }
         ]
+        for step in PROCESSING_STEPS:
+            state = steps.get(step, {"status": "completed" if media.is_processed else "pending"})
+            processing_steps.append({"step": step, **state})
+        
+        finished = sum(1 for step in processing_steps if step["status"] in ("completed", "skipped"))
         
         return MediaProcessingStatusResponse(
             media_id=media_id,
-            processing_status="completed",
-            progress_percentage=100.0,
+            processing_status=media.processing_status,
+            progress_percentage=round(100.0 * finished / len(processing_steps), 1),
             estimated_completion=None,
-            error_message=None,
+            error_message=media.processing_error,
             processing_steps=processing_steps
         )
     
-    def _process_media_file(self, db: Session, media: MediaLibrary):
-        """Process media file (generate thumbnails, extract metadata, etc.)."""
-        # This would be implemented as background tasks
-        # For now, just mark as processed
-        media.is_processed = True
-        media.processing_status = "completed"
-        db.add(media)
-        db.commit()
+    def get_media_model(self, 
+                        db: Session, 
+                        media_id: str, 
+                        program_context: Optional[str] = None) -> Optional[MediaLibrary]:
+        """Get the media model (e.g. for file delivery) with program context validation."""
+        return self._get_media_with_program_check(db, media_id, program_context)
+    
+    def _get_media_with_program_check(self, 
+                                      db: Session, 
+                                      media_id: str, 
+                                      program_context: Optional[str] = None) -> Optional[MediaLibrary]:
+        """Get media model by ID, restricted to the program's media when a context is given."""
+        query = db.query(MediaLibrary).filter(MediaLibrary.id == media_id)
+        
+        # Apply program context filtering if provided
+        if program_context:
+            query = query.filter(MediaLibrary.program_id == program_context)
+        
+        return query.first()
+    
+    @staticmethod
+    def _model_media_type(media_type: str, mime_type: str) -> MediaType:
+        """Map an API media type (or a MIME type for "other") to the stored media type."""
+        if media_type == "presentation":
+            return MediaType.DOCUMENT
+        if media_type != "other":
+            return MediaType(media_type.upper())
+        
+        prefix = (mime_type or "").split("/")[0]
+        return {
+            "video": MediaType.VIDEO,
+            "audio": MediaType.AUDIO,
+            "image": MediaType.IMAGE,
+        }.get(prefix, MediaType.DOCUMENT)
     
     def _to_media_response(self, db: Session, media: MediaLibrary) -> MediaLibraryResponse:
         """Convert MediaLibrary model to MediaLibraryResponse."""
         # Extract file extension
-        file_extension = os.path.splitext(media.file_name)[1].lstrip('.')
+        file_extension = os.path.splitext(media.original_file_name)[1].lstrip('.')
         
         # Generate URLs
         file_url = f"/api/v1/media/{media.id}/download"
-        thumbnail_url = f"/api/v1/media/{media.id}/thumbnail" if media.thumbnail_path else None
+        thumbnail_url = f"/api/v1/media/{media.id}/thumbnail" if media.thumbnail_url else None
         
         # Placeholder usage data
         download_count = 23
@@ -510,20 +577,20 @@ class MediaService(BaseService[MediaLibrary, MediaLibraryCreate, MediaLibraryUpd
         
         return MediaLibraryResponse(
             id=media.id,
-            title=media.title,
+            title=media.title or media.original_file_name,
             description=media.description,
-            media_type=media.media_type,
-            file_name=media.file_name,
-            file_path=media.file_path,
-            file_size=media.file_size,
-            mime_type=media.mime_type,
+            media_type=media.file_type.value.lower(),
+            file_name=media.original_file_name,
+            file_path=media.file_url,
+            file_size=media.file_size_bytes or 0,
+            mime_type=media.mime_type or "application/octet-stream",
             duration_seconds=media.duration_seconds,
             resolution=media.resolution,
-            tags=media.tags,
+            tags=", ".join(media.tags) if media.tags else None,
             is_public=media.is_public,
-            thumbnail_path=media.thumbnail_path,
-            metadata=media.metadata,
-            accessibility_text=media.accessibility_text,
+            thumbnail_path=media.thumbnail_url,
+            metadata=json.dumps(media.extracted_metadata) if media.extracted_metadata else None,
+            accessibility_text=media.alt_text,
             copyright_info=media.copyright_info,
             source_url=media.source_url,
             download_count=download_count,
@@ -534,7 +601,7 @@ class MediaService(BaseService[MediaLibrary, MediaLibraryCreate, MediaLibraryUpd
             file_extension=file_extension,
             is_processed=media.is_processed,
             processing_status=media.processing_status,
-            uploaded_by=media.uploaded_by,
+            uploaded_by=media.created_by,
             created_by=media.created_by,
             updated_by=media.updated_by,
             created_at=media.created_at,
@@ -543,4 +610,12 @@ class MediaService(BaseService[MediaLibrary, MediaLibraryCreate, MediaLibraryUpd
 
 
 # Global instance
-media_service = MediaService()
\ No newline at end of file
+media_service = MediaService(upload_path=settings.MEDIA_ROOT)
+
+# Materialized counters read by get_media_stats
+dashboard_counters.register(
+    CounterDefinition("media.total", MediaLibrary),
+    CounterDefinition("media.public", MediaLibrary, conditions=(("is_public", True),)),
+    CounterDefinition("media.by_type", MediaLibrary, group_by="file_type"),
+    CounterDefinition("media.storage_bytes", MediaLibrary, sum_attribute="file_size_bytes"),
+)
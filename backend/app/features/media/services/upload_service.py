@@ -0,0 +1,369 @@
+"""
+Streaming, resumable media uploads.
+
+Each upload session owns a directory ``{MEDIA_ROOT}/uploads/{upload_id}``
+holding a small JSON manifest and the partial file. Bytes are appended
+through a bounded buffer (``CHUNK_SIZE``) and written from the threadpool,
+so memory per upload stays at a few MB and the event loop is never blocked
+on disk I/O. The SHA-256 digest and the size limit are updated as data
+arrives. A client that loses its connection asks for the received offset
+and continues from there.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+
+CHUNK_SIZE = 1024 * 1024  # bytes buffered before each disk write
+SESSION_TTL = timedelta(hours=1)  # extended on every received chunk
+PURGE_INTERVAL_SECONDS = 600
+
+MANIFEST_NAME = "session.json"
+PART_NAME = "upload.part"
+
+
+class UploadSessionNotFoundError(LookupError):
+    """Raised when an upload session does not exist or has expired."""
+
+
+class UploadOffsetMismatchError(ValueError):
+    """Raised when a chunk does not start where the received data ends."""
+
+    def __init__(self, expected_offset: int, message: Optional[str] = None):
+        super().__init__(message or f"Upload offset mismatch; expected offset {expected_offset}")
+        self.expected_offset = expected_offset
+
+
+class UploadInProgressError(ValueError):
+    """Raised when another request is already writing to the same upload."""
+
+
+class UploadTooLargeError(ValueError):
+    """Raised when an upload exceeds the allowed or announced size."""
+
+
+class UploadChunkLengthError(ValueError):
+    """Raised when a chunk is shorter or longer than announced; nothing of it is kept."""
+
+    def __init__(self, received_bytes: int, message: str):
+        super().__init__(message)
+        self.received_bytes = received_bytes
+
+
+class UploadAccessDeniedError(PermissionError):
+    """Raised when someone other than the uploader uses an upload session."""
+
+
+@dataclass
+class UploadSession:
+    """Upload session manifest."""
+
+    upload_id: str
+    uploaded_by: Optional[str]
+    program_context: Optional[str]
+    max_file_size: int
+    expires_at: datetime
+    media: Dict[str, Any] = field(default_factory=dict)  # MediaUploadRequest fields
+    expected_size: Optional[int] = None
+    received_bytes: int = 0
+
+    @property
+    def is_expired(self) -> bool:
+        return self.expires_at < datetime.utcnow()
+
+
+@dataclass(frozen=True)
+class CompletedUpload:
+    """File assembled from an upload session."""
+
+    upload_id: str
+    path: str
+    size: int
+    sha256: str
+
+
+class MediaUploadService:
+    """Manage upload sessions and stream their bytes to disk."""
+
+    def __init__(self, upload_root: str, max_file_size: int):
+        self.upload_root = upload_root
+        self.max_file_size = max_file_size
+        # upload_id -> (offset, digest of the first ``offset`` bytes); rebuilt from disk on mismatch
+        self._digests: Dict[str, Tuple[int, Any]] = {}
+        self._last_purge = 0.0
+
+    # ------------------------------------------------------------------
+    # Sessions
+    # ------------------------------------------------------------------
+
+    def create_session(
+        self,
+        media: Dict[str, Any],
+        uploaded_by: Optional[str] = None,
+        program_context: Optional[str] = None,
+        expected_size: Optional[int] = None,
+    ) -> UploadSession:
+        """Create an upload session and its directory."""
+        if expected_size is not None and expected_size > self.max_file_size:
+            raise UploadTooLargeError(f"File size {expected_size} exceeds the maximum of {self.max_file_size} bytes")
+        self._purge_expired_periodically()
+
+        session = UploadSession(
+            upload_id=uuid.uuid4().hex,
+            uploaded_by=uploaded_by,
+            program_context=program_context,
+            max_file_size=self.max_file_size,
+            expires_at=datetime.utcnow() + SESSION_TTL,
+            media=media,
+            expected_size=expected_size,
+        )
+        os.makedirs(self._session_dir(session.upload_id), exist_ok=True)
+        open(self._part_path(session.upload_id), "ab").close()
+        self._save(session)
+        return session
+
+    def get_session(self, upload_id: str, user_id: Optional[str] = None) -> UploadSession:
+        """
+        Load a live upload session, with the number of bytes received so far.
+
+        With ``user_id``, only the user who created the session may use it.
+        """
+        try:
+            with open(self._manifest_path(upload_id)) as manifest:
+                data = json.load(manifest)
+        except (FileNotFoundError, ValueError):
+            raise UploadSessionNotFoundError(f"Upload session {upload_id} not found")
+
+        data["expires_at"] = datetime.fromisoformat(data["expires_at"])
+        session = UploadSession(**data)
+        if session.is_expired:
+            raise UploadSessionNotFoundError(f"Upload session {upload_id} has expired")
+        if user_id is not None and session.uploaded_by != user_id:
+            raise UploadAccessDeniedError(f"Upload session {upload_id} belongs to another user")
+        session.received_bytes = os.path.getsize(self._part_path(upload_id))
+        return session
+
+    def find_session(self, upload_id: str) -> Optional[UploadSession]:
+        try:
+            return self.get_session(upload_id)
+        except UploadSessionNotFoundError:
+            return None
+
+    def discard(self, upload_id: str) -> None:
+        """Remove an upload session and everything received for it."""
+        self._digests.pop(upload_id, None)
+        shutil.rmtree(self._session_dir(upload_id), ignore_errors=True)
+
+    # ------------------------------------------------------------------
+    # Data
+    # ------------------------------------------------------------------
+
+    async def append(
+        self,
+        upload_id: str,
+        chunks: AsyncIterator[bytes],
+        offset: Optional[int] = None,
+        total_size: Optional[int] = None,
+        length: Optional[int] = None,
+        user_id: Optional[str] = None,
+    ) -> UploadSession:
+        """
+        Append a stream of bytes at ``offset`` (default: the current end).
+
+        ``total_size`` (e.g. from ``Content-Range``) fixes the expected file
+        size. With ``length`` the stream must be exactly that long: a longer
+        one is cut off before the excess is written and a shorter one is
+        truncated away again. Returns the session with the updated received
+        byte count.
+        """
+        session = await run_in_threadpool(self.get_session, upload_id, user_id)
+        if offset is not None and offset != session.received_bytes:
+            raise UploadOffsetMismatchError(session.received_bytes)
+        if total_size is not None:
+            if session.expected_size is not None and total_size != session.expected_size:
+                raise ValueError(f"Upload size changed from {session.expected_size} to {total_size}")
+            if total_size > session.max_file_size:
+                raise UploadTooLargeError(
+                    f"File size {total_size} exceeds the maximum of {session.max_file_size} bytes"
+                )
+            session.expected_size = total_size
+        limit = session.expected_size if session.expected_size is not None else session.max_file_size
+
+        part = await run_in_threadpool(self._open_locked, upload_id)
+        size = session.received_bytes
+        if os.fstat(part.fileno()).st_size != size:
+            # Another request appended between reading the session and taking the lock
+            part.close()
+            raise UploadOffsetMismatchError(os.path.getsize(self._part_path(upload_id)))
+        start = size
+        try:
+            digest = await run_in_threadpool(self._digest_at, upload_id, size)
+            buffer = bytearray()
+
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > limit:
+                    raise UploadTooLargeError(f"Upload exceeds the allowed size of {limit} bytes")
+                if length is not None and size - start > length:
+                    raise UploadChunkLengthError(start, f"Chunk is longer than the announced {length} bytes")
+                digest.update(chunk)
+                buffer += chunk
+                if len(buffer) >= CHUNK_SIZE:
+                    await run_in_threadpool(part.write, bytes(buffer))
+                    buffer.clear()
+
+            if length is not None and size - start < length:
+                raise UploadChunkLengthError(
+                    start, f"Chunk is shorter than the announced {length} bytes ({size - start} received)"
+                )
+            if buffer:
+                await run_in_threadpool(part.write, bytes(buffer))
+            await run_in_threadpool(part.flush)
+        except UploadChunkLengthError:
+            # Drop whatever part of the chunk was already written
+            await run_in_threadpool(part.flush)
+            await run_in_threadpool(os.ftruncate, part.fileno(), start)
+            part.close()
+            self._digests.pop(upload_id, None)
+            raise
+        except UploadTooLargeError:
+            part.close()
+            await run_in_threadpool(self.discard, upload_id)
+            raise
+        except BaseException:
+            # Part of the stream may be on disk; the client resumes from the received offset
+            part.close()
+            self._digests.pop(upload_id, None)
+            raise
+        part.close()
+        self._digests[upload_id] = (size, digest)
+
+        session.received_bytes = size
+        session.expires_at = datetime.utcnow() + SESSION_TTL
+        await run_in_threadpool(self._save, session)
+        return session
+
+    def complete(
+        self, upload_id: str, file_name: str, sha256: Optional[str] = None, user_id: Optional[str] = None
+    ) -> CompletedUpload:
+        """
+        Finish an upload: check its size and optional checksum and move it to its final name.
+
+        The session is closed; the returned path lives in the session directory
+        until the caller moves it (see ``discard``).
+        """
+        session = self.get_session(upload_id, user_id)
+        if session.expected_size is not None and session.received_bytes != session.expected_size:
+            raise UploadOffsetMismatchError(
+                session.received_bytes,
+                f"Upload incomplete: received {session.received_bytes} of {session.expected_size} bytes",
+            )
+        if session.received_bytes == 0:
+            raise ValueError("Upload is empty")
+
+        digest = self._digest_at(upload_id, session.received_bytes).hexdigest()
+        if sha256 and sha256.lower() != digest:
+            raise ValueError("Checksum mismatch: uploaded data does not match the provided SHA-256")
+
+        name = os.path.basename(file_name) or "upload"
+        path = os.path.join(self._session_dir(upload_id), name)
+        os.replace(self._part_path(upload_id), path)
+        os.remove(self._manifest_path(upload_id))
+        self._digests.pop(upload_id, None)
+        return CompletedUpload(upload_id=upload_id, path=path, size=session.received_bytes, sha256=digest)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _open_locked(self, upload_id: str):
+        part = open(self._part_path(upload_id), "ab")
+        try:
+            fcntl.flock(part.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            part.close()
+            raise UploadInProgressError(f"Upload {upload_id} is already receiving data")
+        return part
+
+    def _digest_at(self, upload_id: str, offset: int):
+        """SHA-256 state after the first ``offset`` bytes of the partial file."""
+        cached = self._digests.get(upload_id)
+        if cached and cached[0] == offset:
+            return cached[1].copy()
+
+        # Another process received earlier chunks: rebuild from disk in bounded reads
+        digest = hashlib.sha256()
+        remaining = offset
+        with open(self._part_path(upload_id), "rb") as part:
+            while remaining:
+                block = part.read(min(CHUNK_SIZE, remaining))
+                if not block:
+                    break
+                digest.update(block)
+                remaining -= len(block)
+        return digest
+
+    def _save(self, session: UploadSession) -> None:
+        data = asdict(session)
+        data["expires_at"] = session.expires_at.isoformat()
+        data.pop("received_bytes")
+        path = self._manifest_path(session.upload_id)
+        with open(f"{path}.tmp", "w") as manifest:
+            json.dump(data, manifest)
+        os.replace(f"{path}.tmp", path)
+
+    def _purge_expired_periodically(self) -> None:
+        now = time.monotonic()
+        if now - self._last_purge < PURGE_INTERVAL_SECONDS:
+            return
+        self._last_purge = now
+        self.purge_expired()
+
+    def purge_expired(self) -> int:
+        """Delete expired, unfinished upload sessions. Returns the number removed."""
+        removed = 0
+        if not os.path.isdir(self.upload_root):
+            return removed
+        for upload_id in os.listdir(self.upload_root):
+            if os.path.exists(self._manifest_path(upload_id)) and self.find_session(upload_id) is None:
+                self.discard(upload_id)
+                removed += 1
+        return removed
+
+    def _session_dir(self, upload_id: str) -> str:
+        if not upload_id.isalnum():
+            raise UploadSessionNotFoundError(f"Upload session {upload_id} not found")
+        return os.path.join(self.upload_root, upload_id)
+
+    def _manifest_path(self, upload_id: str) -> str:
+        return os.path.join(self._session_dir(upload_id), MANIFEST_NAME)
+
+    def _part_path(self, upload_id: str) -> str:
+        return os.path.join(self._session_dir(upload_id), PART_NAME)
+
+
+async def iter_upload_file(file, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Read an ``UploadFile`` in bounded chunks."""
+    while True:
+        chunk = await file.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+# Global instance
+upload_service = MediaUploadService(
+    upload_root=os.path.join(settings.MEDIA_ROOT, "uploads"),
+    max_file_size=settings.MEDIA_MAX_FILE_SIZE,
+)
@@ -113,7 +113,8 @@ async def list_parents(
     has_children: Optional[bool] = Query(None, description="Filter parents with/without children"),
     is_primary_payer: Optional[bool] = Query(None, description="Filter by payment responsibility"),
     sort_by: Optional[str] = Query(None, description="Sort field"),
-    sort_order: Optional[str] = Query("asc", regex="^(asc|desc)$", description="Sort order")
+    sort_order: Optional[str] = Query("asc", regex="^(asc|desc)$", description="Sort order"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page (keyset pagination)")
 ):
     """
     List parents with optional search and pagination.
@@ -121,13 +122,14 @@ async def list_parents(
     Supports filtering by various criteria and sorting.
     """
     try:
-        parents, total_count = parent_service.get_parents_list(
+        parents, total_count, next_cursor = parent_service.get_parents_list(
             db=db,
             program_context=program_context,
             page=page,
             per_page=per_page,
             search=search,
-            has_children=has_children
+            has_children=has_children,
+            cursor=cursor
         )
         
         # Build response with parent data using the service method
@@ -146,9 +148,12 @@ async def list_parents(
             per_page=per_page,
             total_pages=total_pages,
             has_next=page < total_pages,
-            has_prev=page > 1
+            has_prev=page > 1,
+            next_cursor=next_cursor
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error listing parents: {str(e)}")
         raise HTTPException(
@@ -280,6 +280,7 @@ class ParentListResponse(PaginatedResponse):
     """Schema for paginated parent list response."""
     
     items: List[ParentResponse] = Field(..., description="List of parents")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page (keyset pagination)")
 
 
 class ParentSearchParams(BaseModel):
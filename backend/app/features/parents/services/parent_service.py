@@ -8,12 +8,13 @@ and family relationships within the program context.
 from typing import Dict, List, Optional, Any, Tuple
 from uuid import UUID
 from datetime import date, timedelta
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, distinct, select
+from sqlalchemy.orm import Session, contains_eager, joinedload
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from fastapi import HTTPException, status
 import logging
 
-from app.features.authentication.models.user import User
+from app.features.authentication.models.user import USER_SEARCH, User
 from app.features.parents.models.parent import Parent
 from app.features.parents.models.parent_child_relationship import ParentChildRelationship
 from app.features.students.models.student import Student
@@ -21,11 +22,17 @@ from app.features.enrollments.models.program_assignment import ProgramAssignment
 from app.features.enrollments.models.course_enrollment import CourseEnrollment
 from app.features.organizations.models.organization_membership import OrganizationMembership
 from app.features.authentication.services.user_service import user_service
+from app.features.common.services.keyset import after_cursor, encode_cursor
+from app.features.common.services.stats_service import stats_aggregator
+from app.features.common.services.text_search import text_search
 from app.features.common.models.enums import UserRole, ProgramRole, EnrollmentStatus, AssignmentType
 from app.features.parents.schemas.parent import ParentCreate, ParentUpdate, ParentResponse
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on parents loaded per list request
+MAX_PARENTS_PAGE_SIZE = 100
+
 
 class ParentService:
     """
@@ -173,106 +180,86 @@ class ParentService:
         per_page: int = 20,
         search: Optional[str] = None,
         is_active: Optional[bool] = None,
-        has_children: Optional[bool] = None
-    ) -> Tuple[List[Parent], int]:
+        has_children: Optional[bool] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Parent], int, Optional[str]]:
         """
         Get paginated list of parents with optional filtering.
         
+        Filtering, ordering (by last name, first name) and pagination all run
+        in one query; at most ``MAX_PARENTS_PAGE_SIZE`` parents are loaded.
+        
         Args:
             db: Database session
             program_context: Program context
-            page: Page number
+            page: Page number (ignored when ``cursor`` is given)
             per_page: Items per page
             search: Search query
             is_active: Filter by active status
             has_children: Filter by children status
+            cursor: ``next_cursor`` of the previous page for keyset pagination
             
         Returns:
-            Tuple of (parents list, total count)
+            Tuple of (parents list, total count, cursor of the next page or None)
         """
-        # Use enrollment-based approach for program filtering
-        if program_context:
-            # Delegate to the enrollment-based method and then apply additional filters
-            parents, total_count = ParentService.get_parents_in_program_by_children_enrollment(
-                db=db, 
-                program_id=program_context, 
-                page=1, 
-                per_page=10000  # Get all for filtering
-            )
-            
-            # Apply filters to the results
-            filtered_parents = parents
-            
-            # Apply search filter
-            if search:
-                search_lower = search.lower()
-                filtered_parents = [
-                    p for p in filtered_parents 
-                    if (search_lower in p.user.first_name.lower() or
-                        search_lower in p.user.last_name.lower() or
-                        search_lower in p.user.email.lower())
-                ]
-            
-            # Apply active status filter
-            if is_active is not None:
-                filtered_parents = [p for p in filtered_parents if p.user.is_active == is_active]
-            
-            # Apply has_children filter
-            if has_children is not None:
-                children_filtered = []
-                for parent in filtered_parents:
-                    children_count = db.query(ParentChildRelationship).filter(
-                        ParentChildRelationship.parent_id == parent.id
-                    ).count()
-                    if (has_children and children_count > 0) or (not has_children and children_count == 0):
-                        children_filtered.append(parent)
-                filtered_parents = children_filtered
-            
-            # Apply pagination to filtered results
-            total_count = len(filtered_parents)
-            offset = (page - 1) * per_page
-            parents = filtered_parents[offset:offset + per_page]
-            
-            return parents, total_count
-        else:  
-            # No program context - get all parents
-            query = db.query(Parent).options(
-                joinedload(Parent.user)
-            )
-            
-            # Apply search filter
-            if search:
-                query = query.join(User).filter(
-                    (User.first_name.ilike(f"%{search}%")) |
-                    (User.last_name.ilike(f"%{search}%")) |
-                    (User.email.ilike(f"%{search}%"))
+        per_page = min(per_page, MAX_PARENTS_PAGE_SIZE)
+        query = ParentService._parents_query(db, program_context, search, is_active, has_children)
+        total_count = query.order_by(None).count()
+        
+        sort_columns = [User.last_name, User.first_name, Parent.id]
+        query = query.options(contains_eager(Parent.user)).order_by(*sort_columns)
+        if cursor:
+            query = query.filter(after_cursor(sort_columns, cursor))
+        else:
+            query = query.offset((page - 1) * per_page)
+        parents = query.limit(per_page + 1).all()
+        
+        next_cursor = None
+        if len(parents) > per_page:
+            parents = parents[:per_page]
+            last = parents[-1]
+            next_cursor = encode_cursor([last.user.last_name, last.user.first_name, last.id])
+        
+        return parents, total_count, next_cursor
+
+    @staticmethod
+    def _parents_query(
+        db: Session,
+        program_id: Optional[str] = None,
+        search: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        has_children: Optional[bool] = None
+    ):
+        """Parents joined to their users, filtered in SQL."""
+        query = db.query(Parent).join(User, Parent.user_id == User.id)
+        
+        # Visible in a program through a child with a current enrollment in it
+        if program_id:
+            query = query.filter(
+                select(ParentChildRelationship.id)
+                .join(Student, Student.id == ParentChildRelationship.student_id)
+                .join(CourseEnrollment, CourseEnrollment.user_id == Student.user_id)
+                .where(
+                    ParentChildRelationship.parent_id == Parent.id,
+                    CourseEnrollment.program_id == program_id,
+                    CourseEnrollment.status.in_([EnrollmentStatus.active, EnrollmentStatus.paused])
                 )
-            
-            # Apply active status filter
-            if is_active is not None:
-                query = query.join(User).filter(User.is_active == is_active)
-            
-            # Get total count before pagination
-            total_count = query.count()
-            
-            # Apply pagination
-            offset = (page - 1) * per_page
-            parents = query.offset(offset).limit(per_page).all()
-            
-            # Apply has_children filter (post-query since it requires relationship counting)
-            if has_children is not None:
-                filtered_parents = []
-                for parent in parents:
-                    children_count = db.query(ParentChildRelationship).filter(
-                        ParentChildRelationship.parent_id == parent.id
-                    ).count()
-                    
-                    if (has_children and children_count > 0) or (not has_children and children_count == 0):
-                        filtered_parents.append(parent)
-                
-                parents = filtered_parents
-            
-            return parents, total_count
+                .exists()
+            )
+        
+        if search:
+            query = text_search.filter(query, USER_SEARCH, search)
+        
+        if is_active is not None:
+            query = query.filter(User.is_active == is_active)
+        
+        if has_children is not None:
+            children = select(ParentChildRelationship.id).where(
+                ParentChildRelationship.parent_id == Parent.id
+            ).exists()
+            query = query.filter(children if has_children else ~children)
+        
+        return query
 
     @staticmethod
     def update_parent_profile(
@@ -413,56 +400,59 @@ class ParentService:
             Dictionary with parent statistics relevant to assignment-based system
         """
         try:
-            # Get all parents directly (not just via children enrollment filtering)
-            # This gives us the actual count since parents exist as profiles
-            all_parents = db.query(Parent).join(User, Parent.user_id == User.id).filter(
+            # Count all parents with an active user account (not just via children
+            # enrollment filtering); every figure is aggregated in the database.
+            parent_query = db.query(Parent).join(User, Parent.user_id == User.id).filter(
                 User.is_active.is_(True)
-            ).all()
+            )
             
-            total_parents = len(all_parents)
+            thirty_days_ago = date.today() - timedelta(days=30)
+            parent_totals = stats_aggregator.aggregate(
+                parent_query,
+                total=func.count(Parent.id),
+                primary_payers=func.count(Parent.id).filter(Parent.is_primary_payer.is_(True)),
+                recent=func.count(Parent.id).filter(Parent.enrollment_date >= thirty_days_ago),
+            )
+            total_parents = parent_totals["total"]
+            primary_payers = parent_totals["primary_payers"]
+            recent_parent_profiles = parent_totals["recent"]
             
             # Calculate children relationships
-            parent_child_relationships = db.query(ParentChildRelationship).all()
-            total_relationships = len(parent_child_relationships)
+            relationship_totals = stats_aggregator.aggregate(
+                db.query(ParentChildRelationship),
+                total=func.count(ParentChildRelationship.id),
+                parents=func.count(distinct(ParentChildRelationship.parent_id)),
+                students=func.count(distinct(ParentChildRelationship.student_id)),
+            )
+            total_relationships = relationship_totals["total"]
             
             # Count parents who actually have child relationships
-            parents_with_relationships = len(set(rel.parent_id for rel in parent_child_relationships))
+            parents_with_relationships = relationship_totals["parents"]
             
             # Count unique students with parent relationships
-            students_with_parents = len(set(rel.student_id for rel in parent_child_relationships))
+            students_with_parents = relationship_totals["students"]
             
             # Calculate gender distribution with correct lowercase enum values
-            parents_by_gender = {"male": 0, "female": 0, "other": 0, "prefer_not_to_say": 0, "unknown": 0}
-            for parent in all_parents:
-                if parent.gender:
-                    gender_key = parent.gender.value
-                else:
-                    gender_key = "unknown"
-                parents_by_gender[gender_key] = parents_by_gender.get(gender_key, 0) + 1
-            
-            # Calculate children count distribution based on actual relationships
-            parents_by_children_count = {"0": 0, "1": 0, "2": 0, "3+": 0}
-            primary_payers = 0
-            
-            for parent in all_parents:
-                if parent.is_primary_payer:
-                    primary_payers += 1
-                    
-                # Count actual child relationships for this parent
-                children_count = sum(1 for rel in parent_child_relationships if rel.parent_id == parent.id)
-                
-                if children_count == 0:
-                    parents_by_children_count["0"] += 1
-                elif children_count == 1:
-                    parents_by_children_count["1"] += 1
-                elif children_count == 2:
-                    parents_by_children_count["2"] += 1
-                else:
-                    parents_by_children_count["3+"] += 1
-            
-            # Calculate recent parent profile creations (last 30 days)
-            thirty_days_ago = date.today() - timedelta(days=30)
-            recent_parent_profiles = len([p for p in all_parents if p.enrollment_date >= thirty_days_ago])
+            parents_by_gender = stats_aggregator.count_by(
+                parent_query,
+                Parent.gender,
+                defaults={"male": 0, "female": 0, "other": 0, "prefer_not_to_say": 0, "unknown": 0}
+            )
+            
+            # Calculate children count distribution from per-parent relationship counts
+            children_per_parent = db.query(
+                ParentChildRelationship.parent_id.label("parent_id"),
+                func.count(ParentChildRelationship.id).label("children_count")
+            ).group_by(ParentChildRelationship.parent_id).subquery()
+            children_count = func.coalesce(children_per_parent.c.children_count, 0)
+            
+            parents_by_children_count = stats_aggregator.bucket_counts(
+                parent_query.outerjoin(
+                    children_per_parent, children_per_parent.c.parent_id == Parent.id
+                ),
+                [("0", children_count == 0), ("1", children_count == 1), ("2", children_count == 2)],
+                else_key="3+"
+            )
             
             # Calculate average relationships per parent (more relevant than average children)
             avg_relationships_per_parent = total_relationships / total_parents if total_parents > 0 else 0
@@ -967,35 +957,16 @@ class ParentService:
             Tuple of (parents list, total count)
         """
         try:
-            # Get all user IDs with active enrollments in this program
-            enrolled_user_ids_query = db.query(CourseEnrollment.user_id).filter(
-                CourseEnrollment.program_id == program_id,
-                CourseEnrollment.status.in_([EnrollmentStatus.active, EnrollmentStatus.paused])
-            ).distinct()
-            
-            # Get students based on these enrollments
-            enrolled_students_query = db.query(Student.id).filter(
-                Student.user_id.in_(enrolled_user_ids_query)
-            )
-            
-            # Get parents through parent-child relationships
-            parent_ids_query = db.query(ParentChildRelationship.parent_id).filter(
-                ParentChildRelationship.student_id.in_(enrolled_students_query)
-            ).distinct()
-            
-            # Get parents based on these relationships
-            query = db.query(Parent).options(
-                joinedload(Parent.user)
-            ).filter(
-                Parent.id.in_(parent_ids_query)
-            )
+            query = ParentService._parents_query(db, program_id)
             
             # Get total count
             total_count = query.count()
             
             # Apply pagination
             offset = (page - 1) * per_page
-            parents = query.offset(offset).limit(per_page).all()
+            parents = query.options(contains_eager(Parent.user)).order_by(
+                User.last_name, User.first_name, Parent.id
+            ).offset(offset).limit(per_page).all()
             
             return parents, total_count
         except Exception as e:
@@ -4,9 +4,10 @@ Program API routes for curriculum management.
 
 from typing import Annotated, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.features.common.models.database import get_db
+from app.features.common.models.database import get_async_db, get_db
 from app.features.authentication.routes.auth import get_current_active_user
 from app.features.programs.schemas.program import (
     ProgramCreate,
@@ -58,7 +59,7 @@ async def create_program(
 
 @router.get("", response_model=ProgramListResponse)
 async def list_programs(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     current_user: Annotated[dict, Depends(get_current_active_user)],
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
@@ -85,7 +86,7 @@ async def list_programs(
                 sort_order=sort_order
             )
         
-        programs, total_count = program_service.list_programs(
+        programs, total_count = await program_service.list_programs_async(
             db=db,
             search_params=search_params,
             page=page,
@@ -140,7 +141,7 @@ async def get_program_stats(
 @router.get("/{program_id}", response_model=ProgramResponse)
 async def get_program(
     program_id: str,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     current_user: Annotated[dict, Depends(get_current_active_user)]
 ):
     """
@@ -148,7 +149,7 @@ async def get_program(
     
     Returns detailed program information.
     """
-    program = program_service.get_program(db, program_id)
+    program = await program_service.get_program_async(db, program_id)
     if not program:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -231,7 +232,7 @@ async def delete_program(
 @router.get("/by-code/{program_code}", response_model=ProgramResponse)
 async def get_program_by_code(
     program_code: str,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     current_user: Annotated[dict, Depends(get_current_active_user)]
 ):
     """
@@ -239,7 +240,7 @@ async def get_program_by_code(
     
     Alternative lookup method using the program code.
     """
-    program = program_service.get_program_by_code(db, program_code)
+    program = await program_service.get_program_by_code_async(db, program_code)
     if not program:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
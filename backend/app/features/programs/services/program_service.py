@@ -4,7 +4,8 @@ Program service for curriculum management operations.
 
 from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, and_, or_, desc, asc
+from sqlalchemy import func, and_, or_, desc, asc, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.programs.models.program import Program
 from app.features.courses.models.course import Course
@@ -22,6 +23,10 @@ from app.features.programs.schemas.program import (
     TeamAssignment
 )
 from app.features.courses.services.base_service import BaseService
+from app.features.common.services.dashboard_counters import CounterDefinition, dashboard_counters
+from app.features.authentication.models.user_program_assignment import UserProgramAssignment
+from app.features.facilities.models.facility import Facility
+from app.features.students.models.student import Student
 
 
 class ProgramService(BaseService[Program, ProgramCreate, ProgramUpdate]):
@@ -217,48 +222,41 @@ class ProgramService(BaseService[Program, ProgramCreate, ProgramUpdate]):
         
         return self._to_program_response(db, program)
     
+    async def get_program_async(self, db: AsyncSession, program_id: str) -> Optional[ProgramResponse]:
+        """Get program by ID without blocking the event loop."""
+        program = await db.get(Program, program_id)
+        if not program:
+            return None
+        
+        return (await self._to_program_responses_async(db, [program]))[0]
+    
+    async def get_program_by_code_async(self, db: AsyncSession, program_code: str) -> Optional[ProgramResponse]:
+        """Get program by program code without blocking the event loop."""
+        result = await db.execute(
+            select(Program).where(Program.program_code == program_code).limit(1)
+        )
+        program = result.scalars().first()
+        if not program:
+            return None
+        
+        return (await self._to_program_responses_async(db, [program]))[0]
+    
     def get_program_statistics(self, db: Session, program_id: str) -> Optional[Dict[str, Any]]:
         """Get comprehensive statistics for a program."""
-        from app.features.authentication.models.user_program_assignment import UserProgramAssignment
-        from app.features.authentication.models.user import User
-        from app.features.courses.models.course import Course
-        from app.features.facilities.models.facility import Facility
-        from app.features.students.models.student import Student
-        
         # Verify program exists
         program = self.get(db, program_id)
         if not program:
             return None
         
-        # Count courses in this program
-        active_courses = db.query(Course).filter(
-            Course.program_id == program_id,
-            Course.status == 'published'
-        ).count()
-        
-        total_courses = db.query(Course).filter(
-            Course.program_id == program_id
-        ).count()
-        
-        # Count team members (users assigned to this program)
-        team_members = db.query(UserProgramAssignment).filter(
-            UserProgramAssignment.program_id == program_id
-        ).count()
-        
-        # Count students in this program
-        total_students = db.query(Student).filter(
-            Student.program_id == program_id
-        ).count()
-        
-        active_students = db.query(Student).filter(
-            Student.program_id == program_id,
-            Student.status == 'active'
-        ).count()
-        
-        # Count facilities in this program
-        total_facilities = db.query(Facility).filter(
-            Facility.program_id == program_id
-        ).count()
+        # Course, student, team and facility counts come from materialized
+        # counters maintained on flush, so this is a single indexed lookup
+        counters = dashboard_counters.get_counters(db, scope=program_id)
+        total_courses = counters.get("courses.total", 0)
+        active_courses = counters.get("courses.published", 0)
+        team_members = counters.get("team.members", 0)
+        total_students = counters.get("students.total", 0)
+        active_students = counters.get("students.active", 0)
+        total_facilities = counters.get("facilities.total", 0)
         
         return {
             "program_id": program_id,
@@ -346,9 +344,42 @@ class ProgramService(BaseService[Program, ProgramCreate, ProgramUpdate]):
                      page: int = 1,
                      per_page: int = 20) -> Tuple[List[ProgramResponse], int]:
         """List programs with optional search and pagination."""
-        query = db.query(Program)
+        query = self._apply_list_filters(db.query(Program), search_params)
+        
+        # Get total count
+        total_count = query.count()
         
-        # Apply filters
+        # Apply pagination
+        offset = (page - 1) * per_page
+        programs = query.offset(offset).limit(per_page).all()
+        
+        # Convert to response objects
+        program_responses = [self._to_program_response(db, program) for program in programs]
+        
+        return program_responses, total_count
+    
+    async def list_programs_async(self,
+                                  db: AsyncSession,
+                                  search_params: Optional[ProgramSearchParams] = None,
+                                  page: int = 1,
+                                  per_page: int = 20) -> Tuple[List[ProgramResponse], int]:
+        """List programs with optional search and pagination without blocking the event loop."""
+        query = self._apply_list_filters(select(Program), search_params)
+        
+        # Get total count
+        total_count = await db.scalar(
+            select(func.count()).select_from(query.order_by(None).subquery())
+        ) or 0
+        
+        # Apply pagination
+        offset = (page - 1) * per_page
+        result = await db.execute(query.offset(offset).limit(per_page))
+        programs = list(result.scalars().all())
+        
+        return await self._to_program_responses_async(db, programs), total_count
+    
+    def _apply_list_filters(self, query, search_params: Optional[ProgramSearchParams]):
+        """Apply search filters and sorting to a Program query or select."""
         if search_params:
             if search_params.search:
                 search_term = f"%{search_params.search}%"
@@ -370,19 +401,7 @@ class ProgramService(BaseService[Program, ProgramCreate, ProgramUpdate]):
         # Apply sorting
         sort_field = getattr(Program, search_params.sort_by) if search_params and search_params.sort_by else Program.display_order
         sort_order_func = desc if search_params and search_params.sort_order == "desc" else asc
-        query = query.order_by(sort_order_func(sort_field))
-        
-        # Get total count
-        total_count = query.count()
-        
-        # Apply pagination
-        offset = (page - 1) * per_page
-        programs = query.offset(offset).limit(per_page).all()
-        
-        # Convert to response objects
-        program_responses = [self._to_program_response(db, program) for program in programs]
-        
-        return program_responses, total_count
+        return query.order_by(sort_order_func(sort_field))
     
     def get_program_stats(self, db: Session) -> ProgramStatsResponse:
         """Get program statistics."""
@@ -537,6 +556,37 @@ class ProgramService(BaseService[Program, ProgramCreate, ProgramUpdate]):
             Course, Course.id == Curriculum.course_id
         ).filter(Course.program_id == program.id).scalar() or 0
         
+        return self._build_program_response(program, course_count, total_curriculum_count)
+    
+    async def _to_program_responses_async(self, db: AsyncSession, programs: List[Program]) -> List[ProgramResponse]:
+        """Convert Program models to responses with two grouped count queries for the whole page."""
+        if not programs:
+            return []
+        
+        program_ids = [program.id for program in programs]
+        course_counts = dict((await db.execute(
+            select(Course.program_id, func.count(Course.id))
+            .where(Course.program_id.in_(program_ids))
+            .group_by(Course.program_id)
+        )).all())
+        curriculum_counts = dict((await db.execute(
+            select(Course.program_id, func.count(Curriculum.id))
+            .join(Course, Course.id == Curriculum.course_id)
+            .where(Course.program_id.in_(program_ids))
+            .group_by(Course.program_id)
+        )).all())
+        
+        return [
+            self._build_program_response(
+                program,
+                course_counts.get(program.id, 0),
+                curriculum_counts.get(program.id, 0),
+            )
+            for program in programs
+        ]
+    
+    def _build_program_response(self, program: Program, course_count: int, total_curriculum_count: int) -> ProgramResponse:
+        """Build a ProgramResponse from a program and its precomputed counts."""
         # Convert configuration data to Pydantic objects
         age_groups = None
         if program.age_groups:
@@ -573,4 +623,15 @@ class ProgramService(BaseService[Program, ProgramCreate, ProgramUpdate]):
 
 
 # Global instance
-program_service = ProgramService()
\ No newline at end of file
+program_service = ProgramService()
+# Materialized counters read by get_program_statistics
+dashboard_counters.register(
+    CounterDefinition("courses.total", Course, scope_attribute="program_id"),
+    CounterDefinition("courses.published", Course, scope_attribute="program_id",
+                      conditions=(("status", "published"),)),
+    CounterDefinition("team.members", UserProgramAssignment, scope_attribute="program_id"),
+    CounterDefinition("students.total", Student, scope_attribute="program_id"),
+    CounterDefinition("students.active", Student, scope_attribute="program_id",
+                      conditions=(("status", "active"),)),
+    CounterDefinition("facilities.total", Facility, scope_attribute="program_id"),
+)
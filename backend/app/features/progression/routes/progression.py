@@ -3,11 +3,16 @@ API routes for the star-based curriculum progression system.
 Simplified version for initial deployment.
 """
 
-from typing import Dict, Any
+from typing import Annotated, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.features.common.models.database import get_db
+from app.features.authentication.routes.auth import get_current_active_user
+from app.features.authentication.services.principal_cache import AuthenticatedUser
+from app.features.common.models.database import get_async_db, get_db
+from app.features.progression.schemas.progression import CurriculumProgressionSettingsResponse
+from app.features.progression.services.progression_service import progression_service
 
 router = APIRouter(tags=["Curriculum Progression"])
 
@@ -30,10 +35,16 @@ async def progression_health_check():
 @router.get("/settings/curriculum/{curriculum_id}")
 async def get_progression_settings(
     curriculum_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get progression settings for a curriculum"""
-    # Placeholder implementation
+    settings = await progression_service.get_progression_settings_by_curriculum(db, curriculum_id)
+    if settings:
+        return create_response(
+            data=CurriculumProgressionSettingsResponse.model_validate(settings).model_dump()
+        )
+    
+    # Fall back to the default settings when none are configured
     return create_response(data={
         "curriculum_id": curriculum_id,
         "module_unlock_threshold_percentage": 70.0,
@@ -58,12 +69,9 @@ async def create_progression_settings(
 
 @router.get("/analytics/instructor/dashboard")
 async def get_instructor_dashboard(
-    db: Session = Depends(get_db)
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_active_user)],
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get instructor dashboard analytics"""
-    # Placeholder implementation
-    return create_response(data={
-        "students_to_grade": 0,
-        "assessments_to_complete": 0,
-        "recent_activity": []
-    })
\ No newline at end of file
+    """Get instructor dashboard analytics for the current user"""
+    summary = await progression_service.get_instructor_dashboard_summary(db, current_user.id)
+    return create_response(data=summary)
\ No newline at end of file
@@ -11,7 +11,7 @@ from typing import Optional, List, Dict, Any, Union
 from pydantic import BaseModel, Field, validator
 from enum import Enum
 
-from .common import TimestampMixin, PaginatedResponse
+from app.features.courses.schemas.common import TimestampMixin, PaginatedResponse
 
 
 class AssessmentStatus(str, Enum):
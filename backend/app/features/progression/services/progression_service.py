@@ -7,41 +7,42 @@ This service handles business logic for:
 - Module unlock calculations
 - Level assessment management
 - Progress analytics and reporting
+
+All methods run on an ``AsyncSession`` so grading and analytics queries do
+not block the event loop of the async routes calling them.
 """
 
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any
 from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func, desc
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.features.courses.models.progression import (
+from app.features.progression.models.progression import (
     CurriculumProgressionSettings,
     LevelAssessmentCriteria,
     StudentLessonProgress,
     StudentModuleUnlock,
     StudentLevelAssessment,
-    ProgressionAnalytics
 )
-from app.features.courses.models.curriculum import Curriculum
-from app.features.courses.models.level import Level
-from app.features.courses.models.module import Module
-from app.features.courses.models.lesson import Lesson
-from app.features.courses.schemas.progression import (
+from app.features.curricula.models.curriculum import Curriculum
+from app.features.curricula.models.level import Level
+from app.features.curricula.models.module import Module
+from app.features.curricula.models.section import Section
+from app.features.content.models.lesson import Lesson
+from app.features.progression.schemas.progression import (
     CurriculumProgressionSettingsCreate,
     CurriculumProgressionSettingsUpdate,
     LevelAssessmentCriteriaCreate,
     LevelAssessmentCriteriaUpdate,
     StudentLessonProgressCreate,
-    StudentLessonProgressUpdate,
     StudentLevelAssessmentCreate,
-    StudentLevelAssessmentUpdate,
     BulkLessonGradingRequest,
     AssessmentStatus
 )
-from app.features.common.services.base import BaseService
+from app.features.common.services.async_base_service import AsyncBaseService
 
 
-class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict]):
+class ProgressionService(AsyncBaseService[CurriculumProgressionSettings, dict, dict]):
     """Service for managing curriculum progression system."""
     
     def __init__(self):
@@ -49,8 +50,8 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
     
     # Curriculum Progression Settings
     async def create_progression_settings(
-        self, 
-        db: Session, 
+        self,
+        db: AsyncSession,
         settings_data: CurriculumProgressionSettingsCreate,
         user_id: str
     ) -> CurriculumProgressionSettings:
@@ -61,31 +62,32 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
             updated_by=user_id
         )
         db.add(settings)
-        db.commit()
-        db.refresh(settings)
+        await db.commit()
+        await db.refresh(settings)
         return settings
     
     async def get_progression_settings_by_curriculum(
-        self, 
-        db: Session, 
+        self,
+        db: AsyncSession,
         curriculum_id: str
     ) -> Optional[CurriculumProgressionSettings]:
         """Get progression settings for a curriculum."""
-        return db.query(CurriculumProgressionSettings).filter(
-            CurriculumProgressionSettings.curriculum_id == curriculum_id
-        ).first()
+        result = await db.execute(
+            select(CurriculumProgressionSettings).where(
+                CurriculumProgressionSettings.curriculum_id == curriculum_id
+            ).limit(1)
+        )
+        return result.scalars().first()
     
     async def update_progression_settings(
         self,
-        db: Session,
+        db: AsyncSession,
         settings_id: str,
         settings_update: CurriculumProgressionSettingsUpdate,
         user_id: str
     ) -> Optional[CurriculumProgressionSettings]:
         """Update progression settings."""
-        settings = db.query(CurriculumProgressionSettings).filter(
-            CurriculumProgressionSettings.id == settings_id
-        ).first()
+        settings = await db.get(CurriculumProgressionSettings, settings_id)
         
         if not settings:
             return None
@@ -97,14 +99,14 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
         settings.updated_by = user_id
         settings.updated_at = datetime.utcnow()
         
-        db.commit()
-        db.refresh(settings)
+        await db.commit()
+        await db.refresh(settings)
         return settings
     
     # Level Assessment Criteria
     async def create_assessment_criteria(
         self,
-        db: Session,
+        db: AsyncSession,
         criteria_data: LevelAssessmentCriteriaCreate,
         user_id: str
     ) -> LevelAssessmentCriteria:
@@ -115,31 +117,32 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
             updated_by=user_id
         )
         db.add(criteria)
-        db.commit()
-        db.refresh(criteria)
+        await db.commit()
+        await db.refresh(criteria)
         return criteria
     
     async def get_assessment_criteria_by_level(
         self,
-        db: Session,
+        db: AsyncSession,
         level_id: str
     ) -> List[LevelAssessmentCriteria]:
         """Get all assessment criteria for a level."""
-        return db.query(LevelAssessmentCriteria).filter(
-            LevelAssessmentCriteria.level_id == level_id
-        ).order_by(LevelAssessmentCriteria.sequence_order).all()
+        result = await db.execute(
+            select(LevelAssessmentCriteria).where(
+                LevelAssessmentCriteria.level_id == level_id
+            ).order_by(LevelAssessmentCriteria.sequence_order)
+        )
+        return list(result.scalars().all())
     
     async def update_assessment_criteria(
         self,
-        db: Session,
+        db: AsyncSession,
         criteria_id: str,
         criteria_update: LevelAssessmentCriteriaUpdate,
         user_id: str
     ) -> Optional[LevelAssessmentCriteria]:
         """Update assessment criteria."""
-        criteria = db.query(LevelAssessmentCriteria).filter(
-            LevelAssessmentCriteria.id == criteria_id
-        ).first()
+        criteria = await db.get(LevelAssessmentCriteria, criteria_id)
         
         if not criteria:
             return None
@@ -151,42 +154,37 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
         criteria.updated_by = user_id
         criteria.updated_at = datetime.utcnow()
         
-        db.commit()
-        db.refresh(criteria)
+        await db.commit()
+        await db.refresh(criteria)
         return criteria
     
     async def delete_assessment_criteria(
         self,
-        db: Session,
+        db: AsyncSession,
         criteria_id: str
     ) -> bool:
         """Delete assessment criteria."""
-        criteria = db.query(LevelAssessmentCriteria).filter(
-            LevelAssessmentCriteria.id == criteria_id
-        ).first()
+        criteria = await db.get(LevelAssessmentCriteria, criteria_id)
         
         if not criteria:
             return False
         
-        db.delete(criteria)
-        db.commit()
+        await db.delete(criteria)
+        await db.commit()
         return True
     
     # Student Lesson Progress
     async def create_lesson_progress(
         self,
-        db: Session,
+        db: AsyncSession,
         progress_data: StudentLessonProgressCreate,
         user_id: str
     ) -> StudentLessonProgress:
         """Create or update student lesson progress."""
         # Check if progress already exists
-        existing = db.query(StudentLessonProgress).filter(
-            and_(
-                StudentLessonProgress.student_id == progress_data.student_id,
-                StudentLessonProgress.lesson_id == progress_data.lesson_id
-            )
-        ).first()
+        existing = await self._get_lesson_progress(
+            db, progress_data.student_id, progress_data.lesson_id
+        )
         
         if existing:
             # Update existing progress
@@ -199,8 +197,8 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
             if progress_data.is_completed and not existing.completion_date:
                 existing.completion_date = datetime.utcnow()
             
-            db.commit()
-            db.refresh(existing)
+            await db.commit()
+            await db.refresh(existing)
             return existing
         else:
             # Create new progress
@@ -213,13 +211,13 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
                 updated_by=user_id
             )
             db.add(progress)
-            db.commit()
-            db.refresh(progress)
+            await db.commit()
+            await db.refresh(progress)
             return progress
     
     async def grade_lesson(
         self,
-        db: Session,
+        db: AsyncSession,
         student_id: str,
         lesson_id: str,
         stars_earned: int,
@@ -227,12 +225,7 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
         notes: Optional[str] = None
     ) -> Optional[StudentLessonProgress]:
         """Grade a student's lesson performance."""
-        progress = db.query(StudentLessonProgress).filter(
-            and_(
-                StudentLessonProgress.student_id == student_id,
-                StudentLessonProgress.lesson_id == lesson_id
-            )
-        ).first()
+        progress = await self._get_lesson_progress(db, student_id, lesson_id)
         
         if not progress:
             return None
@@ -244,8 +237,8 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
         progress.updated_by = instructor_id
         progress.updated_at = datetime.utcnow()
         
-        db.commit()
-        db.refresh(progress)
+        await db.commit()
+        await db.refresh(progress)
         
         # Check if this grading unlocks the next module
         await self._check_and_update_module_unlocks(db, student_id, lesson_id)
@@ -254,7 +247,7 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
     
     async def bulk_grade_lessons(
         self,
-        db: Session,
+        db: AsyncSession,
         grading_request: BulkLessonGradingRequest
     ) -> List[StudentLessonProgress]:
         """Bulk grade multiple lessons for classroom management."""
@@ -276,68 +269,100 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
     
     async def get_student_lesson_progress(
         self,
-        db: Session,
+        db: AsyncSession,
         student_id: str,
         curriculum_id: Optional[str] = None,
         module_id: Optional[str] = None
     ) -> List[StudentLessonProgress]:
         """Get lesson progress for a student."""
-        query = db.query(StudentLessonProgress).filter(
+        query = select(StudentLessonProgress).where(
             StudentLessonProgress.student_id == student_id
         )
         
-        if curriculum_id:
-            # Join through lesson -> section -> module -> level -> curriculum
-            query = query.join(Lesson).join(Module).join(Level).join(Curriculum).filter(
-                Curriculum.id == curriculum_id
-            )
-        elif module_id:
-            query = query.join(Lesson).join(Module).filter(
-                Module.id == module_id
+        if curriculum_id or module_id:
+            # Join through lesson -> section -> module (-> level for curriculum)
+            query = query.join(
+                Lesson, Lesson.id == StudentLessonProgress.lesson_id
+            ).join(
+                Section, Section.id == Lesson.section_id
             )
+            if curriculum_id:
+                query = query.join(Module, Module.id == Section.module_id).join(
+                    Level, Level.id == Module.level_id
+                ).where(Level.curriculum_id == curriculum_id)
+            else:
+                query = query.where(Section.module_id == module_id)
         
-        return query.order_by(StudentLessonProgress.updated_at.desc()).all()
+        result = await db.execute(query.order_by(StudentLessonProgress.updated_at.desc()))
+        return list(result.scalars().all())
+    
+    async def _get_lesson_progress(
+        self,
+        db: AsyncSession,
+        student_id: str,
+        lesson_id: str
+    ) -> Optional[StudentLessonProgress]:
+        """Get a student's progress record for a single lesson."""
+        result = await db.execute(
+            select(StudentLessonProgress).where(
+                and_(
+                    StudentLessonProgress.student_id == student_id,
+                    StudentLessonProgress.lesson_id == lesson_id
+                )
+            ).limit(1)
+        )
+        return result.scalars().first()
     
     # Module Unlock Logic
     async def _check_and_update_module_unlocks(
         self,
-        db: Session,
+        db: AsyncSession,
         student_id: str,
         lesson_id: str
     ) -> None:
         """Check if grading this lesson unlocks the next module."""
-        # Get the lesson and its module
-        lesson = db.query(Lesson).filter(Lesson.id == lesson_id).first()
-        if not lesson:
+        # Locate the lesson's module, level and curriculum in one query
+        # (lazy relationship loads are not available on AsyncSession)
+        location = (await db.execute(
+            select(
+                Module.id.label("module_id"),
+                Module.level_id,
+                Module.sequence_order,
+                Level.curriculum_id,
+            )
+            .join(Section, Section.module_id == Module.id)
+            .join(Lesson, Lesson.section_id == Section.id)
+            .join(Level, Level.id == Module.level_id)
+            .where(Lesson.id == lesson_id)
+        )).first()
+        if not location:
             return
         
         # Get all lessons in the current module
-        current_module_lessons = db.query(Lesson).filter(
-            Lesson.section_id.in_(
-                db.query(func.distinct(Lesson.section_id)).filter(
-                    Lesson.id == lesson_id
-                )
-            )
-        ).all()
+        module_lesson_ids = select(Lesson.id).join(
+            Section, Section.id == Lesson.section_id
+        ).where(Section.module_id == location.module_id)
+        total_lessons = await db.scalar(
+            select(func.count()).select_from(module_lesson_ids.subquery())
+        ) or 0
         
         # Calculate stars earned vs possible in current module
-        progress_records = db.query(StudentLessonProgress).filter(
-            and_(
+        stars = (await db.execute(
+            select(
+                func.coalesce(func.sum(StudentLessonProgress.stars_earned), 0).label("earned"),
+                func.count().filter(StudentLessonProgress.stars_earned >= 1).label("with_min_stars"),
+            ).where(
                 StudentLessonProgress.student_id == student_id,
-                StudentLessonProgress.lesson_id.in_([l.id for l in current_module_lessons])
+                StudentLessonProgress.lesson_id.in_(module_lesson_ids)
             )
-        ).all()
+        )).one()
         
-        total_possible_stars = len(current_module_lessons) * 3
-        total_earned_stars = sum(p.stars_earned or 0 for p in progress_records)
-        lessons_with_min_stars = sum(1 for p in progress_records if (p.stars_earned or 0) >= 1)
+        total_possible_stars = total_lessons * 3
+        total_earned_stars = int(stars.earned)
+        lessons_with_min_stars = stars.with_min_stars
         
         # Get progression settings
-        curriculum_id = db.query(Curriculum.id).join(Level).join(Module).filter(
-            Module.id == lesson.section.module_id
-        ).scalar()
-        
-        settings = await self.get_progression_settings_by_curriculum(db, curriculum_id)
+        settings = await self.get_progression_settings_by_curriculum(db, location.curriculum_id)
         if not settings:
             return
         
@@ -345,31 +370,35 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
         percentage_achieved = (total_earned_stars / total_possible_stars) * 100 if total_possible_stars > 0 else 0
         threshold_met = (
             percentage_achieved >= settings.module_unlock_threshold_percentage and
-            (not settings.require_minimum_one_star_per_lesson or 
-             lessons_with_min_stars == len(current_module_lessons))
+            (not settings.require_minimum_one_star_per_lesson or
+             lessons_with_min_stars == total_lessons)
         )
         
         # Find the next module
-        next_module = db.query(Module).filter(
-            and_(
-                Module.level_id == lesson.section.module.level_id,
-                Module.sequence_order > lesson.section.module.sequence_order
-            )
-        ).order_by(Module.sequence_order).first()
-        
-        if next_module and threshold_met:
-            # Create or update unlock record
-            unlock_record = db.query(StudentModuleUnlock).filter(
+        next_module_id = await db.scalar(
+            select(Module.id).where(
                 and_(
-                    StudentModuleUnlock.student_id == student_id,
-                    StudentModuleUnlock.module_id == next_module.id
+                    Module.level_id == location.level_id,
+                    Module.sequence_order > location.sequence_order
                 )
-            ).first()
+            ).order_by(Module.sequence_order).limit(1)
+        )
+        
+        if next_module_id and threshold_met:
+            # Create or update unlock record
+            unlock_record = (await db.execute(
+                select(StudentModuleUnlock).where(
+                    and_(
+                        StudentModuleUnlock.student_id == student_id,
+                        StudentModuleUnlock.module_id == next_module_id
+                    )
+                ).limit(1)
+            )).scalars().first()
             
             if not unlock_record:
                 unlock_record = StudentModuleUnlock(
                     student_id=student_id,
-                    module_id=next_module.id,
+                    module_id=next_module_id,
                     is_unlocked=True,
                     unlocked_date=datetime.utcnow(),
                     stars_earned=total_earned_stars,
@@ -386,30 +415,31 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
                 unlock_record.unlock_percentage = percentage_achieved
                 unlock_record.threshold_met = threshold_met
             
-            db.commit()
+            await db.commit()
     
     async def get_student_module_unlocks(
         self,
-        db: Session,
+        db: AsyncSession,
         student_id: str,
         curriculum_id: Optional[str] = None
     ) -> List[StudentModuleUnlock]:
         """Get module unlock status for a student."""
-        query = db.query(StudentModuleUnlock).filter(
+        query = select(StudentModuleUnlock).where(
             StudentModuleUnlock.student_id == student_id
         )
         
         if curriculum_id:
-            query = query.join(Module).join(Level).join(Curriculum).filter(
-                Curriculum.id == curriculum_id
-            )
+            query = query.join(Module, Module.id == StudentModuleUnlock.module_id).join(
+                Level, Level.id == Module.level_id
+            ).where(Level.curriculum_id == curriculum_id)
         
-        return query.order_by(StudentModuleUnlock.unlocked_date.desc()).all()
+        result = await db.execute(query.order_by(StudentModuleUnlock.unlocked_date.desc()))
+        return list(result.scalars().all())
     
     # Level Assessment Management
     async def create_level_assessment(
         self,
-        db: Session,
+        db: AsyncSession,
         assessment_data: StudentLevelAssessmentCreate,
         user_id: str
     ) -> StudentLevelAssessment:
@@ -421,22 +451,20 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
             updated_by=user_id
         )
         db.add(assessment)
-        db.commit()
-        db.refresh(assessment)
+        await db.commit()
+        await db.refresh(assessment)
         return assessment
     
     async def complete_level_assessment(
         self,
-        db: Session,
+        db: AsyncSession,
         assessment_id: str,
         criteria_scores: Dict[str, int],
         instructor_id: str,
         notes: Optional[str] = None
     ) -> Optional[StudentLevelAssessment]:
         """Complete a level assessment with criteria scores."""
-        assessment = db.query(StudentLevelAssessment).filter(
-            StudentLevelAssessment.id == assessment_id
-        ).first()
+        assessment = await db.get(StudentLevelAssessment, assessment_id)
         
         if not assessment:
             return None
@@ -462,21 +490,19 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
         assessment.updated_by = instructor_id
         assessment.updated_at = datetime.utcnow()
         
-        db.commit()
-        db.refresh(assessment)
+        await db.commit()
+        await db.refresh(assessment)
         return assessment
     
     async def suspend_student_progression(
         self,
-        db: Session,
+        db: AsyncSession,
         assessment_id: str,
         instructor_id: str,
         suspension_reason: str
     ) -> Optional[StudentLevelAssessment]:
         """Suspend a student's progression at level assessment."""
-        assessment = db.query(StudentLevelAssessment).filter(
-            StudentLevelAssessment.id == assessment_id
-        ).first()
+        assessment = await db.get(StudentLevelAssessment, assessment_id)
         
         if not assessment:
             return None
@@ -488,59 +514,66 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
         assessment.updated_by = instructor_id
         assessment.updated_at = datetime.utcnow()
         
-        db.commit()
-        db.refresh(assessment)
+        await db.commit()
+        await db.refresh(assessment)
         return assessment
     
     async def get_student_level_assessments(
         self,
-        db: Session,
+        db: AsyncSession,
         student_id: str,
         curriculum_id: Optional[str] = None
     ) -> List[StudentLevelAssessment]:
         """Get level assessments for a student."""
-        query = db.query(StudentLevelAssessment).filter(
+        query = select(StudentLevelAssessment).where(
             StudentLevelAssessment.student_id == student_id
         )
         
         if curriculum_id:
-            query = query.join(Level).join(Curriculum).filter(
-                Curriculum.id == curriculum_id
+            query = query.join(Level, Level.id == StudentLevelAssessment.level_id).where(
+                Level.curriculum_id == curriculum_id
             )
         
-        return query.order_by(StudentLevelAssessment.updated_at.desc()).all()
+        result = await db.execute(query.order_by(StudentLevelAssessment.updated_at.desc()))
+        return list(result.scalars().all())
     
     async def get_pending_assessments_for_instructor(
         self,
-        db: Session,
+        db: AsyncSession,
         instructor_id: str
     ) -> List[StudentLevelAssessment]:
         """Get pending level assessments for an instructor."""
-        return db.query(StudentLevelAssessment).filter(
-            and_(
-                StudentLevelAssessment.assessed_by_instructor_id == instructor_id,
-                StudentLevelAssessment.status == AssessmentStatus.PENDING
-            )
-        ).order_by(StudentLevelAssessment.created_at).all()
+        result = await db.execute(
+            select(StudentLevelAssessment).where(
+                and_(
+                    StudentLevelAssessment.assessed_by_instructor_id == instructor_id,
+                    StudentLevelAssessment.status == AssessmentStatus.PENDING
+                )
+            ).order_by(StudentLevelAssessment.created_at)
+        )
+        return list(result.scalars().all())
     
     # Progress Analytics
     async def generate_student_progress_summary(
         self,
-        db: Session,
+        db: AsyncSession,
         student_id: str,
         curriculum_id: str
     ) -> Dict[str, Any]:
         """Generate comprehensive progress summary for a student."""
         # Get basic curriculum info
-        curriculum = db.query(Curriculum).filter(Curriculum.id == curriculum_id).first()
+        curriculum = await db.get(Curriculum, curriculum_id)
         if not curriculum:
             return {}
         
         # Get total lessons in curriculum
-        total_lessons_query = db.query(func.count(Lesson.id)).join(Module).join(Level).filter(
-            Level.curriculum_id == curriculum_id
-        )
-        total_lessons = total_lessons_query.scalar() or 0
+        total_lessons = await db.scalar(
+            select(func.count(Lesson.id))
+            .join(Section, Section.id == Lesson.section_id)
+            .join(Module, Module.id == Section.module_id)
+            .join(Level, Level.id == Module.level_id)
+            .where(Level.curriculum_id == curriculum_id)
+        ) or 0
         
         # Get student progress
         progress_records = await self.get_student_lesson_progress(
@@ -558,9 +591,11 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
         unlocked_modules = len([u for u in module_unlocks if u.is_unlocked])
         
         # Get total modules
-        total_modules = db.query(func.count(Module.id)).join(Level).filter(
-            Level.curriculum_id == curriculum_id
-        ).scalar() or 0
+        total_modules = await db.scalar(
+            select(func.count(Module.id))
+            .join(Level, Level.id == Module.level_id)
+            .where(Level.curriculum_id == curriculum_id)
+        ) or 0
         
         # Get level assessments
         level_assessments = await self.get_student_level_assessments(
@@ -590,17 +625,19 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
     
     async def get_instructor_dashboard_summary(
         self,
-        db: Session,
+        db: AsyncSession,
         instructor_id: str
     ) -> Dict[str, Any]:
         """Generate dashboard summary for an instructor."""
         # Get students needing grading
-        students_to_grade = db.query(func.count(func.distinct(StudentLessonProgress.student_id))).filter(
-            and_(
-                StudentLessonProgress.is_completed == True,
-                StudentLessonProgress.stars_earned == None
+        students_to_grade = await db.scalar(
+            select(func.count(func.distinct(StudentLessonProgress.student_id))).where(
+                and_(
+                    StudentLessonProgress.is_completed == True,
+                    StudentLessonProgress.stars_earned == None
+                )
             )
-        ).scalar() or 0
+        ) or 0
         
         # Get pending assessments
         pending_assessments = await self.get_pending_assessments_for_instructor(
@@ -608,18 +645,29 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
         )
         
         # Get recent grading activity
-        recent_gradings = db.query(StudentLessonProgress).filter(
-            and_(
-                StudentLessonProgress.graded_by_instructor_id == instructor_id,
-                StudentLessonProgress.graded_date >= datetime.utcnow().replace(day=1)  # This month
-            )
-        ).order_by(StudentLessonProgress.graded_date.desc()).limit(10).all()
+        recent_gradings = list((await db.execute(
+            select(StudentLessonProgress).where(
+                and_(
+                    StudentLessonProgress.graded_by_instructor_id == instructor_id,
+                    StudentLessonProgress.graded_date >= datetime.utcnow().replace(day=1)  # This month
+                )
+            ).order_by(StudentLessonProgress.graded_date.desc()).limit(10)
+        )).scalars().all())
         
         return {
             "instructor_id": instructor_id,
             "students_to_grade": students_to_grade,
             "assessments_to_complete": len(pending_assessments),
             "recent_gradings_count": len(recent_gradings),
+            "recent_activity": [
+                {
+                    "student_id": p.student_id,
+                    "lesson_id": p.lesson_id,
+                    "stars_earned": p.stars_earned,
+                    "graded_date": p.graded_date
+                }
+                for p in recent_gradings
+            ],
             "pending_assessments": [
                 {
                     "id": a.id,
@@ -629,4 +677,8 @@ class ProgressionService(BaseService[CurriculumProgressionSettings, dict, dict])
                 }
                 for a in pending_assessments[:5]  # Top 5
             ]
-        }
\ No newline at end of file
+        }
+
+
+# Global instance
+progression_service = ProgressionService()
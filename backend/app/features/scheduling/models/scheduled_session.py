@@ -13,6 +13,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.features.common.models.base import BaseModel
+from app.features.common.models.search import SearchDocument
 from app.features.common.models.enums import (
     SessionStatus, SessionType, RecurringPattern
 )
@@ -53,6 +54,14 @@ class ScheduledSession(BaseModel):
         comment="ID of the facility where session takes place",
     )
     
+    facility_slot: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Concurrency slot within the facility (0 unless the facility allows concurrent sessions)",
+    )
+    
     course_id: Mapped[Optional[str]] = mapped_column(
         String(36),
         ForeignKey("courses.id"),
@@ -307,4 +316,8 @@ class ScheduledSession(BaseModel):
         return (
             self.start_time < other_session.end_time and
             self.end_time > other_session.start_time
-        )
\ No newline at end of file
+        )
+
+
+# Free-text search over titles and descriptions
+SESSION_SEARCH = SearchDocument(ScheduledSession.__table__, ("title", "description"))
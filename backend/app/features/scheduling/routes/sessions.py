@@ -22,7 +22,7 @@ from app.features.scheduling.schemas.session import (
     SessionConflictResponse,
     SessionBulkUpdateRequest,
 )
-from app.features.scheduling.services.scheduling_service import SchedulingService
+from app.features.scheduling.services.scheduling_service import SchedulingService, SessionConflictError
 from app.features.common.models.enums import SessionStatus
 
 
@@ -61,6 +61,11 @@ async def create_session(
             created_by=current_user["id"]
         )
         return session
+    except SessionConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"message": str(e), **e.conflicts.model_dump(mode="json")}
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -156,6 +161,11 @@ async def update_session_time(
             user_id=current_user["id"]
         )
         return updated_sessions
+    except SessionConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"message": str(e), **e.conflicts.model_dump(mode="json")}
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -288,4 +288,4 @@ class SessionConflictResponse(BaseModel):
     has_conflicts: bool = False
     facility_conflicts: List[SessionResponse] = []
     instructor_conflicts: Dict[str, List[SessionResponse]] = {}
-    suggested_times: List[Dict[str, datetime]] = []
\ No newline at end of file
+    suggested_times: List[Dict[str, Any]] = []
\ No newline at end of file
@@ -0,0 +1,344 @@
+"""
+Interval-index conflict engine for facility scheduling.
+
+``ConflictEngine.load`` fetches every busy interval for a facility and a set
+of instructors over a time window in one query and indexes them in static
+interval trees. Conflict checks and free-slot searches then run in memory,
+honouring the facility's ``FacilityScheduleSettings`` (operating hours,
+setup/cleanup buffer and maximum concurrent sessions).
+"""
+
+import heapq
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import and_, false, or_
+from sqlalchemy.orm import Session
+
+from app.features.scheduling.models import (
+    ScheduledSession,
+    SessionInstructor,
+    FacilityScheduleSettings,
+)
+from app.features.common.models.enums import SessionStatus
+
+FACILITY_RESOURCE = "facility"
+
+# Session statuses that occupy a facility or instructor
+BUSY_STATUSES = (SessionStatus.SCHEDULED, SessionStatus.IN_PROGRESS)
+
+
+@dataclass(frozen=True)
+class BusyInterval:
+    """Half-open ``[start, end)`` period during which a resource is occupied."""
+
+    start: datetime
+    end: datetime
+    session_id: str
+    resource: str
+    slot: int = 0
+
+
+class IntervalTree:
+    """
+    Static augmented interval tree over half-open intervals.
+
+    Intervals are sorted by start and laid out as an implicit balanced BST
+    over the sorted array; each node stores the maximum end of its subtree
+    so overlap queries prune whole subtrees in O(log n + k).
+    """
+
+    def __init__(self, intervals: Iterable[BusyInterval] = ()):
+        self._intervals: List[BusyInterval] = sorted(intervals, key=lambda i: (i.start, i.end))
+        self._max_end: List[Optional[datetime]] = [None] * len(self._intervals)
+        self._build(0, len(self._intervals) - 1)
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def __iter__(self):
+        return iter(self._intervals)
+
+    def _build(self, lo: int, hi: int) -> Optional[datetime]:
+        if lo > hi:
+            return None
+        mid = (lo + hi) // 2
+        max_end = self._intervals[mid].end
+        for child_max in (self._build(lo, mid - 1), self._build(mid + 1, hi)):
+            if child_max is not None and child_max > max_end:
+                max_end = child_max
+        self._max_end[mid] = max_end
+        return max_end
+
+    def overlapping(self, start: datetime, end: datetime) -> List[BusyInterval]:
+        """Intervals overlapping ``[start, end)``, ordered by start."""
+        found: List[BusyInterval] = []
+        stack = [(0, len(self._intervals) - 1)]
+        while stack:
+            lo, hi = stack.pop()
+            if lo > hi:
+                continue
+            mid = (lo + hi) // 2
+            if self._max_end[mid] <= start:
+                # Nothing in this subtree ends after the query starts
+                continue
+            stack.append((lo, mid - 1))
+            interval = self._intervals[mid]
+            if interval.start < end:
+                if interval.end > start:
+                    found.append(interval)
+                # Only nodes to the right can start before ``end`` if this one does
+                stack.append((mid + 1, hi))
+        found.sort(key=lambda i: (i.start, i.end))
+        return found
+
+
+@dataclass(frozen=True)
+class FreeSlot:
+    """Candidate time slot with no facility or instructor conflicts."""
+
+    start_time: datetime
+    end_time: datetime
+
+
+class ConflictEngine:
+    """In-memory conflict checks and free-slot search for one facility and its instructors."""
+
+    def __init__(
+        self,
+        facility_intervals: Iterable[BusyInterval],
+        instructor_intervals: Dict[str, Iterable[BusyInterval]],
+        settings: Optional[FacilityScheduleSettings] = None,
+    ):
+        self.settings = settings
+        self.buffer = timedelta(minutes=settings.get_total_buffer_time_minutes()) if settings else timedelta(0)
+        self.max_concurrent = max(settings.max_concurrent_sessions or 1, 1) if settings else 1
+        self.facility_tree = IntervalTree(facility_intervals)
+        self.instructor_trees = {
+            instructor_id: IntervalTree(intervals)
+            for instructor_id, intervals in instructor_intervals.items()
+        }
+
+    @classmethod
+    def load(
+        cls,
+        db: Session,
+        facility_id: str,
+        program_context: str,
+        window_start: datetime,
+        window_end: datetime,
+        instructor_ids: Optional[Sequence[str]] = None,
+        exclude_session_id: Optional[str] = None,
+        settings: Optional[FacilityScheduleSettings] = None,
+        exclude_session_ids: Sequence[str] = (),
+    ) -> "ConflictEngine":
+        """
+        Load busy intervals for a facility and instructors over a window.
+
+        Facility sessions and the requested instructors' sessions come back
+        from a single query; facility intervals are widened by the
+        facility's setup/cleanup buffer. Pass ``settings`` when already
+        loaded to skip the settings lookup; excluded sessions (e.g. the ones
+        being moved) are left out.
+        """
+        if settings is None:
+            settings = get_facility_settings(db, facility_id, program_context)
+        buffer = timedelta(minutes=settings.get_total_buffer_time_minutes()) if settings else timedelta(0)
+        instructor_ids = list(dict.fromkeys(instructor_ids or []))
+
+        instructor_join = and_(
+            SessionInstructor.session_id == ScheduledSession.id,
+            SessionInstructor.removed_at.is_(None),
+            SessionInstructor.instructor_id.in_(instructor_ids),
+        ) if instructor_ids else false()
+
+        query = db.query(
+            ScheduledSession.id,
+            ScheduledSession.start_time,
+            ScheduledSession.end_time,
+            ScheduledSession.facility_id,
+            ScheduledSession.facility_slot,
+            SessionInstructor.instructor_id,
+        ).outerjoin(
+            SessionInstructor, instructor_join
+        ).filter(
+            ScheduledSession.program_id == program_context,
+            ScheduledSession.status.in_(BUSY_STATUSES),
+            ScheduledSession.start_time < window_end + buffer,
+            ScheduledSession.end_time > window_start - buffer,
+            or_(
+                ScheduledSession.facility_id == facility_id,
+                SessionInstructor.instructor_id.isnot(None),
+            ),
+        )
+        excluded = [exclude_session_id] if exclude_session_id else []
+        excluded.extend(exclude_session_ids)
+        if excluded:
+            query = query.filter(ScheduledSession.id.notin_(excluded))
+
+        reference_tz = window_start.tzinfo
+        facility_intervals: Dict[str, BusyInterval] = {}
+        instructor_intervals: Dict[str, List[BusyInterval]] = {
+            instructor_id: [] for instructor_id in instructor_ids
+        }
+        for session_id, start_time, end_time, session_facility_id, slot, instructor_id in query.all():
+            start_time = _align(start_time, reference_tz)
+            end_time = _align(end_time, reference_tz)
+            if session_facility_id == facility_id and session_id not in facility_intervals:
+                facility_intervals[session_id] = BusyInterval(
+                    start_time - buffer, end_time + buffer, session_id, FACILITY_RESOURCE, slot or 0
+                )
+            if instructor_id is not None:
+                instructor_intervals[instructor_id].append(
+                    BusyInterval(start_time, end_time, session_id, instructor_id)
+                )
+
+        return cls(facility_intervals.values(), instructor_intervals, settings)
+
+    # ------------------------------------------------------------------
+    # Conflict checks
+    # ------------------------------------------------------------------
+
+    def facility_conflicts(self, start: datetime, end: datetime) -> List[BusyInterval]:
+        """
+        Facility sessions blocking ``[start, end)``.
+
+        Overlaps only count as conflicts once every concurrency slot of the
+        facility (``max_concurrent_sessions``) is taken during the period.
+        """
+        overlapping = self.facility_tree.overlapping(start, end)
+        if self._free_slot(overlapping) is not None:
+            return []
+        return overlapping
+
+    def free_facility_slot(self, start: datetime, end: datetime) -> Optional[int]:
+        """Lowest facility slot free during ``[start, end)``, or ``None`` if all are taken."""
+        return self._free_slot(self.facility_tree.overlapping(start, end))
+
+    def _free_slot(self, overlapping: List[BusyInterval]) -> Optional[int]:
+        taken = {interval.slot for interval in overlapping}
+        for slot in range(self.max_concurrent):
+            if slot not in taken:
+                return slot
+        return None
+
+    def instructor_conflicts(self, start: datetime, end: datetime) -> Dict[str, List[BusyInterval]]:
+        """Sessions of each instructor overlapping ``[start, end)``."""
+        conflicts = {}
+        for instructor_id, tree in self.instructor_trees.items():
+            overlapping = tree.overlapping(start, end)
+            if overlapping:
+                conflicts[instructor_id] = overlapping
+        return conflicts
+
+    def has_conflicts(self, start: datetime, end: datetime) -> bool:
+        """Whether the facility or any instructor is busy during ``[start, end)``."""
+        if self.facility_conflicts(start, end):
+            return True
+        return any(tree.overlapping(start, end) for tree in self.instructor_trees.values())
+
+    def is_within_operating_hours(self, start: datetime, end: datetime) -> bool:
+        """Whether a slot fits inside the facility's opening hours for its day."""
+        if self.settings is None:
+            return True
+        open_time, close_time = self.settings.get_operating_hours(start.weekday())
+        if open_time is None or close_time is None:
+            return False
+        opens_at = _combine(start.date(), open_time, start.tzinfo)
+        closes_at = _combine(start.date(), close_time, start.tzinfo)
+        return opens_at <= start and end <= closes_at
+
+    # ------------------------------------------------------------------
+    # Free-slot search
+    # ------------------------------------------------------------------
+
+    def next_free_slots(
+        self,
+        after: datetime,
+        duration: timedelta,
+        count: int = 3,
+        horizon: timedelta = timedelta(days=7),
+    ) -> List[FreeSlot]:
+        """
+        Earliest non-overlapping free slots of ``duration`` starting at or after ``after``.
+
+        Only slot starts at ``after``, at the end of a busy interval or of a
+        previous suggestion, or at a daily opening time can be the earliest
+        feasible start, so those are the only candidates checked.
+        """
+        limit = after + horizon
+        candidates = {after}
+        for tree in [self.facility_tree, *self.instructor_trees.values()]:
+            candidates.update(
+                interval.end for interval in tree if after < interval.end <= limit
+            )
+        if self.settings is not None:
+            day = after.date()
+            while day <= limit.date():
+                open_time, _ = self.settings.get_operating_hours(day.weekday())
+                if open_time is not None:
+                    opens_at = _combine(day, open_time, after.tzinfo)
+                    if after <= opens_at <= limit:
+                        candidates.add(opens_at)
+                day += timedelta(days=1)
+
+        queue = list(candidates)
+        heapq.heapify(queue)
+        slots: List[FreeSlot] = []
+        earliest = after
+        while queue and len(slots) < count:
+            start = heapq.heappop(queue)
+            if start + duration > limit:
+                break
+            if start < earliest:
+                continue
+            end = start + duration
+            if self.is_within_operating_hours(start, end) and not self.has_conflicts(start, end):
+                slots.append(FreeSlot(start, end))
+                # The next suggestion may follow straight on from this one
+                earliest = end
+                heapq.heappush(queue, end)
+        return slots
+
+
+def get_facility_settings(
+    db: Session,
+    facility_id: str,
+    program_context: str,
+) -> Optional[FacilityScheduleSettings]:
+    """Scheduling settings of a facility within a program, if configured."""
+    return db.query(FacilityScheduleSettings).filter(
+        FacilityScheduleSettings.facility_id == facility_id,
+        FacilityScheduleSettings.program_id == program_context,
+    ).first()
+
+
+def requires_precheck(settings: Optional[FacilityScheduleSettings], dialect_name: str) -> bool:
+    """
+    Whether bookings at a facility need the in-memory conflict check.
+
+    On PostgreSQL the exclusion constraints reject overlapping sessions on
+    their own; buffers and concurrency slots are only applied by the engine.
+    Other databases have no constraints, so every booking is checked.
+    """
+    if dialect_name != "postgresql":
+        return True
+    if settings is None:
+        return False
+    return (settings.max_concurrent_sessions or 1) > 1 or settings.get_total_buffer_time_minutes() > 0
+
+
+def _align(value: datetime, reference_tz) -> datetime:
+    """Make a stored datetime comparable with the request's (naive or aware) datetimes."""
+    if reference_tz is None:
+        if value.tzinfo is not None:
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc).astimezone(reference_tz)
+    return value.astimezone(reference_tz)
+
+
+def _combine(day: date, at, tzinfo) -> datetime:
+    return datetime.combine(day, at).replace(tzinfo=tzinfo)
@@ -2,9 +2,11 @@
 Notification service for scheduling system changes.
 """
 
-from typing import List, Optional, Dict, Any
+import logging
+from collections import defaultdict
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_
 
 from app.features.scheduling.models import (
@@ -17,10 +19,19 @@ from app.features.authentication.models.user import User
 from app.features.authentication.models.user_relationship import UserRelationship
 from app.features.common.models.enums import (
     SessionStatus,
-    ParticipantStatus,
-    NotificationStatus,
     RelationshipType,
-    UserRole,
+)
+from app.features.common.services.outbox import ClaimedMessage, outbox
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATION_TOPIC = "scheduling.notification"
+
+# Relationship types whose parent user receives a child's session notifications
+PARENT_RELATIONSHIP_TYPES = (
+    RelationshipType.FATHER,
+    RelationshipType.MOTHER,
+    RelationshipType.GUARDIAN,
 )
 
 
@@ -62,7 +73,11 @@ class SchedulingNotificationService:
         changed_by_user_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        Send notifications for session changes.
+        Queue notifications for session changes.
+        
+        Recipients of all sessions are resolved with a few set-based queries
+        and one outbox message per recipient is written in the caller's
+        transaction; delivery happens in the outbox worker.
         
         Args:
             session_ids: List of session IDs affected
@@ -74,47 +89,32 @@ class SchedulingNotificationService:
         Returns:
             Dictionary with notification results
         """
-        results = {
-            'notifications_sent': 0,
-            'notifications_failed': 0,
-            'recipients': [],
-            'errors': []
-        }
+        results = self._empty_results()
         
-        for session_id in session_ids:
-            try:
-                session = self._get_session_with_program_check(db, session_id, program_context)
-                if not session:
-                    continue
-                
-                # Get all participants and instructors for the session
-                recipients = self._get_session_recipients(db, session)
-                
-                # Create notification content
-                notification_content = self._create_notification_content(
-                    session, notification_type, custom_message
-                )
-                
-                # Send notifications to each recipient
-                for recipient in recipients:
-                    try:
-                        self._send_individual_notification(
-                            recipient, notification_content, notification_type
-                        )
-                        results['notifications_sent'] += 1
-                    except Exception as e:
-                        results['notifications_failed'] += 1
-                        results['errors'].append(f"Failed to notify {recipient['email']}: {str(e)}")
-                
-                results['recipients'].extend(recipients)
-                
-                # Update session notification tracking
-                session.notification_sent = True
-                session.last_notification_time = datetime.utcnow()
-                
-            except Exception as e:
-                results['notifications_failed'] += 1
-                results['errors'].append(f"Failed to process session {session_id}: {str(e)}")
+        sessions = self._get_sessions_with_program_check(db, session_ids, program_context)
+        if not sessions:
+            return results
+        
+        recipients_by_session = self.resolve_session_recipients(db, [session.id for session in sessions])
+        
+        messages = []
+        for session in sessions:
+            content = self._create_notification_content(session, notification_type, custom_message)
+            recipients = recipients_by_session.get(session.id, [])
+            messages.extend(
+                self._build_message(recipient, content, notification_type) for recipient in recipients
+            )
+            results['recipients'].extend(recipients)
+        
+        results['notifications_sent'] = outbox.enqueue(db, NOTIFICATION_TOPIC, messages)
+        
+        # Update session notification tracking
+        db.query(ScheduledSession).filter(
+            ScheduledSession.id.in_([session.id for session in sessions])
+        ).update({
+            ScheduledSession.notification_sent: True,
+            ScheduledSession.last_notification_time: datetime.utcnow(),
+        }, synchronize_session=False)
         
         db.commit()
         return results
@@ -129,7 +129,7 @@ class SchedulingNotificationService:
         custom_message: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        Send notifications specific to participant changes.
+        Queue notifications specific to participant changes.
         
         Args:
             session_id: Session ID
@@ -138,69 +138,45 @@ class SchedulingNotificationService:
             program_context: Program context
             custom_message: Optional custom message
         """
-        results = {
-            'notifications_sent': 0,
-            'notifications_failed': 0,
-            'recipients': [],
-            'errors': []
-        }
+        results = self._empty_results()
         
-        try:
-            session = self._get_session_with_program_check(db, session_id, program_context)
+        session = self._get_session_with_program_check(db, session_id, program_context)
+        if not session or not student_ids:
             if not session:
                 results['errors'].append(f"Session {session_id} not found")
-                return results
-            
-            # Get participants for specific students
-            participants = db.query(SessionParticipant).filter(
-                and_(
-                    SessionParticipant.session_id == session_id,
-                    SessionParticipant.student_id.in_(student_ids)
-                )
-            ).all()
-            
-            for participant in participants:
-                try:
-                    # Get student and parent information
-                    student_info = self._get_student_info(db, participant.student_id)
-                    if not student_info:
-                        continue
-                    
-                    # Create notification content
-                    notification_content = self._create_participant_notification_content(
-                        session, participant, notification_type, custom_message
-                    )
-                    
-                    # Send to student (if email available)
-                    if student_info.get('email'):
-                        self._send_individual_notification(
-                            student_info, notification_content, notification_type
-                        )
-                        results['notifications_sent'] += 1
-                    
-                    # Send to parents
-                    parents = self._get_student_parents(db, participant.student_id)
-                    for parent in parents:
-                        self._send_individual_notification(
-                            parent, notification_content, notification_type
-                        )
-                        results['notifications_sent'] += 1
-                    
-                    results['recipients'].extend([student_info] + parents)
-                    
-                    # Update participant notification tracking
-                    participant.parent_notification_sent = True
-                    participant.parent_notification_time = datetime.utcnow()
-                    
-                except Exception as e:
-                    results['notifications_failed'] += 1
-                    results['errors'].append(f"Failed to notify participant {participant.student_id}: {str(e)}")
-            
-            db.commit()
+            return results
+        
+        participant_rows = db.query(SessionParticipant, Student).join(
+            Student, Student.id == SessionParticipant.student_id
+        ).filter(
+            and_(
+                SessionParticipant.session_id == session_id,
+                SessionParticipant.student_id.in_(student_ids)
+            )
+        ).all()
+        
+        parents_by_user = self._get_parents_by_child_user(
+            db, [student.user_id for _, student in participant_rows if student.user_id]
+        )
+        
+        messages = []
+        now = datetime.utcnow()
+        for participant, student in participant_rows:
+            content = self._create_participant_notification_content(
+                session, participant, notification_type, custom_message
+            )
+            recipients = self._student_recipients(student, parents_by_user)
+            messages.extend(
+                self._build_message(recipient, content, notification_type) for recipient in recipients
+            )
+            results['recipients'].extend(recipients)
             
-        except Exception as e:
-            results['errors'].append(f"Failed to process participant notifications: {str(e)}")
+            # Update participant notification tracking
+            participant.parent_notification_sent = True
+            participant.parent_notification_time = now
         
+        results['notifications_sent'] = outbox.enqueue(db, NOTIFICATION_TOPIC, messages)
+        db.commit()
         return results
     
     def send_instructor_notifications(
@@ -213,57 +189,41 @@ class SchedulingNotificationService:
         custom_message: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        Send notifications specific to instructor changes.
+        Queue notifications specific to instructor changes.
         """
-        results = {
-            'notifications_sent': 0,
-            'notifications_failed': 0,
-            'recipients': [],
-            'errors': []
-        }
+        results = self._empty_results()
         
-        try:
-            session = self._get_session_with_program_check(db, session_id, program_context)
+        session = self._get_session_with_program_check(db, session_id, program_context)
+        if not session or not instructor_ids:
             if not session:
                 results['errors'].append(f"Session {session_id} not found")
-                return results
-            
-            # Get instructor assignments
-            assignments = db.query(SessionInstructor).filter(
-                and_(
-                    SessionInstructor.session_id == session_id,
-                    SessionInstructor.instructor_id.in_(instructor_ids),
-                    SessionInstructor.removed_at.is_(None)
-                )
-            ).all()
-            
-            for assignment in assignments:
-                try:
-                    # Get instructor information
-                    instructor_info = self._get_instructor_info(db, assignment.instructor_id)
-                    if not instructor_info:
-                        continue
-                    
-                    # Create notification content
-                    notification_content = self._create_instructor_notification_content(
-                        session, assignment, notification_type, custom_message
-                    )
-                    
-                    # Send notification
-                    self._send_individual_notification(
-                        instructor_info, notification_content, notification_type
-                    )
-                    
-                    results['notifications_sent'] += 1
-                    results['recipients'].append(instructor_info)
-                    
-                except Exception as e:
-                    results['notifications_failed'] += 1
-                    results['errors'].append(f"Failed to notify instructor {assignment.instructor_id}: {str(e)}")
-            
-        except Exception as e:
-            results['errors'].append(f"Failed to process instructor notifications: {str(e)}")
+            return results
         
+        # Removed instructors are notified too, so removed_at is not filtered here
+        assignments = db.query(SessionInstructor, User).join(
+            User, User.id == SessionInstructor.instructor_id
+        ).filter(
+            and_(
+                SessionInstructor.session_id == session_id,
+                SessionInstructor.instructor_id.in_(instructor_ids)
+            )
+        ).all()
+        
+        messages = []
+        notified = set()
+        for assignment, instructor in assignments:
+            if instructor.id in notified:
+                continue
+            notified.add(instructor.id)
+            content = self._create_instructor_notification_content(
+                session, assignment, notification_type, custom_message
+            )
+            recipient = self._instructor_info(instructor)
+            messages.append(self._build_message(recipient, content, notification_type))
+            results['recipients'].append(recipient)
+        
+        results['notifications_sent'] = outbox.enqueue(db, NOTIFICATION_TOPIC, messages)
+        db.commit()
         return results
     
     def send_reminder_notifications(
@@ -273,7 +233,7 @@ class SchedulingNotificationService:
         program_context: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        Send reminder notifications for upcoming sessions.
+        Queue reminder notifications for upcoming sessions.
         """
         from datetime import timedelta
         
@@ -290,7 +250,7 @@ class SchedulingNotificationService:
         window_end = reminder_time + timedelta(minutes=30)
         
         # Query sessions in the reminder window
-        query = db.query(ScheduledSession).filter(
+        query = db.query(ScheduledSession.id, ScheduledSession.program_id).filter(
             and_(
                 ScheduledSession.start_time >= window_start,
                 ScheduledSession.start_time <= window_end,
@@ -301,166 +261,201 @@ class SchedulingNotificationService:
         if program_context:
             query = query.filter(ScheduledSession.program_id == program_context)
         
-        upcoming_sessions = query.all()
+        session_ids_by_program: Dict[str, List[str]] = defaultdict(list)
+        for session_id, program_id in query.all():
+            session_ids_by_program[program_id].append(session_id)
         
-        for session in upcoming_sessions:
+        for program_id, session_ids in session_ids_by_program.items():
             try:
-                # Send notifications for this session
-                session_results = self.send_session_notifications(
-                    db, [session.id], 'session_reminder', session.program_id
+                program_results = self.send_session_notifications(
+                    db, session_ids, 'session_reminder', program_id
                 )
-                
-                results['notifications_sent'] += session_results['notifications_sent']
-                results['notifications_failed'] += session_results['notifications_failed']
-                results['sessions_processed'] += 1
-                results['errors'].extend(session_results['errors'])
-                
+                results['notifications_sent'] += program_results['notifications_sent']
+                results['sessions_processed'] += len(session_ids)
             except Exception as e:
-                results['notifications_failed'] += 1
-                results['errors'].append(f"Failed to process reminder for session {session.id}: {str(e)}")
+                db.rollback()
+                results['notifications_failed'] += len(session_ids)
+                results['errors'].append(f"Failed to queue reminders for program {program_id}: {str(e)}")
         
         return results
     
-    # Private helper methods
-    
-    def _get_session_with_program_check(
+    def resolve_session_recipients(
         self,
         db: Session,
-        session_id: str,
-        program_context: str
-    ) -> Optional[ScheduledSession]:
-        """Get session with program context validation."""
-        return db.query(ScheduledSession).filter(
-            and_(
-                ScheduledSession.id == session_id,
-                ScheduledSession.program_id == program_context
-            )
-        ).first()
-    
-    def _get_session_recipients(self, db: Session, session: ScheduledSession) -> List[Dict[str, Any]]:
-        """Get all recipients for session notifications."""
-        recipients = []
+        session_ids: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Resolve notification recipients for many sessions at once.
         
-        # Get all participants
-        participants = db.query(SessionParticipant).filter(
-            SessionParticipant.session_id == session.id
+        Students (with an email), their parents and active instructors are
+        loaded with three queries regardless of the number of sessions. A
+        parent shared by siblings in the same session is listed once.
+        """
+        recipients: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+        if not session_ids:
+            return {}
+        
+        participant_rows = db.query(SessionParticipant.session_id, Student).join(
+            Student, Student.id == SessionParticipant.student_id
+        ).filter(
+            SessionParticipant.session_id.in_(session_ids)
         ).all()
         
-        for participant in participants:
-            # Add student if they have contact info
-            student_info = self._get_student_info(db, participant.student_id)
-            if student_info and student_info.get('email'):
-                recipients.append(student_info)
-            
-            # Add parents
-            parents = self._get_student_parents(db, participant.student_id)
-            recipients.extend(parents)
+        parents_by_user = self._get_parents_by_child_user(
+            db, list({student.user_id for _, student in participant_rows if student.user_id})
+        )
         
-        # Get all instructors
-        instructors = db.query(SessionInstructor).filter(
+        for session_id, student in participant_rows:
+            for recipient in self._student_recipients(student, parents_by_user):
+                existing = recipients[session_id].get(recipient['id'])
+                if existing is None:
+                    recipients[session_id][recipient['id']] = recipient
+                elif 'student_ids' in existing and student.id not in existing['student_ids']:
+                    existing['student_ids'] = existing['student_ids'] + [student.id]
+        
+        instructor_rows = db.query(SessionInstructor.session_id, User).join(
+            User, User.id == SessionInstructor.instructor_id
+        ).filter(
             and_(
-                SessionInstructor.session_id == session.id,
+                SessionInstructor.session_id.in_(session_ids),
                 SessionInstructor.removed_at.is_(None)
             )
         ).all()
         
-        for instructor_assignment in instructors:
-            instructor_info = self._get_instructor_info(db, instructor_assignment.instructor_id)
-            if instructor_info:
-                recipients.append(instructor_info)
+        for session_id, instructor in instructor_rows:
+            recipients[session_id].setdefault(instructor.id, self._instructor_info(instructor))
         
-        return recipients
+        return {session_id: list(by_id.values()) for session_id, by_id in recipients.items()}
     
-    def _get_student_info(self, db: Session, student_id: str) -> Optional[Dict[str, Any]]:
-        """Get student contact information."""
-        student = db.query(Student).filter(Student.id == student_id).first()
-        if not student:
-            return None
-        
+    # Private helper methods
+    
+    @staticmethod
+    def _empty_results() -> Dict[str, Any]:
         return {
-            'id': student.id,
-            'name': f"{student.first_name} {student.last_name}",
-            'email': student.email,
-            'phone': student.phone,
-            'emergency_contact': student.emergency_contact,
-            'type': 'student'
+            'notifications_sent': 0,
+            'notifications_failed': 0,
+            'recipients': [],
+            'errors': []
         }
     
-    def _get_student_parents(self, db: Session, student_id: str) -> List[Dict[str, Any]]:
-        """Get parent contact information for a student."""
-        # Get student's user record if exists
-        student = db.query(Student).filter(Student.id == student_id).first()
-        if not student:
+    def _get_session_with_program_check(
+        self,
+        db: Session,
+        session_id: str,
+        program_context: str
+    ) -> Optional[ScheduledSession]:
+        """Get session with program context validation."""
+        sessions = self._get_sessions_with_program_check(db, [session_id], program_context)
+        return sessions[0] if sessions else None
+    
+    def _get_sessions_with_program_check(
+        self,
+        db: Session,
+        session_ids: List[str],
+        program_context: str
+    ) -> List[ScheduledSession]:
+        """Get sessions (with their facility) with program context validation."""
+        if not session_ids:
             return []
-        
-        parents = []
-        
-        # Check if student has associated user account
-        if student.user_id:
-            # Get parent relationships through user relationships
-            parent_relationships = db.query(UserRelationship).filter(
-                and_(
-                    UserRelationship.child_user_id == student.user_id,
-                    UserRelationship.relationship_type.in_([
-                        RelationshipType.PARENT,
-                        RelationshipType.GUARDIAN
-                    ])
-                )
-            ).all()
-            
-            for relationship in parent_relationships:
-                parent_user = db.query(User).filter(
-                    User.id == relationship.parent_user_id
-                ).first()
-                
-                if parent_user:
-                    parents.append({
-                        'id': parent_user.id,
-                        'name': f"{parent_user.first_name} {parent_user.last_name}",
-                        'email': parent_user.email,
-                        'phone': parent_user.phone,
-                        'type': 'parent',
-                        'relationship': relationship.relationship_type.value,
-                        'student_id': student_id
-                    })
-        
-        # Fallback to emergency contact if no parent users found
-        if not parents and student.emergency_contact:
-            emergency_info = student.emergency_contact
-            if isinstance(emergency_info, dict) and emergency_info.get('email'):
-                parents.append({
-                    'id': f'emergency_{student_id}',
-                    'name': emergency_info.get('name', 'Emergency Contact'),
-                    'email': emergency_info.get('email'),
-                    'phone': emergency_info.get('phone'),
-                    'type': 'emergency_contact',
-                    'student_id': student_id
-                })
-        
-        return parents
+        return db.query(ScheduledSession).options(
+            joinedload(ScheduledSession.facility)
+        ).filter(
+            and_(
+                ScheduledSession.id.in_(session_ids),
+                ScheduledSession.program_id == program_context
+            )
+        ).all()
     
-    def _get_instructor_info(self, db: Session, instructor_id: str) -> Optional[Dict[str, Any]]:
-        """Get instructor contact information."""
-        instructor = db.query(User).filter(
+    def _get_parents_by_child_user(
+        self,
+        db: Session,
+        child_user_ids: List[str]
+    ) -> Dict[str, List[Tuple[UserRelationship, User]]]:
+        """Active parent/guardian relationships and parent users, keyed by child user ID."""
+        parents: Dict[str, List[Tuple[UserRelationship, User]]] = defaultdict(list)
+        if not child_user_ids:
+            return parents
+        
+        rows = db.query(UserRelationship, User).join(
+            User, User.id == UserRelationship.parent_user_id
+        ).filter(
             and_(
-                User.id == instructor_id,
-                or_(
-                    User.primary_role == UserRole.INSTRUCTOR,
-                    User.roles.contains([UserRole.INSTRUCTOR.value])
-                )
+                UserRelationship.child_user_id.in_(child_user_ids),
+                UserRelationship.is_active.is_(True),
+                UserRelationship.relationship_type.in_(PARENT_RELATIONSHIP_TYPES)
             )
-        ).first()
+        ).all()
         
-        if not instructor:
-            return None
+        for relationship, parent_user in rows:
+            parents[relationship.child_user_id].append((relationship, parent_user))
+        return parents
+    
+    def _student_recipients(
+        self,
+        student: Student,
+        parents_by_user: Dict[str, List[Tuple[UserRelationship, User]]]
+    ) -> List[Dict[str, Any]]:
+        """The student (if reachable by email) followed by their parents or emergency contact."""
+        recipients = []
+        if student.email:
+            recipients.append({
+                'id': student.id,
+                'name': f"{student.first_name} {student.last_name}",
+                'email': student.email,
+                'phone': student.phone,
+                'type': 'student'
+            })
+        
+        parents = [
+            {
+                'id': parent_user.id,
+                'name': f"{parent_user.first_name} {parent_user.last_name}",
+                'email': parent_user.email,
+                'phone': parent_user.phone,
+                'type': 'parent',
+                'relationship': relationship.relationship_type.value,
+                'student_id': student.id,
+                'student_ids': [student.id]
+            }
+            for relationship, parent_user in parents_by_user.get(student.user_id, [])
+        ]
         
+        # Fallback to emergency contact if no parent users found
+        if not parents and student.emergency_contact_phone:
+            parents.append({
+                'id': f'emergency_{student.id}',
+                'name': student.emergency_contact_name or 'Emergency Contact',
+                'email': None,
+                'phone': student.emergency_contact_phone,
+                'type': 'emergency_contact',
+                'student_id': student.id
+            })
+        
+        return recipients + parents
+    
+    @staticmethod
+    def _instructor_info(instructor: User) -> Dict[str, Any]:
+        """Instructor contact information."""
         return {
             'id': instructor.id,
             'name': f"{instructor.first_name} {instructor.last_name}",
             'email': instructor.email,
             'phone': instructor.phone,
             'type': 'instructor',
-            'role': instructor.primary_role.value
+            'role': instructor.primary_role
+        }
+    
+    @staticmethod
+    def _build_message(
+        recipient: Dict[str, Any],
+        content: Dict[str, Any],
+        notification_type: str
+    ) -> Dict[str, Any]:
+        """Outbox payload for one recipient."""
+        return {
+            'notification_type': notification_type,
+            'recipient': recipient,
+            'content': content,
         }
     
     def _create_notification_content(
@@ -540,6 +535,24 @@ class SchedulingNotificationService:
         
         return content
     
+    def deliver(self, messages: List[ClaimedMessage]) -> Dict[str, str]:
+        """
+        Outbox handler delivering a batch of queued notifications.
+        
+        Returns the messages that failed, keyed by outbox message ID, so they
+        are retried.
+        """
+        failures = {}
+        for message in messages:
+            payload = message.payload
+            try:
+                self._send_individual_notification(
+                    payload['recipient'], payload['content'], payload['notification_type']
+                )
+            except Exception as e:
+                failures[message.id] = str(e)
+        return failures
+    
     def _send_individual_notification(
         self,
         recipient: Dict[str, Any],
@@ -556,13 +569,12 @@ class SchedulingNotificationService:
         - In-app notification system
         """
         # For now, this is a placeholder that would integrate with actual notification services
-        print(f"NOTIFICATION: Sending {notification_type} to {recipient['email']}")
-        print(f"Subject: {content['subject']}")
-        print(f"Content: {content}")
-        
-        # Here you would implement actual sending logic:
-        # - Format email template
-        # - Send via email service
-        # - Store notification record
-        # - Handle delivery failures
-        pass
\ No newline at end of file
+        logger.info(
+            f"NOTIFICATION: Sending {notification_type} to "
+            f"{recipient.get('email') or recipient.get('phone')}: {content['subject']}"
+        )
+
+
+# Global instance
+notification_service = SchedulingNotificationService()
+outbox.register(NOTIFICATION_TOPIC, notification_service.deliver)
@@ -0,0 +1,181 @@
+"""
+Recurrence expansion for recurring scheduled sessions.
+
+Turns a session's ``recurring_pattern`` / ``recurring_config`` into the
+concrete occurrence times of the series, following RRULE semantics for
+daily, weekly (with optional weekdays) and monthly frequencies.
+"""
+
+import calendar
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
+
+from app.features.common.models.enums import RecurringPattern
+
+DAILY = "daily"
+WEEKLY = "weekly"
+MONTHLY = "monthly"
+
+# Defaults carried over from the original recurring-session generator
+DEFAULT_MAX_OCCURRENCES = 52
+DEFAULT_SERIES_LENGTH = timedelta(days=180)
+
+WEEKDAY_NAMES = {
+    name: index
+    for index, names in enumerate([
+        ("mo", "mon", "monday"),
+        ("tu", "tue", "tuesday"),
+        ("we", "wed", "wednesday"),
+        ("th", "thu", "thursday"),
+        ("fr", "fri", "friday"),
+        ("sa", "sat", "saturday"),
+        ("su", "sun", "sunday"),
+    ])
+    for name in names
+}
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """
+    RRULE-style recurrence rule.
+
+    ``weekdays`` use 0=Monday like ``datetime.weekday()``. ``count`` limits
+    the occurrences generated after the first session of the series, and
+    ``exceptions`` removes whole days (EXDATE) after ``count`` is applied.
+    """
+
+    frequency: str
+    interval: int = 1
+    weekdays: Tuple[int, ...] = ()
+    until: Optional[datetime] = None
+    count: int = DEFAULT_MAX_OCCURRENCES
+    exceptions: FrozenSet[date] = frozenset()
+
+    @classmethod
+    def from_session(
+        cls,
+        pattern: RecurringPattern,
+        config: Optional[Dict[str, Any]],
+        start_time: datetime,
+        exceptions: Optional[Iterable[Union[date, datetime, str]]] = None,
+    ) -> Optional["RecurrenceRule"]:
+        """
+        Build a rule from a session's recurring pattern and config.
+
+        Supported config keys: ``interval``, ``end_date``, ``max_occurrences``
+        and ``days_of_week`` (ints with 0=Monday, or day names). Returns
+        ``None`` for non-recurring sessions.
+        """
+        config = config or {}
+        interval = int(config.get('interval') or 1)
+        if interval < 1:
+            raise ValueError("Recurring interval must be at least 1")
+
+        if pattern == RecurringPattern.DAILY:
+            frequency = DAILY
+        elif pattern in (RecurringPattern.WEEKLY, RecurringPattern.CUSTOM):
+            frequency = WEEKLY
+        elif pattern == RecurringPattern.BIWEEKLY:
+            frequency, interval = WEEKLY, interval * 2
+        elif pattern == RecurringPattern.MONTHLY:
+            frequency = MONTHLY
+        else:
+            return None
+
+        weekdays: Tuple[int, ...] = ()
+        if frequency == WEEKLY:
+            weekdays = tuple(sorted({_parse_weekday(day) for day in config.get('days_of_week') or []}))
+
+        until = _parse_until(config.get('end_date'), start_time)
+        if until is None:
+            until = start_time + DEFAULT_SERIES_LENGTH
+
+        return cls(
+            frequency=frequency,
+            interval=interval,
+            weekdays=weekdays or (start_time.weekday(),),
+            until=until,
+            count=int(config.get('max_occurrences') or DEFAULT_MAX_OCCURRENCES),
+            exceptions=frozenset(_parse_date(value) for value in exceptions or []),
+        )
+
+    def occurrences(self, start_time: datetime) -> Iterator[datetime]:
+        """Occurrence start times after ``start_time`` (the first session)."""
+        generated = 0
+        for occurrence in self._candidates(start_time):
+            if generated >= self.count or (self.until is not None and occurrence > self.until):
+                return
+            generated += 1
+            if occurrence.date() not in self.exceptions:
+                yield occurrence
+
+    def _candidates(self, start_time: datetime) -> Iterator[datetime]:
+        if self.frequency == DAILY:
+            step = timedelta(days=self.interval)
+            occurrence = start_time + step
+            while True:
+                yield occurrence
+                occurrence += step
+
+        elif self.frequency == WEEKLY:
+            week_start = start_time - timedelta(days=start_time.weekday())
+            week = 0
+            while True:
+                for weekday in self.weekdays:
+                    occurrence = week_start + timedelta(weeks=week, days=weekday)
+                    if occurrence > start_time:
+                        yield occurrence
+                week += self.interval
+
+        else:
+            # Months without the start's day (e.g. the 31st) are skipped, as in RRULE
+            months = self.interval
+            while True:
+                year, month = divmod(start_time.month - 1 + months, 12)
+                year += start_time.year
+                if start_time.day <= calendar.monthrange(year, month + 1)[1]:
+                    yield start_time.replace(year=year, month=month + 1)
+                months += self.interval
+
+
+def expand_occurrences(
+    rule: RecurrenceRule,
+    start_time: datetime,
+    end_time: datetime,
+) -> List[Tuple[datetime, datetime]]:
+    """``(start, end)`` pairs for every occurrence after the first session."""
+    duration = end_time - start_time
+    return [(occurrence, occurrence + duration) for occurrence in rule.occurrences(start_time)]
+
+
+def _parse_weekday(value: Union[int, str]) -> int:
+    if isinstance(value, int) and 0 <= value <= 6:
+        return value
+    if isinstance(value, str) and value.strip().lower() in WEEKDAY_NAMES:
+        return WEEKDAY_NAMES[value.strip().lower()]
+    raise ValueError(f"Invalid day of week in recurring config: {value!r}")
+
+
+def _parse_date(value: Union[date, datetime, str]) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.fromisoformat(value).date()
+
+
+def _parse_until(value: Union[date, datetime, str, None], start_time: datetime) -> Optional[datetime]:
+    """End of the series; a bare date includes the whole day."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value) if 'T' in value or ' ' in value else date.fromisoformat(value)
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time.max)
+    if value.tzinfo is None and start_time.tzinfo is not None:
+        value = value.replace(tzinfo=start_time.tzinfo)
+    elif value.tzinfo is not None and start_time.tzinfo is None:
+        value = value.replace(tzinfo=None)
+    return value
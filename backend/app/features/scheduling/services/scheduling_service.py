@@ -5,9 +5,11 @@ Main scheduling service for facility-centric session management.
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func, desc
+from sqlalchemy import and_, or_, func, desc, insert
+from sqlalchemy.exc import IntegrityError
 
 from app.features.courses.services.base_service import BaseService
+from app.features.authentication.models.user import User
 from app.features.scheduling.models import (
     ScheduledSession,
     SessionParticipant,
@@ -28,9 +30,43 @@ from app.features.scheduling.schemas.session import (
 from app.features.common.models.enums import (
     SessionStatus,
     ParticipantStatus,
-    RecurringPattern,
 )
-from .notification_service import SchedulingNotificationService
+from app.features.common.services.text_search import text_search
+from app.features.scheduling.models.scheduled_session import SESSION_SEARCH
+from .notification_service import notification_service
+from .conflict_engine import ConflictEngine, get_facility_settings, requires_precheck
+from .recurrence import RecurrenceRule, expand_occurrences
+
+# How far ahead alternative times are searched when a slot is taken
+SUGGESTION_HORIZON = timedelta(days=7)
+
+# Columns copied from the first session onto each generated occurrence
+RECURRING_COPY_FIELDS = (
+    'program_id', 'facility_id', 'course_id', 'title', 'description', 'session_type',
+    'recurring_pattern', 'recurring_config', 'recurring_exceptions', 'status',
+    'max_participants', 'student_type', 'skill_level', 'special_requirements', 'notes',
+)
+
+
+# Exclusion constraints guarding against double-booking (see the session exclusion migration)
+BOOKING_CONSTRAINTS = frozenset({
+    'excl_scheduled_sessions_facility_overlap',
+    'excl_session_instructors_overlap',
+})
+
+
+class SessionConflictError(ValueError):
+    """Raised when a booking overlaps existing sessions; carries the conflict details."""
+    
+    def __init__(self, conflicts: SessionConflictResponse, message: str = "Session conflicts detected"):
+        super().__init__(message)
+        self.conflicts = conflicts
+
+
+def is_booking_conflict(error: IntegrityError) -> bool:
+    """Whether an IntegrityError comes from one of the double-booking exclusion constraints."""
+    diag = getattr(error.orig, 'diag', None)
+    return getattr(diag, 'constraint_name', None) in BOOKING_CONSTRAINTS
 
 
 class SchedulingService(BaseService[ScheduledSession, SessionCreate, SessionUpdate]):
@@ -50,7 +86,7 @@ class SchedulingService(BaseService[ScheduledSession, SessionCreate, SessionUpda
     
     def __init__(self):
         super().__init__(ScheduledSession)
-        self.notification_service = SchedulingNotificationService()
+        self.notification_service = notification_service
     
     def create_session(
         self,
@@ -79,25 +115,88 @@ class SchedulingService(BaseService[ScheduledSession, SessionCreate, SessionUpda
             max_text = f"{max_cap}" if max_cap else "unlimited"
             raise ValueError(f"{session_type_name} sessions require {min_cap}-{max_text} participants")
         
-        # Check for conflicts
         conflict_check = SessionConflictCheck(
             facility_id=session_data.facility_id,
             start_time=session_data.start_time,
             end_time=session_data.end_time,
             instructor_ids=session_data.instructor_ids
         )
-        conflicts = self.check_session_conflicts(db, conflict_check, program_context)
         
-        if conflicts.has_conflicts:
-            raise ValueError("Session conflicts detected")
+        occurrences = []
+        rule = RecurrenceRule.from_session(
+            session_data.recurring_pattern,
+            session_data.recurring_config,
+            session_data.start_time,
+            session_data.recurring_exceptions,
+        )
+        if rule is not None:
+            occurrences = expand_occurrences(rule, session_data.start_time, session_data.end_time)
+        
+        # On PostgreSQL exclusion constraints reject overlapping bookings on
+        # insert, so the pre-check only runs where buffers or concurrency slots apply
+        settings = get_facility_settings(db, session_data.facility_id, program_context)
+        occurrence_slots = [0] * len(occurrences)
+        if requires_precheck(settings, db.get_bind().dialect.name):
+            engine = ConflictEngine.load(
+                db,
+                facility_id=session_data.facility_id,
+                program_context=program_context,
+                window_start=session_data.start_time,
+                window_end=session_data.end_time + SUGGESTION_HORIZON,
+                instructor_ids=session_data.instructor_ids,
+                settings=settings,
+            )
+            conflicts = self._build_conflict_response(db, engine, conflict_check)
+            if conflicts.has_conflicts:
+                raise SessionConflictError(conflicts)
+            session_dict['facility_slot'] = engine.free_facility_slot(
+                session_data.start_time, session_data.end_time
+            )
+            occurrence_slots = self._plan_recurring_occurrences(
+                db, session_data.facility_id, session_data.instructor_ids, occurrences,
+                program_context, settings
+            )
         
-        # Create the session
-        session = self.create(db, type('obj', (), session_dict)(), created_by)
+        # Recurring exceptions are stored as JSON
+        if session_dict.get('recurring_exceptions'):
+            session_dict['recurring_exceptions'] = [
+                exception.isoformat() for exception in session_dict['recurring_exceptions']
+            ]
+        if created_by:
+            session_dict['created_by'] = created_by
+        
+        # Session, series and instructor assignments are written in one transaction
+        instructor_ids = list(dict.fromkeys(session_data.instructor_ids or []))
+        try:
+            session = ScheduledSession(**session_dict)
+            db.add(session)
+            db.flush()
+            session_ids = [session.id] + self._insert_recurring_sessions(
+                db, session, occurrences, occurrence_slots, created_by
+            )
+            self._insert_instructor_assignments(db, session_ids, instructor_ids, created_by)
+            db.commit()
+        except IntegrityError as error:
+            db.rollback()
+            if not is_booking_conflict(error):
+                raise
+            # Another booking won the race; report what it conflicts with
+            conflicts = self.check_session_conflicts(db, conflict_check, program_context)
+            if not conflicts.has_conflicts:
+                # The first session is free, so a later occurrence of the series lost
+                _, conflicting = self._find_recurring_conflicts(
+                    db, session_data.facility_id, session_data.instructor_ids, occurrences, program_context
+                )
+                if conflicting:
+                    raise self._recurring_conflict_error(conflicting)
+            raise SessionConflictError(conflicts)
+        
+        db.refresh(session)
         
-        # Add instructor assignments if provided
-        if session_data.instructor_ids:
-            self.add_instructors_to_session(
-                db, session.id, session_data.instructor_ids, program_context
+        if instructor_ids:
+            self.notification_service.send_instructor_notifications(
+                db, session.id, instructor_ids, 'instructors_added', program_context,
+                custom_message="You have been assigned to this session."
             )
         
         # Add student enrollments if provided
@@ -106,10 +205,6 @@ class SchedulingService(BaseService[ScheduledSession, SessionCreate, SessionUpda
                 db, session.id, session_data.student_ids, program_context
             )
         
-        # Create recurring sessions if needed
-        if session_data.recurring_pattern != RecurringPattern.NONE:
-            self._create_recurring_sessions(db, session, session_data.recurring_config or {})
-        
         # Send creation notifications
         self.notification_service.send_session_notifications(
             db, [session.id], 'session_created', program_context,
@@ -152,7 +247,7 @@ class SchedulingService(BaseService[ScheduledSession, SessionCreate, SessionUpda
         sessions = query.offset(skip).limit(limit).all()
         
         # Convert to responses
-        items = [self._to_session_response(db, session) for session in sessions]
+        items = self._to_session_responses(db, sessions)
         
         return SessionListResponse(
             items=items,
@@ -179,35 +274,60 @@ class SchedulingService(BaseService[ScheduledSession, SessionCreate, SessionUpda
         """
         session = self._get_session_with_program_check(db, session_id, program_context)
         
-        # Check for conflicts with new time
+        if apply_to_all_recurring and session.is_recurring:
+            moved_sessions = self._get_recurring_sessions(db, session, program_context)
+        else:
+            moved_sessions = [session]
+        time_diff = new_start_time - session.start_time
+        duration_diff = (new_end_time - new_start_time) - (session.end_time - session.start_time)
+        new_times = [
+            (moved.start_time + time_diff, moved.end_time + time_diff + duration_diff)
+            for moved in moved_sessions
+        ]
+        
+        # Check for conflicts with new time; the moved sessions no longer block themselves
         conflict_check = SessionConflictCheck(
             facility_id=session.facility_id,
             start_time=new_start_time,
             end_time=new_end_time,
             exclude_session_id=session_id
         )
-        conflicts = self.check_session_conflicts(db, conflict_check, program_context)
+        engine = ConflictEngine.load(
+            db,
+            facility_id=session.facility_id,
+            program_context=program_context,
+            window_start=min(start for start, _ in new_times),
+            window_end=max(end for _, end in new_times) + SUGGESTION_HORIZON,
+            exclude_session_ids=[moved.id for moved in moved_sessions],
+        )
+        conflicts = self._build_conflict_response(db, engine, conflict_check)
         
         if conflicts.has_conflicts:
-            raise ValueError("Time change would create conflicts")
+            raise SessionConflictError(conflicts, "Time change would create conflicts")
         
-        updated_sessions = []
+        # Each moved session takes a facility slot free at its new time, so
+        # concurrency-slot facilities do not trip the exclusion constraint
+        slots = [engine.free_facility_slot(start, end) for start, end in new_times]
+        conflicting = [start for (start, _), slot in zip(new_times, slots) if slot is None]
+        if conflicting:
+            raise self._recurring_conflict_error(conflicting)
         
-        if apply_to_all_recurring and session.is_recurring:
-            # Update all recurring sessions
-            recurring_sessions = self._get_recurring_sessions(db, session, program_context)
-            for recurring_session in recurring_sessions:
-                time_diff = new_start_time - session.start_time
-                recurring_session.start_time += time_diff
-                recurring_session.end_time += time_diff
-                updated_sessions.append(self._to_session_response(db, recurring_session))
-        else:
-            # Update only this session
-            session.start_time = new_start_time
-            session.end_time = new_end_time
-            updated_sessions.append(self._to_session_response(db, session))
-        
-        db.commit()
+        updated_sessions = []
+        for moved, (start, end), slot in zip(moved_sessions, new_times, slots):
+            moved.start_time = start
+            moved.end_time = end
+            moved.facility_slot = slot
+            updated_sessions.append(self._to_session_response(db, moved))
+        
+        try:
+            db.commit()
+        except IntegrityError as error:
+            db.rollback()
+            if not is_booking_conflict(error):
+                raise
+            raise SessionConflictError(
+                SessionConflictResponse(has_conflicts=True), "Time change would create conflicts"
+            )
         
         # Send notifications
         self.notification_service.send_session_notifications(
@@ -234,7 +354,7 @@ class SchedulingService(BaseService[ScheduledSession, SessionCreate, SessionUpda
         """
         session = self._get_session_with_program_check(db, session_id, program_context)
         
-        cancelled_sessions = []
+        cancelled = []
         
         if cancel_all_recurring and session.is_recurring:
             # Cancel all recurring sessions
@@ -242,12 +362,13 @@ class SchedulingService(BaseService[ScheduledSession, SessionCreate, SessionUpda
             for recurring_session in recurring_sessions:
                 if recurring_session.status != SessionStatus.CANCELLED:
                     self._cancel_single_session(recurring_session, reason, user_id)
-                    cancelled_sessions.append(self._to_session_response(db, recurring_session))
+                    cancelled.append(recurring_session)
         else:
             # Cancel only this session
             self._cancel_single_session(session, reason, user_id)
-            cancelled_sessions.append(self._to_session_response(db, session))
+            cancelled.append(session)
         
+        cancelled_sessions = self._to_session_responses(db, cancelled)
         db.commit()
         
         # Send notifications
@@ -286,11 +407,10 @@ class SchedulingService(BaseService[ScheduledSession, SessionCreate, SessionUpda
             )
         ).all()
         
-        cancelled_sessions = []
         for session in sessions_to_cancel:
             self._cancel_single_session(session, f"Bulk cancellation: {reason}", user_id)
-            cancelled_sessions.append(self._to_session_response(db, session))
         
+        cancelled_sessions = self._to_session_responses(db, sessions_to_cancel)
         db.commit()
         
         # Send notifications
@@ -499,60 +619,52 @@ class SchedulingService(BaseService[ScheduledSession, SessionCreate, SessionUpda
         """
         Check for session conflicts (facility and instructor).
         
-        Implements conflict detection for scheduling system.
+        Busy intervals for the facility and all instructors are loaded in one
+        query and indexed by ``ConflictEngine``; suggested times are answered
+        from the same index.
         """
-        facility_conflicts = []
-        instructor_conflicts = {}
-        
-        # Check facility conflicts
-        facility_sessions = db.query(ScheduledSession).filter(
-            and_(
-                ScheduledSession.facility_id == conflict_check.facility_id,
-                ScheduledSession.program_id == program_context,
-                ScheduledSession.status.in_([SessionStatus.SCHEDULED, SessionStatus.IN_PROGRESS]),
-                ScheduledSession.start_time < conflict_check.end_time,
-                ScheduledSession.end_time > conflict_check.start_time
-            )
+        engine = ConflictEngine.load(
+            db,
+            facility_id=conflict_check.facility_id,
+            program_context=program_context,
+            window_start=conflict_check.start_time,
+            window_end=conflict_check.end_time + SUGGESTION_HORIZON,
+            instructor_ids=conflict_check.instructor_ids,
+            exclude_session_id=conflict_check.exclude_session_id,
         )
         
-        if conflict_check.exclude_session_id:
-            facility_sessions = facility_sessions.filter(
-                ScheduledSession.id != conflict_check.exclude_session_id
-            )
-        
-        facility_conflicts = [
-            self._to_session_response(db, session) 
-            for session in facility_sessions.all()
-        ]
-        
-        # Check instructor conflicts
-        if conflict_check.instructor_ids:
-            for instructor_id in conflict_check.instructor_ids:
-                instructor_sessions = db.query(ScheduledSession).join(
-                    SessionInstructor
-                ).filter(
-                    and_(
-                        SessionInstructor.instructor_id == instructor_id,
-                        SessionInstructor.removed_at.is_(None),
-                        ScheduledSession.program_id == program_context,
-                        ScheduledSession.status.in_([SessionStatus.SCHEDULED, SessionStatus.IN_PROGRESS]),
-                        ScheduledSession.start_time < conflict_check.end_time,
-                        ScheduledSession.end_time > conflict_check.start_time
-                    )
-                )
-                
-                if conflict_check.exclude_session_id:
-                    instructor_sessions = instructor_sessions.filter(
-                        ScheduledSession.id != conflict_check.exclude_session_id
-                    )
-                
-                conflicts = [
-                    self._to_session_response(db, session)
-                    for session in instructor_sessions.all()
-                ]
-                
-                if conflicts:
-                    instructor_conflicts[instructor_id] = conflicts
+        return self._build_conflict_response(db, engine, conflict_check)
+    
+    def _build_conflict_response(
+        self,
+        db: Session,
+        engine: ConflictEngine,
+        conflict_check: SessionConflictCheck
+    ) -> SessionConflictResponse:
+        """Describe conflicts of a requested slot from a loaded conflict engine."""
+        start_time, end_time = conflict_check.start_time, conflict_check.end_time
+        facility_hits = engine.facility_conflicts(start_time, end_time)
+        instructor_hits = engine.instructor_conflicts(start_time, end_time)
+        
+        # Load each conflicting session once, however many resources it blocks
+        session_ids = {interval.session_id for interval in facility_hits}
+        for intervals in instructor_hits.values():
+            session_ids.update(interval.session_id for interval in intervals)
+        responses = {}
+        if session_ids:
+            sessions = db.query(ScheduledSession).filter(
+                ScheduledSession.id.in_(session_ids)
+            ).all()
+            responses = {
+                response.id: response
+                for response in self._to_session_responses(db, sessions)
+            }
+        
+        facility_conflicts = [responses[interval.session_id] for interval in facility_hits]
+        instructor_conflicts = {
+            instructor_id: [responses[interval.session_id] for interval in intervals]
+            for instructor_id, intervals in instructor_hits.items()
+        }
         
         has_conflicts = bool(facility_conflicts or instructor_conflicts)
         
@@ -560,7 +672,7 @@ class SchedulingService(BaseService[ScheduledSession, SessionCreate, SessionUpda
             has_conflicts=has_conflicts,
             facility_conflicts=facility_conflicts,
             instructor_conflicts=instructor_conflicts,
-            suggested_times=self._generate_suggested_times(db, conflict_check, program_context) if has_conflicts else []
+            suggested_times=self._generate_suggested_times(engine, conflict_check) if has_conflicts else []
         )
     
     def get_session_participants(
@@ -648,124 +760,190 @@ class SchedulingService(BaseService[ScheduledSession, SessionCreate, SessionUpda
     
     def _to_session_response(self, db: Session, session: ScheduledSession) -> SessionResponse:
         """Convert session model to response schema."""
+        return self._to_session_responses(db, [session])[0]
+    
+    def _to_session_responses(self, db: Session, sessions: List[ScheduledSession]) -> List[SessionResponse]:
+        """Convert session models to response schemas with one query each for counts and instructors."""
+        if not sessions:
+            return []
+        session_ids = [session.id for session in sessions]
+        
         # Get participant counts
-        participants = db.query(SessionParticipant).filter(
-            SessionParticipant.session_id == session.id
+        enrolled_counts: Dict[str, int] = {}
+        waitlist_counts: Dict[str, int] = {}
+        count_rows = db.query(
+            SessionParticipant.session_id,
+            SessionParticipant.enrollment_status,
+            func.count(SessionParticipant.id)
+        ).filter(
+            SessionParticipant.session_id.in_(session_ids)
+        ).group_by(
+            SessionParticipant.session_id, SessionParticipant.enrollment_status
         ).all()
-        
-        enrolled_count = len([p for p in participants if p.is_enrolled])
-        waitlist_count = len([p for p in participants if p.is_waitlisted])
+        for session_id, enrollment_status, count in count_rows:
+            if enrollment_status in (ParticipantStatus.ENROLLED, ParticipantStatus.CONFIRMED):
+                enrolled_counts[session_id] = enrolled_counts.get(session_id, 0) + count
+            elif enrollment_status == ParticipantStatus.WAITLISTED:
+                waitlist_counts[session_id] = waitlist_counts.get(session_id, 0) + count
         
         # Get instructor names
-        instructor_assignments = db.query(SessionInstructor).filter(
+        instructor_names: Dict[str, List[str]] = {}
+        instructor_rows = db.query(SessionInstructor.session_id, User.full_name).join(
+            User, User.id == SessionInstructor.instructor_id
+        ).filter(
             and_(
-                SessionInstructor.session_id == session.id,
+                SessionInstructor.session_id.in_(session_ids),
                 SessionInstructor.removed_at.is_(None)
             )
-        ).all()
-        instructor_names = [assignment.instructor.full_name for assignment in instructor_assignments]
+        ).order_by(SessionInstructor.assigned_at).all()
+        for session_id, full_name in instructor_rows:
+            instructor_names.setdefault(session_id, []).append(full_name)
+        
+        responses = []
+        for session in sessions:
+            enrolled_count = enrolled_counts.get(session.id, 0)
+            max_participants = session.max_participants
+            responses.append(SessionResponse(
+                id=session.id,
+                program_id=session.program_id,
+                facility_id=session.facility_id,
+                course_id=session.course_id,
+                title=session.title,
+                description=session.description,
+                session_type=session.session_type,
+                start_time=session.start_time,
+                end_time=session.end_time,
+                recurring_pattern=session.recurring_pattern,
+                recurring_config=session.recurring_config,
+                recurring_exceptions=session.recurring_exceptions,
+                recurring_parent_id=session.recurring_parent_id,
+                is_recurring=session.is_recurring,
+                status=session.status,
+                max_participants=max_participants,
+                student_type=session.student_type,
+                skill_level=session.skill_level,
+                special_requirements=session.special_requirements,
+                notes=session.notes,
+                enrolled_count=enrolled_count,
+                waitlist_count=waitlist_counts.get(session.id, 0),
+                available_spots=max(0, max_participants - enrolled_count) if max_participants is not None else None,
+                is_full=max_participants is not None and enrolled_count >= max_participants,
+                notification_sent=session.notification_sent,
+                last_notification_time=session.last_notification_time,
+                cancellation_reason=session.cancellation_reason,
+                cancelled_by_user_id=session.cancelled_by_user_id,
+                cancelled_at=session.cancelled_at,
+                duration_minutes=session.duration_minutes,
+                instructor_names=instructor_names.get(session.id, []),
+                created_at=session.created_at,
+                updated_at=session.updated_at,
+            ))
+        return responses
+    
+    def _plan_recurring_occurrences(
+        self,
+        db: Session,
+        facility_id: str,
+        instructor_ids: Optional[List[str]],
+        occurrences: List[Tuple[datetime, datetime]],
+        program_context: str,
+        settings: Optional[FacilityScheduleSettings] = None
+    ) -> List[int]:
+        """
+        Check every occurrence of a series against existing bookings in one query.
         
-        return SessionResponse(
-            id=session.id,
-            program_id=session.program_id,
-            facility_id=session.facility_id,
-            course_id=session.course_id,
-            title=session.title,
-            description=session.description,
-            session_type=session.session_type,
-            start_time=session.start_time,
-            end_time=session.end_time,
-            recurring_pattern=session.recurring_pattern,
-            recurring_config=session.recurring_config,
-            recurring_exceptions=session.recurring_exceptions,
-            recurring_parent_id=session.recurring_parent_id,
-            is_recurring=session.is_recurring,
-            status=session.status,
-            max_participants=session.max_participants,
-            student_type=session.student_type,
-            skill_level=session.skill_level,
-            special_requirements=session.special_requirements,
-            notes=session.notes,
-            enrolled_count=enrolled_count,
-            waitlist_count=waitlist_count,
-            available_spots=session.available_spots,
-            is_full=session.is_full,
-            notification_sent=session.notification_sent,
-            last_notification_time=session.last_notification_time,
-            cancellation_reason=session.cancellation_reason,
-            cancelled_by_user_id=session.cancelled_by_user_id,
-            cancelled_at=session.cancelled_at,
-            duration_minutes=session.duration_minutes,
-            instructor_names=instructor_names,
-            created_at=session.created_at,
-            updated_at=session.updated_at,
+        Returns the facility slot to book for each occurrence.
+        """
+        if not occurrences:
+            return []
+        
+        engine, conflicting = self._find_recurring_conflicts(
+            db, facility_id, instructor_ids, occurrences, program_context, settings
         )
+        if conflicting:
+            raise self._recurring_conflict_error(conflicting)
+        
+        return [engine.free_facility_slot(start, end) for start, end in occurrences]
+    
+    def _find_recurring_conflicts(
+        self,
+        db: Session,
+        facility_id: str,
+        instructor_ids: Optional[List[str]],
+        occurrences: List[Tuple[datetime, datetime]],
+        program_context: str,
+        settings: Optional[FacilityScheduleSettings] = None
+    ) -> Tuple[Optional[ConflictEngine], List[datetime]]:
+        """Load bookings around a series once; returns the engine and the conflicting start times."""
+        if not occurrences:
+            return None, []
+        
+        engine = ConflictEngine.load(
+            db,
+            facility_id=facility_id,
+            program_context=program_context,
+            window_start=occurrences[0][0],
+            window_end=occurrences[-1][1],
+            instructor_ids=instructor_ids,
+            settings=settings,
+        )
+        return engine, [start for start, end in occurrences if engine.has_conflicts(start, end)]
     
-    def _create_recurring_sessions(
+    @staticmethod
+    def _recurring_conflict_error(conflicting: List[datetime]) -> SessionConflictError:
+        """Conflict error naming the first few conflicting occurrences."""
+        dates = ", ".join(start.strftime('%Y-%m-%d %H:%M') for start in conflicting[:5])
+        more = f" and {len(conflicting) - 5} more" if len(conflicting) > 5 else ""
+        return SessionConflictError(
+            SessionConflictResponse(has_conflicts=True),
+            f"Recurring session conflicts detected on {dates}{more}"
+        )
+    
+    def _insert_recurring_sessions(
         self, 
         db: Session, 
         parent_session: ScheduledSession, 
-        config: Dict[str, Any]
-    ) -> List[ScheduledSession]:
-        """Create recurring sessions based on configuration."""
-        from datetime import timedelta
-        
-        created_sessions = []
-        
-        # Get configuration parameters
-        end_date = config.get('end_date')
-        max_occurrences = config.get('max_occurrences', 52)  # Default to 1 year weekly
-        interval = config.get('interval', 1)
-        
-        if not end_date:
-            # Default to 6 months from start date
-            end_date = parent_session.start_time + timedelta(days=180)
-        
-        current_date = parent_session.start_time
-        occurrence_count = 0
-        
-        while current_date <= end_date and occurrence_count < max_occurrences:
-            # Calculate next occurrence based on pattern
-            if parent_session.recurring_pattern == RecurringPattern.DAILY:
-                current_date += timedelta(days=interval)
-            elif parent_session.recurring_pattern == RecurringPattern.WEEKLY:
-                current_date += timedelta(weeks=interval)
-            elif parent_session.recurring_pattern == RecurringPattern.MONTHLY:
-                current_date += timedelta(days=30 * interval)  # Simplified monthly
-            else:
-                break
-            
-            if current_date > end_date:
-                break
-            
-            # Create recurring session
-            duration = parent_session.end_time - parent_session.start_time
-            recurring_session = ScheduledSession(
-                program_id=parent_session.program_id,
-                facility_id=parent_session.facility_id,
-                course_id=parent_session.course_id,
-                title=parent_session.title,
-                description=parent_session.description,
-                session_type=parent_session.session_type,
-                start_time=current_date,
-                end_time=current_date + duration,
-                recurring_pattern=parent_session.recurring_pattern,
-                recurring_config=parent_session.recurring_config,
-                recurring_parent_id=parent_session.id,
-                is_recurring=True,
-                max_participants=parent_session.max_participants,
-                student_type=parent_session.student_type,
-                skill_level=parent_session.skill_level,
-                special_requirements=parent_session.special_requirements,
-                notes=parent_session.notes,
-                created_by_user_id=parent_session.created_by_user_id
-            )
-            
-            db.add(recurring_session)
-            created_sessions.append(recurring_session)
-            occurrence_count += 1
+        occurrences: List[Tuple[datetime, datetime]],
+        facility_slots: List[int],
+        created_by: Optional[str] = None
+    ) -> List[str]:
+        """Insert the occurrences of a series with a single INSERT ... RETURNING."""
+        if not occurrences:
+            return []
+        
+        template = {field: getattr(parent_session, field) for field in RECURRING_COPY_FIELDS}
+        template['recurring_parent_id'] = parent_session.id
+        template['created_by'] = created_by
+        
+        return list(db.scalars(
+            insert(ScheduledSession).returning(ScheduledSession.id),
+            [
+                dict(template, start_time=start, end_time=end, facility_slot=slot)
+                for (start, end), slot in zip(occurrences, facility_slots)
+            ]
+        ))
+    
+    def _insert_instructor_assignments(
+        self,
+        db: Session,
+        session_ids: List[str],
+        instructor_ids: List[str],
+        assigned_by: Optional[str] = None
+    ) -> None:
+        """Assign instructors to a set of sessions with one executemany."""
+        if not session_ids or not instructor_ids:
+            return
         
-        return created_sessions
+        db.execute(insert(SessionInstructor), [
+            {
+                'session_id': session_id,
+                'instructor_id': instructor_id,
+                'is_primary': index == 0,  # First instructor is primary
+                'assigned_by_user_id': assigned_by,
+            }
+            for session_id in session_ids
+            for index, instructor_id in enumerate(instructor_ids)
+        ])
     
     def _get_recurring_sessions(
         self, 
@@ -823,13 +1001,7 @@ class SchedulingService(BaseService[ScheduledSession, SessionCreate, SessionUpda
     ):
         """Apply search filters to session query."""
         if search_params.search:
-            search_term = f"%{search_params.search}%"
-            query = query.filter(
-                or_(
-                    ScheduledSession.title.ilike(search_term),
-                    ScheduledSession.description.ilike(search_term)
-                )
-            )
+            query = text_search.filter(query, SESSION_SEARCH, search_params.search)
         
         if search_params.session_type:
             query = query.filter(ScheduledSession.session_type == search_params.session_type)
@@ -855,42 +1027,23 @@ class SchedulingService(BaseService[ScheduledSession, SessionCreate, SessionUpda
     
     def _generate_suggested_times(
         self, 
-        db: Session, 
-        conflict_check: SessionConflictCheck, 
-        program_context: str
+        engine: ConflictEngine, 
+        conflict_check: SessionConflictCheck
     ) -> List[Dict[str, Any]]:
         """Generate suggested alternative times when conflicts exist."""
-        suggestions = []
-        
-        # Simple implementation: suggest next available hours
-        base_time = conflict_check.start_time
         duration = conflict_check.end_time - conflict_check.start_time
+        slots = engine.next_free_slots(
+            conflict_check.start_time, duration, count=3, horizon=SUGGESTION_HORIZON
+        )
         
-        for hours_offset in [1, 2, 3, 24, 48]:  # 1-3 hours later, next day, day after
-            suggested_start = base_time + timedelta(hours=hours_offset)
-            suggested_end = suggested_start + duration
-            
-            # Check if this time has conflicts
-            test_conflict = SessionConflictCheck(
-                facility_id=conflict_check.facility_id,
-                start_time=suggested_start,
-                end_time=suggested_end,
-                instructor_ids=conflict_check.instructor_ids,
-                exclude_session_id=conflict_check.exclude_session_id
-            )
-            
-            conflicts = self.check_session_conflicts(db, test_conflict, program_context)
-            
-            if not conflicts.has_conflicts:
-                suggestions.append({
-                    'start_time': suggested_start,
-                    'end_time': suggested_end,
-                    'reason': f'Available {hours_offset} hour(s) later'
-                })
-            
-            # Limit suggestions
-            if len(suggestions) >= 3:
-                break
+        suggestions = []
+        for slot in slots:
+            hours_offset = (slot.start_time - conflict_check.start_time).total_seconds() / 3600
+            suggestions.append({
+                'start_time': slot.start_time,
+                'end_time': slot.end_time,
+                'reason': f'Available {hours_offset:g} hour(s) later'
+            })
         
         return suggestions
     
@@ -20,6 +20,7 @@ from sqlalchemy import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.features.common.models.base import BaseModel
+from app.features.common.models.search import SearchDocument
 from app.features.common.models.enums import StudentStatus, Gender, EnrollmentStatus
 
 
@@ -301,4 +302,8 @@ class Student(BaseModel):
     
     def __repr__(self) -> str:
         """String representation of the student."""
-        return f"<Student(id={self.id}, student_id='{self.student_id}', name='{self.full_name}')>"
\ No newline at end of file
+        return f"<Student(id={self.id}, student_id='{self.student_id}', name='{self.full_name}')>"
+
+
+# Free-text search over names, email and student ID
+STUDENT_SEARCH = SearchDocument(Student.__table__, ("first_name", "last_name", "email", "student_id"))
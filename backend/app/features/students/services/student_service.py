@@ -5,10 +5,10 @@ Student service for handling student CRUD operations with PostgreSQL and program
 from datetime import date, datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_, desc, asc
+from sqlalchemy import func, and_, desc, asc, distinct
 import logging
 
-from app.features.students.models.student import Student
+from app.features.students.models.student import STUDENT_SEARCH, Student
 from app.features.students.schemas.student import (
     StudentCreate,
     StudentUpdate,
@@ -19,6 +19,8 @@ from app.features.students.schemas.student import (
 )
 from app.features.common.models.enums import StudentStatus
 from app.features.courses.services.base_service import BaseService
+from app.features.common.services.stats_service import stats_aggregator
+from app.features.common.services.text_search import text_search
 
 # Import related models for program context filtering
 from app.features.programs.models.program import Program
@@ -187,15 +189,7 @@ class StudentService(BaseService[Student, StudentCreate, StudentUpdate]):
         # Apply filters
         if search_params:
             if search_params.search:
-                search_term = f"%{search_params.search}%"
-                query = query.filter(
-                    or_(
-                        Student.first_name.ilike(search_term),
-                        Student.last_name.ilike(search_term),
-                        Student.email.ilike(search_term),
-                        Student.student_id.ilike(search_term)
-                    )
-                )
+                query = text_search.filter(query, STUDENT_SEARCH, search_params.search)
             
             if search_params.status:
                 query = query.filter(Student.status == search_params.status)
@@ -231,7 +225,7 @@ class StudentService(BaseService[Student, StudentCreate, StudentUpdate]):
         students = query.offset(offset).limit(per_page).all()
         
         # Convert to response objects
-        student_responses = [self._to_student_response(db, student) for student in students]
+        student_responses = self._to_student_responses(db, students)
         
         return student_responses, total_count
     
@@ -240,84 +234,78 @@ class StudentService(BaseService[Student, StudentCreate, StudentUpdate]):
                          program_context: Optional[str] = None) -> StudentStatsResponse:
         """Get student statistics for current assignment-based architecture."""
         try:
-            # Get all students directly (not filtered by program context for total count)
-            # This gives us the actual count since students exist as profiles
-            all_students = db.query(Student).join(User, Student.user_id == User.id).filter(
+            # Students exist as profiles, so count all students with an active user
+            # account (not filtered by program context). Every figure below is
+            # aggregated in the database from this base query.
+            student_query = db.query(Student).join(User, Student.user_id == User.id).filter(
                 User.is_active.is_(True)
-            ).all()
+            )
             
-            total_students = len(all_students)
+            thirty_days_ago = date.today() - timedelta(days=30)
+            totals = stats_aggregator.aggregate(
+                student_query,
+                total_students=func.count(Student.id),
+                recent_student_profiles=func.count(Student.id).filter(
+                    Student.enrollment_date >= thirty_days_ago
+                ),
+            )
+            total_students = totals["total_students"]
+            recent_student_profiles = totals["recent_student_profiles"]
             
-            # Calculate status distribution
-            students_by_status = {"active": 0, "inactive": 0, "graduated": 0, "withdrawn": 0, "suspended": 0}
-            for student in all_students:
-                if student.status:
-                    status_key = student.status.value if hasattr(student.status, 'value') else str(student.status)
-                else:
-                    status_key = "active"  # Default status
-                students_by_status[status_key] = students_by_status.get(status_key, 0) + 1
+            # Calculate status distribution (missing status counts as active)
+            students_by_status = stats_aggregator.count_by(
+                student_query,
+                Student.status,
+                defaults={"active": 0, "inactive": 0, "graduated": 0, "withdrawn": 0, "suspended": 0},
+                null_key="active"
+            )
             
             # Calculate gender distribution with correct lowercase enum values
-            students_by_gender = {"male": 0, "female": 0, "other": 0, "prefer_not_to_say": 0, "unknown": 0}
-            for student in all_students:
-                if student.gender:
-                    gender_key = student.gender.value if hasattr(student.gender, 'value') else str(student.gender)
-                else:
-                    gender_key = "unknown"
-                students_by_gender[gender_key] = students_by_gender.get(gender_key, 0) + 1
+            students_by_gender = stats_aggregator.count_by(
+                student_query,
+                Student.gender,
+                defaults={"male": 0, "female": 0, "other": 0, "prefer_not_to_say": 0, "unknown": 0}
+            )
             
             # Calculate age groups
-            students_by_age_group = {"0-10": 0, "11-15": 0, "16-18": 0, "19+": 0}
-            today = date.today()
-            
-            for student in all_students:
-                if student.date_of_birth:
-                    age = today.year - student.date_of_birth.year - (
-                        (today.month, today.day) < (student.date_of_birth.month, student.date_of_birth.day)
-                    )
-                    
-                    if age <= 10:
-                        students_by_age_group["0-10"] += 1
-                    elif age <= 15:
-                        students_by_age_group["11-15"] += 1
-                    elif age <= 18:
-                        students_by_age_group["16-18"] += 1
-                    else:
-                        students_by_age_group["19+"] += 1
-            
-            # Calculate recent student profile creations (last 30 days)
-            thirty_days_ago = date.today() - timedelta(days=30)
-            recent_student_profiles = len([s for s in all_students if s.enrollment_date >= thirty_days_ago])
+            students_by_age_group = stats_aggregator.bucket_counts(
+                student_query.filter(Student.date_of_birth.isnot(None)),
+                stats_aggregator.age_group_conditions(
+                    Student.date_of_birth,
+                    [("0-10", 10), ("11-15", 15), ("16-18", 18)]
+                ),
+                else_key="19+"
+            )
             
             # Calculate parent-child relationships
             from app.features.parents.models.parent_child_relationship import ParentChildRelationship
-            parent_child_relationships = db.query(ParentChildRelationship).all()
-            total_parent_child_relationships = len(parent_child_relationships)
+            relationship_totals = stats_aggregator.aggregate(
+                db.query(ParentChildRelationship),
+                total=func.count(ParentChildRelationship.id),
+                students=func.count(distinct(ParentChildRelationship.student_id)),
+            )
+            total_parent_child_relationships = relationship_totals["total"]
             
             # Count unique students who have parent relationships
-            students_with_parent_relationships = len(set(rel.student_id for rel in parent_child_relationships))
+            students_with_parent_relationships = relationship_totals["students"]
             
             # Count course enrollments using raw SQL to avoid model/enum issues
             try:
                 from sqlalchemy import text
                 
-                # Active course enrollments
+                # Active/paused enrollments and students with any of them, in one pass
                 result = db.execute(
-                    text("SELECT COUNT(*) FROM course_enrollments WHERE status = 'active'")
-                )
-                active_course_enrollments = result.scalar()
-                
-                # Paused course enrollments
-                result = db.execute(
-                    text("SELECT COUNT(*) FROM course_enrollments WHERE status = 'paused'")
-                )
-                paused_course_enrollments = result.scalar()
-                
-                # Students with any active/paused enrollments
-                result = db.execute(
-                    text("SELECT COUNT(DISTINCT user_id) FROM course_enrollments WHERE status IN ('active', 'paused')")
-                )
-                students_with_enrollments = result.scalar()
+                    text("""
+                        SELECT
+                            COALESCE(SUM(CASE WHEN status = 'active' THEN 1 ELSE 0 END), 0) AS active,
+                            COALESCE(SUM(CASE WHEN status = 'paused' THEN 1 ELSE 0 END), 0) AS paused,
+                            COUNT(DISTINCT CASE WHEN status IN ('active', 'paused') THEN user_id END) AS students
+                        FROM course_enrollments
+                    """)
+                ).one()
+                active_course_enrollments = result.active
+                paused_course_enrollments = result.paused
+                students_with_enrollments = result.students
                 
                 # Calculate average enrollments per student
                 total_enrollments = active_course_enrollments + paused_course_enrollments
@@ -444,22 +432,98 @@ class StudentService(BaseService[Student, StudentCreate, StudentUpdate]):
         students = query.offset(offset).limit(per_page).all()
         
         # Convert to response objects
-        student_responses = [self._to_student_response(db, student) for student in students]
+        student_responses = self._to_student_responses(db, students)
         
         return student_responses, total_count
     
     def _to_student_response(self, db: Session, student: Student) -> StudentResponse:
         """Convert Student model to StudentResponse with real enrollment data."""
-        # Get program information (optional - avoid relationship errors)
-        program_name = None
+        return self._to_student_responses(db, [student])[0]
+    
+    def _to_student_responses(self, db: Session, students: List[Student]) -> List[StudentResponse]:
+        """
+        Convert a page of Student models to StudentResponses.
+        
+        Program names and latest enrollments are fetched for the whole page
+        with two set-based queries instead of two queries per student.
+        """
+        if not students:
+            return []
+        
+        program_names = self._get_program_names(
+            db, {student.program_id for student in students if student.program_id}
+        )
+        latest_enrollments = self._get_latest_enrollments(db, [student.id for student in students])
+        
+        return [
+            self._build_student_response(
+                student,
+                program_names.get(student.program_id),
+                latest_enrollments.get(student.id)
+            )
+            for student in students
+        ]
+    
+    def _get_program_names(self, db: Session, program_ids: set) -> Dict[str, str]:
+        """Map program IDs to names in a single query."""
+        if not program_ids:
+            return {}
         try:
-            program = db.query(Program).filter(Program.id == student.program_id).first()
-            if program:
-                program_name = program.name
+            rows = db.query(Program.id, Program.name).filter(Program.id.in_(program_ids)).all()
+            return {row.id: row.name for row in rows}
         except Exception:
             # Skip program lookup if there are relationship issues
-            pass
+            return {}
+    
+    def _get_latest_enrollments(self, db: Session, student_ids: List[str]) -> Dict[str, Any]:
+        """
+        Get the most recent enrollment for each student in a single query.
         
+        Uses ROW_NUMBER() partitioned by student so the database picks the
+        latest enrollment per student; works on PostgreSQL and SQLite.
+        """
+        if not student_ids:
+            return {}
+        
+        try:
+            # Raw SQL to avoid model/enum issues, matching the per-student lookup it replaces
+            from sqlalchemy import text, bindparam
+            
+            statement = text("""
+                SELECT ranked.student_id, ranked.course_id, ranked.facility_id,
+                       ranked.enrollment_fee, ranked.amount_paid, ranked.outstanding_balance,
+                       ranked.enrollment_date, ranked.course_name, ranked.sessions_per_payment,
+                       ranked.facility_name
+                FROM (
+                    SELECT ce.student_id, ce.course_id, ce.facility_id, ce.enrollment_fee,
+                           ce.amount_paid, ce.outstanding_balance, ce.enrollment_date,
+                           c.name as course_name, c.sessions_per_payment, f.name as facility_name,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY ce.student_id
+                               ORDER BY ce.enrollment_date DESC
+                           ) AS enrollment_rank
+                    FROM course_enrollments ce
+                    LEFT JOIN courses c ON ce.course_id = c.id
+                    LEFT JOIN facilities f ON ce.facility_id = f.id
+                    WHERE ce.student_id IN :student_ids
+                ) ranked
+                WHERE ranked.enrollment_rank = 1
+            """).bindparams(bindparam("student_ids", expanding=True))
+            
+            rows = db.execute(statement, {"student_ids": list(student_ids)}).all()
+            return {row.student_id: row for row in rows}
+            
+        except Exception as e:
+            logger.error(f"Error fetching enrollment data for students: {e}")
+            import traceback
+            logger.error(traceback.format_exc())
+            return {}
+    
+    def _build_student_response(self,
+                                student: Student,
+                                program_name: Optional[str],
+                                enrollment_result: Optional[Any]) -> StudentResponse:
+        """Build a StudentResponse from a student and its pre-fetched enrichment data."""
         # Use status as string directly
         student_status = student.status or "active"
         
@@ -486,24 +550,6 @@ class StudentService(BaseService[Student, StudentCreate, StudentUpdate]):
         outstanding_balance = None
         
         try:
-            # Get the most recent active enrollment for this student using raw SQL to avoid model issues
-            from sqlalchemy import text
-            
-            enrollment_result = db.execute(
-                text("""
-                    SELECT ce.course_id, ce.facility_id, ce.enrollment_fee, ce.amount_paid, 
-                           ce.outstanding_balance, ce.enrollment_date, c.name as course_name, 
-                           c.sessions_per_payment, f.name as facility_name
-                    FROM course_enrollments ce
-                    LEFT JOIN courses c ON ce.course_id = c.id
-                    LEFT JOIN facilities f ON ce.facility_id = f.id
-                    WHERE ce.student_id = :student_id
-                    ORDER BY ce.enrollment_date DESC
-                    LIMIT 1
-                """),
-                {"student_id": student.id}
-            ).first()
-            
             if enrollment_result:
                 logger.info(f"Found enrollment for student {student.first_name} {student.last_name}")
                 
@@ -958,7 +1004,7 @@ class StudentService(BaseService[Student, StudentCreate, StudentUpdate]):
         students = query.offset(offset).limit(per_page).all()
         
         # Convert to response objects
-        student_responses = [self._to_student_response(db, student) for student in students]
+        student_responses = self._to_student_responses(db, students)
         
         return student_responses, total_count
 
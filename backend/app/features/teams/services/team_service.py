@@ -5,12 +5,13 @@ Team service for managing program team members and roles.
 from datetime import datetime
 from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, and_, or_, desc, asc
+from sqlalchemy import func, and_, desc, asc
 
-from app.features.authentication.models.user import User
+from app.features.authentication.models.user import USER_SEARCH, User
 from app.features.authentication.models.user_program_assignment import UserProgramAssignment
 from app.features.programs.models.program import Program
 from app.features.common.models.enums import UserRole
+from app.features.common.services.text_search import text_search
 from app.features.teams.schemas.team_schemas import (
     TeamMemberResponse,
     AvailableUserResponse,
@@ -47,14 +48,7 @@ class TeamService:
         # Apply search filters
         if search_params:
             if search_params.search:
-                search_term = f"%{search_params.search}%"
-                query = query.filter(
-                    or_(
-                        func.concat(User.first_name, ' ', User.last_name).ilike(search_term),
-                        User.username.ilike(search_term),
-                        User.email.ilike(search_term)
-                    )
-                )
+                query = text_search.filter(query, USER_SEARCH, search_params.search)
             
             if search_params.role:
                 query = query.filter(User.roles.any(search_params.role))
@@ -329,14 +323,7 @@ class TeamService:
         
         # Apply search filter
         if search:
-            search_term = f"%{search}%"
-            query = query.filter(
-                or_(
-                    func.concat(User.first_name, ' ', User.last_name).ilike(search_term),
-                    User.username.ilike(search_term),
-                    User.email.ilike(search_term)
-                )
-            )
+            query = text_search.filter(query, USER_SEARCH, search)
         
         # Order by name
         query = query.order_by(func.concat(User.first_name, ' ', User.last_name))
@@ -1,8 +1,12 @@
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api.api_v1.api import api_router
 from app.middleware import ProgramContextMiddleware
+from app.features.common.services.dashboard_counters import dashboard_counters
+from app.features.common.services.outbox import outbox
 # from app.middleware.security import SecurityHeadersMiddleware, RateLimitMiddleware, LoggingMiddleware
 
 # Import all models to ensure SQLAlchemy relationships are properly initialized
@@ -35,6 +39,27 @@ app.add_middleware(
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+@app.on_event("startup")
+async def start_dashboard_counter_reconciliation():
+    """Reconcile materialized dashboard counters now and then periodically."""
+    if settings.DASHBOARD_COUNTER_RECONCILE_INTERVAL > 0:
+        app.state.dashboard_counter_task = asyncio.create_task(
+            dashboard_counters.reconcile_periodically(settings.DASHBOARD_COUNTER_RECONCILE_INTERVAL)
+        )
+
+
+@app.on_event("startup")
+async def start_outbox_worker():
+    """Drain light outbox topics (e.g. notifications) in this process; heavy ones run in app.worker."""
+    topics = [topic for topic in outbox.topics if topic not in settings.OUTBOX_WORKER_ONLY_TOPIC_LIST]
+    if settings.OUTBOX_POLL_INTERVAL_SECONDS > 0 and topics:
+        app.state.outbox_task = asyncio.create_task(
+            outbox.run_periodically(
+                settings.OUTBOX_POLL_INTERVAL_SECONDS, settings.OUTBOX_WORKER_CONCURRENCY, topics
+            )
+        )
+
+
 @app.get("/")
 async def root():
     return {"message": "Academy Admin API is running", "version": settings.VERSION}
\ No newline at end of file
@@ -13,6 +13,7 @@ from .program_context import (
     validate_program_access,
     get_user_accessible_programs,
 )
+from .program_access import ProgramAccessResolver
 from .security import SecurityHeadersMiddleware, RateLimitMiddleware, LoggingMiddleware
 
 __all__ = [
@@ -26,6 +27,7 @@ __all__ = [
     "create_program_filter_dependency",
     "validate_program_access",
     "get_user_accessible_programs",
+    "ProgramAccessResolver",
     
     # Security middleware
     "SecurityHeadersMiddleware",
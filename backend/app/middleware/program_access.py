@@ -0,0 +1,184 @@
+"""
+Cached program-access resolver for program context dependencies.
+
+Keeps an in-process access matrix so program-scoped requests can be
+authorized without a database round-trip:
+
+- user_id -> frozenset of assigned program IDs (LRU-bounded, loaded per user)
+- program_id -> program name (loaded once for all programs)
+
+Committed changes to ``UserProgramAssignment`` rows drop the affected users'
+entries and committed changes to ``Program`` rows drop the program map; both
+are detected through session flush events. Entries also expire after a TTL
+so bulk statements and other worker processes converge; a program missing
+from the cached map is looked up directly before it is reported missing.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.features.authentication.models.user_program_assignment import UserProgramAssignment
+from app.features.programs.models.program import Program
+
+_PENDING_CHANGES_KEY = "program_access_changes"
+
+
+class ProgramAccessResolver:
+    """Thread-safe, event-invalidated cache of program access and names."""
+
+    def __init__(self, ttl_seconds: float, max_users: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_users = max_users
+        self._user_programs: "OrderedDict[str, Tuple[float, FrozenSet[str]]]" = OrderedDict()
+        self._program_names: Optional[Dict[str, str]] = None
+        self._program_names_expire_at = 0.0
+        self._lock = threading.Lock()
+        self._user_generation = 0
+        self._program_generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get_user_program_ids(self, db: Session, user_id: str) -> FrozenSet[str]:
+        """Program IDs a user is assigned to."""
+        if self.enabled:
+            with self._lock:
+                entry = self._user_programs.get(user_id)
+                if entry is not None and entry[0] > time.monotonic():
+                    self._user_programs.move_to_end(user_id)
+                    return entry[1]
+                generation = self._user_generation
+
+        rows = db.query(UserProgramAssignment.program_id).filter(
+            UserProgramAssignment.user_id == user_id
+        ).all()
+        program_ids = frozenset(row.program_id for row in rows)
+
+        if self.enabled:
+            with self._lock:
+                if generation == self._user_generation:
+                    self._user_programs[user_id] = (time.monotonic() + self.ttl_seconds, program_ids)
+                    self._user_programs.move_to_end(user_id)
+                    while len(self._user_programs) > self.max_users:
+                        self._user_programs.popitem(last=False)
+        return program_ids
+
+    def get_program_names(self, db: Session) -> Dict[str, str]:
+        """Map of every program ID to its name."""
+        if self.enabled:
+            with self._lock:
+                if self._program_names is not None and self._program_names_expire_at > time.monotonic():
+                    return self._program_names
+                generation = self._program_generation
+
+        program_names = {row.id: row.name for row in db.query(Program.id, Program.name).all()}
+
+        if self.enabled:
+            with self._lock:
+                if generation == self._program_generation:
+                    self._program_names = program_names
+                    self._program_names_expire_at = time.monotonic() + self.ttl_seconds
+        return program_names
+
+    def get_program_name(self, db: Session, program_id: str) -> Optional[str]:
+        """Name of a program, or None if it does not exist."""
+        name = self.get_program_names(db).get(program_id)
+        if name is None and self.enabled:
+            # The cached map may predate a program created by another process
+            row = db.query(Program.name).filter(Program.id == program_id).first()
+            if row is not None:
+                self.invalidate_programs()
+                name = row.name
+        return name
+
+    def get_all_program_ids(self, db: Session) -> List[str]:
+        """IDs of every program."""
+        return list(self.get_program_names(db))
+
+    def has_access(self, db: Session, user: Any, program_id: str) -> bool:
+        """Whether a user is a super admin or assigned to the program."""
+        if user.primary_role == "super_admin":
+            return True
+        return program_id in self.get_user_program_ids(db, user.id)
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    def invalidate_users(self, user_ids: Iterable[str]) -> None:
+        """Drop cached assignments for the given users."""
+        with self._lock:
+            self._user_generation += 1
+            for user_id in user_ids:
+                self._user_programs.pop(user_id, None)
+
+    def invalidate_programs(self) -> None:
+        """Drop the cached program map."""
+        with self._lock:
+            self._program_generation += 1
+            self._program_names = None
+
+    def clear(self) -> None:
+        """Drop everything."""
+        with self._lock:
+            self._user_generation += 1
+            self._program_generation += 1
+            self._user_programs.clear()
+            self._program_names = None
+
+
+def _collect_changes(session: Session) -> Tuple[Set[str], bool]:
+    user_ids: Set[str] = set()
+    programs_changed = False
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, UserProgramAssignment):
+            if obj.user_id is not None:
+                user_ids.add(obj.user_id)
+            history = inspect(obj).attrs.user_id.history
+            user_ids.update(value for value in history.deleted if value is not None)
+        elif isinstance(obj, Program):
+            programs_changed = True
+    return user_ids, programs_changed
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_program_access_changes(session: Session, flush_context: Any, instances: Any) -> None:
+    user_ids, programs_changed = _collect_changes(session)
+    if user_ids or programs_changed:
+        pending = session.info.setdefault(_PENDING_CHANGES_KEY, {"user_ids": set(), "programs": False})
+        pending["user_ids"].update(user_ids)
+        pending["programs"] = pending["programs"] or programs_changed
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_program_access(session: Session) -> None:
+    pending = session.info.pop(_PENDING_CHANGES_KEY, None)
+    if not pending:
+        return
+    if pending["user_ids"]:
+        program_access.invalidate_users(pending["user_ids"])
+    if pending["programs"]:
+        program_access.invalidate_programs()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_program_access_changes(session: Session) -> None:
+    session.info.pop(_PENDING_CHANGES_KEY, None)
+
+
+# Global instance
+program_access = ProgramAccessResolver(
+    ttl_seconds=settings.PROGRAM_ACCESS_CACHE_TTL_SECONDS,
+    max_users=settings.PROGRAM_ACCESS_CACHE_MAX_USERS,
+)
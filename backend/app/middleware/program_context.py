@@ -14,8 +14,7 @@ from sqlalchemy.orm import Session
 
 from app.features.common.models.database import get_db
 from app.features.authentication.models.user import User
-from app.features.authentication.models.user_program_assignment import UserProgramAssignment
-from app.features.programs.models.program import Program
+from app.middleware.program_access import program_access
 
 
 class ProgramContextMiddleware:
@@ -81,17 +80,8 @@ async def validate_program_access(
     Returns:
         True if user has access, False otherwise
     """
-    # Super admin has access to all programs
-    if current_user.primary_role == "super_admin":
-        return True
-    
-    # Check if user has program assignment
-    assignment = db.query(UserProgramAssignment).filter(
-        UserProgramAssignment.user_id == current_user.id,
-        UserProgramAssignment.program_id == program_id
-    ).first()
-    
-    return assignment is not None
+    # Super admins pass; others are checked against the cached access matrix
+    return program_access.has_access(db, current_user, program_id)
 
 
 async def get_user_accessible_programs(
@@ -110,15 +100,9 @@ async def get_user_accessible_programs(
     """
     # Super admin has access to all programs
     if current_user.primary_role == "super_admin":
-        programs = db.query(Program.id).all()
-        return [p.id for p in programs]
-    
-    # Get user's program assignments
-    assignments = db.query(UserProgramAssignment.program_id).filter(
-        UserProgramAssignment.user_id == current_user.id
-    ).all()
+        return program_access.get_all_program_ids(db)
     
-    return [assignment.program_id for assignment in assignments]
+    return list(program_access.get_user_program_ids(db, current_user.id))
 
 
 def require_program_context(
@@ -176,8 +160,8 @@ async def validate_program_context_access(
         return None
     
     # Validate program exists
-    program = db.query(Program).filter(Program.id == program_context).first()
-    if not program:
+    program_name = program_access.get_program_name(db, program_context)
+    if program_name is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Program with ID '{program_context}' not found"
@@ -188,7 +172,7 @@ async def validate_program_context_access(
     if not has_access:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"You do not have access to program '{program.name}'"
+            detail=f"You do not have access to program '{program_name}'"
         )
     
     return program_context
@@ -245,8 +229,7 @@ def create_program_filter_dependency(current_user_dependency):
         # Validate program access
         has_access = await validate_program_access(program_context, current_user, db)
         if not has_access:
-            program = db.query(Program).filter(Program.id == program_context).first()
-            program_name = program.name if program else program_context
+            program_name = program_access.get_program_name(db, program_context) or program_context
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"You do not have access to program '{program_name}'"
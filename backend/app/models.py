@@ -11,6 +11,8 @@ for better maintainability and understanding.
 # ============================================================================
 from app.features.common.models.base import BaseModel, TimestampMixin
 from app.features.common.models.database import Base
+from app.features.common.models.dashboard_counter import DashboardCounter
+from app.features.common.models.outbox import OutboxMessage
 
 
 # ============================================================================
@@ -92,6 +94,15 @@ from app.features.progression.models.progression import (
     ProgressionAnalytics
 )
 
+# Flush events maintaining the denormalized program scope of the curriculum hierarchy
+import app.features.curricula.services.program_scope  # noqa: F401, E402
+
+# Flush events maintaining the materialized ancestry paths of the curriculum hierarchy
+import app.features.curricula.services.ancestry  # noqa: F401, E402
+
+# Flush events bumping curriculum structure versions for the tree cache
+import app.features.curricula.services.tree_cache  # noqa: F401, E402
+
 # ============================================================================
 # EXPORTED MODELS (Organized by Domain)
 # ============================================================================
@@ -101,6 +112,8 @@ __all__ = [
     "Base",
     "BaseModel", 
     "TimestampMixin",
+    "DashboardCounter",
+    "OutboxMessage",
     
     # Authentication & User Management
     "User",
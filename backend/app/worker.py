@@ -0,0 +1,49 @@
+"""
+Standalone outbox worker.
+
+Runs background work (media processing, notifications, ...) outside the API
+processes:
+
+    python -m app.worker                      # all registered topics
+    python -m app.worker media.processing     # selected topics only
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.features.common.services.outbox import outbox
+
+# Import all models and the services that register outbox handlers
+import app.models  # noqa: F401
+from app.features.media.services.media_processing import media_processor
+from app.features.scheduling.services.notification_service import notification_service  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the outbox worker")
+    parser.add_argument("topics", nargs="*", help="Topics to drain (default: all registered topics)")
+    parser.add_argument("--poll-interval", type=float, default=settings.OUTBOX_POLL_INTERVAL_SECONDS or 2.0)
+    parser.add_argument("--concurrency", type=int, default=settings.OUTBOX_WORKER_CONCURRENCY)
+    args = parser.parse_args()
+
+    unknown = set(args.topics) - set(outbox.topics)
+    if unknown:
+        parser.error(f"Unknown topics: {', '.join(sorted(unknown))} (registered: {', '.join(outbox.topics)})")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    topics = args.topics or outbox.topics
+    logger.info(f"Outbox worker draining {', '.join(topics)}")
+    try:
+        asyncio.run(outbox.run_periodically(args.poll_interval, args.concurrency, topics))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        media_processor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -63,6 +63,10 @@ from app.features.progression.models.progression import (
     StudentModuleUnlock, StudentLevelAssessment, ProgressionAnalytics
 )
 
+# Dashboard Models
+from app.features.common.models.dashboard_counter import DashboardCounter
+from app.features.common.models.outbox import OutboxMessage
+
 # Create database engine
 engine = create_engine(settings.DATABASE_URL)
 
@@ -0,0 +1,162 @@
+"""
+Shared fixtures for unit tests that need the curriculum hierarchy or the
+user, family and enrollment tables on SQLite.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import ARRAY, JSON, create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401  (configures every mapper the hierarchy relates to)
+from app.features.authentication.models.user import User
+from app.features.common.models.dashboard_counter import DashboardCounter
+from app.features.common.models.database import Base
+from app.features.content.models.assessment import AssessmentCriteria, AssessmentRubric
+from app.features.content.models.lesson import Lesson
+from app.features.courses.models.course import Course
+from app.features.curricula.models.curriculum import Curriculum
+from app.features.curricula.models.level import Level
+from app.features.curricula.models.module import Module
+from app.features.curricula.models.section import Section
+from app.features.enrollments.models.course_enrollment import CourseEnrollment
+from app.features.enrollments.models.program_assignment import ProgramAssignment
+from app.features.equipment.models.equipment import EquipmentRequirement
+from app.features.media.models.media import MediaLibrary
+from app.features.organizations.models.organization_membership import OrganizationMembership
+from app.features.parents.models.parent import Parent
+from app.features.parents.models.parent_child_relationship import ParentChildRelationship
+from app.features.programs.models.program import Program
+from app.features.progression.models.progression import LevelAssessmentCriteria
+from app.features.students.models.student import Student
+
+HIERARCHY_MODELS = (Program, Course, Curriculum, Level, Module, Section, Lesson, MediaLibrary)
+# Copied along with the hierarchy by curriculum duplication
+LEVEL_CONTENT_MODELS = (AssessmentRubric, AssessmentCriteria, LevelAssessmentCriteria, EquipmentRequirement)
+# Users with their family, program assignment and enrollment rows
+PEOPLE_MODELS = (
+    User, Parent, Student, ParentChildRelationship, ProgramAssignment, CourseEnrollment, OrganizationMembership,
+    DashboardCounter,
+)
+
+
+@compiles(JSONB, "sqlite")
+@compiles(ARRAY, "sqlite")
+def _compile_json_on_sqlite(type_, compiler, **kw):
+    # PostgreSQL-only column types
+    return "JSON"
+
+
+def _sqlite_session(monkeypatch, models):
+    """In-memory SQLite session with the tables of the given models."""
+    engine = create_engine("sqlite://")
+    tables = [model.__table__ for model in models]
+    for table in tables:
+        for column in table.columns:
+            if isinstance(column.type, ARRAY):
+                # Arrays are stored as JSON lists (SQLite cannot bind lists)
+                monkeypatch.setattr(column, "type", JSON())
+    with monkeypatch.context() as patch:
+        for table in tables:
+            # gen_random_uuid() does not exist on SQLite; the tests assign IDs
+            for column in table.primary_key.columns:
+                if column.server_default is not None and "gen_random_uuid" in str(column.server_default.arg):
+                    patch.setattr(column, "server_default", None)
+        Base.metadata.create_all(engine, tables=tables)
+    session = Session(engine)
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def curriculum_db(monkeypatch):
+    """In-memory SQLite session with the program -> media hierarchy tables."""
+    yield from _sqlite_session(monkeypatch, HIERARCHY_MODELS + LEVEL_CONTENT_MODELS + (DashboardCounter,))
+
+
+@pytest.fixture
+def people_db(monkeypatch):
+    """In-memory SQLite session with the user, family, assignment and enrollment tables."""
+    yield from _sqlite_session(monkeypatch, PEOPLE_MODELS)
+
+
+@pytest.fixture
+def make_user(people_db):
+    """Factory adding an active user."""
+
+    def build(user_id: str, first_name: str, last_name: str, roles=("student",)) -> User:
+        user = User(
+            id=user_id,
+            username=user_id,
+            email=f"{user_id}@example.com",
+            first_name=first_name,
+            last_name=last_name,
+            full_name=f"{first_name} {last_name}",
+            roles=list(roles),
+            primary_role=roles[0],
+            is_active=True,
+        )
+        people_db.add(user)
+        people_db.commit()
+        return user
+
+    return build
+
+
+@pytest.fixture
+def curriculum_tree(curriculum_db):
+    """Factory adding one program -> course -> curriculum -> level -> module -> section -> lesson chain."""
+
+    def build(prefix: str, program: Program = None, course: Course = None) -> SimpleNamespace:
+        if course is None:
+            if program is None:
+                program = Program(id=f"{prefix}-program", name=f"{prefix} program", display_order=1)
+                curriculum_db.add(program)
+            course = Course(
+                id=f"{prefix}-course",
+                program_id=program.id,
+                name=f"{prefix} course",
+                code=f"{prefix}-C",
+                age_groups=[],
+                location_types=[],
+                session_types=[],
+                pricing_ranges=[],
+                sequence=1,
+            )
+            curriculum_db.add(course)
+        curriculum = Curriculum(
+            id=f"{prefix}-curriculum",
+            course_id=course.id,
+            name=f"{prefix} curriculum",
+            difficulty_level="beginner",
+            age_ranges=[],
+            status="draft",
+            sequence=1,
+        )
+        level = Level(id=f"{prefix}-level", curriculum_id=curriculum.id, name=f"{prefix} level", sequence_order=1)
+        module = Module(id=f"{prefix}-module", level_id=level.id, name=f"{prefix} module", sequence_order=1)
+        section = Section(id=f"{prefix}-section", module_id=module.id, name=f"{prefix} section", sequence_order=1)
+        lesson = Lesson(
+            id=f"{prefix}-lesson",
+            section_id=section.id,
+            lesson_id=f"{prefix}-L1",
+            title=f"{prefix} lesson",
+            sequence_order=1,
+        )
+        curriculum_db.add_all([curriculum, level, module, section, lesson])
+        curriculum_db.commit()
+        return SimpleNamespace(
+            program_id=course.program_id,
+            course=course,
+            curriculum=curriculum,
+            level=level,
+            module=module,
+            section=section,
+            lesson=lesson,
+        )
+
+    return build
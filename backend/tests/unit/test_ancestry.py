@@ -0,0 +1,133 @@
+"""
+Tests for materialized ancestry paths of the curriculum hierarchy.
+"""
+
+from sqlalchemy import update
+
+from app.features.curricula.models.curriculum import Curriculum
+from app.features.curricula.models.section import Section
+from app.features.curricula.services.ancestry import join_path, load_breadcrumbs, parse_path, refresh_paths
+
+
+class TestAncestryPaths:
+    """Test class for path encoding."""
+
+    def test_join_path(self):
+        assert join_path("p1", "c1", "cu1") == "p1/c1/cu1"
+
+    def test_join_path_with_missing_ancestor(self):
+        assert join_path("p1", None) is None
+
+    def test_parse_lesson_path(self):
+        assert parse_path("p1/c1/cu1/l1/m1/s1") == [
+            ("program", "p1"),
+            ("course", "c1"),
+            ("curriculum", "cu1"),
+            ("level", "l1"),
+            ("module", "m1"),
+            ("section", "s1"),
+        ]
+
+    def test_parse_partial_path(self):
+        assert parse_path("p1/c1") == [("program", "p1"), ("course", "c1")]
+
+    def test_parse_missing_path(self):
+        assert parse_path(None) == []
+        assert parse_path("") == []
+
+
+def lesson_path(prefix, program=None, course=None, curriculum=None):
+    program = program or prefix
+    course = course or prefix
+    curriculum = curriculum or prefix
+    return f"{program}-program/{course}-course/{curriculum}-curriculum/{prefix}-level/{prefix}-module/{prefix}-section"
+
+
+class TestPathMaintenance:
+    """Test class for keeping ancestry paths current."""
+
+    def test_paths_set_on_insert(self, curriculum_tree):
+        """Test rows inserted with their parents get their ancestors' IDs."""
+        tree = curriculum_tree("a")
+
+        assert tree.level.ancestry_path == "a-program/a-course/a-curriculum"
+        assert tree.lesson.ancestry_path == lesson_path("a")
+
+    def test_moved_section_takes_new_path(self, curriculum_db, curriculum_tree):
+        """Test moving a section rewrites its path and its lessons' paths."""
+        a = curriculum_tree("a")
+        b = curriculum_tree("b")
+
+        a.section.module_id = b.module.id
+        curriculum_db.commit()
+
+        assert a.section.ancestry_path == "b-program/b-course/b-curriculum/b-level/b-module"
+        assert a.lesson.ancestry_path.startswith(a.section.ancestry_path + "/a-section")
+
+    def test_refresh_paths_below_curriculum(self, curriculum_db, curriculum_tree):
+        """Test refresh_paths repairs everything below a curriculum moved with raw SQL."""
+        a = curriculum_tree("a")
+        b = curriculum_tree("b")
+        connection = curriculum_db.connection()
+        connection.execute(
+            update(Curriculum.__table__).where(Curriculum.id == a.curriculum.id).values(course_id=b.course.id)
+        )
+
+        refresh_paths(connection, curriculum_ids=[a.curriculum.id])
+        curriculum_db.commit()
+
+        assert a.level.ancestry_path == "b-program/b-course/a-curriculum"
+        assert a.lesson.ancestry_path == lesson_path("a", program="b", course="b")
+        assert b.lesson.ancestry_path == lesson_path("b")
+
+    def test_refresh_paths_for_rows(self, curriculum_db, curriculum_tree):
+        """Test refresh_paths recomputes the given rows and the rows below them only."""
+        a = curriculum_tree("a")
+        b = curriculum_tree("b")
+        connection = curriculum_db.connection()
+        connection.execute(
+            update(Section.__table__).where(Section.id == a.section.id).values(module_id=b.module.id)
+        )
+
+        refresh_paths(connection, row_ids={Section: [a.section.id]})
+        curriculum_db.commit()
+
+        assert a.lesson.ancestry_path == "b-program/b-course/b-curriculum/b-level/b-module/a-section"
+        assert a.module.ancestry_path == "a-program/a-course/a-curriculum/a-level"
+
+
+class TestBreadcrumbs:
+    """Test class for load_breadcrumbs."""
+
+    def test_breadcrumbs_for_several_paths(self, curriculum_db, curriculum_tree):
+        """Test every distinct path resolves to its named ancestors, top-down."""
+        a = curriculum_tree("a")
+        b = curriculum_tree("b")
+
+        paths = [a.lesson.ancestry_path, b.level.ancestry_path, a.lesson.ancestry_path, None]
+
+        crumbs = load_breadcrumbs(curriculum_db, paths)
+
+        assert set(crumbs) == {a.lesson.ancestry_path, b.level.ancestry_path}
+        assert [(crumb.type, crumb.name) for crumb in crumbs[a.lesson.ancestry_path]] == [
+            ("program", "a program"),
+            ("course", "a course"),
+            ("curriculum", "a curriculum"),
+            ("level", "a level"),
+            ("module", "a module"),
+            ("section", "a section"),
+        ]
+        assert [crumb.id for crumb in crumbs[b.level.ancestry_path]] == ["b-program", "b-course", "b-curriculum"]
+        assert crumbs[b.level.ancestry_path][0].sequence == 1
+
+    def test_missing_ancestors_are_left_out(self, curriculum_db, curriculum_tree):
+        """Test an ancestor that no longer exists is skipped instead of failing the lookup."""
+        curriculum_tree("a")
+
+        crumbs = load_breadcrumbs(curriculum_db, ["a-program/gone-course/a-curriculum"])
+
+        assert [crumb.id for crumb in crumbs["a-program/gone-course/a-curriculum"]] == ["a-program", "a-curriculum"]
+
+    def test_no_paths(self, curriculum_db):
+        """Test nothing is queried without paths."""
+        assert load_breadcrumbs(curriculum_db, [None, ""]) == {}
@@ -0,0 +1,74 @@
+"""
+Tests for the async database engine helpers and AsyncBaseService.
+"""
+
+import pytest
+from sqlalchemy import Column, String
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+
+from app.features.common.models.database import get_async_database_url
+from app.features.common.services.async_base_service import AsyncBaseService
+
+
+AsyncTestBase = declarative_base()
+
+
+class Widget(AsyncTestBase):
+    """Minimal table used to exercise the async CRUD helpers."""
+
+    __tablename__ = "async_widgets"
+
+    id = Column(String(36), primary_key=True)
+    name = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=True)
+
+
+class TestAsyncDatabaseUrl:
+    """Test class for async driver URL derivation."""
+
+    @pytest.mark.parametrize("sync_url, async_url", [
+        ("postgresql://user:secret@db:5432/academy", "postgresql+asyncpg://user:secret@db:5432/academy"),
+        ("postgresql+psycopg2://user@db/academy", "postgresql+asyncpg://user@db/academy"),
+        ("sqlite:///./academy_admin.db", "sqlite+aiosqlite:///./academy_admin.db"),
+    ])
+    def test_sync_url_maps_to_async_driver(self, sync_url, async_url):
+        """Test sync URLs are rewritten to the matching async driver."""
+        assert get_async_database_url(sync_url) == async_url
+
+    def test_unsupported_backend_raises(self):
+        """Test backends without an async driver are rejected."""
+        with pytest.raises(ValueError):
+            get_async_database_url("mssql+pyodbc://user@server/db")
+
+
+class TestAsyncBaseService:
+    """Test class for AsyncBaseService functionality."""
+
+    @pytest.mark.asyncio
+    async def test_crud_and_pagination(self):
+        """Test create, get, paginated listing, update and delete on an AsyncSession."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(AsyncTestBase.metadata.create_all)
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        service = AsyncBaseService(Widget)
+
+        async with session_factory() as db:
+            for index in range(5):
+                await service.create(db, {"name": f"widget-{index}", "status": "active" if index % 2 else "draft"})
+
+            items, total = await service.get_multi(
+                db, skip=1, limit=2, filters={"status": "active"}, sort_by="name"
+            )
+            assert total == 2
+            assert [item.name for item in items] == ["widget-3"]
+
+            widget = items[0]
+            await service.update(db, widget, {"name": "renamed"})
+            assert (await service.get(db, widget.id)).name == "renamed"
+
+            assert await service.delete(db, widget.id) is True
+            assert await service.count(db) == 4
+
+        await engine.dispose()
@@ -0,0 +1,135 @@
+"""
+Tests for content-addressed media storage.
+"""
+
+import hashlib
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from app.features.media.services import media_service as media_service_module
+from app.features.media.services.blob_store import ContentAddressedStore
+from app.features.media.services.media_service import media_service
+
+
+class FakeDB:
+    """Session stub for the store: not PostgreSQL, records deletes and commits."""
+
+    def __init__(self):
+        self.deleted = []
+        self.commits = 0
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="sqlite"))
+
+    def delete(self, obj):
+        self.deleted.append(obj)
+
+    def commit(self):
+        self.commits += 1
+
+
+def write(path, content: bytes) -> str:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(content)
+    return str(path)
+
+
+def digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Store rooted in a temporary directory whose reference counts are set per test."""
+    store = ContentAddressedStore(str(tmp_path / "blobs"))
+    store.counts = {}
+    store.references = lambda db, sha256: store.counts.get(sha256, 0)
+    return store
+
+
+class TestContentAddressedStore:
+    """Test class for ContentAddressedStore functionality."""
+
+    def test_put_moves_new_content_into_the_store(self, store, tmp_path):
+        """Test new content is moved under its sharded digest path."""
+        sha256 = digest(b"clip")
+        source = write(tmp_path / "upload" / "clip.mp4", b"clip")
+
+        blob_path = store.put(FakeDB(), source, sha256)
+
+        assert blob_path == os.path.join(store.root, sha256[:2], sha256[2:4], sha256)
+        assert open(blob_path, "rb").read() == b"clip"
+        assert not os.path.exists(source)
+
+    def test_put_deduplicates_and_removes_the_source(self, store, tmp_path):
+        """Test storing existing content keeps one blob and drops the new copy."""
+        sha256 = digest(b"clip")
+        first = store.put(FakeDB(), write(tmp_path / "a" / "clip.mp4", b"clip"), sha256)
+        source = write(tmp_path / "b" / "clip.mp4", b"clip")
+
+        second = store.put(FakeDB(), source, sha256)
+
+        assert second == first
+        assert not os.path.exists(source)
+        assert os.listdir(os.path.dirname(first)) == [sha256]
+
+    def test_collect_keeps_referenced_blob(self, store, tmp_path):
+        """Test a blob survives while any row still references it."""
+        sha256 = digest(b"clip")
+        blob_path = store.put(FakeDB(), write(tmp_path / "clip.mp4", b"clip"), sha256)
+        store.counts[sha256] = 1
+        db = FakeDB()
+
+        assert store.collect(db, sha256) is False
+        assert os.path.exists(blob_path)
+        assert db.commits == 1
+
+    def test_collect_removes_unreferenced_blob(self, store, tmp_path):
+        """Test the blob goes once nothing references it."""
+        sha256 = digest(b"clip")
+        blob_path = store.put(FakeDB(), write(tmp_path / "clip.mp4", b"clip"), sha256)
+
+        assert store.collect(FakeDB(), sha256) is True
+        assert not os.path.exists(blob_path)
+        assert store.collect(FakeDB(), sha256) is False
+
+    def test_invalid_digest_and_store_paths(self, store, tmp_path):
+        """Test malformed digests are rejected and only store paths count as blobs."""
+        with pytest.raises(ValueError):
+            store.path_for("../../etc/passwd")
+        assert store.contains_path(store.path_for("a" * 64))
+        assert not store.contains_path(str(tmp_path / "elsewhere" / ("a" * 64)))
+        assert not store.contains_path(None)
+
+
+class TestDeleteMedia:
+    """Test class for deleting media backed by the store."""
+
+    @pytest.fixture
+    def media(self, store, tmp_path, monkeypatch):
+        sha256 = digest(b"clip")
+        blob_path = store.put(FakeDB(), write(tmp_path / "clip.mp4", b"clip"), sha256)
+        media = SimpleNamespace(id="m1", file_url=blob_path, thumbnail_url=None, content_sha256=sha256)
+        monkeypatch.setattr(media_service_module, "blob_store", store)
+        monkeypatch.setattr(media_service, "_get_media_with_program_check", lambda db, media_id, program: media)
+        return media
+
+    def test_deleting_last_reference_removes_blob(self, media, store):
+        """Test the blob is collected with its last referencing row."""
+        db = FakeDB()
+
+        assert media_service.delete_media(db, "m1") is True
+
+        assert db.deleted == [media]
+        assert not os.path.exists(media.file_url)
+
+    def test_deleting_one_of_several_references_keeps_blob(self, media, store):
+        """Test a blob shared with another row stays on disk."""
+        store.counts[media.content_sha256] = 1
+
+        assert media_service.delete_media(FakeDB(), "m1") is True
+
+        assert os.path.exists(media.file_url)
@@ -0,0 +1,124 @@
+"""
+Tests for the scheduling interval tree and conflict engine.
+"""
+
+import random
+from datetime import datetime, time, timedelta
+from types import SimpleNamespace
+
+from app.features.scheduling.services.conflict_engine import (
+    BusyInterval,
+    ConflictEngine,
+    IntervalTree,
+    requires_precheck,
+)
+
+
+BASE = datetime(2025, 3, 3, 0, 0)  # a Monday
+
+
+def at(hour: float, day: int = 0) -> datetime:
+    return BASE + timedelta(days=day, hours=hour)
+
+
+def busy(start: datetime, end: datetime, session_id: str, resource: str = "facility", slot: int = 0) -> BusyInterval:
+    return BusyInterval(start, end, session_id, resource, slot)
+
+
+def make_settings(open_hour=8, close_hour=18, buffer_minutes=0, max_concurrent=1):
+    """Plain settings object with the FacilityScheduleSettings surface used by the engine."""
+    hours = (time(open_hour), time(close_hour))
+    return SimpleNamespace(
+        max_concurrent_sessions=max_concurrent,
+        get_operating_hours=lambda day_of_week: hours if day_of_week < 5 else (None, None),
+        get_total_buffer_time_minutes=lambda: buffer_minutes,
+    )
+
+
+class TestIntervalTree:
+    """Test class for IntervalTree overlap queries."""
+
+    def test_matches_brute_force(self):
+        """Test overlap queries agree with a linear scan on random intervals."""
+        rng = random.Random(7)
+        intervals = []
+        for index in range(200):
+            start = at(rng.uniform(0, 100))
+            intervals.append(busy(start, start + timedelta(hours=rng.uniform(0.25, 6)), str(index)))
+        tree = IntervalTree(intervals)
+
+        for _ in range(100):
+            start = at(rng.uniform(0, 100))
+            end = start + timedelta(hours=rng.uniform(0.25, 4))
+            expected = {i.session_id for i in intervals if i.start < end and i.end > start}
+            assert {i.session_id for i in tree.overlapping(start, end)} == expected
+
+    def test_touching_intervals_do_not_overlap(self):
+        """Test half-open semantics: back-to-back slots are not conflicts."""
+        tree = IntervalTree([busy(at(9), at(10), "a")])
+
+        assert tree.overlapping(at(10), at(11)) == []
+        assert tree.overlapping(at(8), at(9)) == []
+        assert [i.session_id for i in tree.overlapping(at(9.5), at(10.5))] == ["a"]
+
+
+class TestConflictEngine:
+    """Test class for ConflictEngine checks and free-slot search."""
+
+    def test_max_concurrent_sessions_allows_overlap(self):
+        """Test overlaps only conflict once every facility slot is taken."""
+        engine = ConflictEngine(
+            [busy(at(9), at(10), "a", slot=0), busy(at(9.5), at(11), "b", slot=1)],
+            {},
+            make_settings(max_concurrent=2),
+        )
+
+        assert engine.facility_conflicts(at(10), at(12)) == []
+        assert engine.free_facility_slot(at(10), at(12)) == 0
+        assert {i.session_id for i in engine.facility_conflicts(at(9.5), at(10))} == {"a", "b"}
+        assert engine.free_facility_slot(at(9.5), at(10)) is None
+
+    def test_next_free_slots_respects_hours_and_instructors(self):
+        """Test suggestions skip instructor bookings and stay within operating hours."""
+        engine = ConflictEngine(
+            [busy(at(9), at(12), "a")],
+            {"inst-1": [busy(at(12), at(17), "b", "inst-1")]},
+            make_settings(open_hour=8, close_hour=18),
+        )
+
+        slots = engine.next_free_slots(at(9), timedelta(hours=2), count=2)
+
+        assert [(slot.start_time, slot.end_time) for slot in slots] == [
+            (at(8, day=1), at(10, day=1)),
+            (at(10, day=1), at(12, day=1)),
+        ]
+
+    def test_buffer_widens_facility_sessions(self):
+        """Test the setup/cleanup buffer keeps suggestions away from existing sessions."""
+        settings = make_settings(buffer_minutes=30)
+        buffer = timedelta(minutes=30)
+        engine = ConflictEngine([busy(at(9) - buffer, at(10) + buffer, "a")], {}, settings)
+
+        assert engine.has_conflicts(at(10), at(11))
+        assert [slot.start_time for slot in engine.next_free_slots(at(9), timedelta(hours=1), count=1)] == [
+            at(10.5)
+        ]
+
+
+class TestRequiresPrecheck:
+    """Test class for deciding when the in-memory check must run."""
+
+    def test_postgresql_relies_on_constraints_for_plain_facilities(self):
+        """Test plain facilities skip the pre-check where exclusion constraints exist."""
+        assert not requires_precheck(None, "postgresql")
+        assert not requires_precheck(make_settings(), "postgresql")
+
+    def test_postgresql_checks_buffers_and_slots(self):
+        """Test buffers and concurrency slots always need the engine."""
+        assert requires_precheck(make_settings(buffer_minutes=10), "postgresql")
+        assert requires_precheck(make_settings(max_concurrent=2), "postgresql")
+
+    def test_other_databases_always_check(self):
+        """Test databases without exclusion constraints check every booking."""
+        assert requires_precheck(None, "sqlite")
+        assert requires_precheck(make_settings(), "sqlite")
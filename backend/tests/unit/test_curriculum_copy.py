@@ -0,0 +1,120 @@
+"""
+Tests for the set-based deep copy of curriculum content.
+"""
+
+from types import SimpleNamespace
+
+from app.features.common.models.enums import MediaType
+from app.features.content.models.lesson import Lesson
+from app.features.curricula.models.curriculum import Curriculum
+from app.features.curricula.models.level import Level
+from app.features.curricula.models.module import Module
+from app.features.curricula.models.section import Section
+from app.features.curricula.services.curriculum_copy import copy_curriculum_content
+from app.features.equipment.models.equipment import EquipmentRequirement
+from app.features.media.models.media import MediaLibrary
+
+
+def copy_options(**enabled):
+    options = {"copy_assessments": False, "copy_equipment": False, "copy_media": False}
+    options.update(enabled)
+    return SimpleNamespace(**options)
+
+
+class TestCurriculumCopy:
+    """Test class for copy_curriculum_content."""
+
+    def make_target(self, curriculum_db, curriculum_tree):
+        """Source tree in program a and an empty target curriculum in program b."""
+        source = curriculum_tree("a")
+        other = curriculum_tree("b")
+        target = Curriculum(
+            id="copy-curriculum",
+            course_id=other.course.id,
+            name="Copy",
+            difficulty_level="beginner",
+            age_ranges=[],
+            status="draft",
+        )
+        curriculum_db.add(target)
+        curriculum_db.commit()
+        return source, target
+
+    def run_copy(self, curriculum_db, source, target, **enabled):
+        copied = copy_curriculum_content(
+            curriculum_db, source.curriculum.id, target.id, "b-program", copy_options(**enabled), created_by="u1"
+        )
+        curriculum_db.commit()
+        return copied
+
+    def test_copies_tree_with_new_ids_and_target_scope(self, curriculum_db, curriculum_tree):
+        """Test copied rows get new IDs, remapped parents, the target scope and paths."""
+        source, target = self.make_target(curriculum_db, curriculum_tree)
+
+        copied = self.run_copy(curriculum_db, source, target)
+
+        assert copied == {"levels": 1, "modules": 1, "sections": 1, "lessons": 1}
+        level = curriculum_db.query(Level).filter(Level.curriculum_id == target.id).one()
+        module = curriculum_db.query(Module).filter(Module.level_id == level.id).one()
+        section = curriculum_db.query(Section).filter(Section.module_id == module.id).one()
+        lesson = curriculum_db.query(Lesson).filter(Lesson.section_id == section.id).one()
+
+        assert level.id != source.level.id
+        assert (level.name, level.sequence_order) == (source.level.name, source.level.sequence_order)
+        assert (lesson.lesson_id, lesson.title) == (source.lesson.lesson_id, source.lesson.title)
+        for row in (module, section, lesson):
+            assert (row.curriculum_id, row.program_id) == (target.id, "b-program")
+        assert level.program_id == "b-program"
+        assert lesson.created_by == "u1"
+        assert level.ancestry_path == "b-program/b-course/copy-curriculum"
+        assert lesson.ancestry_path == f"{level.ancestry_path}/{level.id}/{module.id}/{section.id}"
+
+        # The source is left as it was
+        curriculum_db.refresh(source.lesson)
+        assert (source.lesson.section_id, source.lesson.program_id) == (source.section.id, "a-program")
+
+    def test_options_gate_optional_tables(self, curriculum_db, curriculum_tree):
+        """Test equipment and media are only copied when their option is set."""
+        source, target = self.make_target(curriculum_db, curriculum_tree)
+        curriculum_db.add_all([
+            EquipmentRequirement(id="a-goggles", level_id=source.level.id, equipment_name="Goggles"),
+            MediaLibrary(
+                id="a-media",
+                lesson_id=source.lesson.id,
+                file_name="clip.mp4",
+                original_file_name="clip.mp4",
+                file_type=MediaType.VIDEO,
+                file_url="/media/clip.mp4",
+            ),
+        ])
+        curriculum_db.commit()
+
+        copied = self.run_copy(curriculum_db, source, target, copy_equipment=True)
+
+        assert copied["equipment_requirements"] == 1
+        assert "media_library" not in copied
+        assert "assessment_rubrics" not in copied
+        level = curriculum_db.query(Level).filter(Level.curriculum_id == target.id).one()
+        equipment = curriculum_db.query(EquipmentRequirement).filter(EquipmentRequirement.level_id == level.id).one()
+        assert equipment.equipment_name == "Goggles"
+        assert curriculum_db.query(MediaLibrary).count() == 1
+
+    def test_copy_media(self, curriculum_db, curriculum_tree):
+        """Test media rows follow their copied lesson into the target program."""
+        source, target = self.make_target(curriculum_db, curriculum_tree)
+        curriculum_db.add(MediaLibrary(
+            id="a-media",
+            lesson_id=source.lesson.id,
+            file_name="clip.mp4",
+            original_file_name="clip.mp4",
+            file_type=MediaType.VIDEO,
+            file_url="/media/clip.mp4",
+        ))
+        curriculum_db.commit()
+
+        self.run_copy(curriculum_db, source, target, copy_media=True)
+
+        media = curriculum_db.query(MediaLibrary).filter(MediaLibrary.id != "a-media").one()
+        lesson = curriculum_db.query(Lesson).filter(Lesson.curriculum_id == target.id).one()
+        assert (media.lesson_id, media.curriculum_id, media.program_id) == (lesson.id, target.id, "b-program")
+        assert media.file_url == "/media/clip.mp4"
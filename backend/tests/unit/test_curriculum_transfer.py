@@ -0,0 +1,185 @@
+"""
+Tests for the curriculum export record stream and its import.
+"""
+
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.features.common.models.enums import CurriculumStatus
+from app.features.content.models.lesson import Lesson
+from app.features.courses.schemas.advanced import ExportFormat
+from app.features.courses.services.curriculum_transfer import (
+    TRANSFER_TABLES,
+    CurriculumExporter,
+    CurriculumImporter,
+    DecodeFailure,
+    _jsonable,
+    owning_programs,
+    read_records,
+)
+from app.features.curricula.models.curriculum import Curriculum
+from app.features.curricula.models.module import Module
+
+
+class TestCurriculumTransfer:
+    """Test class for record encoding and decoding."""
+
+    def test_parents_come_before_children(self):
+        seen = {"program"}
+        for spec in TRANSFER_TABLES:
+            assert spec.parent_type in seen
+            seen.add(spec.type)
+
+    def test_generated_columns_are_not_exported(self):
+        for spec in TRANSFER_TABLES:
+            names = {column.name for column in spec.columns}
+            assert not names & {"id", "created_at", "updated_at", "ancestry_path", "structure_version"}
+            assert spec.parent_key in names
+
+    def test_jsonable_values(self):
+        assert _jsonable(CurriculumStatus.DRAFT) == CurriculumStatus.DRAFT.value
+        assert _jsonable(datetime(2025, 8, 1, 12, 30)) == "2025-08-01T12:30:00"
+        assert _jsonable(Decimal("1.50")) == "1.50"
+        assert _jsonable({"a": 1}) == {"a": 1}
+
+    def test_read_ndjson_records(self):
+        lines = [
+            json.dumps({"type": "header", "version": 1}),
+            "",
+            "{not json",
+            json.dumps({"type": "level", "id": "l1", "data": {}}),
+        ]
+        stream = io.BytesIO("\n".join(lines).encode())
+
+        records = list(read_records(stream, ExportFormat.NDJSON))
+
+        assert records[0] == {"type": "header", "version": 1}
+        assert isinstance(records[1], DecodeFailure)
+        assert records[1].position == 3
+        assert records[2]["id"] == "l1"
+
+
+class TestProgramScope:
+    """Test class for the program checks of exports and custom mappings."""
+
+    def test_exporter_program_is_the_root_of_its_path(self):
+        exporter = CurriculumExporter("level", "l1", "p1/c1/cur1/l1", ExportFormat.NDJSON, None)
+
+        assert exporter.program_id == "p1"
+
+    def test_owning_programs(self, curriculum_db, curriculum_tree):
+        tree = curriculum_tree("a")
+        ids = [tree.program_id, tree.course.id, tree.curriculum.id, tree.level.id, tree.lesson.id]
+
+        programs = owning_programs(curriculum_db, ids + ["missing"])
+
+        assert programs == {row_id: tree.program_id for row_id in ids}
+
+    def test_mappings_must_target_the_target_program(self, curriculum_db, curriculum_tree):
+        a = curriculum_tree("a")
+        b = curriculum_tree("b")
+
+        CurriculumImporter(curriculum_db, a.program_id, {"source": a.curriculum.id}).check_mappings()
+        for target in (b.curriculum.id, b.program_id, "missing"):
+            importer = CurriculumImporter(curriculum_db, a.program_id, {"source": target})
+            with pytest.raises(ValueError, match=target):
+                importer.check_mappings()
+
+
+def export_records(db, root_type, root_id, format=ExportFormat.NDJSON):
+    """Records of an export, encoded and read back as the import endpoints do."""
+    exporter = CurriculumExporter.for_root(db, root_type, root_id, format, None)
+    encode = exporter._encoder()
+    payload = b"".join(encode(record) for record in exporter.iter_records(db))
+    return list(read_records(io.BytesIO(payload), format))
+
+
+class TestCurriculumImport:
+    """Test class for CurriculumImporter.run."""
+
+    def import_into(self, db, records, target, **kwargs):
+        """Import records below another tree's course."""
+        importer = CurriculumImporter(
+            db, target.program_id, {"a-course": target.course.id}, created_by="u1", **kwargs
+        )
+        result = importer.run(records)
+        db.commit()
+        return importer, result
+
+    @pytest.mark.parametrize("format", [ExportFormat.NDJSON, ExportFormat.MSGPACK])
+    def test_round_trip(self, curriculum_db, curriculum_tree, format):
+        """Test an exported curriculum imports below another course with new IDs, scope, paths and version."""
+        curriculum_tree("a")
+        target = curriculum_tree("b")
+        records = export_records(curriculum_db, "curriculum", "a-curriculum", format)
+        assert [record["type"] for record in records] == ["header", "curriculum", "level", "module", "section", "lesson"]
+
+        importer, result = self.import_into(curriculum_db, records, target, batch_size=2)
+
+        assert result["failed"] == []
+        assert result["total_successful"] == result["total_processed"] == 5
+        new_ids = importer.id_map
+        assert set(result["successful"]) == {new_ids[record["id"]] for record in records[1:]}
+        assert "a-curriculum" not in result["successful"]
+
+        curriculum = curriculum_db.get(Curriculum, new_ids["a-curriculum"])
+        assert (curriculum.course_id, curriculum.name, curriculum.created_by) == ("b-course", "a curriculum", "u1")
+        assert curriculum.structure_version > 1
+        lesson = curriculum_db.get(Lesson, new_ids["a-lesson"])
+        assert (lesson.lesson_id, lesson.title) == ("a-L1", "a lesson")
+        assert (lesson.curriculum_id, lesson.program_id) == (curriculum.id, "b-program")
+        assert lesson.ancestry_path == "/".join([
+            "b-program", "b-course", curriculum.id, new_ids["a-level"], new_ids["a-module"], new_ids["a-section"]
+        ])
+
+    def test_children_of_a_bad_record_fail_with_it(self, curriculum_db, curriculum_tree):
+        """Test an invalid record is reported and its descendants fail instead of being orphaned."""
+        curriculum_tree("a")
+        target = curriculum_tree("b")
+        records = export_records(curriculum_db, "curriculum", "a-curriculum")
+        del records[3]["data"]["name"]  # the module
+
+        importer, result = self.import_into(curriculum_db, records, target)
+
+        assert [(failure["type"], failure["id"]) for failure in result["failed"]] == [
+            ("module", "a-module"),
+            ("section", "a-section"),
+            ("lesson", "a-lesson"),
+        ]
+        assert "Missing required field 'name'" in result["failed"][0]["error"]
+        assert "not in the import" in result["failed"][1]["error"]
+        assert result["total_successful"] == 2
+        assert curriculum_db.query(Module).filter(Module.level_id == importer.id_map["a-level"]).count() == 0
+
+    def test_failed_insert_is_retried_row_by_row(self, curriculum_db, curriculum_tree, monkeypatch):
+        """Test a batch that fails to insert is retried one row at a time and only the bad row fails."""
+        tree = curriculum_tree("a")
+        curriculum_db.add_all([
+            Lesson(id=f"a-lesson{n}", section_id=tree.section.id, lesson_id=f"a-L{n}", title=title, sequence_order=n)
+            for n, title in [(2, "boom"), (3, "fine")]
+        ])
+        curriculum_db.commit()
+        target = curriculum_tree("b")
+        records = export_records(curriculum_db, "curriculum", "a-curriculum")
+
+        importer = CurriculumImporter(curriculum_db, "b-program", {"a-course": target.course.id})
+        insert = importer._insert
+
+        def failing_insert(spec, rows):
+            if any(row.get("title") == "boom" for row in rows):
+                raise RuntimeError("insert failed")
+            insert(spec, rows)
+
+        monkeypatch.setattr(importer, "_insert", failing_insert)
+        result = importer.run(records)
+        curriculum_db.commit()
+
+        assert result["failed"] == [{"id": "a-lesson2", "type": "lesson", "error": "insert failed"}]
+        assert result["total_successful"] == 6
+        section_id = importer.id_map["a-section"]
+        titles = {title for (title,) in curriculum_db.query(Lesson.title).filter(Lesson.section_id == section_id)}
+        assert titles == {"a lesson", "fine"}
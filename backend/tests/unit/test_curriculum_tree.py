@@ -0,0 +1,136 @@
+"""
+Tests for the level-at-a-time curriculum tree loader and its JSON streamer.
+"""
+
+import json
+
+import pytest
+from sqlalchemy import event
+
+from app.features.common.models.enums import MediaType
+from app.features.content.models.lesson import Lesson
+from app.features.courses.services.advanced_service import advanced_service
+from app.features.courses.services.curriculum_tree import iter_tree_json
+from app.features.equipment.models.equipment import EquipmentRequirement
+from app.features.media.models.media import MediaLibrary
+from app.features.programs.models.program import Program
+
+
+def node(nodes, node_id):
+    """The node with ``node_id`` in a list of trees."""
+    for candidate in nodes:
+        if candidate.id == node_id:
+            return candidate
+        found = node(candidate.children, node_id)
+        if found is not None:
+            return found
+    return None
+
+
+class TestCurriculumTree:
+    """Test class for CurriculumTreeLoader and iter_tree_json."""
+
+    @pytest.fixture
+    def statements(self, curriculum_db):
+        """SQL statements executed by the session, recorded as they run."""
+        executed = []
+        engine = curriculum_db.get_bind()
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            executed.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        yield executed
+        event.remove(engine, "before_cursor_execute", record)
+
+    def load(self, db, **options):
+        return advanced_service.get_full_curriculum_tree(db, **options)
+
+    def test_streamed_json_matches_model_dump(self, curriculum_db, curriculum_tree):
+        """Test the chunks join into the same JSON document as model_dump_json()."""
+        curriculum_tree("a")
+        curriculum_tree("b")
+        curriculum_db.add(Program(id="empty-program", name="empty program", display_order=3))
+        curriculum_db.commit()
+        tree = self.load(curriculum_db, include_inactive=True)
+
+        chunks = list(iter_tree_json(tree, chunk_size=64))
+
+        assert len(chunks) > 1
+        assert json.loads(b"".join(chunks)) == json.loads(tree.model_dump_json())
+        assert b"".join(iter_tree_json(tree)) == b"".join(chunks)
+
+    def test_max_depth_stops_loading(self, curriculum_db, curriculum_tree, statements):
+        """Test levels below max_depth are not queried and their parents are marked."""
+        curriculum_tree("a")
+        statements.clear()
+
+        tree = self.load(curriculum_db, include_inactive=True, max_depth=2)
+
+        assert not any("FROM levels" in statement for statement in statements)
+        curriculum = node(tree.programs, "a-curriculum")
+        assert curriculum.children == []
+        assert curriculum.metadata["max_depth_reached"] is True
+        assert "total_levels" not in curriculum.metadata
+        assert node(tree.programs, "a-course").metadata["total_curricula"] == 1
+        assert (tree.total_curricula, tree.total_levels, tree.tree_depth) == (1, 0, 2)
+
+    def test_inactive_parents_prune_their_subtrees(self, curriculum_db, curriculum_tree, statements):
+        """Test children of filtered-out parents are neither queried nor returned."""
+        a = curriculum_tree("a")
+        a.course.status = "published"  # a's curriculum stays a draft
+        curriculum_db.commit()
+        statements.clear()
+
+        tree = self.load(curriculum_db)
+
+        course = node(tree.programs, "a-course")
+        assert course.children == []
+        assert course.metadata["total_curricula"] == 0
+        assert not any("FROM levels" in statement for statement in statements)
+        assert (tree.total_courses, tree.total_curricula, tree.total_lessons) == (1, 0, 0)
+
+        b = curriculum_tree("b")
+        b.course.status = b.curriculum.status = "published"
+        curriculum_db.commit()
+
+        tree = self.load(curriculum_db)
+
+        assert node(tree.programs, "a-course").children == []
+        assert node(tree.programs, "b-lesson") is not None
+        assert (tree.total_courses, tree.total_curricula, tree.total_lessons) == (2, 1, 1)
+
+    def test_totals(self, curriculum_db, curriculum_tree):
+        """Test tree totals, per-node child totals and grouped counts."""
+        a = curriculum_tree("a")
+        curriculum_tree("b")
+        curriculum_db.add_all([
+            Lesson(id="a-lesson2", section_id=a.section.id, lesson_id="a-L2", title="a lesson 2", sequence_order=2),
+            EquipmentRequirement(id="a-goggles", level_id=a.level.id, equipment_name="Goggles"),
+            MediaLibrary(
+                id="a-media",
+                lesson_id=a.lesson.id,
+                file_name="clip.mp4",
+                original_file_name="clip.mp4",
+                file_type=MediaType.VIDEO,
+                file_url="/media/clip.mp4",
+            ),
+        ])
+        curriculum_db.commit()
+
+        tree = self.load(curriculum_db, include_inactive=True)
+
+        totals = (
+            tree.total_programs, tree.total_courses, tree.total_curricula,
+            tree.total_levels, tree.total_modules, tree.total_sections, tree.total_lessons,
+        )
+        assert totals == (2, 2, 2, 2, 2, 2, 3)
+        assert tree.total_assessments == 0
+        assert node(tree.programs, "a-program").metadata["total_courses"] == 1
+        assert node(tree.programs, "a-section").metadata["total_lessons"] == 2
+        assert node(tree.programs, "b-section").metadata["total_lessons"] == 1
+        assert node(tree.programs, "a-level").metadata["equipment_count"] == 1
+        assert node(tree.programs, "b-level").metadata["equipment_count"] == 0
+        assert node(tree.programs, "a-lesson").metadata["media_count"] == 1
+        assert node(tree.programs, "a-lesson2").metadata["media_count"] == 0
+        assert [lesson.id for lesson in node(tree.programs, "a-section").children] == ["a-lesson", "a-lesson2"]
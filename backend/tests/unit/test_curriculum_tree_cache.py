@@ -0,0 +1,80 @@
+"""
+Tests for the versioned curriculum tree cache.
+"""
+
+from app.features.curricula.services.tree_cache import CachedTree, CurriculumTreeCache, tree_etag
+
+
+def make_tree(curriculum_id, version):
+    return CachedTree(version=version, etag=tree_etag(curriculum_id, version), body=b"{}")
+
+
+class TestCurriculumTreeCache:
+    """Test class for CurriculumTreeCache functionality."""
+
+    def test_hit_only_at_cached_version(self):
+        cache = CurriculumTreeCache(max_entries=10)
+        tree = make_tree("c1", 3)
+        cache.put("c1", tree)
+
+        assert cache.get("c1", 3) is tree
+        assert cache.get("c1", 4) is None
+        assert cache.get("c2", 3) is None
+
+    def test_newer_version_replaces_older(self):
+        cache = CurriculumTreeCache(max_entries=10)
+        cache.put("c1", make_tree("c1", 1))
+        cache.put("c1", make_tree("c1", 2))
+
+        assert cache.get("c1", 1) is None
+        assert cache.get("c1", 2).etag == '"c1.2"'
+
+    def test_older_version_does_not_replace_newer(self):
+        cache = CurriculumTreeCache(max_entries=10)
+        cache.put("c1", make_tree("c1", 5))
+        cache.put("c1", make_tree("c1", 4))
+
+        assert cache.get("c1", 5) is not None
+
+    def test_evicts_least_recently_used(self):
+        cache = CurriculumTreeCache(max_entries=2)
+        cache.put("c1", make_tree("c1", 1))
+        cache.put("c2", make_tree("c2", 1))
+        cache.get("c1", 1)
+        cache.put("c3", make_tree("c3", 1))
+
+        assert cache.get("c1", 1) is not None
+        assert cache.get("c2", 1) is None
+        assert cache.get("c3", 1) is not None
+
+    def test_disabled_cache_stores_nothing(self):
+        cache = CurriculumTreeCache(max_entries=0)
+        cache.put("c1", make_tree("c1", 1))
+
+        assert cache.get("c1", 1) is None
+
+
+class TestStructureVersions:
+    """Test class for structure version bumps on flush."""
+
+    def test_moving_a_section_bumps_both_curricula(self, curriculum_db, curriculum_tree):
+        """Test the curriculum a row left and the one it joined both change version."""
+        a = curriculum_tree("a")
+        b = curriculum_tree("b")
+        versions = (a.curriculum.structure_version, b.curriculum.structure_version)
+
+        a.section.module_id = b.module.id
+        curriculum_db.flush()
+
+        assert a.curriculum.structure_version == versions[0] + 1
+        assert b.curriculum.structure_version == versions[1] + 1
+
+    def test_editing_a_lesson_bumps_its_curriculum(self, curriculum_db, curriculum_tree):
+        """Test an in-place edit below a curriculum changes its version."""
+        a = curriculum_tree("a")
+        version = a.curriculum.structure_version
+
+        a.lesson.title = "Renamed"
+        curriculum_db.flush()
+
+        assert a.curriculum.structure_version == version + 1
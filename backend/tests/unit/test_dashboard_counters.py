@@ -0,0 +1,105 @@
+"""
+Tests for materialized dashboard counters.
+"""
+
+import pytest
+from sqlalchemy import Boolean, Column, Integer, String, create_engine, text
+from sqlalchemy.orm import Session, declarative_base
+
+from app.features.common.models.dashboard_counter import DashboardCounter
+from app.features.common.services.dashboard_counters import (
+    GLOBAL_SCOPE,
+    CounterDefinition,
+    DashboardCounterService,
+)
+
+
+CounterBase = declarative_base()
+
+
+class Enrolment(CounterBase):
+    """Minimal program-scoped table used to exercise the counters."""
+
+    __tablename__ = "counter_enrolments"
+
+    id = Column(Integer, primary_key=True)
+    program_id = Column(String(36), nullable=True)
+    status = Column(String(20), default="active", nullable=False)
+    kind = Column(String(20), nullable=True)
+    size = Column(Integer, nullable=True)
+    is_public = Column(Boolean, default=False, nullable=False)
+
+
+class TestDashboardCounterService:
+    """Test class for DashboardCounterService functionality."""
+
+    @pytest.fixture(scope="class")
+    def service(self):
+        """Counter service with a handful of definitions on the test model."""
+        service = DashboardCounterService()
+        service.register(
+            CounterDefinition("enrolments.total", Enrolment, scope_attribute="program_id"),
+            CounterDefinition("enrolments.active", Enrolment, scope_attribute="program_id",
+                              conditions=(("status", "active"),)),
+            CounterDefinition("enrolments.by_kind", Enrolment, group_by="kind"),
+            CounterDefinition("enrolments.size", Enrolment, sum_attribute="size"),
+        )
+        return service
+
+    @pytest.fixture
+    def db(self):
+        """In-memory SQLite session with the counters table."""
+        engine = create_engine("sqlite://")
+        CounterBase.metadata.create_all(engine)
+        DashboardCounter.__table__.create(engine)
+        session = Session(engine)
+        yield session
+        session.close()
+
+    def test_insert_update_delete_maintain_counters(self, service, db):
+        """Test flushes keep program-scoped and global counters current."""
+        db.add_all([
+            Enrolment(id=1, program_id="p1", kind="video", size=10),
+            Enrolment(id=2, program_id="p1", status="paused", kind="video", size=5),
+            Enrolment(id=3, program_id="p2", kind="audio", size=1),
+        ])
+        db.commit()
+
+        assert service.get_counters(db, "p1") == {"enrolments.total": 2, "enrolments.active": 1}
+        global_counters = service.get_counters(db)
+        assert service.grouped(global_counters, "enrolments.by_kind") == {"video": 2, "audio": 1}
+        assert global_counters["enrolments.size"] == 16
+
+        # Moving a row between programs and statuses moves its counts
+        enrolment = db.get(Enrolment, 1)
+        enrolment.program_id = "p2"
+        enrolment.status = "paused"
+        db.commit()
+        assert service.get_counters(db, "p1") == {"enrolments.total": 1, "enrolments.active": 0}
+        assert service.get_counters(db, "p2") == {"enrolments.total": 2, "enrolments.active": 1}
+
+        db.delete(db.get(Enrolment, 3))
+        db.commit()
+        assert service.get_counters(db, "p2") == {"enrolments.total": 1, "enrolments.active": 0}
+        assert service.grouped(service.get_counters(db), "enrolments.by_kind") == {"video": 2}
+
+    def test_rollback_discards_deltas(self, service, db):
+        """Test counter updates share the transaction of the change."""
+        db.add(Enrolment(id=1, program_id="p1"))
+        db.flush()
+        db.rollback()
+
+        assert service.get_counters(db, "p1") == {}
+
+    def test_reconcile_repairs_drift_from_bulk_statements(self, service, db):
+        """Test reconciliation recomputes counters changed behind the ORM's back."""
+        db.add_all([Enrolment(id=1, program_id="p1"), Enrolment(id=2, program_id="p1")])
+        db.commit()
+        db.execute(text("UPDATE counter_enrolments SET status = 'paused' WHERE id = 1"))
+        db.commit()
+
+        corrected = service.reconcile(db)
+
+        assert corrected == 1
+        assert service.get_counters(db, "p1") == {"enrolments.total": 2, "enrolments.active": 1}
+        assert service.get_counters(db, GLOBAL_SCOPE)["enrolments.by_kind.unknown"] == 2
@@ -0,0 +1,73 @@
+"""
+Tests for media file delivery (conditional GET and proxy offload).
+"""
+
+import hashlib
+import os
+
+import pytest
+from fastapi import Request
+
+from app.core.config import settings
+from app.features.common.services.conditional_requests import strong_etag
+from app.features.media.services.file_delivery import file_response, stat_etag
+
+
+def make_request(**headers):
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "headers": [(name.replace("_", "-").lower().encode(), value.encode()) for name, value in headers.items()],
+    })
+
+
+class TestFileDelivery:
+    """Test class for file_response functionality."""
+
+    @pytest.fixture
+    def media_file(self, tmp_path, monkeypatch):
+        """A stored media file below a temporary MEDIA_ROOT."""
+        monkeypatch.setattr(settings, "MEDIA_ROOT", str(tmp_path))
+        monkeypatch.setattr(settings, "MEDIA_SENDFILE_BACKEND", "")
+        path = tmp_path / "videos" / "clip.mp4"
+        path.parent.mkdir()
+        path.write_bytes(b"0123456789")
+        return path
+
+    def test_matching_etag_returns_not_modified(self, media_file):
+        """Test If-None-Match (weak comparison, lists) short-circuits with 304."""
+        etag = strong_etag(hashlib.sha256(b"0123456789").hexdigest())
+
+        response = file_response(make_request(if_none_match=f'"other", W/{etag}'), str(media_file), etag=etag)
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+    def test_if_none_match_takes_precedence_over_if_modified_since(self, media_file):
+        """Test a stale ETag sends the file even if it was not modified since the given date."""
+        request = make_request(if_none_match='"stale"', if_modified_since="Fri, 01 Jan 2100 00:00:00 GMT")
+
+        response = file_response(request, str(media_file), etag='"fresh"')
+
+        assert response.status_code == 200
+        assert response.headers["accept-ranges"] == "bytes"
+
+    def test_file_without_content_hash_revalidates(self, media_file):
+        """Test the size and mtime ETag sent for files without a content hash answers revalidations."""
+        response = file_response(make_request(), str(media_file), media_type="image/jpeg")
+        etag = response.headers["etag"]
+        assert etag == stat_etag(os.stat(media_file))
+
+        revalidated = file_response(make_request(if_none_match=etag), str(media_file), media_type="image/jpeg")
+
+        assert revalidated.status_code == 304
+        assert revalidated.headers["etag"] == etag
+
+    def test_accel_redirect_offloads_body(self, media_file, monkeypatch):
+        """Test nginx offload returns an internal redirect instead of the body."""
+        monkeypatch.setattr(settings, "MEDIA_SENDFILE_BACKEND", "x-accel-redirect")
+
+        response = file_response(make_request(), str(media_file), media_type="video/mp4", filename="clip.mp4")
+
+        assert response.headers["x-accel-redirect"] == "/protected-media/videos/clip.mp4"
+        assert response.body == b""
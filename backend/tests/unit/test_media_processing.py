@@ -0,0 +1,199 @@
+"""
+Tests for background media processing and its status reporting.
+"""
+
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+import pytest
+
+from app.features.common.models.enums import MediaType
+from app.features.common.services.outbox import ClaimedMessage
+from app.features.media.services import media_processing
+from app.features.media.services.media_processing import (
+    METADATA_STEP,
+    THUMBNAIL_STEP,
+    MediaProcessor,
+)
+from app.features.media.services.media_service import media_service
+
+
+class StubExecutor:
+    """Runs submitted steps inline and returns completed futures."""
+
+    def __init__(self, results):
+        self.results = results
+        self.calls = []
+
+    def submit(self, function, *args):
+        self.calls.append((function.__name__, args))
+        future = Future()
+        result = self.results[function.__name__]
+        if isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result(*args) if callable(result) else result)
+        return future
+
+
+class FakeQuery:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def filter(self, *conditions):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class FakeDB:
+    """Session stub returning the given media rows and counting commits."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.commits = 0
+
+    def query(self, model):
+        return FakeQuery(self.rows)
+
+    def commit(self):
+        self.commits += 1
+
+
+def make_media(media_id="m1", file_type=MediaType.IMAGE, content_sha256=None):
+    return SimpleNamespace(
+        id=media_id,
+        file_type=file_type,
+        file_url=f"/media/{media_id}",
+        content_sha256=content_sha256,
+        file_size_bytes=None,
+        duration_seconds=None,
+        resolution=None,
+        thumbnail_url=None,
+        extracted_metadata=None,
+        processing_status="pending",
+        processing_error=None,
+        processing_steps=None,
+        processed_at=None,
+        created_at=None,
+    )
+
+
+def message(media_id="m1", attempts=1):
+    return ClaimedMessage(id=f"msg-{media_id}", payload={"media_id": media_id}, attempts=attempts)
+
+
+def make_processor(tmp_path, **results):
+    processor = MediaProcessor(max_workers=1, thumbnail_dir=str(tmp_path))
+    processor._executor = StubExecutor({
+        "generate_thumbnail": lambda file_path, file_type, thumbnail_path: thumbnail_path,
+        "extract_metadata": {"file_size_bytes": 10, "width": 64, "height": 48, "sha256": "ab" * 32},
+        **results,
+    })
+    return processor
+
+
+class TestMediaProcessor:
+    """Test class for MediaProcessor.process."""
+
+    def test_successful_batch_completes_media(self, tmp_path):
+        """Test every step's result is applied and the media is completed."""
+        media = [make_media("m1"), make_media("m2", content_sha256="cd" * 32)]
+        db = FakeDB(media)
+        processor = make_processor(tmp_path)
+
+        errors = processor.process(db, [message("m1"), message("m2")])
+
+        assert errors == {}
+        for item in media:
+            assert item.processing_status == "completed"
+            assert item.processed_at is not None
+            assert item.thumbnail_url.endswith(f"{item.id}.jpg")
+            assert item.resolution == "64x48"
+            assert item.file_size_bytes == 10
+            assert {state["status"] for state in item.processing_steps.values()} == {"completed"}
+        assert media[0].content_sha256 == "ab" * 32
+        assert media[1].content_sha256 == "cd" * 32
+        # The hash is only computed when the upload did not record it
+        hash_flags = [args[2] for name, args in processor.executor.calls if name == "extract_metadata"]
+        assert hash_flags == [True, False]
+        # One commit for the start, then one per finished step
+        assert db.commits == 1 + 4
+
+    def test_unsupported_step_is_skipped(self, tmp_path):
+        """Test a step without a tool or format reports skipped, not failed."""
+        media = make_media(file_type=MediaType.DOCUMENT)
+        processor = make_processor(tmp_path, generate_thumbnail=None)
+
+        errors = processor.process(FakeDB([media]), [message()])
+
+        assert errors == {}
+        assert media.processing_steps[THUMBNAIL_STEP]["status"] == "skipped"
+        assert media.thumbnail_url is None
+        assert media.processing_status == "completed"
+
+    def test_failed_step_is_retried(self, tmp_path):
+        """Test a failure before the last attempt leaves the media pending for the outbox retry."""
+        media = make_media()
+        processor = make_processor(tmp_path, extract_metadata=RuntimeError("corrupt file"))
+
+        errors = processor.process(FakeDB([media]), [message(attempts=1)])
+
+        assert errors == {"msg-m1": f"{METADATA_STEP}: corrupt file"}
+        assert media.processing_status == "pending"
+        assert media.processing_error == f"{METADATA_STEP}: corrupt file"
+        assert media.processing_steps[METADATA_STEP]["status"] == "failed"
+        assert media.processing_steps[METADATA_STEP]["error"] == "corrupt file"
+        assert media.processing_steps[THUMBNAIL_STEP]["status"] == "completed"
+        assert media.processed_at is None
+
+    def test_failure_on_last_attempt_marks_media_failed(self, tmp_path, monkeypatch):
+        """Test the final attempt records the failure."""
+        monkeypatch.setattr(media_processing.outbox, "max_attempts", 3)
+        media = make_media()
+        processor = make_processor(tmp_path, generate_thumbnail=RuntimeError("ffmpeg exited 1"))
+
+        processor.process(FakeDB([media]), [message(attempts=3)])
+
+        assert media.processing_status == "failed"
+        assert media.processing_error == f"{THUMBNAIL_STEP}: ffmpeg exited 1"
+        assert media.processed_at is not None
+
+
+class TestProcessingStatus:
+    """Test class for MediaService.get_processing_status."""
+
+    @pytest.fixture
+    def media(self, monkeypatch):
+        media = make_media()
+        monkeypatch.setattr(media_service, "_get_media_with_program_check", lambda db, media_id, program: media)
+        media.is_processed = False
+        return media
+
+    def test_status_reports_step_progress(self, media):
+        """Test finished and skipped steps count towards progress."""
+        media.processing_status = "processing"
+        media.processing_steps = {
+            THUMBNAIL_STEP: {"status": "skipped"},
+            METADATA_STEP: {"status": "processing"},
+        }
+
+        status = media_service.get_processing_status(None, "m1")
+
+        assert [step["step"] for step in status.processing_steps] == ["upload", THUMBNAIL_STEP, METADATA_STEP]
+        assert status.processing_status == "processing"
+        assert status.progress_percentage == pytest.approx(66.7)
+
+    def test_status_before_processing_started(self, media):
+        """Test media without step state reports its steps as pending."""
+        status = media_service.get_processing_status(None, "m1")
+
+        assert [step["status"] for step in status.processing_steps] == ["completed", "pending", "pending"]
+        assert status.progress_percentage == pytest.approx(33.3)
+
+    def test_missing_media_returns_none(self, monkeypatch):
+        """Test unknown media returns None so the route answers 404."""
+        monkeypatch.setattr(media_service, "_get_media_with_program_check", lambda db, media_id, program: None)
+
+        assert media_service.get_processing_status(None, "missing") is None
@@ -0,0 +1,58 @@
+"""
+Tests for the transactional outbox.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.features.common.models.outbox import OutboxMessage
+from app.features.common.services.outbox import DONE, FAILED, PENDING, OutboxService
+
+
+class TestOutboxService:
+    """Test class for OutboxService functionality."""
+
+    @pytest.fixture
+    def db(self):
+        """In-memory SQLite session with the outbox table."""
+        engine = create_engine("sqlite://")
+        OutboxMessage.__table__.create(engine)
+        session = Session(engine)
+        yield session
+        session.close()
+
+    def test_messages_are_claimed_once_and_completed(self, db):
+        """Test a drained topic hands every message to its handler exactly once."""
+        delivered = []
+        service = OutboxService()
+        service.register("test.topic", lambda messages: delivered.extend(m.payload["n"] for m in messages), 2)
+
+        service.enqueue(db, "test.topic", [{"n": n} for n in range(5)])
+        db.commit()
+
+        assert service.drain(db) == 5
+        assert sorted(delivered) == [0, 1, 2, 3, 4]
+        assert {m.status for m in db.query(OutboxMessage)} == {DONE}
+
+    def test_failures_back_off_and_give_up(self, db):
+        """Test failed messages are retried later and marked failed after max attempts."""
+        service = OutboxService(max_attempts=2, retry_backoff=timedelta(minutes=1))
+        service.register("test.topic", lambda messages: {m.id: "boom" for m in messages})
+
+        service.enqueue(db, "test.topic", [{"n": 1}])
+        db.commit()
+
+        assert service.drain(db) == 1
+        message = db.query(OutboxMessage).one()
+        assert (message.status, message.attempts, message.last_error) == (PENDING, 1, "boom")
+        assert message.available_at > datetime.utcnow()
+        assert service.drain(db) == 0
+
+        message.available_at = datetime.utcnow()
+        db.commit()
+        service.drain(db)
+        db.refresh(message)
+        assert (message.status, message.attempts) == (FAILED, 2)
@@ -0,0 +1,146 @@
+"""
+Tests for the parents list query.
+"""
+
+import importlib
+from datetime import date
+
+import pytest
+
+from app.features.common.models.enums import EnrollmentStatus
+from app.features.enrollments.models.course_enrollment import CourseEnrollment
+from app.features.parents.models.parent import Parent
+from app.features.parents.models.parent_child_relationship import ParentChildRelationship
+from app.features.parents.services.parent_service import ParentService
+from app.features.students.models.student import Student
+
+# The package re-exports the service instance under the module's name
+parent_service_module = importlib.import_module("app.features.parents.services.parent_service")
+
+
+class TestParentsList:
+    """Test class for ParentService.get_parents_list."""
+
+    @pytest.fixture
+    def make_parent(self, people_db, make_user):
+        """Factory adding a parent with a user account."""
+
+        def build(parent_id: str, first_name: str, last_name: str) -> Parent:
+            user = make_user(f"{parent_id}-user", first_name, last_name, roles=("parent",))
+            parent = Parent(
+                id=parent_id,
+                user_id=user.id,
+                first_name=first_name,
+                last_name=last_name,
+                email=user.email,
+                enrollment_date=date(2025, 1, 6),
+            )
+            people_db.add(parent)
+            people_db.commit()
+            return parent
+
+        return build
+
+    @pytest.fixture
+    def add_child(self, people_db, make_user):
+        """Factory adding a student child of a parent, enrolled in a program with the given status."""
+
+        def build(parent: Parent, child_id: str, program_id: str, status=EnrollmentStatus.active) -> Student:
+            user = make_user(f"{child_id}-user", child_id, parent.last_name)
+            student = Student(
+                id=child_id,
+                user_id=user.id,
+                student_id=f"STU-{child_id}",
+                first_name=child_id,
+                last_name=parent.last_name,
+                date_of_birth=date(2015, 3, 1),
+                program_id=program_id,
+                enrollment_date=date(2025, 1, 6),
+            )
+            people_db.add_all([
+                student,
+                ParentChildRelationship(
+                    id=f"{parent.id}-{child_id}",
+                    user_relationship_id=f"{parent.id}-{child_id}-relationship",
+                    parent_id=parent.id,
+                    student_id=student.id,
+                    program_id=program_id,
+                ),
+                CourseEnrollment(
+                    id=f"{child_id}-enrollment",
+                    user_id=user.id,
+                    course_id=f"{program_id}-course",
+                    program_id=program_id,
+                    enrollment_date=date(2025, 1, 6),
+                    status=status,
+                ),
+            ])
+            people_db.commit()
+            return student
+
+        return build
+
+    def ids(self, db, program_context=None, **kwargs):
+        parents, _, _ = ParentService.get_parents_list(db, program_context, **kwargs)
+        return [parent.id for parent in parents]
+
+    def test_program_scope_follows_current_child_enrollments(self, people_db, make_parent, add_child):
+        """Test a parent is listed in a program only through a child with a current enrollment there."""
+        swim = make_parent("swim", "Ada", "Swimmer")
+        add_child(swim, "s1", "p-swim", EnrollmentStatus.paused)
+        left = make_parent("left", "Bea", "Leaver")
+        add_child(left, "s2", "p-swim", EnrollmentStatus.withdrawn)
+        tennis = make_parent("tennis", "Cy", "Player")
+        add_child(tennis, "s3", "p-tennis")
+
+        assert self.ids(people_db, "p-swim") == ["swim"]
+        assert self.ids(people_db, "p-tennis") == ["tennis"]
+        assert self.ids(people_db) == ["left", "tennis", "swim"]
+
+    def test_has_children(self, people_db, make_parent, add_child):
+        """Test the has_children filter in both directions."""
+        add_child(make_parent("with", "Ada", "Able"), "s1", "p1")
+        make_parent("without", "Bea", "Baker")
+
+        assert self.ids(people_db, has_children=True) == ["with"]
+        assert self.ids(people_db, has_children=False) == ["without"]
+        assert self.ids(people_db) == ["with", "without"]
+
+    def test_search(self, people_db, make_parent):
+        """Test the search term matches the parents' user names and emails."""
+        make_parent("ada", "Ada", "Lovelace")
+        make_parent("grace", "Grace", "Hopper")
+
+        assert self.ids(people_db, search="hop") == ["grace"]
+        assert self.ids(people_db, search="ada love") == ["ada"]
+        assert self.ids(people_db, search="grace-user@example") == ["grace"]
+
+    def test_page_size_is_capped(self, people_db, make_parent, monkeypatch):
+        """Test per_page above MAX_PARENTS_PAGE_SIZE loads at most that many parents."""
+        monkeypatch.setattr(parent_service_module, "MAX_PARENTS_PAGE_SIZE", 2)
+        for n in range(3):
+            make_parent(f"p{n}", "Parent", f"Number{n}")
+
+        parents, total, next_cursor = ParentService.get_parents_list(people_db, None, per_page=50)
+
+        assert [parent.id for parent in parents] == ["p0", "p1"]
+        assert total == 3
+        assert next_cursor is not None
+
+    def test_cursor_walk_returns_every_parent_once(self, people_db, make_parent):
+        """Test following next_cursor visits every parent exactly once, in name order."""
+        names = [("Ada", "Smith"), ("Bea", "Smith"), ("Ada", "Jones"), ("Cy", "Adams"), ("Ada", "Smith")]
+        for n, (first_name, last_name) in enumerate(names):
+            make_parent(f"p{n}", first_name, last_name)
+
+        seen, cursor, pages = [], None, 0
+        while True:
+            parents, total, cursor = ParentService.get_parents_list(people_db, None, per_page=2, cursor=cursor)
+            seen.extend(parent.id for parent in parents)
+            pages += 1
+            if cursor is None:
+                break
+
+        assert total == 5
+        assert pages == 3
+        assert seen == ["p3", "p2", "p0", "p4", "p1"]
@@ -0,0 +1,98 @@
+"""
+Tests for connection pool instrumentation and the /health/db payload.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app.api.api_v1.endpoints.health import database_health_check
+from app.features.common.services import pool_metrics as pool_metrics_module
+from app.features.common.services.pool_metrics import (
+    WAIT_BUCKETS_MS,
+    InstrumentedQueuePool,
+    PoolMetrics,
+    instrument_pool,
+)
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """File-backed SQLite engine on a one-connection instrumented pool."""
+    monkeypatch.setattr(pool_metrics_module, "pool_metrics", {})
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    instrument_pool(engine.pool, "test")
+    yield engine
+    engine.dispose()
+
+
+class TestPoolMetrics:
+    """Test class for PoolMetrics functionality."""
+
+    def test_wait_histogram_buckets(self):
+        """Test waits land in the first bucket that bounds them."""
+        metrics = PoolMetrics("test")
+        metrics.record_wait(0.5)
+        metrics.record_wait(7)
+        metrics.record_wait(WAIT_BUCKETS_MS[-1] + 1, timed_out=True)
+
+        wait = metrics.snapshot()["checkout_wait"]
+
+        assert wait["count"] == 3
+        assert wait["histogram"]["le_1ms"] == 1
+        assert wait["histogram"]["le_10ms"] == 1
+        assert wait["histogram"]["gt_5000ms"] == 1
+        assert wait["max_ms"] == WAIT_BUCKETS_MS[-1] + 1
+        assert metrics.snapshot()["counters"]["checkout_timeouts"] == 1
+
+    def test_snapshot_counts_checkouts_and_connections(self, engine):
+        """Test checkouts, connects and pool gauges are reported."""
+        for _ in range(3):
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+
+        snapshot = pool_metrics_module.pool_metrics["test"].snapshot()
+
+        assert snapshot["counters"]["checkouts"] == 3
+        assert snapshot["counters"]["connects"] == 1
+        assert snapshot["checkout_wait"]["count"] == 3
+        assert snapshot["pool"]["size"] == 1
+        assert snapshot["pool"]["checked_out"] == 0
+        assert snapshot["connection_age_seconds"]["open"] == 1
+
+    def test_checkout_timeout_is_recorded(self, engine):
+        """Test a checkout that times out on an exhausted pool is counted."""
+        with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+            snapshot = pool_metrics_module.pool_metrics["test"].snapshot()
+
+        assert snapshot["counters"]["checkout_timeouts"] == 1
+        assert snapshot["pool"]["exhausted"] is True
+
+
+class TestDatabaseHealthEndpoint:
+    """Test class for the /health/db endpoint."""
+
+    def test_healthy_payload(self, engine):
+        """Test an idle pool reports healthy with its metrics."""
+        response = asyncio.run(database_health_check())
+
+        assert response.status == "healthy"
+        assert set(response.pools) == {"test"}
+        assert response.pools["test"]["pool"]["capacity"] == 1
+
+    def test_exhausted_pool_reports_degraded(self, engine):
+        """Test the endpoint degrades while every connection is checked out."""
+        with engine.connect():
+            response = asyncio.run(database_health_check())
+
+        assert response.status == "degraded"
+        assert response.pools["test"]["pool"]["exhausted"] is True
@@ -0,0 +1,112 @@
+"""
+Tests for the authenticated-user (principal) cache.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.features.authentication.services import principal_cache as principal_cache_module
+from app.features.authentication.services.principal_cache import (
+    AuthenticatedUser,
+    PrincipalCache,
+    _USER_FIELDS,
+)
+
+
+def make_principal(user_id: str, roles=("program_admin",), program_ids=("p1",)) -> AuthenticatedUser:
+    """Build a snapshot from a plain object carrying the user columns."""
+    user = SimpleNamespace(**{field: None for field in _USER_FIELDS})
+    user.id = user_id
+    user.username = f"user-{user_id}"
+    user.roles = list(roles)
+    user.is_active = True
+    assignments = [
+        SimpleNamespace(program_id=program_id, is_default=index == 0)
+        for index, program_id in enumerate(program_ids)
+    ]
+    return AuthenticatedUser(user, assignments)
+
+
+class TestAuthenticatedUser:
+    """Test class for AuthenticatedUser snapshots."""
+
+    def test_snapshot_exposes_roles_and_programs(self):
+        """Test role helpers and program assignments work on the snapshot."""
+        principal = make_principal("u1", roles=("program_admin",), program_ids=("p1", "p2"))
+
+        assert principal.has_role("program_admin")
+        assert principal.is_program_admin()
+        assert not principal.is_super_admin()
+        assert principal.program_ids == ("p1", "p2")
+        assert principal.default_program_id == "p1"
+        assert principal.has_program_access("p2")
+        assert not principal.has_program_access("p3")
+
+    def test_snapshot_is_read_only(self):
+        """Test snapshots shared between requests cannot be mutated."""
+        principal = make_principal("u1")
+
+        with pytest.raises(AttributeError):
+            principal.is_active = False
+        assert not hasattr(principal, "password_hash")
+
+
+class TestPrincipalCache:
+    """Test class for PrincipalCache functionality."""
+
+    def test_get_returns_cached_snapshot_until_ttl(self, monkeypatch):
+        """Test entries expire after the TTL."""
+        now = [1000.0]
+        monkeypatch.setattr(principal_cache_module.time, "monotonic", lambda: now[0])
+        cache = PrincipalCache(ttl_seconds=60, max_entries=10)
+        principal = make_principal("u1")
+
+        cache.put(("user-u1", 1), principal)
+        assert cache.get(("user-u1", 1)) is principal
+
+        now[0] += 61
+        assert cache.get(("user-u1", 1)) is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the cache stays bounded by evicting the LRU entry."""
+        cache = PrincipalCache(ttl_seconds=60, max_entries=2)
+        cache.put("a", make_principal("u1"))
+        cache.put("b", make_principal("u2"))
+        cache.get("a")
+        cache.put("c", make_principal("u3"))
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_invalidate_user_drops_all_tokens_of_user(self):
+        """Test invalidation removes every token cached for the user."""
+        cache = PrincipalCache(ttl_seconds=60, max_entries=10)
+        cache.put(("user-u1", 1), make_principal("u1"))
+        cache.put(("user-u1", 2), make_principal("u1"))
+        cache.put(("user-u2", 1), make_principal("u2"))
+
+        cache.invalidate_user("u1")
+
+        assert cache.get(("user-u1", 1)) is None
+        assert cache.get(("user-u1", 2)) is None
+        assert cache.get(("user-u2", 1)) is not None
+
+    def test_put_skips_snapshot_loaded_before_invalidation(self):
+        """Test a snapshot loaded concurrently with an invalidation is not cached."""
+        cache = PrincipalCache(ttl_seconds=60, max_entries=10)
+        generation = cache.generation
+
+        cache.invalidate_user("u1")
+        cache.put("a", make_principal("u1"), generation)
+
+        assert cache.get("a") is None
+
+    def test_zero_ttl_disables_cache(self):
+        """Test a zero TTL turns the cache off."""
+        cache = PrincipalCache(ttl_seconds=0, max_entries=10)
+        cache.put("a", make_principal("u1"))
+
+        assert cache.get("a") is None
@@ -0,0 +1,111 @@
+"""
+Tests for the cached program-access resolver.
+"""
+
+from types import SimpleNamespace
+
+from app.middleware import program_access as program_access_module
+from app.middleware.program_access import ProgramAccessResolver
+
+
+class FakeQuery:
+    """Query stub answering the resolver's program and assignment lookups."""
+
+    def __init__(self, db, columns):
+        self.db = db
+        self.columns = columns
+        self.value = None
+
+    def filter(self, condition):
+        self.value = condition.right.value
+        return self
+
+    def all(self):
+        self.db.queries += 1
+        if self.columns[0].key == "program_id":
+            return [SimpleNamespace(program_id=program_id) for program_id in self.db.assignments.get(self.value, ())]
+        return [SimpleNamespace(id=program_id, name=name) for program_id, name in self.db.programs.items()]
+
+    def first(self):
+        self.db.queries += 1
+        name = self.db.programs.get(self.value)
+        return SimpleNamespace(name=name) if name is not None else None
+
+
+class FakeDB:
+    """Session stub backed by dicts."""
+
+    def __init__(self):
+        self.programs = {"p1": "Swimming"}
+        self.assignments = {"u1": ["p1"]}
+        self.queries = 0
+
+    def query(self, *columns):
+        return FakeQuery(self, columns)
+
+
+class TestProgramAccessResolver:
+    """Test class for ProgramAccessResolver functionality."""
+
+    def test_program_names_are_cached(self):
+        """Test the program map is loaded once within the TTL."""
+        db = FakeDB()
+        resolver = ProgramAccessResolver(ttl_seconds=60, max_users=10)
+
+        assert resolver.get_program_name(db, "p1") == "Swimming"
+        assert resolver.get_program_name(db, "p1") == "Swimming"
+        assert db.queries == 1
+
+    def test_program_created_elsewhere_is_found_before_ttl(self):
+        """Test a miss against the cached map falls back to the database."""
+        db = FakeDB()
+        resolver = ProgramAccessResolver(ttl_seconds=60, max_users=10)
+        resolver.get_program_names(db)
+
+        db.programs["p2"] = "Tennis"
+
+        assert resolver.get_program_name(db, "p2") == "Tennis"
+        assert "p2" in resolver.get_all_program_ids(db)
+
+    def test_missing_program_returns_none(self):
+        """Test a program that does not exist is still reported missing."""
+        db = FakeDB()
+        resolver = ProgramAccessResolver(ttl_seconds=60, max_users=10)
+
+        assert resolver.get_program_name(db, "nope") is None
+
+    def test_user_programs_expire_after_ttl(self, monkeypatch):
+        """Test assignments are reloaded once the TTL has passed."""
+        now = [1000.0]
+        monkeypatch.setattr(program_access_module.time, "monotonic", lambda: now[0])
+        db = FakeDB()
+        resolver = ProgramAccessResolver(ttl_seconds=60, max_users=10)
+
+        assert resolver.get_user_program_ids(db, "u1") == frozenset({"p1"})
+        db.assignments["u1"] = ["p1", "p2"]
+        assert resolver.get_user_program_ids(db, "u1") == frozenset({"p1"})
+
+        now[0] += 61
+        assert resolver.get_user_program_ids(db, "u1") == frozenset({"p1", "p2"})
+
+    def test_invalidate_users_drops_cached_assignments(self):
+        """Test committed assignment changes are picked up immediately."""
+        db = FakeDB()
+        resolver = ProgramAccessResolver(ttl_seconds=60, max_users=10)
+        resolver.get_user_program_ids(db, "u1")
+
+        db.assignments["u1"] = []
+        resolver.invalidate_users(["u1"])
+
+        assert resolver.get_user_program_ids(db, "u1") == frozenset()
+
+    def test_has_access(self):
+        """Test super admins see every program and others only their assignments."""
+        db = FakeDB()
+        resolver = ProgramAccessResolver(ttl_seconds=60, max_users=10)
+        admin = SimpleNamespace(id="u9", primary_role="super_admin")
+        user = SimpleNamespace(id="u1", primary_role="program_admin")
+
+        assert resolver.has_access(db, admin, "p2")
+        assert resolver.has_access(db, user, "p1")
+        assert not resolver.has_access(db, user, "p2")
@@ -0,0 +1,74 @@
+"""
+Tests for the denormalized program scope of the curriculum hierarchy.
+"""
+
+from app.features.common.models.enums import MediaType
+from app.features.media.models.media import MediaLibrary
+
+
+def scopes(tree):
+    return {
+        type(row).__name__: (getattr(row, "curriculum_id", None), row.program_id)
+        for row in (tree.level, tree.module, tree.section, tree.lesson)
+    }
+
+
+class TestProgramScope:
+    """Test class for program scope maintenance."""
+
+    def test_insert_under_new_parents(self, curriculum_tree):
+        """Test rows flushed together with their parents get the parents' scope."""
+        tree = curriculum_tree("a")
+
+        assert tree.level.program_id == "a-program"
+        assert set(scopes(tree).values()) == {("a-curriculum", "a-program")}
+
+    def test_insert_under_existing_parent(self, curriculum_db, curriculum_tree):
+        """Test a row added below an existing parent copies its scope before the flush."""
+        tree = curriculum_tree("a")
+        media = MediaLibrary(
+            id="a-media",
+            lesson_id=tree.lesson.id,
+            file_name="clip.mp4",
+            original_file_name="clip.mp4",
+            file_type=MediaType.VIDEO,
+            file_url="/media/clip.mp4",
+        )
+        curriculum_db.add(media)
+        curriculum_db.commit()
+
+        assert (media.curriculum_id, media.program_id) == ("a-curriculum", "a-program")
+
+    def test_move_section_to_other_program(self, curriculum_db, curriculum_tree):
+        """Test a moved section and the lessons below it take the new module's scope."""
+        a = curriculum_tree("a")
+        b = curriculum_tree("b")
+
+        a.section.module_id = b.module.id
+        curriculum_db.commit()
+
+        assert (a.section.curriculum_id, a.section.program_id) == ("b-curriculum", "b-program")
+        assert (a.lesson.curriculum_id, a.lesson.program_id) == ("b-curriculum", "b-program")
+        # Rows above the section stay where they were
+        assert (a.module.curriculum_id, a.module.program_id) == ("a-curriculum", "a-program")
+
+    def test_move_section_through_relationship(self, curriculum_db, curriculum_tree):
+        """Test re-parenting by assigning the relationship is detected too."""
+        a = curriculum_tree("a")
+        b = curriculum_tree("b")
+
+        a.section.module = b.module
+        curriculum_db.commit()
+
+        assert a.lesson.program_id == "b-program"
+
+    def test_move_curriculum_to_other_program(self, curriculum_db, curriculum_tree):
+        """Test moving a curriculum to another program's course rescopes its whole tree."""
+        a = curriculum_tree("a")
+        b = curriculum_tree("b")
+
+        a.curriculum.course_id = b.course.id
+        curriculum_db.commit()
+
+        assert set(scopes(a).values()) == {("a-curriculum", "b-program")}
+        assert set(scopes(b).values()) == {("b-curriculum", "b-program")}
@@ -0,0 +1,53 @@
+"""
+Tests for recurring-session expansion.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.features.common.models.enums import RecurringPattern
+from app.features.scheduling.services.recurrence import RecurrenceRule, expand_occurrences
+
+
+START = datetime(2025, 1, 31, 10, 0)  # a Friday
+
+
+def occurrences(pattern, config, exceptions=None, start=START):
+    rule = RecurrenceRule.from_session(pattern, config, start, exceptions)
+    return [occurrence for occurrence, _ in expand_occurrences(rule, start, start + timedelta(hours=1))]
+
+
+class TestRecurrenceRule:
+    """Test class for RecurrenceRule expansion."""
+
+    def test_non_recurring_pattern_has_no_rule(self):
+        """Test sessions without a pattern do not expand."""
+        assert RecurrenceRule.from_session(RecurringPattern.NONE, {}, START) is None
+
+    def test_monthly_keeps_day_of_month_and_skips_short_months(self):
+        """Test monthly recurrence uses calendar months rather than 30-day steps."""
+        result = occurrences(RecurringPattern.MONTHLY, {"end_date": "2025-06-30"})
+
+        assert result == [datetime(2025, 3, 31, 10), datetime(2025, 5, 31, 10)]
+
+    def test_weekly_days_of_week_with_exceptions(self):
+        """Test weekday lists, the end date and exception dates."""
+        result = occurrences(
+            RecurringPattern.CUSTOM,
+            {"days_of_week": ["mo", 4], "end_date": "2025-02-14"},
+            exceptions=["2025-02-07T10:00:00"],
+        )
+
+        assert result == [datetime(2025, 2, 3, 10), datetime(2025, 2, 10, 10), datetime(2025, 2, 14, 10)]
+
+    def test_biweekly_respects_max_occurrences(self):
+        """Test biweekly spacing and the occurrence cap."""
+        result = occurrences(RecurringPattern.BIWEEKLY, {"max_occurrences": 3})
+
+        assert result == [START + timedelta(weeks=2 * week) for week in (1, 2, 3)]
+
+    def test_invalid_weekday_rejected(self):
+        """Test unknown day names raise a ValueError."""
+        with pytest.raises(ValueError):
+            RecurrenceRule.from_session(RecurringPattern.WEEKLY, {"days_of_week": ["funday"]}, START)
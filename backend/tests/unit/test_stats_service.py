@@ -0,0 +1,83 @@
+"""
+Tests for the SQL-side statistics aggregation helpers.
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import Column, Date, Integer, String, create_engine, func
+from sqlalchemy.orm import Session, declarative_base
+
+from app.features.common.services.stats_service import StatsAggregator, _years_before
+
+
+StatsBase = declarative_base()
+
+TODAY = date(2025, 6, 15)
+
+
+class Member(StatsBase):
+    """Minimal table used to exercise the aggregation helpers."""
+
+    __tablename__ = "stats_members"
+
+    id = Column(Integer, primary_key=True)
+    status = Column(String(20), nullable=True)
+    date_of_birth = Column(Date, nullable=True)
+
+
+class TestStatsAggregator:
+    """Test class for StatsAggregator functionality."""
+
+    @pytest.fixture
+    def db(self):
+        """In-memory SQLite session seeded with a few members."""
+        engine = create_engine("sqlite://")
+        StatsBase.metadata.create_all(engine)
+        session = Session(engine)
+        session.add_all([
+            Member(id=1, status="active", date_of_birth=date(2020, 1, 1)),
+            Member(id=2, status="active", date_of_birth=date(2012, 6, 15)),
+            Member(id=3, status="inactive", date_of_birth=date(2008, 6, 16)),
+            Member(id=4, status=None, date_of_birth=date(1990, 3, 3)),
+        ])
+        session.commit()
+        yield session
+        session.close()
+
+    def test_aggregate_evaluates_all_expressions(self, db):
+        """Test several aggregates are returned from one query."""
+        result = StatsAggregator.aggregate(
+            db.query(Member),
+            total=func.count(Member.id),
+            active=func.count(Member.id).filter(Member.status == "active"),
+        )
+
+        assert result == {"total": 4, "active": 2}
+
+    def test_count_by_fills_defaults_and_null_key(self, db):
+        """Test grouped counts keep default keys and map NULL to null_key."""
+        counts = StatsAggregator.count_by(
+            db.query(Member),
+            Member.status,
+            defaults={"active": 0, "suspended": 0},
+            null_key="active",
+        )
+
+        assert counts == {"active": 3, "suspended": 0, "inactive": 1}
+
+    def test_age_group_buckets(self, db):
+        """Test age buckets respect birthdays falling on the reference day."""
+        buckets = StatsAggregator.age_group_conditions(
+            Member.date_of_birth,
+            [("0-10", 10), ("11-15", 15), ("16-18", 18)],
+            today=TODAY,
+        )
+        counts = StatsAggregator.bucket_counts(db.query(Member), buckets, else_key="19+")
+
+        # Member 2 turns 13 today; member 3 turns 17 tomorrow and is still 16.
+        assert counts == {"0-10": 1, "11-15": 1, "16-18": 1, "19+": 1}
+
+    def test_years_before_clamps_leap_day(self):
+        """Test Feb 29 falls back to Feb 28 in non-leap years."""
+        assert _years_before(date(2024, 2, 29), 1) == date(2023, 2, 28)
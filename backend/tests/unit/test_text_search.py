@@ -0,0 +1,83 @@
+"""
+Tests for free-text search documents.
+"""
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session, declarative_base
+
+from app.features.common.models.search import SearchDocument
+from app.features.common.services.text_search import text_search
+
+
+SearchBase = declarative_base()
+
+
+class Person(SearchBase):
+    """Minimal table with a search document."""
+
+    __tablename__ = "search_people"
+
+    id = Column(Integer, primary_key=True)
+    first_name = Column(String(50), nullable=True)
+    last_name = Column(String(50), nullable=True)
+    email = Column(String(100), nullable=True)
+
+
+PERSON_SEARCH = SearchDocument(Person.__table__, ["first_name", "last_name", "email"])
+
+
+class TestTextSearchService:
+    """Test class for TextSearchService functionality."""
+
+    @pytest.fixture
+    def db(self):
+        """In-memory SQLite session with a few people."""
+        engine = create_engine("sqlite://")
+        SearchBase.metadata.create_all(engine)
+        session = Session(engine)
+        session.add_all([
+            Person(id=1, first_name="Ada", last_name="Lovelace", email="ada@example.com"),
+            Person(id=2, first_name="Grace", last_name="Hopper", email="grace@example.com"),
+            Person(id=3, first_name="Alan", last_name="Turing", email=None),
+        ])
+        session.commit()
+        yield session
+        session.close()
+
+    def _ids(self, db, term, **kwargs):
+        return [person.id for person in text_search.filter(db.query(Person), PERSON_SEARCH, term, **kwargs)]
+
+    def test_matches_word_prefixes_across_columns(self, db):
+        """Test every word must match the start of a word in any column."""
+        assert sorted(self._ids(db, "a")) == [1, 3]
+        assert self._ids(db, "gra hop") == [2]
+        assert self._ids(db, "ada turing") == []
+        assert sorted(self._ids(db, "")) == [1, 2, 3]
+
+    def test_index_follows_updates_and_deletes(self, db):
+        """Test the FTS table is kept in sync by the triggers."""
+        db.get(Person, 3).last_name = "Kay"
+        db.delete(db.get(Person, 1))
+        db.commit()
+
+        assert self._ids(db, "turing") == []
+        assert self._ids(db, "kay") == [3]
+        assert self._ids(db, "lovelace") == []
+
+    def test_orders_by_rank(self, db):
+        """Test better matches come first when ranking is requested."""
+        db.add(Person(id=4, first_name="Grace", last_name="Grace", email="grace@grace.org"))
+        db.commit()
+
+        assert self._ids(db, "grace", order_by_rank=True) == [4, 2]
+
+    def test_postgresql_condition_uses_indexed_expressions(self):
+        """Test the PostgreSQL condition matches the expression indexes."""
+        condition = text_search.condition(PERSON_SEARCH, "Ada L", "postgresql")
+        sql = str(condition.compile(dialect=postgresql.dialect()))
+
+        document = str(PERSON_SEARCH.expression().compile(dialect=postgresql.dialect()))
+        assert f"{document} LIKE" in sql
+        assert f"to_tsvector('simple', {document}) @@ to_tsquery('simple'," in sql
@@ -0,0 +1,131 @@
+"""
+Tests for the assignment typeahead prefix index.
+"""
+
+from datetime import datetime
+
+from app.features.enrollments.services import typeahead_index as typeahead_module
+from app.features.enrollments.services.typeahead_index import (
+    TypeaheadEntry,
+    TypeaheadIndex,
+    normalize,
+)
+
+
+class InMemoryTypeaheadIndex(TypeaheadIndex):
+    """Index whose loaders read plain dictionaries instead of the database."""
+
+    def __init__(self, sync_interval_seconds=0):
+        super().__init__(ttl_seconds=3600, max_results=5, sync_interval_seconds=sync_interval_seconds)
+        self.users = {}
+        self.updated = {}
+        self.assigned = {}
+        self.enrolled = {}
+        self.user_loads = []
+
+    def add_user(self, user_id, first_name, last_name, email, roles=("student",), is_active=True,
+                 updated_at=datetime(2025, 1, 1)):
+        self.users[user_id] = (user_id, first_name, last_name, email, list(roles), is_active)
+        self.updated[user_id] = updated_at
+
+    def _latest_update(self, db):
+        return max(self.updated.values(), default=None)
+
+    def _changed_users(self, db, since):
+        changed = {user_id: updated for user_id, updated in self.updated.items() if updated >= since}
+        return set(changed), max(changed.values(), default=None)
+
+    def _load_entries(self, db, user_ids):
+        self.user_loads.append(None if user_ids is None else set(user_ids))
+        return [
+            TypeaheadEntry(*row) for user_id, row in self.users.items()
+            if user_ids is None or user_id in user_ids
+        ]
+
+    def _assigned(self, db, program_id):
+        return frozenset(self.assigned.get(program_id, ()))
+
+    def _enrolled(self, db, course_id):
+        return frozenset(self.enrolled.get(course_id, ()))
+
+
+class TestTypeaheadIndex:
+    """Test class for TypeaheadIndex functionality."""
+
+    def _ids(self, index, query, role="student", **kwargs):
+        return [user["id"] for user in index.search(None, query, role, "p1", **kwargs)]
+
+    def make_index(self):
+        index = InMemoryTypeaheadIndex()
+        index.add_user("u1", "Zoë", "Adams", "zoe@example.com")
+        index.add_user("u2", "Zack", "Brown", "zack@example.com")
+        index.add_user("u3", "Anna", "Zimmer", "anna@example.com", roles=("parent",))
+        index.add_user("u4", "Zed", "Clark", "zed@example.com", is_active=False)
+        return index
+
+    def test_normalize_folds_case_and_accents(self):
+        """Test keys and queries compare without case or accents."""
+        assert normalize("  Zoë ÅSA ") == "zoe asa"
+
+    def test_prefix_search_filters_role_activity_and_words(self):
+        """Test every word must prefix a name or email of an active user with the role."""
+        index = self.make_index()
+
+        assert self._ids(index, "z") == ["u2", "u1"]
+        assert self._ids(index, "ZOE") == ["u1"]
+        assert self._ids(index, "zack@ex") == ["u2"]
+        assert self._ids(index, "za bro") == ["u2"]
+        assert self._ids(index, "za adams") == []
+        assert self._ids(index, "z", role="parent") == ["u3"]
+        assert self._ids(index, " ") == []
+
+    def test_excludes_assigned_and_enrolled_users(self):
+        """Test users already in the program or course are not suggested."""
+        index = self.make_index()
+        index.assigned["p1"] = {"u1"}
+        index.enrolled["c1"] = {"u2"}
+
+        assert self._ids(index, "z") == ["u2"]
+        assert self._ids(index, "z", exclude_enrolled_in_course="c1") == []
+
+    def test_caps_results(self):
+        """Test results are capped at the limit and the configured maximum."""
+        index = InMemoryTypeaheadIndex()
+        for number in range(10):
+            index.add_user(f"u{number}", f"Sam{number}", "Smith", f"sam{number}@example.com")
+
+        assert len(self._ids(index, "sam")) == 5
+        assert len(self._ids(index, "sam", limit=2)) == 2
+        assert len(self._ids(index, "sam", limit=50)) == 5
+
+    def test_invalidated_users_are_rekeyed_incrementally(self):
+        """Test changed users are reloaded on the next lookup without a rebuild."""
+        index = self.make_index()
+        assert self._ids(index, "zack") == ["u2"]
+
+        index.add_user("u2", "Max", "Brown", "max@example.com")
+        index.add_user("u5", "Zara", "Diaz", "zara@example.com")
+        del index.users["u1"]
+        index.invalidate_users(["u1", "u2", "u5"])
+
+        assert self._ids(index, "z") == ["u5"]
+        assert self._ids(index, "max") == ["u2"]
+        assert index.user_loads == [None, {"u1", "u2", "u5"}]
+        assert index._keys == sorted(index._keys)
+        assert len(index) == 4
+
+    def test_sync_picks_up_users_changed_by_other_processes(self, monkeypatch):
+        """Test users updated without a local commit are re-keyed after the sync interval."""
+        now = [1000.0]
+        monkeypatch.setattr(typeahead_module.time, "monotonic", lambda: now[0])
+        index = InMemoryTypeaheadIndex(sync_interval_seconds=5)
+        index.add_user("u1", "Zoë", "Adams", "zoe@example.com", updated_at=datetime(2025, 1, 1, 12))
+        assert self._ids(index, "z") == ["u1"]
+
+        index.add_user("u2", "Zack", "Brown", "zack@example.com", updated_at=datetime(2025, 1, 1, 12, 5))
+        assert self._ids(index, "z") == ["u1"]
+
+        now[0] += 5
+        assert self._ids(index, "z") == ["u2", "u1"]
+        # Only the recently updated users are reloaded, not the whole index
+        assert index.user_loads == [None, {"u1", "u2"}]
@@ -0,0 +1,118 @@
+"""
+Tests for streaming, resumable media uploads.
+"""
+
+import hashlib
+
+import pytest
+
+from app.features.media.services import upload_service as uploads
+from app.features.media.services.upload_service import (
+    MediaUploadService,
+    UploadAccessDeniedError,
+    UploadChunkLengthError,
+    UploadOffsetMismatchError,
+    UploadSessionNotFoundError,
+    UploadTooLargeError,
+)
+
+
+async def stream(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+class TestMediaUploadService:
+    """Test class for MediaUploadService functionality."""
+
+    @pytest.fixture
+    def service(self, tmp_path, monkeypatch):
+        """Upload service rooted in a temporary directory with small chunks."""
+        monkeypatch.setattr(uploads, "CHUNK_SIZE", 4)
+        return MediaUploadService(str(tmp_path), max_file_size=64)
+
+    @pytest.mark.asyncio
+    async def test_resumed_chunks_assemble_file_and_digest(self, service):
+        """Test chunks appended across requests produce the file and its SHA-256."""
+        session = service.create_session({"title": "Video"}, "user-1")
+
+        await service.append(session.upload_id, stream(b"hello ", b"wor"), offset=0, total_size=11)
+        service._digests.clear()  # next chunk handled by another process
+        resumed = await service.append(session.upload_id, stream(b"ld"), offset=9)
+        upload = service.complete(session.upload_id, "../clip.mp4")
+
+        assert resumed.received_bytes == 11
+        assert upload.path.endswith("clip.mp4") and upload.size == 11
+        assert open(upload.path, "rb").read() == b"hello world"
+        assert upload.sha256 == hashlib.sha256(b"hello world").hexdigest()
+        with pytest.raises(UploadSessionNotFoundError):
+            service.get_session(session.upload_id)
+
+    @pytest.mark.asyncio
+    async def test_wrong_offset_is_rejected_with_received_bytes(self, service):
+        """Test a chunk that does not continue the upload is rejected."""
+        session = service.create_session({})
+        await service.append(session.upload_id, stream(b"abc"))
+
+        with pytest.raises(UploadOffsetMismatchError) as error:
+            await service.append(session.upload_id, stream(b"zzz"), offset=0)
+        assert error.value.expected_offset == 3
+
+    @pytest.mark.asyncio
+    async def test_size_enforced_while_streaming(self, service):
+        """Test uploads beyond the announced size are aborted and discarded."""
+        session = service.create_session({}, expected_size=5)
+
+        with pytest.raises(UploadTooLargeError):
+            await service.append(session.upload_id, stream(b"1234", b"5678"))
+        with pytest.raises(UploadSessionNotFoundError):
+            service.get_session(session.upload_id)
+
+    def test_incomplete_upload_and_invalid_ids_rejected(self, service):
+        """Test incomplete uploads cannot be completed and path-like ids are unknown."""
+        session = service.create_session({}, expected_size=5)
+
+        with pytest.raises(UploadOffsetMismatchError):
+            service.complete(session.upload_id, "file.bin")
+        with pytest.raises(UploadSessionNotFoundError):
+            service.get_session("../../etc")
+
+    @pytest.mark.asyncio
+    async def test_only_the_uploader_can_use_the_session(self, service):
+        """Test another user cannot read, append to or complete an upload."""
+        session = service.create_session({}, "user-1")
+        await service.append(session.upload_id, stream(b"abc"), user_id="user-1")
+
+        with pytest.raises(UploadAccessDeniedError):
+            service.get_session(session.upload_id, "user-2")
+        with pytest.raises(UploadAccessDeniedError):
+            await service.append(session.upload_id, stream(b"zzz"), user_id="user-2")
+        with pytest.raises(UploadAccessDeniedError):
+            service.complete(session.upload_id, "file.bin", user_id="user-2")
+        assert service.get_session(session.upload_id, "user-1").received_bytes == 3
+
+    @pytest.mark.asyncio
+    async def test_long_chunk_rejected_before_it_is_written(self, service):
+        """Test bytes beyond the announced chunk length are never kept."""
+        session = service.create_session({})
+        await service.append(session.upload_id, stream(b"abc"))
+
+        with pytest.raises(UploadChunkLengthError) as error:
+            await service.append(session.upload_id, stream(b"12345", b"678"), offset=3, length=4)
+
+        assert error.value.received_bytes == 3
+        assert service.get_session(session.upload_id).received_bytes == 3
+        resumed = await service.append(session.upload_id, stream(b"defg"), offset=3, length=4)
+        assert resumed.received_bytes == 7
+        upload = service.complete(session.upload_id, "file.bin")
+        assert upload.sha256 == hashlib.sha256(b"abcdefg").hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_short_chunk_is_truncated_away(self, service):
+        """Test a chunk shorter than announced leaves the upload where it was."""
+        session = service.create_session({})
+
+        with pytest.raises(UploadChunkLengthError):
+            await service.append(session.upload_id, stream(b"1234", b"56"), offset=0, length=10)
+
+        assert service.get_session(session.upload_id).received_bytes == 0
@@ -0,0 +1,105 @@
+"""
+Tests for the cross-program user search.
+"""
+
+from datetime import date
+
+from app.features.common.models.enums import EnrollmentStatus, ProgramRole
+from app.features.enrollments.models.course_enrollment import CourseEnrollment
+from app.features.enrollments.models.program_assignment import ProgramAssignment
+from app.features.enrollments.services.user_search_service import UserSearchParams, UserSearchService
+
+
+def walk(db, **params):
+    """IDs of every user returned by following next_cursor, and the number of pages."""
+    ids, cursor, pages = [], None, 0
+    while True:
+        result = UserSearchService.search_all_users(db, UserSearchParams(cursor=cursor, **params), "admin")
+        ids.extend(user["id"] for user in result.users)
+        pages += 1
+        cursor = result.next_cursor
+        if cursor is None:
+            return ids, pages, result.total_count
+
+
+class TestSearchAllUsers:
+    """Test class for UserSearchService.search_all_users."""
+
+    def test_cursor_walk_by_name(self, people_db, make_user):
+        """Test a name-ordered cursor walk returns every user once, in order."""
+        make_user("admin", "Zed", "Admin", roles=("super_admin",))
+        names = [("Ada", "Smith"), ("Bea", "Smith"), ("Ada", "Jones"), ("Cy", "Adams"), ("Ada", "Smith")]
+        for n, (first_name, last_name) in enumerate(names):
+            make_user(f"u{n}", first_name, last_name)
+
+        ids, pages, total = walk(people_db, per_page=2)
+
+        assert ids == ["u3", "admin", "u2", "u0", "u4", "u1"]
+        assert (pages, total) == (3, 6)
+
+    def test_cursor_walk_by_relevance(self, people_db, make_user):
+        """Test a relevance-ordered cursor walk has no duplicates or gaps, ties included."""
+        make_user("admin", "Zed", "Admin", roles=("super_admin",))
+        for n in range(5):
+            make_user(f"smith{n}", "Ada", "Smith")
+        make_user("smithson", "Smith", "Smithson")
+        make_user("jones", "Bea", "Jones")
+
+        ids, pages, total = walk(people_db, search_query="smith", per_page=2)
+
+        assert sorted(ids) == ["smith0", "smith1", "smith2", "smith3", "smith4", "smithson"]
+        assert len(ids) == len(set(ids)) == total
+        assert pages == 3
+
+    def test_user_with_many_rows_is_listed_once_with_counts(self, people_db, make_user):
+        """Test assignments and enrollments do not repeat a user and only current rows are counted."""
+        make_user("admin", "Zed", "Admin", roles=("super_admin",))
+        make_user("busy", "Ada", "Busy")
+        make_user("idle", "Bea", "Idle")
+        people_db.add_all(
+            [
+                ProgramAssignment(
+                    id=f"busy-{program_id}",
+                    user_id="busy",
+                    program_id=program_id,
+                    assignment_date=date(2025, 1, day),
+                    assigned_by="admin",
+                    role_in_program=ProgramRole.STUDENT,
+                    is_active=program_id != "p-old",
+                )
+                for day, program_id in enumerate(["p1", "p2", "p3", "p-old"], start=1)
+            ]
+            + [
+                CourseEnrollment(
+                    id=f"busy-{course_id}",
+                    user_id="busy",
+                    course_id=course_id,
+                    program_id="p1",
+                    enrollment_date=date(2025, 2, day),
+                    status=status,
+                )
+                for day, (course_id, status) in enumerate([
+                    ("c1", EnrollmentStatus.active),
+                    ("c2", EnrollmentStatus.paused),
+                    ("c3", EnrollmentStatus.active),
+                    ("c4", EnrollmentStatus.withdrawn),
+                ], start=1)
+            ]
+        )
+        people_db.commit()
+
+        result = UserSearchService.search_all_users(people_db, UserSearchParams(program_filter="p1"), "admin")
+
+        assert [user["id"] for user in result.users] == ["busy"]
+        assert result.total_count == 1
+        busy = result.users[0]
+        assert busy["program_ids"] == ["p1", "p2", "p3"]
+        assert busy["active_enrollment_count"] == 3
+        assert [enrollment["course_id"] for enrollment in busy["active_enrollments"]] == ["c1", "c2", "c3"]
+
+        result = UserSearchService.search_all_users(people_db, UserSearchParams(), "admin")
+
+        users = {user["id"]: user for user in result.users}
+        assert [user["id"] for user in result.users] == ["admin", "busy", "idle"]
+        assert (users["idle"]["program_ids"], users["idle"]["active_enrollment_count"]) == ([], 0)
+        assert users["busy"]["active_enrollment_count"] == 3